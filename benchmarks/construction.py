@@ -0,0 +1,108 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures the construction of messages with typical nesting, both directly via the
+constructors and via ``TelegramObject.de_json`` as done for incoming updates. As ``de_json``
+modifies its input, the payloads are parsed from JSON for every call. The cost of that is listed
+separately.
+
+Usage: python -m benchmarks.construction [--number N] [--repeat N]
+"""
+import argparse
+import datetime as dtm
+import json
+import timeit
+from typing import Callable
+
+from telegram import Bot, Chat, Message, MessageEntity, PhotoSize, Update, User
+
+USER = {"id": 1, "is_bot": False, "first_name": "John", "last_name": "Doe", "username": "john"}
+CHAT = {"id": 1, "type": "private", "first_name": "John", "username": "john"}
+
+
+def message_payload(message_id: int, reply: bool) -> dict[str, object]:
+    payload: dict[str, object] = {
+        "message_id": message_id,
+        "date": 1_700_000_000,
+        "chat": CHAT,
+        "from": USER,
+        "text": "/start hello https://example.com",
+        "entities": [
+            {"type": "bot_command", "offset": 0, "length": 6},
+            {"type": "url", "offset": 13, "length": 19},
+        ],
+    }
+    if reply:
+        payload["reply_to_message"] = {
+            **message_payload(message_id - 1, reply=False),
+            "photo": [
+                {"file_id": "AgAD", "file_unique_id": "AQAD", "width": 90, "height": 90},
+                {"file_id": "AgAE", "file_unique_id": "AQAE", "width": 320, "height": 320},
+            ],
+        }
+    return payload
+
+
+def build_message() -> Message:
+    date = dtm.datetime(2024, 1, 1, tzinfo=dtm.timezone.utc)
+    chat = Chat(id=1, type=Chat.PRIVATE, first_name="John", username="john")
+    user = User(id=1, first_name="John", is_bot=False, last_name="Doe", username="john")
+    return Message(
+        message_id=2,
+        date=date,
+        chat=chat,
+        from_user=user,
+        text="/start hello https://example.com",
+        entities=(
+            MessageEntity(MessageEntity.BOT_COMMAND, 0, 6),
+            MessageEntity(MessageEntity.URL, 13, 19),
+        ),
+        reply_to_message=Message(
+            message_id=1,
+            date=date,
+            chat=chat,
+            from_user=user,
+            photo=(PhotoSize("AgAD", "AQAD", 90, 90), PhotoSize("AgAE", "AQAE", 320, 320)),
+        ),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=5_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    bot = Bot("1:token")
+    message = json.dumps(message_payload(2, reply=True))
+    update = json.dumps({"update_id": 1, "message": message_payload(2, reply=True)})
+    cases: dict[str, Callable[[], object]] = {
+        "json.loads only": lambda: json.loads(message),
+        "Message(...) with nesting": build_message,
+        "Message.de_json": lambda: Message.de_json(json.loads(message), bot),
+        "Update.de_json": lambda: Update.de_json(json.loads(update), bot),
+    }
+
+    print(f"Best of {args.repeat} runs with {args.number} calls each:")
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=args.number, repeat=args.repeat))
+        print(f"{name:>26}: {best / args.number * 1_000_000:8.2f} µs per call")
+
+
+if __name__ == "__main__":
+    main()
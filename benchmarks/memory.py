@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures the memory held by typical Telegram objects decoded via ``TelegramObject.de_json``,
+e.g. when they are kept in ``chat_data``. The JSON payloads are built before the measurement, so
+the numbers only include the memory allocated by the library, including nested objects.
+
+Usage: python -m benchmarks.memory [--number N]
+"""
+import argparse
+import tracemalloc
+from typing import Callable
+
+from telegram import Bot, Chat, Message, MessageEntity, PhotoSize, TelegramObject, Update, User
+
+USER = {"id": 1, "is_bot": False, "first_name": "John", "last_name": "Doe", "username": "john"}
+CHAT = {"id": 1, "type": "private", "first_name": "John", "username": "john"}
+ENTITY = {"type": "bot_command", "offset": 0, "length": 6}
+PHOTO = {"file_id": "AgACAgIAAxkBAAI", "file_unique_id": "AQADAgAT", "width": 90, "height": 90}
+
+
+def message(message_id: int) -> dict[str, object]:
+    return {
+        "message_id": message_id,
+        "date": 1_700_000_000,
+        "chat": dict(CHAT),
+        "from": dict(USER),
+        "text": "/start hello world",
+        "entities": [dict(ENTITY)],
+    }
+
+
+CASES: dict[str, tuple[type[TelegramObject], Callable[[int], dict[str, object]]]] = {
+    "User": (User, lambda _: dict(USER)),
+    "Chat": (Chat, lambda _: dict(CHAT)),
+    "MessageEntity": (MessageEntity, lambda _: dict(ENTITY)),
+    "PhotoSize": (PhotoSize, lambda _: dict(PHOTO)),
+    "Message (text)": (Message, message),
+    "Message (photo, reply)": (
+        Message,
+        lambda number: {
+            **message(number),
+            "photo": [dict(PHOTO), dict(PHOTO)],
+            "reply_to_message": message(number - 1),
+        },
+    ),
+    "Update": (Update, lambda number: {"update_id": number, "message": message(number)}),
+}
+
+
+def measure(
+    cls: type[TelegramObject], build: Callable[[int], dict[str, object]], number: int
+) -> float:
+    bot = Bot("1:token")
+    payloads = [build(index) for index in range(number)]
+    objects: list[object] = [None] * number
+
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    for index, payload in enumerate(payloads):
+        objects[index] = cls.de_json(payload, bot)
+    used = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    return used / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print(f"Average memory held by {args.number} objects of each class:")
+    for name, (cls, build) in CASES.items():
+        print(f"{name:>22}: {measure(cls, build, args.number):8.0f} bytes per object")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Compares the copies made by ``Application.update_persistence`` with :func:`copy.deepcopy`.
+
+Usage: python -m benchmarks.persistence_snapshot [--entries N] [--repeat N]
+"""
+import argparse
+import datetime as dtm
+import timeit
+from copy import deepcopy
+
+from telegram.ext._utils.snapshot import snapshot
+
+
+def build_bot_data(entries: int) -> dict[object, object]:
+    now = dtm.datetime.now(dtm.timezone.utc)
+    return {
+        user_id: {
+            "name": f"user {user_id}",
+            "joined": now,
+            "language": "en",
+            "scores": [user_id, user_id * 2, user_id * 3],
+            "settings": {"notifications": True, "tags": {"a", "b"}, "limits": (1, 2, 3)},
+        }
+        for user_id in range(entries)
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--entries", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    bot_data = build_bot_data(args.entries)
+    cases = {
+        "copy.deepcopy": lambda: deepcopy(bot_data),
+        "snapshot": lambda: snapshot(bot_data),
+    }
+
+    print(f"bot_data with {args.entries} entries, best of {args.repeat} runs:")
+    baseline = None
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=1, repeat=args.repeat))
+        baseline = baseline or best
+        print(f"{name:>22}: {best * 1000:8.2f} ms ({baseline / best:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
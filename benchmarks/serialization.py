@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures the serialization of typical Telegram objects via ``TelegramObject.to_dict`` and
+:mod:`pickle`, as done for outgoing requests and by the persistence classes, respectively.
+
+Usage: python -m benchmarks.serialization [--number N] [--repeat N]
+"""
+import argparse
+import datetime as dtm
+import pickle
+import timeit
+from typing import Callable
+
+from telegram import (
+    Chat,
+    InlineKeyboardButton,
+    InlineKeyboardMarkup,
+    InputMediaPhoto,
+    Message,
+    MessageEntity,
+    Update,
+    User,
+)
+
+
+def build_update() -> Update:
+    user = User(id=1, first_name="John", is_bot=False, last_name="Doe", username="john")
+    chat = Chat(id=1, type=Chat.PRIVATE, first_name="John", username="john")
+    message = Message(
+        message_id=1,
+        date=dtm.datetime(2024, 1, 1, tzinfo=dtm.timezone.utc),
+        chat=chat,
+        from_user=user,
+        text="Hello world, this is a /command with an https://example.com link",
+        entities=(
+            MessageEntity(MessageEntity.BOT_COMMAND, 26, 8),
+            MessageEntity(MessageEntity.URL, 48, 19),
+        ),
+        reply_to_message=Message(
+            message_id=0,
+            date=dtm.datetime(2024, 1, 1, tzinfo=dtm.timezone.utc),
+            chat=chat,
+            from_user=user,
+            text="Previous message",
+        ),
+    )
+    return Update(update_id=1, message=message)
+
+
+def build_keyboard(size: int) -> InlineKeyboardMarkup:
+    return InlineKeyboardMarkup(
+        [
+            [
+                InlineKeyboardButton(f"Button {row}/{column}", callback_data=f"{row}:{column}")
+                for column in range(size)
+            ]
+            for row in range(size)
+        ]
+    )
+
+
+def build_media_group(size: int) -> list[InputMediaPhoto]:
+    return [
+        InputMediaPhoto(
+            f"AgACAgIAAxkBAAI{number}",
+            caption=f"Photo {number}",
+            caption_entities=[MessageEntity(MessageEntity.BOLD, 0, 5)],
+        )
+        for number in range(size)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--number", type=int, default=2_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    update = build_update()
+    keyboard = build_keyboard(8)
+    media_group = build_media_group(10)
+    cases: dict[str, Callable[[], object]] = {
+        "Update.to_dict": update.to_dict,
+        "Update.to_json": update.to_json,
+        "InlineKeyboardMarkup(8x8).to_dict": keyboard.to_dict,
+        "10 x InputMediaPhoto.to_dict": lambda: [media.to_dict() for media in media_group],
+        "pickle.dumps(Update)": lambda: pickle.dumps(update),
+        "pickle.loads(Update)": lambda pickled=pickle.dumps(update): pickle.loads(pickled),
+    }
+
+    print(f"Best of {args.repeat} runs with {args.number} calls each:")
+    for name, func in cases.items():
+        best = min(timeit.repeat(func, number=args.number, repeat=args.repeat))
+        print(f"{name:>34}: {best / args.number * 1_000_000:8.2f} µs per call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""Measures how many updates per second flow from ``Updater.start_polling`` through
+``Application`` to a handler callback. Telegram is replaced by a stub request that answers every
+``getUpdates`` call with a full batch of text messages, so the numbers only reflect the overhead
+of the library itself.
+
+Usage: python -m benchmarks.update_ingestion [--updates N] [--batch-size N] [--repeat N]
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import Optional
+
+from telegram.ext import Application, ContextTypes, MessageHandler
+from telegram.request import BaseRequest, RequestData
+
+BOT_USER = {"id": 1, "is_bot": True, "first_name": "Bot", "username": "bench_bot"}
+
+
+class StubRequest(BaseRequest):
+    """Answers ``getUpdates`` with batches of ``batch_size`` updates until ``total`` updates were
+    delivered. All other methods just return :obj:`True`."""
+
+    def __init__(self, total: int, batch_size: int):
+        self.total = total
+        self.batch_size = batch_size
+        self.delivered = 0
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    @property
+    def read_timeout(self) -> Optional[float]:
+        return 1
+
+    def build_updates(self) -> list[dict[str, object]]:
+        count = min(self.batch_size, self.total - self.delivered)
+        updates = []
+        for update_id in range(self.delivered, self.delivered + count):
+            chat_id = update_id % 100
+            updates.append(
+                {
+                    "update_id": update_id,
+                    "message": {
+                        "message_id": update_id,
+                        "date": 1_700_000_000,
+                        "chat": {"id": chat_id, "type": "private", "first_name": "User"},
+                        "from": {"id": chat_id, "is_bot": False, "first_name": "User"},
+                        "text": f"message {update_id}",
+                    },
+                }
+            )
+        self.delivered += count
+        return updates
+
+    async def do_request(
+        self,
+        url: str,
+        method: str,  # noqa: ARG002
+        request_data: Optional[RequestData] = None,  # noqa: ARG002
+        read_timeout: Optional[float] = None,  # noqa: ARG002
+        write_timeout: Optional[float] = None,  # noqa: ARG002
+        connect_timeout: Optional[float] = None,  # noqa: ARG002
+        pool_timeout: Optional[float] = None,  # noqa: ARG002
+    ) -> tuple[int, bytes]:
+        endpoint = url.rsplit("/", 1)[-1]
+        if endpoint == "getMe":
+            result: object = BOT_USER
+        elif endpoint == "getUpdates":
+            result = self.build_updates()
+            if not result:
+                # Emulate long polling without pending updates
+                await asyncio.sleep(0.01)
+        else:
+            result = True
+        return 200, json.dumps({"ok": True, "result": result}).encode()
+
+
+async def run(updates: int, batch_size: int, concurrent_updates: int) -> float:
+    request = StubRequest(updates, batch_size)
+    processed = 0
+    done = asyncio.Event()
+
+    async def callback(_: object, __: ContextTypes.DEFAULT_TYPE) -> None:
+        nonlocal processed
+        processed += 1
+        if processed == updates:
+            done.set()
+
+    application = (
+        Application.builder()
+        .token("1:token")
+        .request(request)
+        .get_updates_request(request)
+        .concurrent_updates(concurrent_updates)
+        .build()
+    )
+    application.add_handler(MessageHandler(None, callback))
+
+    async with application:
+        await application.start()
+        start = time.perf_counter()
+        await application.updater.start_polling(poll_interval=0)
+        await done.wait()
+        elapsed = time.perf_counter() - start
+        await application.updater.stop()
+        await application.stop()
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--updates", type=int, default=20_000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"{args.updates} updates in batches of {args.batch_size}, best of {args.repeat} runs:")
+    for name, concurrent_updates in (("sequential", 1), ("concurrent (256)", 256)):
+        best = min(
+            asyncio.run(run(args.updates, args.batch_size, concurrent_updates))
+            for _ in range(args.repeat)
+        )
+        print(f"{name:>18}: {args.updates / best:10.0f} updates/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Final,
     NoReturn,
     Optional,
     TypeVar,
@@ -93,6 +94,7 @@ from telegram._userprofilephotos import UserProfilePhotos
 from telegram._utils.argumentparsing import parse_lpo_and_dwpp, parse_sequence_arg
 from telegram._utils.defaultvalue import DEFAULT_NONE, DefaultValue
 from telegram._utils.files import is_local_file, parse_file_input
+from telegram._utils.interning import InternCache
 from telegram._utils.logging import get_logger
 from telegram._utils.repr import build_repr_with_selected_attrs
 from telegram._utils.strings import to_camel_case
@@ -125,6 +127,18 @@ if TYPE_CHECKING:
 
 BT = TypeVar("BT", bound="Bot")
 
+# Requests that a user is actively waiting for. They are sent via the interactive request object
+_INTERACTIVE_ENDPOINTS: Final = frozenset(
+    (
+        "answerCallbackQuery",
+        "answerInlineQuery",
+        "answerPreCheckoutQuery",
+        "answerShippingQuery",
+        "answerWebAppQuery",
+        "sendChatAction",
+    )
+)
+
 
 class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
     """This object represents a Telegram Bot.
@@ -213,6 +227,23 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
             Defaults to :obj:`False`.
 
             .. versionadded:: 20.0.
+        media_request (:class:`telegram.request.BaseRequest`, optional): Pre initialized
+            :class:`telegram.request.BaseRequest` instance. Will be used for all requests that
+            upload files. If not passed, :paramref:`request` will be used for these requests.
+
+            .. versionadded:: NEXT.VERSION
+        interactive_request (:class:`telegram.request.BaseRequest`, optional): Pre initialized
+            :class:`telegram.request.BaseRequest` instance. Will be used for requests that a user
+            is actively waiting for, e.g. :meth:`answer_callback_query`,
+            :meth:`answer_inline_query` and :meth:`send_chat_action`. If not passed,
+            :paramref:`request` will be used for these requests.
+
+            .. versionadded:: NEXT.VERSION
+
+    Tip:
+        Using separate request objects for :paramref:`media_request` and
+        :paramref:`interactive_request` ensures that slow file uploads don't occupy the
+        connections needed by quick interactive requests.
 
     .. include:: inclusions/bot_methods.rst
 
@@ -230,7 +261,10 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
         "_base_url",
         "_bot_user",
         "_initialized",
+        "_interactive_request",
+        "_intern_cache",
         "_local_mode",
+        "_media_request",
         "_private_key",
         "_request",
         "_token",
@@ -246,6 +280,8 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
         private_key: Optional[bytes] = None,
         private_key_password: Optional[bytes] = None,
         local_mode: bool = False,
+        media_request: Optional[BaseRequest] = None,
+        interactive_request: Optional[BaseRequest] = None,
     ):
         super().__init__(api_kwargs=None)
         if not token:
@@ -263,29 +299,32 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
             HTTPXRequest() if get_updates_request is None else get_updates_request,
             HTTPXRequest() if request is None else request,
         )
+        self._media_request: Optional[BaseRequest] = media_request
+        self._interactive_request: Optional[BaseRequest] = interactive_request
+        # Set by ExtBot, see the `intern_objects` parameter there
+        self._intern_cache: Optional[InternCache] = None
 
         # this section is about issuing a warning when using HTTP/2 and connect to a self hosted
         # bot api instance, which currently only supports HTTP/1.1. Checking if a custom base url
         # is set is the best way to do that.
 
-        warning_string = ""
-
-        if (
-            isinstance(self._request[0], HTTPXRequest)
-            and self._request[0].http_version == "2"
-            and not base_url.startswith("https://api.telegram.org/bot")
-        ):
-            warning_string = "get_updates_request"
-
-        if (
-            isinstance(self._request[1], HTTPXRequest)
-            and self._request[1].http_version == "2"
+        http2_requests = [
+            name
+            for name, request_object in (
+                ("get_updates_request", self._request[0]),
+                ("request", self._request[1]),
+                ("media_request", media_request),
+                ("interactive_request", interactive_request),
+            )
+            if isinstance(request_object, HTTPXRequest)
+            and request_object.http_version == "2"
             and not base_url.startswith("https://api.telegram.org/bot")
-        ):
-            if warning_string:
-                warning_string += " and request"
-            else:
-                warning_string = "request"
+        ]
+        warning_string = (
+            " and ".join(http2_requests)
+            if len(http2_requests) < 3
+            else f"{', '.join(http2_requests[:-1])} and {http2_requests[-1]}"
+        )
 
         if warning_string:
             self._warn(
@@ -433,6 +472,11 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
         """
         return self._private_key
 
+    def _unique_requests(self) -> list[BaseRequest]:
+        """The request objects used by this bot, without duplicates."""
+        requests = (*self._request, self._media_request, self._interactive_request)
+        return list({id(request): request for request in requests if request}.values())
+
     @property
     def request(self) -> BaseRequest:
         """The :class:`~telegram.request.BaseRequest` object used by this bot.
@@ -547,6 +591,12 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
             local_mode=self._local_mode,
         )
 
+    def _parse_updates(self, data: list[JSONDict]) -> tuple[Update, ...]:
+        """Converts the result of :meth:`get_updates`. This is a standalone method so that
+        ExtBot can override it to decode the updates lazily.
+        """
+        return Update.de_list(data, self)
+
     def _insert_defaults(self, data: dict[str, object]) -> None:
         """This method is here to make ext.Defaults work. Because we need to be able to tell
         e.g. `send_message(chat_id, text)` from `send_message(chat_id, text, parse_mode=None)`, the
@@ -638,11 +688,16 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
         # This also converts datetimes into timestamps.
         # We don't do this earlier so that _insert_defaults (see above) has a chance to convert
         # to the default timezone in case this is called by ExtBot
-        request_data = RequestData(
-            parameters=[RequestParameter.from_input(key, value) for key, value in data.items()],
-        )
-
-        request = self._request[0] if endpoint == "getUpdates" else self._request[1]
+        parameters = [RequestParameter.from_input(key, value) for key, value in data.items()]
+        if endpoint == "getUpdates":
+            request = self._request[0]
+        elif self._interactive_request and endpoint in _INTERACTIVE_ENDPOINTS:
+            request = self._interactive_request
+        elif self._media_request and any(parameter.input_files for parameter in parameters):
+            request = self._media_request
+        else:
+            request = self._request[1]
+        request_data = RequestData(parameters=parameters, json_codec=request.json_codec)
 
         self._LOGGER.debug("Calling Bot API endpoint `%s` with parameters `%s`", endpoint, data)
         result = await request.post(
@@ -756,7 +811,7 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
             self._LOGGER.debug("This Bot is already initialized.")
             return
 
-        await asyncio.gather(self._request[0].initialize(), self._request[1].initialize())
+        await asyncio.gather(*(request.initialize() for request in self._unique_requests()))
         # Since the bot is to be initialized only once, we can also use it for
         # verifying the token passed and raising an exception if it's invalid.
         try:
@@ -777,7 +832,7 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
             self._LOGGER.debug("This Bot is already shut down. Returning.")
             return
 
-        await asyncio.gather(self._request[0].shutdown(), self._request[1].shutdown())
+        await asyncio.gather(*(request.shutdown() for request in self._unique_requests()))
         self._initialized = False
 
     async def do_api_request(
@@ -4494,7 +4549,7 @@ class Bot(TelegramObject, contextlib.AbstractAsyncContextManager["Bot"]):
             self._LOGGER.debug("No new updates found.")
 
         try:
-            return Update.de_list(result, self)
+            return self._parse_updates(result)
         except Exception as exc:
             # This logging is in place mostly b/c we can't access the raw json data in Updater,
             # where the exception is caught and logged again. Still, it might also be beneficial
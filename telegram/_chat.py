@@ -28,7 +28,7 @@ from telegram._chatpermissions import ChatPermissions
 from telegram._forumtopic import ForumTopic
 from telegram._menubutton import MenuButton
 from telegram._reaction import ReactionType
-from telegram._telegramobject import TelegramObject
+from telegram._telegramobject import IdAttrs, TelegramObject
 from telegram._utils import enum
 from telegram._utils.defaultvalue import DEFAULT_NONE
 from telegram._utils.types import CorrectOptionID, FileInput, JSONDict, ODVInput, ReplyMarkup
@@ -40,6 +40,7 @@ if TYPE_CHECKING:
     from telegram import (
         Animation,
         Audio,
+        Bot,
         ChatInviteLink,
         ChatMember,
         Contact,
@@ -77,6 +78,8 @@ class _ChatBase(TelegramObject):
 
     __slots__ = ("first_name", "id", "is_forum", "last_name", "title", "type", "username")
 
+    _id_attrs = IdAttrs("id")
+
     def __init__(
         self,
         id: int,
@@ -100,8 +103,6 @@ class _ChatBase(TelegramObject):
         self.last_name: Optional[str] = last_name
         self.is_forum: Optional[bool] = is_forum
 
-        self._id_attrs = (self.id,)
-
         self._freeze()
 
     SENDER: Final[str] = constants.ChatType.SENDER
@@ -3533,3 +3534,15 @@ class Chat(_ChatBase):
     """
 
     __slots__ = ()
+
+    @classmethod
+    def de_json(cls, data: Optional[JSONDict], bot: Optional["Bot"] = None) -> Optional["Chat"]:
+        """See :meth:`telegram.TelegramObject.de_json`.
+
+        .. versionchanged:: NEXT.VERSION
+            If :paramref:`bot` was built with :paramref:`telegram.ext.ExtBot.intern_objects`,
+            a previously decoded instance is returned if :paramref:`data` is unchanged.
+        """
+        if data and bot is not None and (intern_cache := bot._intern_cache) is not None:
+            return intern_cache.de_json(cls, data, bot)
+        return cls._de_json(data=data, bot=bot)
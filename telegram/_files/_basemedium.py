@@ -19,7 +19,7 @@
 """Common base class for media objects"""
 from typing import TYPE_CHECKING, Optional
 
-from telegram._telegramobject import TelegramObject
+from telegram._telegramobject import IdAttrs, TelegramObject
 from telegram._utils.defaultvalue import DEFAULT_NONE
 from telegram._utils.types import JSONDict, ODVInput
 
@@ -52,6 +52,8 @@ class _BaseMedium(TelegramObject):
 
     __slots__ = ("file_id", "file_size", "file_unique_id")
 
+    _id_attrs = IdAttrs("file_unique_id")
+
     def __init__(
         self,
         file_id: str,
@@ -68,8 +70,6 @@ class _BaseMedium(TelegramObject):
         # Optionals
         self.file_size: Optional[int] = file_size
 
-        self._id_attrs = (self.file_unique_id,)
-
     async def get_file(
         self,
         *,
@@ -17,16 +17,18 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains an object that represents a Telegram File."""
+import asyncio
+import os
 import shutil
 import urllib.parse as urllib_parse
 from base64 import b64decode
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO, Optional
+from typing import TYPE_CHECKING, Any, BinaryIO, Optional
 
 from telegram._passport.credentials import decrypt
 from telegram._telegramobject import TelegramObject
 from telegram._utils.defaultvalue import DEFAULT_NONE
-from telegram._utils.files import is_local_file
+from telegram._utils.files import copy_local_file, is_local_file, read_local_file_into
 from telegram._utils.types import FilePathInput, JSONDict, ODVInput
 
 if TYPE_CHECKING:
@@ -121,6 +123,8 @@ class File(TelegramObject):
         self,
         custom_path: Optional[FilePathInput] = None,
         *,
+        parallel_ranges: int = 1,
+        hardlink: bool = False,
         read_timeout: ODVInput[float] = DEFAULT_NONE,
         write_timeout: ODVInput[float] = DEFAULT_NONE,
         connect_timeout: ODVInput[float] = DEFAULT_NONE,
@@ -156,6 +160,14 @@ class File(TelegramObject):
             a :attr:`file_path` could never be downloaded, as this attribute is mandatory for that
             operation.
 
+        .. versionchanged:: NEXT.VERSION
+            The file is no longer loaded into memory completely but written to disk in chunks via
+            :meth:`telegram.request.BaseRequest.retrieve_stream`. Until the download is complete,
+            the data is written to a file with the suffix ``.<file_unique_id>.part`` next to the
+            target path. If a download is interrupted, calling this method again resumes the
+            download from where it stopped, provided that :attr:`file_size` is known. Encrypted
+            files are still loaded into memory, as they have to be decrypted as a whole.
+
         Args:
             custom_path (:class:`pathlib.Path` | :obj:`str` , optional): The path where the file
                 will be saved to. If not specified, will be saved in the current working directory
@@ -163,6 +175,21 @@ class File(TelegramObject):
                 is not set.
 
         Keyword Args:
+            parallel_ranges (:obj:`int`, optional): The number of byte ranges of the file that are
+                downloaded concurrently. This can speed up downloads of large files from a
+                `Local Bot API Server <https://core.telegram.org/bots/api#using-a-local-bot-api-\
+                server>`_. Only has an effect if :attr:`file_size` is known and the file is not
+                encrypted. Interrupted parallel downloads are not resumed. Defaults to ``1``.
+
+                .. versionadded:: NEXT.VERSION
+            hardlink (:obj:`bool`, optional): Only relevant if :attr:`file_path` is the path of a
+                local file and :paramref:`custom_path` is passed. Pass :obj:`True` to create a
+                hard link at :paramref:`custom_path` instead of copying the file. This avoids
+                copying any data, but changes to either path affect both. If the link can't be
+                created, e.g. because :paramref:`custom_path` already exists or is located on a
+                different file system, the file is copied instead. Defaults to :obj:`False`.
+
+                .. versionadded:: NEXT.VERSION
             read_timeout (:obj:`float` | :obj:`None`, optional): Value to pass to
                 :paramref:`telegram.request.BaseRequest.post.read_timeout`. Defaults to
                 :attr:`~telegram.request.BaseRequest.DEFAULT_NONE`.
@@ -181,10 +208,13 @@ class File(TelegramObject):
 
         Raises:
             RuntimeError: If :attr:`file_path` is not set.
+            ValueError: If :paramref:`parallel_ranges` is smaller than ``1``.
 
         """
         if not self.file_path:
             raise RuntimeError("No `file_path` available for this file. Can not download.")
+        if parallel_ranges < 1:
+            raise ValueError("`parallel_ranges` must be at least 1.")
 
         local_file = is_local_file(self.file_path)
         url = None if local_file else self._get_encoded_url()
@@ -201,8 +231,17 @@ class File(TelegramObject):
             return path
 
         if custom_path is not None and local_file:
-            shutil.copyfile(self.file_path, str(custom_path))
-            return Path(custom_path)
+            path = Path(custom_path)
+            if hardlink:
+                try:
+                    os.link(self.file_path, path)
+                except OSError:
+                    pass
+                else:
+                    return path
+            # copyfile uses zero-copy system calls like os.sendfile where available
+            shutil.copyfile(self.file_path, path)
+            return path
 
         if custom_path:
             filename = Path(custom_path)
@@ -211,18 +250,77 @@ class File(TelegramObject):
         else:
             filename = Path(Path(self.file_path).name)
 
-        buf = await self.get_bot().request.retrieve(
-            url,
-            read_timeout=read_timeout,
-            write_timeout=write_timeout,
-            connect_timeout=connect_timeout,
-            pool_timeout=pool_timeout,
-        )
+        timeouts = {
+            "read_timeout": read_timeout,
+            "write_timeout": write_timeout,
+            "connect_timeout": connect_timeout,
+            "pool_timeout": pool_timeout,
+        }
         if self._credentials:
-            buf = self._prepare_decrypt(buf)
-        filename.write_bytes(buf)
+            buf = await self.get_bot().request.retrieve(url, **timeouts)
+            filename.write_bytes(self._prepare_decrypt(buf))
+            return filename
+
+        part_path = filename.with_name(f"{filename.name}.{self.file_unique_id}.part")
+        if parallel_ranges > 1 and self.file_size:
+            await self._download_ranges(url, part_path, parallel_ranges, timeouts)
+        else:
+            await self._download_stream(url, part_path, timeouts)
+        part_path.replace(filename)
         return filename
 
+    async def _download_stream(self, url: str, path: Path, timeouts: dict[str, Any]) -> None:
+        """Downloads the file to ``path`` in chunks. If ``path`` already contains the start of the
+        file, only the missing part is downloaded.
+        """
+        offset = path.stat().st_size if self.file_size and path.is_file() else 0
+        if self.file_size and offset >= self.file_size:
+            if offset == self.file_size:
+                return
+            offset = 0
+
+        stream = self.get_bot().request.retrieve_stream(url, offset=offset, **timeouts)
+        try:
+            with path.open("ab" if offset else "wb") as file:
+                async for chunk in stream:
+                    file.write(chunk)
+        finally:
+            await stream.aclose()
+
+    async def _download_ranges(
+        self, url: str, path: Path, parallel_ranges: int, timeouts: dict[str, Any]
+    ) -> None:
+        """Downloads the file to ``path`` by fetching ``parallel_ranges`` ranges concurrently."""
+        size: int = self.file_size  # type: ignore[assignment]
+        range_size = -(-size // parallel_ranges)
+        with path.open("wb") as file:
+            file.truncate(size)
+
+        async def download_range(offset: int) -> None:
+            stream = self.get_bot().request.retrieve_stream(
+                url, offset=offset, length=min(range_size, size - offset), **timeouts
+            )
+            try:
+                with path.open("r+b") as file:
+                    file.seek(offset)
+                    async for chunk in stream:
+                        file.write(chunk)
+            finally:
+                await stream.aclose()
+
+        tasks = [
+            asyncio.create_task(download_range(offset)) for offset in range(0, size, range_size)
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            # A file with gaps must not be mistaken for the start of the file when resuming
+            path.unlink(missing_ok=True)
+            raise
+
     async def download_to_memory(
         self,
         out: BinaryIO,
@@ -250,6 +348,12 @@ class File(TelegramObject):
             a :attr:`file_path` could never be downloaded, as this attribute is mandatory for that
             operation.
 
+        .. versionchanged:: NEXT.VERSION
+            If :attr:`file_path` is the path of a local file, the file is no longer loaded into
+            memory completely. Instead, it is copied to :paramref:`out` by the kernel, if
+            :paramref:`out` is backed by a file descriptor, or in chunks otherwise. This does not
+            apply to encrypted files.
+
         Args:
             out (:obj:`io.BufferedIOBase`): A file-like object. Must be opened for writing in
                 binary mode.
@@ -275,6 +379,10 @@ class File(TelegramObject):
             raise RuntimeError("No `file_path` available for this file. Can not download.")
 
         local_file = is_local_file(self.file_path)
+        if local_file and not self._credentials:
+            copy_local_file(self.file_path, out)
+            return
+
         url = None if local_file else self._get_encoded_url()
         path = Path(self.file_path) if local_file else None
         if local_file:
@@ -307,6 +415,11 @@ class File(TelegramObject):
             a :attr:`file_path` could never be downloaded, as this attribute is mandatory for that
             operation.
 
+        .. versionchanged:: NEXT.VERSION
+            If :attr:`file_path` is the path of a local file, the file is memory mapped and
+            copied to :paramref:`buf` directly, instead of being read into an intermediate
+            :obj:`bytes` object first. This does not apply to encrypted files.
+
         Args:
             buf (:obj:`bytearray`, optional): Extend the given bytearray with the downloaded data.
 
@@ -347,6 +460,9 @@ class File(TelegramObject):
             buf = bytearray()
 
         if is_local_file(self.file_path):
+            if not self._credentials:
+                read_local_file_into(self.file_path, buf)
+                return buf
             bytes_data = Path(self.file_path).read_bytes()
         else:
             bytes_data = await self.get_bot().request.retrieve(
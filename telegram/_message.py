@@ -21,9 +21,10 @@
 
 import datetime
 import re
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from html import escape
-from typing import TYPE_CHECKING, Optional, TypedDict, Union
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Optional, TypedDict, Union
 
 from telegram._chat import Chat
 from telegram._chatbackground import ChatBackground
@@ -63,7 +64,7 @@ from telegram._proximityalerttriggered import ProximityAlertTriggered
 from telegram._reply import ReplyParameters
 from telegram._shared import ChatShared, UsersShared
 from telegram._story import Story
-from telegram._telegramobject import TelegramObject
+from telegram._telegramobject import IdAttrs, TelegramObject
 from telegram._user import User
 from telegram._utils.argumentparsing import parse_sequence_arg
 from telegram._utils.datetime import extract_tzinfo_from_defaults, from_timestamp
@@ -154,6 +155,8 @@ class MaybeInaccessibleMessage(TelegramObject):
 
     __slots__ = ("chat", "date", "message_id")
 
+    _id_attrs = IdAttrs("message_id", "chat")
+
     def __init__(
         self,
         chat: Chat,
@@ -167,8 +170,6 @@ class MaybeInaccessibleMessage(TelegramObject):
         self.message_id: int = message_id
         self.date: datetime.datetime = date
 
-        self._id_attrs = (self.message_id, self.chat)
-
         self._freeze()
 
     @property
@@ -937,6 +938,7 @@ class Message(MaybeInaccessibleMessage):
     # fmt: on
     __slots__ = (
         "_effective_attachment",
+        "_lazy_data",
         "animation",
         "audio",
         "author_signature",
@@ -1021,6 +1023,76 @@ class Message(MaybeInaccessibleMessage):
         "write_access_allowed",
     )
 
+    # Functions that decode the nested objects of a message in `de_json`. The ones that can only be
+    # imported at runtime due to cyclic imports are added by `_get_decoders`.
+    _DECODERS: ClassVar[Mapping[str, Callable[[Any, Optional["Bot"]], object]]] = (
+        MappingProxyType(
+            {
+                "sender_chat": Chat.de_json,
+                "entities": MessageEntity.de_list,
+                "caption_entities": MessageEntity.de_list,
+                # reply_to_message is always accessible, but `Message` can't reference itself here
+                "reply_to_message": MaybeInaccessibleMessage.de_json,
+                "audio": Audio.de_json,
+                "document": Document.de_json,
+                "animation": Animation.de_json,
+                "game": Game.de_json,
+                "photo": PhotoSize.de_list,
+                "sticker": Sticker.de_json,
+                "story": Story.de_json,
+                "video": Video.de_json,
+                "voice": Voice.de_json,
+                "video_note": VideoNote.de_json,
+                "contact": Contact.de_json,
+                "location": Location.de_json,
+                "venue": Venue.de_json,
+                "new_chat_members": User.de_list,
+                "left_chat_member": User.de_json,
+                "new_chat_photo": PhotoSize.de_list,
+                "message_auto_delete_timer_changed": MessageAutoDeleteTimerChanged.de_json,
+                "pinned_message": MaybeInaccessibleMessage.de_json,
+                "invoice": Invoice.de_json,
+                "successful_payment": SuccessfulPayment.de_json,
+                "passport_data": PassportData.de_json,
+                "poll": Poll.de_json,
+                "dice": Dice.de_json,
+                "via_bot": User.de_json,
+                "proximity_alert_triggered": ProximityAlertTriggered.de_json,
+                "reply_markup": InlineKeyboardMarkup.de_json,
+                "video_chat_scheduled": VideoChatScheduled.de_json,
+                "video_chat_started": VideoChatStarted.de_json,
+                "video_chat_ended": VideoChatEnded.de_json,
+                "video_chat_participants_invited": VideoChatParticipantsInvited.de_json,
+                "web_app_data": WebAppData.de_json,
+                "forum_topic_closed": ForumTopicClosed.de_json,
+                "forum_topic_created": ForumTopicCreated.de_json,
+                "forum_topic_reopened": ForumTopicReopened.de_json,
+                "forum_topic_edited": ForumTopicEdited.de_json,
+                "general_forum_topic_hidden": GeneralForumTopicHidden.de_json,
+                "general_forum_topic_unhidden": GeneralForumTopicUnhidden.de_json,
+                "write_access_allowed": WriteAccessAllowed.de_json,
+                "users_shared": UsersShared.de_json,
+                "chat_shared": ChatShared.de_json,
+                "chat_background_set": ChatBackground.de_json,
+                "paid_media": PaidMediaInfo.de_json,
+                "refunded_payment": RefundedPayment.de_json,
+                "link_preview_options": LinkPreviewOptions.de_json,
+                "reply_to_story": Story.de_json,
+                "boost_added": ChatBoostAdded.de_json,
+                "sender_business_bot": User.de_json,
+            }
+        )
+    )
+    # Nested objects that are only decoded on first access when the message is part of an update
+    # decoded via `Update._de_json_lazy`. Required attributes (`chat`) and attributes that are not
+    # Telegram objects (e.g. `edit_date`) are always decoded right away. `from` is stored as
+    # `from_user` before the lazy attributes are split off.
+    _LAZY_DECODERS = MappingProxyType({**_DECODERS, "from_user": User.de_json})
+    # `_DECODERS` completed by `_get_decoders`
+    __ALL_DECODERS: ClassVar[Optional[Mapping[str, Callable[[Any, Optional["Bot"]], object]]]] = (
+        None
+    )
+
     def __init__(
         self,
         message_id: int,
@@ -1213,8 +1285,7 @@ class Message(MaybeInaccessibleMessage):
             self.refunded_payment: Optional[RefundedPayment] = refunded_payment
 
             self._effective_attachment = DEFAULT_NONE
-
-            self._id_attrs = (self.message_id, self.chat)
+            self._lazy_data: Optional[JSONDict] = None
 
     @property
     def chat_id(self) -> int:
@@ -1251,83 +1322,13 @@ class Message(MaybeInaccessibleMessage):
         return None
 
     @classmethod
-    def de_json(cls, data: Optional[JSONDict], bot: Optional["Bot"] = None) -> Optional["Message"]:
-        """See :meth:`telegram.TelegramObject.de_json`."""
-        data = cls._parse_data(data)
-
-        if not data:
-            return None
-
-        # Get the local timezone from the bot if it has defaults
-        loc_tzinfo = extract_tzinfo_from_defaults(bot)
-
-        data["from_user"] = User.de_json(data.pop("from", None), bot)
-        data["sender_chat"] = Chat.de_json(data.get("sender_chat"), bot)
-        data["entities"] = MessageEntity.de_list(data.get("entities"), bot)
-        data["caption_entities"] = MessageEntity.de_list(data.get("caption_entities"), bot)
-        data["reply_to_message"] = Message.de_json(data.get("reply_to_message"), bot)
-        data["edit_date"] = from_timestamp(data.get("edit_date"), tzinfo=loc_tzinfo)
-        data["audio"] = Audio.de_json(data.get("audio"), bot)
-        data["document"] = Document.de_json(data.get("document"), bot)
-        data["animation"] = Animation.de_json(data.get("animation"), bot)
-        data["game"] = Game.de_json(data.get("game"), bot)
-        data["photo"] = PhotoSize.de_list(data.get("photo"), bot)
-        data["sticker"] = Sticker.de_json(data.get("sticker"), bot)
-        data["story"] = Story.de_json(data.get("story"), bot)
-        data["video"] = Video.de_json(data.get("video"), bot)
-        data["voice"] = Voice.de_json(data.get("voice"), bot)
-        data["video_note"] = VideoNote.de_json(data.get("video_note"), bot)
-        data["contact"] = Contact.de_json(data.get("contact"), bot)
-        data["location"] = Location.de_json(data.get("location"), bot)
-        data["venue"] = Venue.de_json(data.get("venue"), bot)
-        data["new_chat_members"] = User.de_list(data.get("new_chat_members"), bot)
-        data["left_chat_member"] = User.de_json(data.get("left_chat_member"), bot)
-        data["new_chat_photo"] = PhotoSize.de_list(data.get("new_chat_photo"), bot)
-        data["message_auto_delete_timer_changed"] = MessageAutoDeleteTimerChanged.de_json(
-            data.get("message_auto_delete_timer_changed"), bot
-        )
-        data["pinned_message"] = MaybeInaccessibleMessage.de_json(data.get("pinned_message"), bot)
-        data["invoice"] = Invoice.de_json(data.get("invoice"), bot)
-        data["successful_payment"] = SuccessfulPayment.de_json(data.get("successful_payment"), bot)
-        data["passport_data"] = PassportData.de_json(data.get("passport_data"), bot)
-        data["poll"] = Poll.de_json(data.get("poll"), bot)
-        data["dice"] = Dice.de_json(data.get("dice"), bot)
-        data["via_bot"] = User.de_json(data.get("via_bot"), bot)
-        data["proximity_alert_triggered"] = ProximityAlertTriggered.de_json(
-            data.get("proximity_alert_triggered"), bot
-        )
-        data["reply_markup"] = InlineKeyboardMarkup.de_json(data.get("reply_markup"), bot)
-        data["video_chat_scheduled"] = VideoChatScheduled.de_json(
-            data.get("video_chat_scheduled"), bot
-        )
-        data["video_chat_started"] = VideoChatStarted.de_json(data.get("video_chat_started"), bot)
-        data["video_chat_ended"] = VideoChatEnded.de_json(data.get("video_chat_ended"), bot)
-        data["video_chat_participants_invited"] = VideoChatParticipantsInvited.de_json(
-            data.get("video_chat_participants_invited"), bot
-        )
-        data["web_app_data"] = WebAppData.de_json(data.get("web_app_data"), bot)
-        data["forum_topic_closed"] = ForumTopicClosed.de_json(data.get("forum_topic_closed"), bot)
-        data["forum_topic_created"] = ForumTopicCreated.de_json(
-            data.get("forum_topic_created"), bot
-        )
-        data["forum_topic_reopened"] = ForumTopicReopened.de_json(
-            data.get("forum_topic_reopened"), bot
-        )
-        data["forum_topic_edited"] = ForumTopicEdited.de_json(data.get("forum_topic_edited"), bot)
-        data["general_forum_topic_hidden"] = GeneralForumTopicHidden.de_json(
-            data.get("general_forum_topic_hidden"), bot
-        )
-        data["general_forum_topic_unhidden"] = GeneralForumTopicUnhidden.de_json(
-            data.get("general_forum_topic_unhidden"), bot
-        )
-        data["write_access_allowed"] = WriteAccessAllowed.de_json(
-            data.get("write_access_allowed"), bot
-        )
-        data["users_shared"] = UsersShared.de_json(data.get("users_shared"), bot)
-        data["chat_shared"] = ChatShared.de_json(data.get("chat_shared"), bot)
-        data["chat_background_set"] = ChatBackground.de_json(data.get("chat_background_set"), bot)
-        data["paid_media"] = PaidMediaInfo.de_json(data.get("paid_media"), bot)
-        data["refunded_payment"] = RefundedPayment.de_json(data.get("refunded_payment"), bot)
+    def _get_decoders(cls) -> Mapping[str, Callable[[Any, Optional["Bot"]], object]]:
+        """Returns the functions that decode the nested objects of a message, mapped by their
+        keys in the JSON data, i.e. :attr:`_DECODERS` and the decoders of the classes that can only
+        be imported at runtime due to cyclic imports. The mapping is built on first use.
+        """
+        if Message.__ALL_DECODERS is not None:
+            return Message.__ALL_DECODERS
 
         # Unfortunately, this needs to be here due to cyclic imports
         from telegram._giveaway import (  # pylint: disable=import-outside-toplevel
@@ -1344,19 +1345,35 @@ class Message(MaybeInaccessibleMessage):
             TextQuote,
         )
 
-        data["giveaway"] = Giveaway.de_json(data.get("giveaway"), bot)
-        data["giveaway_completed"] = GiveawayCompleted.de_json(data.get("giveaway_completed"), bot)
-        data["giveaway_created"] = GiveawayCreated.de_json(data.get("giveaway_created"), bot)
-        data["giveaway_winners"] = GiveawayWinners.de_json(data.get("giveaway_winners"), bot)
-        data["link_preview_options"] = LinkPreviewOptions.de_json(
-            data.get("link_preview_options"), bot
+        Message.__ALL_DECODERS = MappingProxyType(
+            {
+                **Message._DECODERS,
+                "giveaway": Giveaway.de_json,
+                "giveaway_completed": GiveawayCompleted.de_json,
+                "giveaway_created": GiveawayCreated.de_json,
+                "giveaway_winners": GiveawayWinners.de_json,
+                "external_reply": ExternalReplyInfo.de_json,
+                "quote": TextQuote.de_json,
+                "forward_origin": MessageOrigin.de_json,
+            }
         )
-        data["external_reply"] = ExternalReplyInfo.de_json(data.get("external_reply"), bot)
-        data["quote"] = TextQuote.de_json(data.get("quote"), bot)
-        data["forward_origin"] = MessageOrigin.de_json(data.get("forward_origin"), bot)
-        data["reply_to_story"] = Story.de_json(data.get("reply_to_story"), bot)
-        data["boost_added"] = ChatBoostAdded.de_json(data.get("boost_added"), bot)
-        data["sender_business_bot"] = User.de_json(data.get("sender_business_bot"), bot)
+        return Message.__ALL_DECODERS
+
+    @classmethod
+    def de_json(cls, data: Optional[JSONDict], bot: Optional["Bot"] = None) -> Optional["Message"]:
+        """See :meth:`telegram.TelegramObject.de_json`."""
+        data = cls._parse_data(data)
+
+        if not data:
+            return None
+
+        if "from" in data:
+            data["from_user"] = User.de_json(data.pop("from"), bot)
+        if "edit_date" in data:
+            # Get the local timezone from the bot if it has defaults
+            loc_tzinfo = extract_tzinfo_from_defaults(bot)
+            data["edit_date"] = from_timestamp(data["edit_date"], tzinfo=loc_tzinfo)
+        cls._decode_fields(data, cls._get_decoders(), bot)
 
         api_kwargs = {}
         # This is a deprecated field that TG still returns for backwards compatibility
@@ -24,7 +24,7 @@ from collections.abc import Sequence
 from typing import TYPE_CHECKING, Final, Optional, Union
 
 from telegram import constants
-from telegram._telegramobject import TelegramObject
+from telegram._telegramobject import IdAttrs, TelegramObject
 from telegram._user import User
 from telegram._utils import enum
 from telegram._utils.strings import TextEncoding
@@ -109,6 +109,8 @@ class MessageEntity(TelegramObject):
 
     __slots__ = ("custom_emoji_id", "language", "length", "offset", "type", "url", "user")
 
+    _id_attrs = IdAttrs("type", "offset", "length")
+
     def __init__(
         self,
         type: str,  # pylint: disable=redefined-builtin
@@ -132,8 +134,6 @@ class MessageEntity(TelegramObject):
         self.language: Optional[str] = language
         self.custom_emoji_id: Optional[str] = custom_emoji_id
 
-        self._id_attrs = (self.type, self.offset, self.length)
-
         self._freeze()
 
     @classmethod
@@ -25,8 +25,9 @@ from collections.abc import Iterator, Mapping, Sized
 from contextlib import contextmanager
 from copy import deepcopy
 from itertools import chain
-from types import MappingProxyType
-from typing import TYPE_CHECKING, Any, ClassVar, Optional, TypeVar, Union, cast
+from operator import attrgetter
+from types import MappingProxyType, MemberDescriptorType
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Optional, TypeVar, Union, cast, overload
 
 from telegram._utils.datetime import to_timestamp
 from telegram._utils.defaultvalue import DefaultValue
@@ -38,6 +39,95 @@ if TYPE_CHECKING:
 
 Tele_co = TypeVar("Tele_co", bound="TelegramObject", covariant=True)
 
+# Attribute values of these types are included in `TelegramObject.to_dict` as they are
+_JSON_SCALAR_TYPES: frozenset[type] = frozenset((str, int, float, bool))
+
+
+def _item_to_dict(item: object, recursive: bool) -> object:
+    """Converts an item of a sequence attribute for `TelegramObject.to_dict`."""
+    if type(item) in _JSON_SCALAR_TYPES:
+        return item
+    if hasattr(item, "to_dict"):
+        return item.to_dict(recursive=recursive)
+    # This branch is useful for e.g. tuple[tuple[PhotoSize|KeyboardButton]]
+    if isinstance(item, (tuple, list)):
+        return [i.to_dict(recursive=recursive) if hasattr(i, "to_dict") else i for i in item]
+    # if it's not a TGObject, just return it. E.g. [TGObject, 2]
+    return item
+
+
+# Shared by all objects without api_kwargs, which is the vast majority. Note that this must never
+# be exposed as a plain dict, as that would allow modifying the api_kwargs of all these objects.
+_EMPTY_API_KWARGS: Mapping[str, Any] = MappingProxyType({})
+_object_setattr = object.__setattr__
+
+
+class IdAttrs:
+    """Can be set as class attribute ``_id_attrs`` of subclasses of :class:`TelegramObject`
+    instead of setting ``self._id_attrs`` in ``__init__``. The tuple is then built from the named
+    attributes on access instead of being stored on each instance, which saves memory for classes
+    of which many instances are kept around. For internal use only.
+
+    Values assigned to ``_id_attrs`` of instances are stored in the ``_id_attrs`` slot of
+    :class:`TelegramObject` and returned instead of the built tuple, e.g. if a subclass defined by
+    the user sets ``self._id_attrs`` to compare different attributes. An empty tuple, as set by
+    :meth:`TelegramObject.__init__`, and the tuple that would be built anyway, as set when
+    unpickling or copying objects, are not kept.
+
+    Args:
+        *names (:obj:`str`): The names of the attributes that make up the tuple.
+    """
+
+    __slots__ = ("_getter", "_single", "_slot", "names")
+
+    def __init__(self, *names: str):
+        self.names: tuple[str, ...] = names
+        # attrgetter returns the value itself instead of a tuple for a single name
+        self._getter: Callable[[object], Any] = attrgetter(*names)
+        self._single: bool = len(names) == 1
+        self._slot: Any = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        # The slot that this descriptor shadows in `owner`
+        self._slot = next(
+            attr
+            for base in owner.__mro__
+            if isinstance(attr := base.__dict__.get(name), MemberDescriptorType)
+        )
+
+    def _build(self, obj: object) -> tuple[object, ...]:
+        if self._single:
+            return (self._getter(obj),)
+        return self._getter(obj)  # type: ignore[no-any-return]
+
+    @overload
+    def __get__(self, obj: None, objtype: Optional[type] = None) -> "IdAttrs": ...
+
+    @overload
+    def __get__(self, obj: object, objtype: Optional[type] = None) -> tuple[object, ...]: ...
+
+    def __get__(
+        self, obj: Optional[object], objtype: Optional[type] = None
+    ) -> Union["IdAttrs", tuple[object, ...]]:
+        if obj is None:
+            return self
+        if value := self._slot.__get__(obj):
+            return value  # type: ignore[no-any-return]
+        # Not using _build, as this is called on every comparison and hashing
+        if self._single:
+            return (self._getter(obj),)
+        return self._getter(obj)  # type: ignore[no-any-return]
+
+    def __set__(self, obj: object, value: tuple[object, ...]) -> None:
+        if value:
+            try:
+                if value == self._build(obj):
+                    value = ()
+            except AttributeError:
+                # The attributes are not set yet
+                pass
+        self._slot.__set__(obj, value)
+
 
 class TelegramObject:
     """Base class for most Telegram objects.
@@ -78,24 +168,47 @@ class TelegramObject:
 
     __slots__ = ("_bot", "_frozen", "_id_attrs", "api_kwargs")
 
-    # Used to cache the names of the parameters of the __init__ method of the class
+    # Used to cache the names of the parameters of the __init__ method of the class. `None` means
+    # that __init__ accepts arbitrary keyword arguments.
     # Must be a private attribute to avoid name clashes between subclasses
-    __INIT_PARAMS: ClassVar[set[str]] = set()
+    __INIT_PARAMS: ClassVar[Optional[frozenset[str]]] = frozenset()
     # Used to check if __INIT_PARAMS has been set for the current class. Unfortunately, we can't
     # just check if `__INIT_PARAMS is None`, since subclasses use the parent class' __INIT_PARAMS
     # unless it's overridden
     __INIT_PARAMS_CHECK: Optional[type["TelegramObject"]] = None
 
+    # Used to cache the names of the attributes of the class, see `_get_attrs_names`. As for
+    # __INIT_PARAMS, __ATTRS_CHECK is used to check if the cache was filled for the current class
+    __ALL_ATTRS: ClassVar[tuple[str, ...]] = ()
+    __PUBLIC_ATTRS: ClassVar[tuple[str, ...]] = ()
+    __HAS_DICT: ClassVar[bool] = False
+    __ATTRS_CHECK: Optional[type["TelegramObject"]] = None
+
+    # Maps names of attributes that may be decoded on first access to the callable that decodes
+    # them. Subclasses that set this must also have a `_lazy_data` slot. See `_de_json_lazy`.
+    _LAZY_DECODERS: ClassVar[Mapping[str, Callable[[Any, Optional["Bot"]], object]]] = (
+        MappingProxyType({})
+    )
+    _lazy_data: Optional[JSONDict]
+
     def __init__(self, *, api_kwargs: Optional[JSONDict] = None) -> None:
         # Setting _frozen to `False` here means that classes without arguments still need to
         # implement __init__. However, with `True` would mean increased usage of
         # `with self._unfrozen()` in the `__init__` of subclasses and we have fewer empty
         # classes than classes with arguments.
-        self._frozen: bool = False
-        self._id_attrs: tuple[object, ...] = ()
-        self._bot: Optional[Bot] = None
+        # The attributes are assigned via object.__setattr__, which skips the immutability check
+        # of __setattr__. This is called for every object, so the saved calls add up.
+        self._frozen: bool
+        self._id_attrs: tuple[object, ...]
+        self._bot: Optional[Bot]
+        self.api_kwargs: Mapping[str, Any]
+        _object_setattr(self, "_frozen", False)
+        _object_setattr(self, "_id_attrs", ())
+        _object_setattr(self, "_bot", None)
         # We don't do anything with api_kwargs here - see docstring of _apply_api_kwargs
-        self.api_kwargs: Mapping[str, Any] = MappingProxyType(api_kwargs or {})
+        _object_setattr(
+            self, "api_kwargs", MappingProxyType(api_kwargs) if api_kwargs else _EMPTY_API_KWARGS
+        )
 
     def __eq__(self, other: object) -> bool:
         """Compares this object with :paramref:`other` in terms of equality.
@@ -119,19 +232,22 @@ class TelegramObject:
 
         """
         if isinstance(other, self.__class__):
-            if not self._id_attrs:
+            # Getting _id_attrs may build a new tuple, so we do that only once per object
+            id_attrs = self._id_attrs
+            if not id_attrs:
                 warn(
                     f"Objects of type {self.__class__.__name__} can not be meaningfully tested for"
                     " equivalence.",
                     stacklevel=2,
                 )
-            if not other._id_attrs:
+            other_id_attrs = id_attrs if other is self else other._id_attrs
+            if not other_id_attrs:
                 warn(
                     f"Objects of type {other.__class__.__name__} can not be meaningfully tested"
                     " for equivalence.",
                     stacklevel=2,
                 )
-            return self._id_attrs == other._id_attrs
+            return other is self or id_attrs == other_id_attrs
         return super().__eq__(other)
 
     def __hash__(self) -> int:
@@ -141,8 +257,8 @@ class TelegramObject:
         Returns:
             :obj:`int`
         """
-        if self._id_attrs:
-            return hash((self.__class__, self._id_attrs))
+        if id_attrs := self._id_attrs:
+            return hash((self.__class__, id_attrs))
         return super().__hash__()
 
     def __setattr__(self, key: str, value: object) -> None:
@@ -152,13 +268,13 @@ class TelegramObject:
             :exc:`AttributeError`
         """
         # protected attributes can always be set for convenient internal use
-        if key[0] == "_" or not getattr(self, "_frozen", True):
-            super().__setattr__(key, value)
-            return
-
-        raise AttributeError(
-            f"Attribute `{key}` of class `{self.__class__.__name__}` can't be set!"
-        )
+        if key[0] != "_" and getattr(self, "_frozen", True):
+            raise AttributeError(
+                f"Attribute `{key}` of class `{self.__class__.__name__}` can't be set!"
+            )
+        # This is called for every attribute that __init__ assigns. As TelegramObject directly
+        # subclasses object, calling object.__setattr__ is equivalent to and faster than super()
+        _object_setattr(self, key, value)
 
     def __delattr__(self, key: str) -> None:
         """Overrides :meth:`object.__delattr__` to prevent the deletion of attributes.
@@ -167,13 +283,35 @@ class TelegramObject:
             :exc:`AttributeError`
         """
         # protected attributes can always be set for convenient internal use
-        if key[0] == "_" or not getattr(self, "_frozen", True):
-            super().__delattr__(key)
-            return
-
-        raise AttributeError(
-            f"Attribute `{key}` of class `{self.__class__.__name__}` can't be deleted!"
-        )
+        if key[0] != "_" and getattr(self, "_frozen", True):
+            raise AttributeError(
+                f"Attribute `{key}` of class `{self.__class__.__name__}` can't be deleted!"
+            )
+        object.__delattr__(self, key)
+
+    # Defined only at runtime. Otherwise, type checkers would accept any attribute name for all
+    # subclasses
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, key: str) -> Any:
+            """Only called if the regular attribute lookup fails. This is the case for
+            attributes that were left undecoded by :meth:`_de_json_lazy`, which are decoded and
+            stored on first access.
+
+            Raises:
+                :exc:`AttributeError`
+            """
+            if key in self._LAZY_DECODERS:
+                # `_lazy_data` is not in `_LAZY_DECODERS`, so this can't recurse
+                pending = self._lazy_data
+                if pending and key in pending:
+                    value = self._LAZY_DECODERS[key](pending[key], self._bot)
+                    # bypass the immutability check - the value is set exactly once
+                    object.__setattr__(self, key, value)
+                    del pending[key]
+                    return value
+
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{key}'")
 
     def __repr__(self) -> str:
         """Gives a string representation of this object in the form
@@ -318,7 +456,7 @@ class TelegramObject:
         # and then set the rest as MappingProxyType attribute. Converting to MappingProxyType
         # is necessary, since __getstate__ converts it to a dict as MPT is not pickable.
         self._apply_api_kwargs(api_kwargs)
-        self.api_kwargs = MappingProxyType(api_kwargs)
+        self.api_kwargs = MappingProxyType(api_kwargs) if api_kwargs else _EMPTY_API_KWARGS
 
         # Apply freezing if necessary
         # we .get(…) the setting for backwards compatibility with objects that were pickled
@@ -357,7 +495,15 @@ class TelegramObject:
             if k == "api_kwargs":
                 # Need to copy api_kwargs manually, since it's a MappingProxyType is not
                 # pickable and deepcopy uses the pickle interface
-                setattr(result, k, MappingProxyType(deepcopy(dict(self.api_kwargs), memodict)))
+                setattr(
+                    result,
+                    k,
+                    (
+                        MappingProxyType(deepcopy(dict(self.api_kwargs), memodict))
+                        if self.api_kwargs
+                        else _EMPTY_API_KWARGS
+                    ),
+                )
                 continue
 
             try:
@@ -384,6 +530,20 @@ class TelegramObject:
         """
         return None if data is None else data.copy()
 
+    @staticmethod
+    def _decode_fields(
+        data: JSONDict,
+        decoders: Mapping[str, Callable[[Any, Optional["Bot"]], object]],
+        bot: Optional["Bot"],
+    ) -> None:
+        """Can be called by subclasses that override de_json to decode the values of ``data``
+        for which ``decoders`` has an entry. In contrast to decoding each attribute explicitly,
+        only the keys that are present in ``data`` are processed. *Edits* ``data`` *in place!*
+        """
+        for key, value in data.items():
+            if (decoder := decoders.get(key)) is not None:
+                data[key] = decoder(value, bot)
+
     @classmethod
     def _de_json(
         cls: type[Tele_co],
@@ -394,22 +554,25 @@ class TelegramObject:
         if data is None:
             return None
 
-        # try-except is significantly faster in case we already have a correct argument set
-        try:
-            obj = cls(**data, api_kwargs=api_kwargs)
-        except TypeError as exc:
-            if "__init__() got an unexpected keyword argument" not in str(exc):
-                raise
-
-            if cls.__INIT_PARAMS_CHECK is not cls:
-                signature = inspect.signature(cls)
-                cls.__INIT_PARAMS = set(signature.parameters.keys())
-                cls.__INIT_PARAMS_CHECK = cls
+        if cls.__INIT_PARAMS_CHECK is not cls:
+            parameters = inspect.signature(cls).parameters
+            cls.__INIT_PARAMS = (
+                None
+                if any(param.kind is param.VAR_KEYWORD for param in parameters.values())
+                else frozenset(parameters)
+            )
+            cls.__INIT_PARAMS_CHECK = cls
 
+        init_params = cls.__INIT_PARAMS
+        if init_params is None or data.keys() <= init_params:
+            obj = cls(**data, api_kwargs=api_kwargs)
+        else:
+            # Keys that are unknown to this class, e.g. because they were added to the Bot API
+            # after this version of the library was released, are moved to api_kwargs
             api_kwargs = api_kwargs or {}
             existing_kwargs: JSONDict = {}
             for key, value in data.items():
-                (existing_kwargs if key in cls.__INIT_PARAMS else api_kwargs)[key] = value
+                (existing_kwargs if key in init_params else api_kwargs)[key] = value
 
             obj = cls(api_kwargs=api_kwargs, **existing_kwargs)
 
@@ -436,6 +599,40 @@ class TelegramObject:
         """
         return cls._de_json(data=data, bot=bot)
 
+    @classmethod
+    def _de_json_lazy(
+        cls: type[Tele_co], data: Optional[JSONDict], bot: Optional["Bot"] = None
+    ) -> Optional[Tele_co]:
+        """Like :meth:`de_json`, but the attributes listed in ``_LAZY_DECODERS`` are only
+        decoded on first access. For classes without ``_LAZY_DECODERS``, this is equivalent to
+        :meth:`de_json`. For internal use only.
+        """
+        if not data or not cls._LAZY_DECODERS:
+            return cls.de_json(data=data, bot=bot)
+
+        eager: JSONDict = {}
+        pending: JSONDict = {}
+        for key, value in data.items():
+            attr = "from_user" if key == "from" else key
+            if value is not None and attr in cls._LAZY_DECODERS:
+                pending[attr] = value
+            else:
+                eager[key] = value
+
+        obj = cls.de_json(data=eager, bot=bot)
+        if obj is not None and pending:
+            for attr in pending:
+                # Unset the slot so that the first access is routed through __getattr__
+                object.__delattr__(obj, attr)
+            obj._lazy_data = pending
+        return obj
+
+    def _decode_lazy_data(self) -> None:
+        """Decodes all attributes that are still pending from :meth:`_de_json_lazy`."""
+        for key in list(self._lazy_data):
+            getattr(self, key)
+        self._lazy_data = None
+
     @classmethod
     def de_list(
         cls: type[Tele_co], data: Optional[list[JSONDict]], bot: Optional["Bot"] = None
@@ -477,10 +674,10 @@ class TelegramObject:
         self._freeze()
 
     def _freeze(self) -> None:
-        self._frozen = True
+        _object_setattr(self, "_frozen", True)
 
     def _unfreeze(self) -> None:
-        self._frozen = False
+        _object_setattr(self, "_frozen", False)
 
     def _apply_api_kwargs(self, api_kwargs: JSONDict) -> None:
         """Loops through the api kwargs and for every key that exists as attribute of the
@@ -518,18 +715,33 @@ class TelegramObject:
         Returns:
             Iterator[:obj:`str`]: An iterator over the names of the attributes of this object.
         """
-        # We want to get all attributes for the class, using self.__slots__ only includes the
-        # attributes used by that class itself, and not its superclass(es). Hence, we get its MRO
-        # and then get their attributes. The `[:-1]` slice excludes the `object` class
-        all_slots = (s for c in self.__class__.__mro__[:-1] for s in c.__slots__)  # type: ignore
-        # chain the class's slots with the user defined subclass __dict__ (class has no slots)
-        all_attrs = (
-            chain(all_slots, self.__dict__.keys()) if hasattr(self, "__dict__") else all_slots
-        )
+        # Make sure that lazily decoded attributes are available before listing them. Otherwise,
+        # the pending raw data would be e.g. pickled along with the decoded values
+        if self._LAZY_DECODERS and getattr(self, "_lazy_data", None):
+            self._decode_lazy_data()
+
+        cls = self.__class__
+        if cls.__ATTRS_CHECK is not cls:
+            # The slots of a class can't change, so we only have to collect them once per class.
+            # We want to get all attributes for the class, using self.__slots__ only includes the
+            # attributes used by that class itself, and not its superclass(es). Hence, we get its
+            # MRO and then get their attributes. The `[:-1]` slice excludes the `object` class
+            cls.__ALL_ATTRS = tuple(
+                s for c in cls.__mro__[:-1] for s in c.__slots__  # type: ignore[attr-defined]
+            )
+            cls.__PUBLIC_ATTRS = tuple(s for s in cls.__ALL_ATTRS if not s.startswith("_"))
+            # Subclasses defined by users may not have slots
+            cls.__HAS_DICT = hasattr(self, "__dict__")
+            cls.__ATTRS_CHECK = cls
+
+        all_slots = cls.__ALL_ATTRS if include_private else cls.__PUBLIC_ATTRS
+        if not cls.__HAS_DICT:
+            return iter(all_slots)
 
+        # chain the class's slots with the user defined subclass __dict__ (class has no slots)
         if include_private:
-            return all_attrs
-        return (attr for attr in all_attrs if not attr.startswith("_"))
+            return chain(all_slots, self.__dict__.keys())
+        return chain(all_slots, (attr for attr in self.__dict__ if not attr.startswith("_")))
 
     def _get_attrs(
         self,
@@ -605,42 +817,37 @@ class TelegramObject:
         Returns:
             :obj:`dict`
         """
-        out = self._get_attrs(recursive=recursive)
-
-        # Now we should convert TGObjects to dicts inside objects such as sequences, and convert
-        # datetimes to timestamps. This mostly eliminates the need for subclasses to override
-        # `to_dict`
-        pop_keys: set[str] = set()
-        for key, value in out.items():
-            if isinstance(value, (tuple, list)):
-                if not value:
-                    # not popping directly to avoid changing the dict size during iteration
-                    pop_keys.add(key)
-                    continue
-
-                val = []  # empty list to append our converted values to
-                for item in value:
-                    if hasattr(item, "to_dict"):
-                        val.append(item.to_dict(recursive=recursive))
-                    # This branch is useful for e.g. tuple[tuple[PhotoSize|KeyboardButton]]
-                    elif isinstance(item, (tuple, list)):
-                        val.append(
-                            [
-                                i.to_dict(recursive=recursive) if hasattr(i, "to_dict") else i
-                                for i in item
-                            ]
-                        )
-                    else:  # if it's not a TGObject, just append it. E.g. [TGObject, 2]
-                        val.append(item)
-                out[key] = val
-
+        # This is equivalent to first calling `_get_attrs(recursive=recursive)` and then
+        # converting the values, but does everything in a single pass over the attributes.
+        # We convert TGObjects to dicts, also inside sequences, and datetimes to timestamps.
+        # This mostly eliminates the need for subclasses to override `to_dict`
+        out: JSONDict = {}
+        for key in self._get_attrs_names(include_private=False):
+            value = getattr(self, key, None)
+            # Scalars are by far the most common case, so we check them before anything else
+            if type(value) in _JSON_SCALAR_TYPES:
+                out[key] = value
+                continue
+            if isinstance(value, DefaultValue):
+                value = value.value
+
+            if value is None:
+                if not recursive:
+                    out[key] = value
+            elif recursive and hasattr(value, "to_dict"):
+                out[key] = value.to_dict(recursive=True)
+            elif isinstance(value, (tuple, list)):
+                if value:  # empty sequences are left out
+                    out[key] = [_item_to_dict(item, recursive) for item in value]
             elif isinstance(value, datetime.datetime):
                 out[key] = to_timestamp(value)
             elif isinstance(value, datetime.timedelta):
                 out[key] = value.total_seconds()
+            else:
+                out[key] = value
 
-        for key in pop_keys:
-            out.pop(key)
+        if recursive and out.get("from_user"):
+            out["from"] = out.pop("from_user", None)
 
         # Effectively "unpack" api_kwargs into `out`:
         out.update(out.pop("api_kwargs", {}))  # type: ignore[call-overload]
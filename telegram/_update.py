@@ -18,7 +18,9 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains an object that represents a Telegram Update."""
 
-from typing import TYPE_CHECKING, Final, Optional, Union
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Final, Optional, Union
 
 from telegram import constants
 from telegram._business import BusinessConnection, BusinessMessagesDeleted
@@ -34,7 +36,7 @@ from telegram._paidmedia import PaidMediaPurchased
 from telegram._payment.precheckoutquery import PreCheckoutQuery
 from telegram._payment.shippingquery import ShippingQuery
 from telegram._poll import Poll, PollAnswer
-from telegram._telegramobject import TelegramObject
+from telegram._telegramobject import IdAttrs, TelegramObject
 from telegram._utils.types import JSONDict
 from telegram._utils.warnings import warn
 
@@ -281,6 +283,7 @@ class Update(TelegramObject):
         "_effective_message",
         "_effective_sender",
         "_effective_user",
+        "_lazy_data",
         "business_connection",
         "business_message",
         "callback_query",
@@ -307,6 +310,8 @@ class Update(TelegramObject):
         "update_id",
     )
 
+    _id_attrs = IdAttrs("update_id")
+
     MESSAGE: Final[str] = constants.UpdateType.MESSAGE
     """:const:`telegram.constants.UpdateType.MESSAGE`
 
@@ -407,6 +412,49 @@ class Update(TelegramObject):
 
     .. versionadded:: 13.5"""
 
+    # Functions that decode the nested objects of an update in `de_json`
+    _DECODERS: ClassVar[Mapping[str, Callable[[Any, Optional["Bot"]], object]]] = (
+        MappingProxyType(
+            {
+                "message": Message.de_json,
+                "edited_message": Message.de_json,
+                "channel_post": Message.de_json,
+                "edited_channel_post": Message.de_json,
+                "inline_query": InlineQuery.de_json,
+                "chosen_inline_result": ChosenInlineResult.de_json,
+                "callback_query": CallbackQuery.de_json,
+                "shipping_query": ShippingQuery.de_json,
+                "pre_checkout_query": PreCheckoutQuery.de_json,
+                "poll": Poll.de_json,
+                "poll_answer": PollAnswer.de_json,
+                "my_chat_member": ChatMemberUpdated.de_json,
+                "chat_member": ChatMemberUpdated.de_json,
+                "chat_join_request": ChatJoinRequest.de_json,
+                "chat_boost": ChatBoostUpdated.de_json,
+                "removed_chat_boost": ChatBoostRemoved.de_json,
+                "message_reaction": MessageReactionUpdated.de_json,
+                "message_reaction_count": MessageReactionCountUpdated.de_json,
+                "business_connection": BusinessConnection.de_json,
+                "business_message": Message.de_json,
+                "edited_business_message": Message.de_json,
+                "deleted_business_messages": BusinessMessagesDeleted.de_json,
+                "purchased_paid_media": PaidMediaPurchased.de_json,
+            }
+        )
+    )
+    _LAZY_DECODERS = MappingProxyType(
+        {
+            **_DECODERS,
+            # Messages are decoded lazily as well, see `Message._LAZY_DECODERS`
+            "message": Message._de_json_lazy,
+            "edited_message": Message._de_json_lazy,
+            "channel_post": Message._de_json_lazy,
+            "edited_channel_post": Message._de_json_lazy,
+            "business_message": Message._de_json_lazy,
+            "edited_business_message": Message._de_json_lazy,
+        }
+    )
+
     def __init__(
         self,
         update_id: int,
@@ -470,8 +518,7 @@ class Update(TelegramObject):
         self._effective_sender: Optional[Union[User, Chat]] = None
         self._effective_chat: Optional[Chat] = None
         self._effective_message: Optional[Message] = None
-
-        self._id_attrs = (self.update_id,)
+        self._lazy_data: Optional[JSONDict] = None
 
         self._freeze()
 
@@ -764,40 +811,6 @@ class Update(TelegramObject):
         if not data:
             return None
 
-        data["message"] = Message.de_json(data.get("message"), bot)
-        data["edited_message"] = Message.de_json(data.get("edited_message"), bot)
-        data["inline_query"] = InlineQuery.de_json(data.get("inline_query"), bot)
-        data["chosen_inline_result"] = ChosenInlineResult.de_json(
-            data.get("chosen_inline_result"), bot
-        )
-        data["callback_query"] = CallbackQuery.de_json(data.get("callback_query"), bot)
-        data["shipping_query"] = ShippingQuery.de_json(data.get("shipping_query"), bot)
-        data["pre_checkout_query"] = PreCheckoutQuery.de_json(data.get("pre_checkout_query"), bot)
-        data["channel_post"] = Message.de_json(data.get("channel_post"), bot)
-        data["edited_channel_post"] = Message.de_json(data.get("edited_channel_post"), bot)
-        data["poll"] = Poll.de_json(data.get("poll"), bot)
-        data["poll_answer"] = PollAnswer.de_json(data.get("poll_answer"), bot)
-        data["my_chat_member"] = ChatMemberUpdated.de_json(data.get("my_chat_member"), bot)
-        data["chat_member"] = ChatMemberUpdated.de_json(data.get("chat_member"), bot)
-        data["chat_join_request"] = ChatJoinRequest.de_json(data.get("chat_join_request"), bot)
-        data["chat_boost"] = ChatBoostUpdated.de_json(data.get("chat_boost"), bot)
-        data["removed_chat_boost"] = ChatBoostRemoved.de_json(data.get("removed_chat_boost"), bot)
-        data["message_reaction"] = MessageReactionUpdated.de_json(
-            data.get("message_reaction"), bot
-        )
-        data["message_reaction_count"] = MessageReactionCountUpdated.de_json(
-            data.get("message_reaction_count"), bot
-        )
-        data["business_connection"] = BusinessConnection.de_json(
-            data.get("business_connection"), bot
-        )
-        data["business_message"] = Message.de_json(data.get("business_message"), bot)
-        data["edited_business_message"] = Message.de_json(data.get("edited_business_message"), bot)
-        data["deleted_business_messages"] = BusinessMessagesDeleted.de_json(
-            data.get("deleted_business_messages"), bot
-        )
-        data["purchased_paid_media"] = PaidMediaPurchased.de_json(
-            data.get("purchased_paid_media"), bot
-        )
+        cls._decode_fields(data, cls._DECODERS, bot)
 
         return super().de_json(data=data, bot=bot)
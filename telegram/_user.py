@@ -24,7 +24,7 @@ from typing import TYPE_CHECKING, Optional, Union
 
 from telegram._inline.inlinekeyboardbutton import InlineKeyboardButton
 from telegram._menubutton import MenuButton
-from telegram._telegramobject import TelegramObject
+from telegram._telegramobject import IdAttrs, TelegramObject
 from telegram._utils.defaultvalue import DEFAULT_NONE
 from telegram._utils.types import CorrectOptionID, FileInput, JSONDict, ODVInput, ReplyMarkup
 from telegram.helpers import mention_html as helpers_mention_html
@@ -34,6 +34,7 @@ if TYPE_CHECKING:
     from telegram import (
         Animation,
         Audio,
+        Bot,
         Contact,
         Document,
         Gift,
@@ -156,6 +157,8 @@ class User(TelegramObject):
         "username",
     )
 
+    _id_attrs = IdAttrs("id")
+
     def __init__(
         self,
         id: int,
@@ -191,10 +194,20 @@ class User(TelegramObject):
         self.can_connect_to_business: Optional[bool] = can_connect_to_business
         self.has_main_web_app: Optional[bool] = has_main_web_app
 
-        self._id_attrs = (self.id,)
-
         self._freeze()
 
+    @classmethod
+    def de_json(cls, data: Optional[JSONDict], bot: Optional["Bot"] = None) -> Optional["User"]:
+        """See :meth:`telegram.TelegramObject.de_json`.
+
+        .. versionchanged:: NEXT.VERSION
+            If :paramref:`bot` was built with :paramref:`telegram.ext.ExtBot.intern_objects`,
+            a previously decoded instance is returned if :paramref:`data` is unchanged.
+        """
+        if data and bot is not None and (intern_cache := bot._intern_cache) is not None:
+            return intern_cache.de_json(cls, data, bot)
+        return cls._de_json(data=data, bot=bot)
+
     @property
     def name(self) -> str:
         """:obj:`str`: Convenience property. If available, returns the user's :attr:`username`
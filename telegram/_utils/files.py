@@ -28,6 +28,9 @@ Warning:
     the changelog.
 """
 
+import mmap
+import os
+import shutil
 from pathlib import Path
 from typing import IO, TYPE_CHECKING, Any, Optional, TypeVar, Union, cast, overload
 
@@ -76,6 +79,52 @@ def guess_file_name(obj: FileInput) -> Optional[str]:
     return None
 
 
+class LazyFile:
+    """A binary read-only handle of a local file, that opens the file only once it is accessed.
+    The handle can be closed via :meth:`close` after each request and is reopened when the file is
+    uploaded again, such that no file descriptor is held while the file is not being uploaded.
+
+    Args:
+        path (:obj:`pathlib.Path`): The path of the file.
+    """
+
+    __slots__ = ("_file", "name")
+
+    def __init__(self, path: Path):
+        self.name: str = str(path)
+        self._file: Optional[IO[bytes]] = None
+
+    @property
+    def file(self) -> IO[bytes]:
+        """The underlying file handle. Opens the file, if it's not open yet."""
+        if self._file is None:
+            self._file = Path(self.name).open(mode="rb")  # noqa: SIM115
+        return self._file
+
+    @property
+    def closed(self) -> bool:
+        """Whether the file is currently not open."""
+        return self._file is None
+
+    def read(self, size: int = -1) -> bytes:
+        return self.file.read(size)
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        return self.file.seek(offset, whence)
+
+    def tell(self) -> int:
+        return self.file.tell()
+
+    def fileno(self) -> int:
+        return self.file.fileno()
+
+    def close(self) -> None:
+        """Closes the file handle, if it's open."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
 def is_local_file(obj: Optional[FilePathInput]) -> bool:
     """
     Checks if a given string is a file on local system.
@@ -107,8 +156,9 @@ def parse_file_input(  # pylint: disable=too-many-return-statements
 
         * if ``local_mode`` is ``True``, adds the ``file://`` prefix. If the input is a relative
         path of a local file, computes the absolute path and adds the ``file://`` prefix.
-        * if ``local_mode`` is ``False``, loads the file as binary data and builds an
-          :class:`InputFile` from that
+        * if ``local_mode`` is ``False``, builds an :class:`InputFile` from a :class:`LazyFile`.
+          The file is not read into memory but opened and streamed in chunks once the request is
+          made and closed after the request.
 
       Returns the input unchanged, otherwise.
     * :class:`pathlib.Path` objects are treated the same way as strings.
@@ -145,7 +195,14 @@ def parse_file_input(  # pylint: disable=too-many-return-statements
             path = Path(file_input)
             if local_mode:
                 return path.absolute().as_uri()
-            return InputFile(path.open(mode="rb"), filename=filename, attach=attach)
+            # Passing a file handle on instead of reading the file keeps the memory usage of
+            # uploads constant, independent of the file size
+            return InputFile(
+                cast(IO[bytes], LazyFile(path)),
+                filename=filename,
+                attach=attach,
+                read_file_handle=False,
+            )
 
         return file_input
     if isinstance(file_input, bytes):
@@ -155,3 +212,69 @@ def parse_file_input(  # pylint: disable=too-many-return-statements
     if tg_type and isinstance(file_input, tg_type):
         return file_input.file_id  # type: ignore[attr-defined]
     return file_input
+
+
+def copy_local_file(path: FilePathInput, out: IO[bytes]) -> None:
+    """Writes the contents of the local file at ``path`` to ``out``. If ``out`` is backed by a
+    seekable file descriptor and the platform supports it, the data is copied by the kernel via
+    :func:`os.sendfile` without passing through user space. Otherwise, the file is copied in
+    chunks, i.e. it is never loaded into memory completely.
+
+    Args:
+        path (:obj:`str` | :obj:`pathlib.Path`): The path of the file to copy.
+        out (:obj:`io.BufferedIOBase`): The file-like object to write to.
+    """
+    with Path(path).open("rb") as file:
+        if not _sendfile(file, out):
+            shutil.copyfileobj(file, out)
+
+
+def _sendfile(file: IO[bytes], out: IO[bytes]) -> bool:
+    if not hasattr(os, "sendfile"):
+        return False
+    try:
+        out_fd = out.fileno()
+        if not out.seekable():
+            return False
+    except (AttributeError, OSError, ValueError):
+        # io.UnsupportedOperation is a subclass of OSError and ValueError
+        return False
+
+    out.flush()
+    in_fd = file.fileno()
+    size = os.fstat(in_fd).st_size
+    offset = 0
+    try:
+        while offset < size:
+            sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    except OSError:
+        # E.g. on platforms where sendfile only supports sockets as target. If nothing was
+        # written yet, we can still fall back to copying in user space.
+        if offset:
+            raise
+        return False
+
+    # Writing to the file descriptor directly bypasses the position cached by buffered file
+    # objects, so we have to synchronize it
+    out.seek(os.lseek(out_fd, 0, os.SEEK_CUR))
+    return True
+
+
+def read_local_file_into(path: FilePathInput, buf: bytearray) -> None:
+    """Appends the contents of the local file at ``path`` to ``buf``. The file is memory mapped,
+    such that the data is copied to ``buf`` directly instead of being read into an intermediate
+    :obj:`bytes` object first.
+
+    Args:
+        path (:obj:`str` | :obj:`pathlib.Path`): The path of the file to read.
+        buf (:obj:`bytearray`): The buffer to append the contents to.
+    """
+    with Path(path).open("rb") as file:
+        # Empty files can't be memory mapped
+        if not os.fstat(file.fileno()).st_size:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            buf += mapped
@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a bounded cache for sharing immutable Telegram objects between updates.
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Optional, TypeVar
+
+from telegram._utils.types import JSONDict
+
+if TYPE_CHECKING:
+    from telegram import Bot, TelegramObject
+
+Tele_co = TypeVar("Tele_co", bound="TelegramObject", covariant=True)
+
+
+class InternCache:
+    """A least recently used cache of decoded Telegram objects, keyed by class and ``id``.
+
+    An object is only reused if the JSON payload it was decoded from is equal to the new payload.
+    Otherwise, the new payload is decoded and replaces the cached object, such that changed
+    attributes, e.g. a new username, are never lost.
+
+    Args:
+        maxsize (:obj:`int`): The maximum number of objects to keep.
+    """
+
+    __slots__ = ("_entries", "maxsize")
+
+    def __init__(self, maxsize: int):
+        self.maxsize: int = maxsize
+        self._entries: OrderedDict[tuple[type, object], tuple[JSONDict, TelegramObject]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def de_json(
+        self, cls: type[Tele_co], data: JSONDict, bot: Optional["Bot"]
+    ) -> Optional[Tele_co]:
+        """Returns the cached instance of ``cls`` for ``data`` or decodes ``data`` via
+        ``cls._de_json`` and caches the result."""
+        key = (cls, data.get("id"))
+        if (entry := self._entries.get(key)) is not None and entry[0] == data:
+            self._entries.move_to_end(key)
+            return entry[1]  # type: ignore[return-value]
+
+        # Copy the payload before decoding, as the caller may modify it afterwards
+        payload = dict(data)
+        obj = cls._de_json(data=data, bot=bot)
+        if obj is None or key[1] is None:
+            return obj
+
+        self._entries[key] = (payload, obj)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return obj
+
+    def clear(self) -> None:
+        """Removes all objects from the cache."""
+        self._entries.clear()
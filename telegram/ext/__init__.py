@@ -27,6 +27,7 @@ __all__ = (
     "BasePersistence",
     "BaseRateLimiter",
     "BaseUpdateProcessor",
+    "BroadcastReport",
     "BusinessConnectionHandler",
     "BusinessMessagesDeletedHandler",
     "CallbackContext",
@@ -48,6 +49,7 @@ __all__ = (
     "JobQueue",
     "MessageHandler",
     "MessageReactionHandler",
+    "OrderedUpdateProcessor",
     "PaidMediaPurchasedHandler",
     "PersistenceInput",
     "PicklePersistence",
@@ -55,6 +57,9 @@ __all__ = (
     "PollHandler",
     "PreCheckoutQueryHandler",
     "PrefixHandler",
+    "RequestPriority",
+    "RequestScheduler",
+    "SQLitePersistence",
     "ShippingQueryHandler",
     "SimpleUpdateProcessor",
     "StringCommandHandler",
@@ -70,7 +75,12 @@ from ._application import Application, ApplicationHandlerStop
 from ._applicationbuilder import ApplicationBuilder
 from ._basepersistence import BasePersistence, PersistenceInput
 from ._baseratelimiter import BaseRateLimiter
-from ._baseupdateprocessor import BaseUpdateProcessor, SimpleUpdateProcessor
+from ._baseupdateprocessor import (
+    BaseUpdateProcessor,
+    OrderedUpdateProcessor,
+    SimpleUpdateProcessor,
+)
+from ._broadcast import BroadcastReport
 from ._callbackcontext import CallbackContext
 from ._callbackdatacache import CallbackDataCache, InvalidCallbackData
 from ._contexttypes import ContextTypes
@@ -101,4 +111,6 @@ from ._handlers.stringregexhandler import StringRegexHandler
 from ._handlers.typehandler import TypeHandler
 from ._jobqueue import Job, JobQueue
 from ._picklepersistence import PicklePersistence
+from ._requestscheduler import RequestPriority, RequestScheduler
+from ._sqlitepersistence import SQLitePersistence
 from ._updater import Updater
@@ -22,7 +22,9 @@ library.
 import asyncio
 import contextlib
 import sys
+from collections import OrderedDict
 from collections.abc import AsyncIterator, Coroutine
+from contextlib import AbstractAsyncContextManager
 from typing import Any, Callable, Optional, Union
 
 try:
@@ -51,6 +53,13 @@ else:
 
 _LOGGER = get_logger(__name__, class_name="AIORateLimiter")
 
+# Scope of RetryAfter exceptions raised by requests that are not bound to a chat
+_OVERALL_SCOPE = ""
+# Keys of AIORateLimiter.stalled_time
+_OVERALL = "overall"
+_GROUP = "group"
+_CHAT = "chat"
+
 
 class AIORateLimiter(BaseRateLimiter[int]):
     """
@@ -68,14 +77,21 @@ class AIORateLimiter(BaseRateLimiter[int]):
     The rate limiting is applied by combining two levels of throttling and :meth:`process_request`
     roughly boils down to::
 
-        async with group_limiter(group_id):
+        async with chat_limiter(chat_id):
             async with overall_limiter:
                 await callback(*args, **kwargs)
 
-    Here, ``group_id`` is determined by checking if there is a ``chat_id`` parameter in the
-    :paramref:`~telegram.ext.BaseRateLimiter.process_request.data`.
+    Here, ``chat_id`` is determined by checking if there is a ``chat_id`` parameter in the
+    :paramref:`~telegram.ext.BaseRateLimiter.process_request.data`. For groups and channels, the
+    ``chat_limiter`` applies :paramref:`group_max_rate`, for other chats it applies
+    :paramref:`private_chat_max_rate`.
     The ``overall_limiter`` is applied only if a ``chat_id`` argument is present at all.
 
+    The limiters of the single chats are kept in a cache. Limiters that were not used for so long
+    that all their capacity is available again are removed from the cache. If the cache contains
+    more than :paramref:`max_cached_limiters` limiters nevertheless, the least recently used ones
+    are removed.
+
     Attention:
         * Some bot methods accept a ``chat_id`` parameter in form of a ``@username`` for
           supergroups and channels. As we can't know which ``@username`` corresponds to which
@@ -83,10 +99,10 @@ class AIORateLimiter(BaseRateLimiter[int]):
           exceeding the rate limit.
         * As channels can't be differentiated from supergroups by the ``@username`` or integer
           ``chat_id``, this also applies the group related rate limits to channels.
-        * A :exc:`~telegram.error.RetryAfter` exception will halt *all* requests for
-          :attr:`~telegram.error.RetryAfter.retry_after` + 0.1 seconds. This may be stricter than
-          necessary in some cases, e.g. the bot may hit a rate limit in one group but might still
-          be allowed to send messages in another group.
+        * A :exc:`~telegram.error.RetryAfter` exception will halt all requests to the same
+          ``chat_id`` for :attr:`~telegram.error.RetryAfter.retry_after` + 0.1 seconds. Only if
+          the request that raised the exception has no ``chat_id`` parameter, *all* requests are
+          halted, as the flood limit can't be attributed to a single chat in this case.
 
     Tip:
         With `Bot API 7.1 <https://core.telegram.org/bots/api-changelog#october-31-2024>`_
@@ -111,6 +127,14 @@ class AIORateLimiter(BaseRateLimiter[int]):
 
     .. versionadded:: 20.0
 
+    .. versionchanged:: NEXT.VERSION
+        A :exc:`~telegram.error.RetryAfter` exception now only halts the requests to the affected
+        chat, unless the request has no ``chat_id`` parameter. See also :attr:`stalled_time`.
+
+    .. versionchanged:: NEXT.VERSION
+        Added the parameters :paramref:`private_chat_max_rate`,
+        :paramref:`private_chat_time_period` and :paramref:`max_cached_limiters`.
+
     Args:
         overall_max_rate (:obj:`float`): The maximum number of requests allowed for the entire bot
             per :paramref:`overall_time_period`. When set to 0, no rate limiting will be applied.
@@ -127,7 +151,27 @@ class AIORateLimiter(BaseRateLimiter[int]):
         max_retries (:obj:`int`): The maximum number of retries to be made in case of a
             :exc:`~telegram.error.RetryAfter` exception.
             If set to 0, no retries will be made. Defaults to ``0``.
-
+        private_chat_max_rate (:obj:`float`): The maximum number of requests allowed for
+            requests related to a single chat that is not a group or channel per
+            :paramref:`private_chat_time_period`. When set to 0, no rate limiting will be applied.
+            Telegram recommends to not send more than one message per second to a single chat,
+            which can be achieved by setting this and :paramref:`private_chat_time_period` to
+            ``1``. Defaults to ``0``.
+
+            .. versionadded:: NEXT.VERSION
+        private_chat_time_period (:obj:`float`): The time period (in seconds) during which the
+            :paramref:`private_chat_max_rate` is enforced. When set to 0, no rate limiting will
+            be applied. Defaults to ``1``.
+
+            .. versionadded:: NEXT.VERSION
+        max_cached_limiters (:obj:`int`): The maximum number of limiters for single groups and
+            the maximum number of limiters for single private chats to keep in memory. Must be
+            positive. Defaults to ``4096``.
+
+            .. versionadded:: NEXT.VERSION
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`max_cached_limiters` is not a positive integer.
     """
 
     __slots__ = (
@@ -135,8 +179,13 @@ class AIORateLimiter(BaseRateLimiter[int]):
         "_group_limiters",
         "_group_max_rate",
         "_group_time_period",
+        "_max_cached_limiters",
         "_max_retries",
-        "_retry_after_event",
+        "_private_chat_limiters",
+        "_private_chat_max_rate",
+        "_private_chat_time_period",
+        "_retry_after_deadlines",
+        "_stalled_time",
     )
 
     def __init__(
@@ -146,6 +195,9 @@ class AIORateLimiter(BaseRateLimiter[int]):
         group_max_rate: float = 20,
         group_time_period: float = 60,
         max_retries: int = 0,
+        private_chat_max_rate: float = 0,
+        private_chat_time_period: float = 1,
+        max_cached_limiters: int = 4096,
     ) -> None:
         if not AIO_LIMITER_AVAILABLE:
             raise RuntimeError(
@@ -166,10 +218,35 @@ class AIORateLimiter(BaseRateLimiter[int]):
             self._group_max_rate = 0
             self._group_time_period = 0
 
-        self._group_limiters: dict[Union[str, int], AsyncLimiter] = {}
+        if private_chat_max_rate and private_chat_time_period:
+            self._private_chat_max_rate: float = private_chat_max_rate
+            self._private_chat_time_period: float = private_chat_time_period
+        else:
+            self._private_chat_max_rate = 0
+            self._private_chat_time_period = 0
+
+        if max_cached_limiters < 1:
+            raise ValueError("`max_cached_limiters` must be a positive integer!")
+        self._max_cached_limiters: int = max_cached_limiters
+        # Ordered by the time of the last usage, the least recently used limiter coming first
+        self._group_limiters: OrderedDict[Union[str, int], AsyncLimiter] = OrderedDict()
+        self._private_chat_limiters: OrderedDict[int, AsyncLimiter] = OrderedDict()
         self._max_retries: int = max_retries
-        self._retry_after_event = asyncio.Event()
-        self._retry_after_event.set()
+        # Maps the scopes to the loop time until which requests in that scope have to wait
+        self._retry_after_deadlines: dict[Union[str, int], float] = {}
+        self._stalled_time: dict[str, float] = {_OVERALL: 0.0, _GROUP: 0.0, _CHAT: 0.0}
+
+    @property
+    def stalled_time(self) -> dict[str, float]:
+        """dict[:obj:`str`, :obj:`float`]: The total time in seconds that requests spent waiting
+        because of :exc:`~telegram.error.RetryAfter` exceptions, including the time spent before
+        retrying the request that raised the exception. The keys are ``"overall"`` for waiting
+        caused by requests without ``chat_id``, ``"group"`` for groups and channels and
+        ``"chat"`` for other chats. Time spent by concurrent requests is added up.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._stalled_time.copy()
 
     async def initialize(self) -> None:
         """Does nothing."""
@@ -177,45 +254,102 @@ class AIORateLimiter(BaseRateLimiter[int]):
     async def shutdown(self) -> None:
         """Does nothing."""
 
-    def _get_group_limiter(self, group_id: Union[str, int, bool]) -> "AsyncLimiter":
-        # Remove limiters that haven't been used for so long that all their capacity is unused
-        # We only do that if we have a lot of limiters lying around to avoid looping on every call
-        # This is a minimal effort approach - a full-fledged cache could use a TTL approach
-        # or at least adapt the threshold dynamically depending on the number of active limiters
-        if len(self._group_limiters) > 512:
-            # We copy to avoid modifying the dict while we iterate over it
-            for key, limiter in self._group_limiters.copy().items():
-                if key == group_id:
-                    continue
-                if limiter.has_capacity(limiter.max_rate):
-                    del self._group_limiters[key]
-
-        if group_id not in self._group_limiters:
-            self._group_limiters[group_id] = AsyncLimiter(
-                max_rate=self._group_max_rate,
-                time_period=self._group_time_period,
-            )
-        return self._group_limiters[group_id]
+    def _get_limiter(
+        self,
+        limiters: "OrderedDict[Any, AsyncLimiter]",
+        key: Union[str, int],
+        max_rate: float,
+        time_period: float,
+    ) -> "AsyncLimiter":
+        # Remove limiters that haven't been used for so long that all their capacity is unused.
+        # As the limiters are ordered by their last usage, we can stop at the first one that is
+        # still in use, which keeps this cheap
+        while limiters:
+            oldest = next(iter(limiters.values()))
+            if not oldest.has_capacity(oldest.max_rate):
+                break
+            limiters.popitem(last=False)
+
+        if (limiter := limiters.get(key)) is not None:
+            limiters.move_to_end(key)
+            return limiter
+
+        # If there are still too many limiters, we remove the least recently used ones
+        while len(limiters) >= self._max_cached_limiters:
+            limiters.popitem(last=False)
+
+        limiter = limiters[key] = AsyncLimiter(max_rate=max_rate, time_period=time_period)
+        return limiter
 
     async def _run_request(
         self,
         chat: bool,
+        chat_id: Union[str, int],
         group: Union[str, int, bool],
         callback: Callable[..., Coroutine[Any, Any, Union[bool, JSONDict, list[JSONDict]]]],
         args: Any,
         kwargs: dict[str, Any],
     ) -> Union[bool, JSONDict, list[JSONDict]]:
         base_context = self._base_limiter if (chat and self._base_limiter) else null_context()
-        group_context = (
-            self._get_group_limiter(group) if group and self._group_max_rate else null_context()
-        )
+        chat_context: Union[AsyncLimiter, AbstractAsyncContextManager[None]]
+        if group:
+            chat_context = (
+                self._get_limiter(
+                    self._group_limiters, group, self._group_max_rate, self._group_time_period
+                )
+                if self._group_max_rate
+                else null_context()
+            )
+        elif chat and self._private_chat_max_rate and isinstance(chat_id, int):
+            chat_context = self._get_limiter(
+                self._private_chat_limiters,
+                chat_id,
+                self._private_chat_max_rate,
+                self._private_chat_time_period,
+            )
+        else:
+            chat_context = null_context()
 
-        async with group_context, base_context:
+        async with chat_context, base_context:
             # In case a retry_after was hit, we wait with processing the request
-            await self._retry_after_event.wait()
+            await self._wait_for_retry_after(chat_id if chat else _OVERALL_SCOPE, bool(group))
 
             return await callback(*args, **kwargs)
 
+    def _set_retry_after(self, scope: Union[str, int], delay: float) -> None:
+        loop_time = asyncio.get_running_loop().time()
+        # Remove deadlines that have passed. We only do that if we have a lot of them lying
+        # around to avoid looping on every call, just like for the group limiters
+        if len(self._retry_after_deadlines) > 512:
+            for key, deadline in self._retry_after_deadlines.copy().items():
+                if deadline <= loop_time:
+                    del self._retry_after_deadlines[key]
+
+        deadline = loop_time + delay
+        self._retry_after_deadlines[scope] = max(
+            deadline, self._retry_after_deadlines.get(scope, deadline)
+        )
+
+    async def _wait_for_retry_after(self, scope: Union[str, int], group: bool) -> None:
+        loop = asyncio.get_running_loop()
+        # Looping, as the deadlines may be extended while we wait
+        while True:
+            overall_deadline = self._retry_after_deadlines.get(_OVERALL_SCOPE, 0.0)
+            scope_deadline = self._retry_after_deadlines.get(scope, 0.0)
+            delay = max(overall_deadline, scope_deadline) - loop.time()
+            if delay <= 0:
+                return
+
+            if overall_deadline >= scope_deadline:
+                kind = _OVERALL
+            else:
+                kind = _GROUP if group else _CHAT
+            start = loop.time()
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._stalled_time[kind] += loop.time() - start
+
     # mypy doesn't understand that the last run of the for loop raises an exception
     async def process_request(
         self,
@@ -257,7 +391,12 @@ class AIORateLimiter(BaseRateLimiter[int]):
         for i in range(max_retries + 1):
             try:
                 return await self._run_request(
-                    chat=chat, group=group, callback=callback, args=args, kwargs=kwargs
+                    chat=chat,
+                    chat_id=chat_id,  # type: ignore[arg-type]
+                    group=group,
+                    callback=callback,
+                    args=args,
+                    kwargs=kwargs,
                 )
             except RetryAfter as exc:
                 if i == max_retries:
@@ -268,10 +407,7 @@ class AIORateLimiter(BaseRateLimiter[int]):
 
                 sleep = exc.retry_after + 0.1
                 _LOGGER.info("Rate limit hit. Retrying after %f seconds", sleep)
-                # Make sure we don't allow other requests to be processed
-                self._retry_after_event.clear()
-                await asyncio.sleep(sleep)
-            finally:
-                # Allow other requests to be processed
-                self._retry_after_event.set()
+                # Make sure we don't allow other requests in the same scope to be processed.
+                # The retry waits for the deadline, too.
+                self._set_retry_after(chat_id if chat else _OVERALL_SCOPE, sleep)
         return None  # type: ignore[return-value]
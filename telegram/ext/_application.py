@@ -20,17 +20,25 @@
 
 import asyncio
 import contextlib
+import functools
 import inspect
 import itertools
 import platform
 import signal
 import sys
 from collections import defaultdict
-from collections.abc import Awaitable, Coroutine, Generator, Mapping, Sequence
-from copy import deepcopy
+from collections.abc import (
+    AsyncIterable,
+    Awaitable,
+    Coroutine,
+    Generator,
+    Iterable,
+    Mapping,
+    Sequence,
+)
 from pathlib import Path
 from types import MappingProxyType, TracebackType
-from typing import TYPE_CHECKING, Any, Callable, Generic, NoReturn, Optional, TypeVar, Union
+from typing import TYPE_CHECKING, Any, Callable, Generic, NoReturn, Optional, TypeVar, Union, cast
 
 from telegram._update import Update
 from telegram._utils.defaultvalue import (
@@ -46,10 +54,15 @@ from telegram._utils.types import SCT, DVType, ODVInput
 from telegram._utils.warnings import warn
 from telegram.error import TelegramError
 from telegram.ext._basepersistence import BasePersistence
+from telegram.ext._broadcast import BroadcastReport, run_broadcast
 from telegram.ext._contexttypes import ContextTypes
 from telegram.ext._extbot import ExtBot
 from telegram.ext._handlers.basehandler import BaseHandler
+from telegram.ext._requestscheduler import RequestPriority
 from telegram.ext._updater import Updater
+from telegram.ext._utils.handlerindex import GroupIndex, HandlerList, UpdateKeys
+from telegram.ext._utils.lazydatadict import LazyDataDict
+from telegram.ext._utils.snapshot import snapshot
 from telegram.ext._utils.stack import was_called_by
 from telegram.ext._utils.trackingdict import TrackingDict
 from telegram.ext._utils.types import BD, BT, CCT, CD, JQ, RT, UD, ConversationKey, HandlerCallback
@@ -67,6 +80,7 @@ if TYPE_CHECKING:
 DEFAULT_GROUP: int = 0
 
 _AppType = TypeVar("_AppType", bound="Application")  # pylint: disable=invalid-name
+_T = TypeVar("_T")
 _STOP_SIGNAL = object()
 _DEFAULT_0 = DefaultValue(0)
 
@@ -188,6 +202,12 @@ class Application(
                   the data associated with a specific chat, e.g. if the bot got removed from that
                   chat, please use :meth:`drop_chat_data`.
 
+            .. versionchanged:: NEXT.VERSION
+                If :attr:`telegram.ext.BasePersistence.lazy_loading` is :obj:`True`, this
+                mapping only contains the entries that were loaded from the persistence so far.
+                Entries of other chats are not loaded automatically and changes to them are not
+                persisted.
+
         user_data (:obj:`types.MappingProxyType`): A dictionary handlers can use to store data for
             the user. For each integer user id, the corresponding value of this mapping is
             available as :attr:`telegram.ext.CallbackContext.user_data` in handler callbacks for
@@ -205,6 +225,12 @@ class Application(
                  the data associated with a specific user, e.g. if that user blocked the bot,
                  please use :meth:`drop_user_data`.
 
+            .. versionchanged:: NEXT.VERSION
+                If :attr:`telegram.ext.BasePersistence.lazy_loading` is :obj:`True`, this
+                mapping only contains the entries that were loaded from the persistence so far.
+                Entries of other users are not loaded automatically and changes to them are not
+                persisted.
+
         bot_data (:obj:`dict`): A dictionary handlers can use to store data for the bot.
         persistence (:class:`telegram.ext.BasePersistence`): The persistence class to
             store data that should be persistent over restarts.
@@ -237,6 +263,7 @@ class Application(
     __slots__ = (
         (  # noqa: RUF005
             "__create_task_tasks",
+            "__handler_index",
             "__update_fetcher_task",
             "__update_persistence_event",
             "__update_persistence_lock",
@@ -308,6 +335,9 @@ class Application(
         self.context_types: ContextTypes[CCT, UD, CD, BD] = context_types
         self.updater: Optional[Updater] = updater
         self.handlers: dict[int, list[BaseHandler[Any, CCT, Any]]] = {}
+        # Maps handler groups to an index over the handlers of that group, such that
+        # process_update only needs to check the handlers that can possibly handle an update
+        self.__handler_index: dict[int, GroupIndex] = {}
         self.error_handlers: dict[
             HandlerCallback[object, CCT, None], Union[bool, DefaultValue[bool]]
         ] = {}
@@ -321,18 +351,24 @@ class Application(
             Callable[[Application[BT, CCT, UD, CD, BD, JQ]], Coroutine[Any, Any, None]]
         ] = post_stop
         self._update_processor = update_processor
-        self.bot_data: BD = self.context_types.bot_data()
-        self._user_data: defaultdict[int, UD] = defaultdict(self.context_types.user_data)
-        self._chat_data: defaultdict[int, CD] = defaultdict(self.context_types.chat_data)
-        # Read only mapping
-        self.user_data: Mapping[int, UD] = MappingProxyType(self._user_data)
-        self.chat_data: Mapping[int, CD] = MappingProxyType(self._chat_data)
-
         self.persistence: Optional[BasePersistence[UD, CD, BD]] = None
         if persistence and not isinstance(persistence, BasePersistence):
             raise TypeError("persistence must be based on telegram.ext.BasePersistence")
         self.persistence = persistence
 
+        self.bot_data: BD = self.context_types.bot_data()
+        self._user_data: defaultdict[int, UD]
+        self._chat_data: defaultdict[int, CD]
+        if self.persistence and self.persistence.lazy_loading:
+            self._user_data = LazyDataDict(self.context_types.user_data)
+            self._chat_data = LazyDataDict(self.context_types.chat_data)
+        else:
+            self._user_data = defaultdict(self.context_types.user_data)
+            self._chat_data = defaultdict(self.context_types.chat_data)
+        # Read only mapping
+        self.user_data: Mapping[int, UD] = MappingProxyType(self._user_data)
+        self.chat_data: Mapping[int, CD] = MappingProxyType(self._chat_data)
+
         # Some bookkeeping for persistence logic
         self._chat_ids_to_be_updated_in_persistence: set[int] = set()
         self._user_ids_to_be_updated_in_persistence: set[int] = set()
@@ -557,9 +593,10 @@ class Application(
         if not self.persistence:
             return
 
-        if self.persistence.store_data.user_data:
+        # With lazy loading, the entries are loaded in _load_lazy_data once they are needed
+        if self.persistence.store_data.user_data and not self.persistence.lazy_loading:
             self._user_data.update(await self.persistence.get_user_data())
-        if self.persistence.store_data.chat_data:
+        if self.persistence.store_data.chat_data and not self.persistence.lazy_loading:
             self._chat_data.update(await self.persistence.get_chat_data())
         if self.persistence.store_data.bot_data:
             self.bot_data = await self.persistence.get_bot_data()
@@ -1264,6 +1301,13 @@ class Application(
             Persistence is now updated in an interval set by
             :attr:`telegram.ext.BasePersistence.update_interval`.
 
+        .. versionchanged:: NEXT.VERSION
+            :meth:`~telegram.ext.BaseHandler.check_update` is no longer called for handlers that
+            can't handle the update in any case, e.g. for a :class:`~telegram.ext.CommandHandler`
+            if the update contains a different command. The order in which the remaining handlers
+            are checked is unchanged. Subclasses of the built-in handlers that override
+            :meth:`~telegram.ext.BaseHandler.check_update` are always checked.
+
         Args:
             update (:class:`telegram.Update` | :obj:`object` | \
                 :class:`telegram.error.TelegramError`): The update to process.
@@ -1275,66 +1319,108 @@ class Application(
         self._check_initialized()
 
         context = None
+        pinned_context = None
         any_blocking = False  # Flag which is set to True if any handler specifies block=True
+        update_keys = None
 
-        for handlers in self.handlers.values():
-            try:
-                for handler in handlers:
-                    check = handler.check_update(update)  # Should the handler handle this update?
-                    if check is None or check is False:
-                        continue
-
-                    if not context:  # build a context if not already built
-                        try:
-                            context = self.context_types.context.from_update(update, self)
-                        except Exception as exc:
-                            _LOGGER.critical(
-                                (
-                                    "Error while building CallbackContext for update %s. "
-                                    "Update will not be processed."
-                                ),
-                                update,
-                                exc_info=exc,
-                            )
-                            return
-                        await context.refresh_data()
-                    coroutine: Coroutine = handler.handle_update(update, self, check, context)
-
-                    if not handler.block or (  # if handler is running with block=False,
-                        handler.block is DEFAULT_TRUE
-                        and isinstance(self.bot, ExtBot)
-                        and self.bot.defaults
-                        and not self.bot.defaults.block
-                    ):
-                        self.create_task(
-                            coroutine,
-                            update=update,
-                            name=(
-                                f"Application:{self.bot.id}:process_update_non_blocking"
-                                f":{handler}"
-                            ),
+        try:
+            for group, handlers in self.handlers.items():
+                try:
+                    group_index = self.__get_group_index(group, handlers)
+                    if group_index is not None:
+                        if update_keys is None:
+                            update_keys = UpdateKeys(update)
+                        candidates: Sequence[BaseHandler[Any, CCT, Any]] = group_index.candidates(
+                            update_keys
                         )
                     else:
-                        any_blocking = True
-                        await coroutine
-                    break  # Only a max of 1 handler per group is handled
-
-            # Stop processing with any other handler.
-            except ApplicationHandlerStop:
-                _LOGGER.debug("Stopping further handlers due to ApplicationHandlerStop")
-                break
-
-            # Dispatch any error.
-            except Exception as exc:
-                if await self.process_error(update=update, error=exc):
-                    _LOGGER.debug("Error handler stopped further handlers.")
+                        candidates = handlers
+
+                    for handler in candidates:
+                        # Should the handler handle this update?
+                        check = handler.check_update(update)
+                        if check is None or check is False:
+                            continue
+
+                        if not context:  # build a context if not already built
+                            try:
+                                context = self.context_types.context.from_update(update, self)
+                            except Exception as exc:
+                                _LOGGER.critical(
+                                    (
+                                        "Error while building CallbackContext for update %s. "
+                                        "Update will not be processed."
+                                    ),
+                                    update,
+                                    exc_info=exc,
+                                )
+                                return
+                            await context.refresh_data()
+                        if pinned_context is None:
+                            # Keeps the data from being evicted while the handlers use it. Done
+                            # here, so that the data is pinned even if refreshing it failed for an
+                            # earlier group
+                            self._pin_lazy_data(context)
+                            pinned_context = context
+                        coroutine: Coroutine = handler.handle_update(update, self, check, context)
+
+                        if not handler.block or (  # if handler is running with block=False,
+                            handler.block is DEFAULT_TRUE
+                            and isinstance(self.bot, ExtBot)
+                            and self.bot.defaults
+                            and not self.bot.defaults.block
+                        ):
+                            task = self.create_task(
+                                coroutine,
+                                update=update,
+                                name=(
+                                    f"Application:{self.bot.id}:process_update_non_blocking"
+                                    f":{handler}"
+                                ),
+                            )
+                            self._pin_lazy_data(context)
+                            task.add_done_callback(
+                                functools.partial(self.__unpin_lazy_data_callback, context)
+                            )
+                        else:
+                            any_blocking = True
+                            await coroutine
+                        break  # Only a max of 1 handler per group is handled
+
+                # Stop processing with any other handler.
+                except ApplicationHandlerStop:
+                    _LOGGER.debug("Stopping further handlers due to ApplicationHandlerStop")
                     break
 
-        if any_blocking:
-            # Only need to mark the update for persistence if there was at least one
-            # blocking handler - the non-blocking handlers mark the update again when finished
-            # (in __create_task_callback)
-            self._mark_for_persistence_update(update=update)
+                # Dispatch any error.
+                except Exception as exc:
+                    if await self.process_error(update=update, error=exc):
+                        _LOGGER.debug("Error handler stopped further handlers.")
+                        break
+
+            if any_blocking:
+                # Only need to mark the update for persistence if there was at least one
+                # blocking handler - the non-blocking handlers mark the update again when finished
+                # (in __create_task_callback)
+                self._mark_for_persistence_update(update=update)
+        finally:
+            if pinned_context is not None:
+                self._unpin_lazy_data(pinned_context)
+
+    def __get_group_index(
+        self, group: int, handlers: list[BaseHandler[Any, CCT, Any]]
+    ) -> Optional[GroupIndex]:
+        """Returns the index for the handlers of the given group or :obj:`None`, if the group
+        can't be indexed in a meaningful way. The index is (re)built if the handlers of the group
+        changed since the index was last built. :meth:`add_handler` & co. as well as in-place
+        changes of the lists in :attr:`handlers` bump the version of the
+        :class:`~telegram.ext._utils.handlerindex.HandlerList`. Only lists that were assigned
+        directly to :attr:`handlers` are compared item by item.
+        """
+        group_index = self.__handler_index.get(group)
+        if group_index is None or group_index.is_stale(handlers):
+            group_index = self.__handler_index[group] = GroupIndex(handlers)
+        return None if group_index.is_trivial else group_index
 
     def add_handler(self, handler: BaseHandler[Any, CCT, Any], group: int = DEFAULT_GROUP) -> None:
         """Register a handler.
@@ -1396,7 +1482,7 @@ class Application(
                 )
 
         if group not in self.handlers:
-            self.handlers[group] = []
+            self.handlers[group] = HandlerList()
             self.handlers = dict(sorted(self.handlers.items()))  # lower -> higher groups
 
         self.handlers[group].append(handler)
@@ -1475,6 +1561,7 @@ class Application(
             self.handlers[group].remove(handler)
             if not self.handlers[group]:
                 del self.handlers[group]
+                self.__handler_index.pop(group, None)
 
     def drop_chat_data(self, chat_id: int) -> None:
         """Drops the corresponding entry from the :attr:`chat_data`. Will also be deleted from
@@ -1581,6 +1668,106 @@ class Application(
         self._chat_ids_to_be_updated_in_persistence.add(new_chat_id)
         # old_chat_id is marked for deletion by drop_chat_data above
 
+    async def broadcast(
+        self,
+        chat_ids: Union[Iterable[Union[int, str]], AsyncIterable[Union[int, str]]],
+        callback: Callable[[Union[int, str]], Awaitable[object]],
+        *,
+        start_offset: int = 0,
+        max_concurrent_sends: int = 30,
+        max_retries: int = 3,
+        checkpoint_callback: Optional[
+            Callable[[BroadcastReport], Coroutine[Any, Any, None]]
+        ] = None,
+        checkpoint_interval: float = 10,
+    ) -> BroadcastReport:
+        """Sends a message to many chats. For each chat id in :paramref:`chat_ids`,
+        :paramref:`callback` is awaited with that chat id. The recipients are consumed lazily, so
+        they can be streamed e.g. from a database.
+
+        .. code:: python
+
+            async def send_news(chat_id):
+                await application.bot.send_message(chat_id, "News!")
+
+            report = await application.broadcast(fetch_subscribers(), send_news)
+
+        Sending to the single recipients is handled as follows:
+
+        * :exc:`telegram.error.RetryAfter`: The request is retried after the requested time.
+        * :exc:`telegram.error.ChatMigrated`: The request is retried for the new chat id. If
+          :attr:`chat_data` contains data for the old chat id, it is migrated via
+          :meth:`migrate_chat_data`.
+        * :exc:`telegram.error.Forbidden`: The recipient is added to
+          :attr:`telegram.ext.BroadcastReport.blocked_chat_ids`.
+        * Any other exception: The recipient is added to
+          :attr:`telegram.ext.BroadcastReport.failed_chat_ids`.
+
+        Tip:
+            * Set a :attr:`~telegram.ext.ExtBot.rate_limiter` like
+              :class:`~telegram.ext.AIORateLimiter` to stay within the flood limits. Make
+              :paramref:`max_concurrent_sends` large enough to use the whole rate budget, i.e.
+              roughly the allowed number of messages per second times the response time of the
+              Bot API in seconds.
+            * If the :attr:`bot` has a :attr:`~telegram.ext.ExtBot.request_scheduler`, all
+              requests made by :paramref:`callback` get the priority
+              :attr:`~telegram.ext.RequestPriority.BULK`, so that the bot stays responsive.
+            * To run the broadcast in the background, e.g. from a handler callback or a job of
+              the :attr:`job_queue`, pass the coroutine to :meth:`create_task`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            chat_ids (Iterable[:obj:`int` | :obj:`str`] | AsyncIterable[:obj:`int` | :obj:`str`]):
+                The ids of the chats to send the message to.
+            callback (:term:`coroutine function`): A coroutine function that sends the message
+                to a single chat. Will be called with the chat id as only argument.
+            start_offset (:obj:`int`, optional): The number of recipients at the start of
+                :paramref:`chat_ids` to skip. Pass :attr:`telegram.ext.BroadcastReport.offset` of
+                a checkpoint here to resume an interrupted broadcast. Defaults to ``0``.
+            max_concurrent_sends (:obj:`int`, optional): The maximum number of recipients
+                processed concurrently. Defaults to ``30``.
+            max_retries (:obj:`int`, optional): The maximum number of retries per recipient for
+                :exc:`~telegram.error.RetryAfter` and :exc:`~telegram.error.ChatMigrated`.
+                Defaults to ``3``.
+            checkpoint_callback (:term:`coroutine function`, optional): A coroutine function
+                that is called with the :class:`~telegram.ext.BroadcastReport` every
+                :paramref:`checkpoint_interval` seconds and once when the broadcast is finished.
+                Use this to persist the progress or to report the throughput.
+            checkpoint_interval (:obj:`float`, optional): The minimum time in seconds between two
+                calls of :paramref:`checkpoint_callback`. Defaults to ``10``.
+
+        Returns:
+            :class:`telegram.ext.BroadcastReport`: The final report of the broadcast.
+
+        Raises:
+            :exc:`ValueError`: If :paramref:`max_concurrent_sends` is not a positive integer.
+        """
+        if max_concurrent_sends < 1:
+            raise ValueError("`max_concurrent_sends` must be a positive integer!")
+
+        def on_migrate(old_chat_id: Union[int, str], new_chat_id: int) -> None:
+            if old_chat_id in self._chat_data:
+                self.migrate_chat_data(
+                    old_chat_id=old_chat_id, new_chat_id=new_chat_id  # type: ignore[arg-type]
+                )
+
+        scheduler = getattr(self.bot, "request_scheduler", None)
+        priority_context = (
+            scheduler.use_priority(RequestPriority.BULK) if scheduler else contextlib.nullcontext()
+        )
+        with priority_context:
+            return await run_broadcast(
+                chat_ids,
+                callback,
+                start_offset=start_offset,
+                max_concurrent_sends=max_concurrent_sends,
+                max_retries=max_retries,
+                checkpoint_callback=checkpoint_callback,
+                checkpoint_interval=checkpoint_interval,
+                on_migrate=on_migrate,
+            )
+
     def _mark_for_persistence_update(
         self, *, update: Optional[object] = None, job: Optional["Job"] = None
     ) -> None:
@@ -1662,8 +1849,12 @@ class Application(
             no need to call it manually.
 
         Note:
-            Any data is deep copied with :func:`copy.deepcopy` before handing it over to the
-            persistence in order to avoid race conditions, so all persisted data must be copyable.
+            Any data is deep copied before handing it over to the persistence in order to avoid
+            race conditions, so all persisted data must be copyable with :func:`copy.deepcopy`.
+
+        .. versionchanged:: NEXT.VERSION
+            Builtin containers like :obj:`dict` and :obj:`list` as well as immutable objects are
+            no longer copied with :func:`copy.deepcopy`, which is considerably faster.
 
         .. seealso:: :attr:`telegram.ext.BasePersistence.update_interval`,
             :meth:`mark_data_for_update_persistence`
@@ -1686,14 +1877,14 @@ class Application(
         ):
             coroutines.add(
                 self.persistence.update_callback_data(
-                    deepcopy(
+                    snapshot(
                         self.bot.callback_data_cache.persistence_data  # type: ignore[attr-defined]
                     )
                 )
             )
 
         if self.persistence.store_data.bot_data:
-            coroutines.add(self.persistence.update_bot_data(deepcopy(self.bot_data)))
+            coroutines.add(self.persistence.update_bot_data(snapshot(self.bot_data)))
 
         if self.persistence.store_data.chat_data:
             update_ids = self._chat_ids_to_be_updated_in_persistence
@@ -1703,10 +1894,12 @@ class Application(
 
             # We don't want to update any data that has been deleted!
             update_ids -= delete_ids
+            if self.persistence.lazy_loading:
+                update_ids = self.__filter_lazy_data_ids(self._chat_data, update_ids, "chat")
 
             for chat_id in update_ids:
                 coroutines.add(
-                    self.persistence.update_chat_data(chat_id, deepcopy(self.chat_data[chat_id]))
+                    self.persistence.update_chat_data(chat_id, snapshot(self.chat_data[chat_id]))
                 )
             for chat_id in delete_ids:
                 coroutines.add(self.persistence.drop_chat_data(chat_id))
@@ -1719,10 +1912,12 @@ class Application(
 
             # We don't want to update any data that has been deleted!
             update_ids -= delete_ids
+            if self.persistence.lazy_loading:
+                update_ids = self.__filter_lazy_data_ids(self._user_data, update_ids, "user")
 
             for user_id in update_ids:
                 coroutines.add(
-                    self.persistence.update_user_data(user_id, deepcopy(self.user_data[user_id]))
+                    self.persistence.update_user_data(user_id, snapshot(self.user_data[user_id]))
                 )
             for user_id in delete_ids:
                 coroutines.add(self.persistence.drop_user_data(user_id))
@@ -1771,6 +1966,12 @@ class Application(
         results = await asyncio.gather(*coroutines, return_exceptions=True)
         _LOGGER.debug("Finished updating persistence.")
 
+        # Only drop data from memory if it's safely stored in the persistence
+        if self.persistence.lazy_loading and not any(
+            isinstance(result, Exception) for result in results
+        ):
+            self.__evict_lazy_data()
+
         # dispatch any errors
         await asyncio.gather(
             *(
@@ -1780,6 +1981,99 @@ class Application(
             )
         )
 
+    async def _load_lazy_data(self, chat_id: Optional[int], user_id: Optional[int]) -> None:
+        """Loads the entries of :attr:`chat_data` and :attr:`user_data` for the given ids from
+        the persistence, if :attr:`telegram.ext.BasePersistence.lazy_loading` is :obj:`True` and
+        they were not loaded yet. Called by :meth:`telegram.ext.CallbackContext.refresh_data`.
+        """
+        if not self.persistence or not self.persistence.lazy_loading:
+            return
+        if chat_id is not None and self.persistence.store_data.chat_data:
+            await self.__load_lazy_entry(
+                cast(LazyDataDict[CD], self._chat_data),
+                chat_id,
+                self._chat_ids_to_be_deleted_in_persistence,
+                self.persistence.get_chat_data_entry,
+            )
+        if user_id is not None and self.persistence.store_data.user_data:
+            await self.__load_lazy_entry(
+                cast(LazyDataDict[UD], self._user_data),
+                user_id,
+                self._user_ids_to_be_deleted_in_persistence,
+                self.persistence.get_user_data_entry,
+            )
+
+    @staticmethod
+    async def __load_lazy_entry(
+        data: LazyDataDict[_T],
+        key: int,
+        dropped: set[int],
+        load: Callable[[int], Awaitable[Optional[_T]]],
+    ) -> None:
+        if not data.is_loaded(key):
+            # Dropped entries are deleted from the persistence only on the next run of
+            # update_persistence, so we must not load them again
+            entry = None if key in dropped else await load(key)
+            # The entry may have been loaded for another update in the meantime and may already
+            # be in use, so we must not replace it
+            if not data.is_loaded(key):
+                data[key] = data.default_factory() if entry is None else entry
+                return
+        data.touch(key)
+
+    def _pin_lazy_data(self, context: CCT) -> None:
+        """Excludes the entries of :attr:`chat_data` and :attr:`user_data` that ``context``
+        refers to from eviction until :meth:`_unpin_lazy_data` is called. Handlers and jobs access
+        these entries on every use of :attr:`telegram.ext.CallbackContext.chat_data` and
+        :attr:`telegram.ext.CallbackContext.user_data`, so evicting them while they run would
+        lose their changes.
+        """
+        # pylint: disable=protected-access
+        if isinstance(self._chat_data, LazyDataDict) and context._chat_id is not None:
+            self._chat_data.pin(context._chat_id)
+        if isinstance(self._user_data, LazyDataDict) and context._user_id is not None:
+            self._user_data.pin(context._user_id)
+
+    def _unpin_lazy_data(self, context: CCT) -> None:
+        """Releases the entries pinned by :meth:`_pin_lazy_data`."""
+        # pylint: disable=protected-access
+        if isinstance(self._chat_data, LazyDataDict) and context._chat_id is not None:
+            self._chat_data.unpin(context._chat_id)
+        if isinstance(self._user_data, LazyDataDict) and context._user_id is not None:
+            self._user_data.unpin(context._user_id)
+
+    def __unpin_lazy_data_callback(self, context: CCT, _: asyncio.Task) -> None:
+        self._unpin_lazy_data(context)
+
+    @staticmethod
+    def __filter_lazy_data_ids(data: defaultdict[int, Any], ids: set[int], kind: str) -> set[int]:
+        # Entries that were not loaded from the persistence must not be written to the
+        # persistence, as this would overwrite the stored data
+        not_loaded = {key for key in ids if not cast(LazyDataDict, data).is_loaded(key)}
+        for key in not_loaded:
+            if key in data:
+                _LOGGER.warning(
+                    "The %s_data of id %s was accessed without being loaded from the persistence. "
+                    "Changes to it will not be persisted.",
+                    kind,
+                    key,
+                )
+        return ids - not_loaded
+
+    def __evict_lazy_data(self) -> None:
+        if not self.persistence or not self.persistence.max_cached_entries:
+            return
+        if self.persistence.store_data.chat_data:
+            evicted = cast(LazyDataDict[CD], self._chat_data).evict(
+                self.persistence.max_cached_entries, self._chat_ids_to_be_updated_in_persistence
+            )
+            _LOGGER.debug("Dropped chat_data of %d chats from memory", len(evicted))
+        if self.persistence.store_data.user_data:
+            evicted = cast(LazyDataDict[UD], self._user_data).evict(
+                self.persistence.max_cached_entries, self._user_ids_to_be_updated_in_persistence
+            )
+            _LOGGER.debug("Dropped user_data of %d users from memory", len(evicted))
+
     def add_error_handler(
         self,
         callback: HandlerCallback[object, CCT, None],
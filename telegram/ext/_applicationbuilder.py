@@ -35,13 +35,19 @@ from telegram.ext._extbot import ExtBot
 from telegram.ext._jobqueue import JobQueue
 from telegram.ext._updater import Updater
 from telegram.ext._utils.types import BD, BT, CCT, CD, JQ, UD
-from telegram.request import BaseRequest
+from telegram.request import BaseRequest, JSONCodec
 from telegram.request._httpxrequest import HTTPXRequest
 from telegram.warnings import PTBDeprecationWarning
 
 if TYPE_CHECKING:
     from telegram import Update
-    from telegram.ext import BasePersistence, BaseRateLimiter, CallbackContext, Defaults
+    from telegram.ext import (
+        BasePersistence,
+        BaseRateLimiter,
+        CallbackContext,
+        Defaults,
+        RequestScheduler,
+    )
     from telegram.ext._utils.types import RLARGS
 
 # Type hinting is a bit complicated here because we try to get to a sane level of
@@ -60,7 +66,10 @@ BuilderType = TypeVar("BuilderType", bound="ApplicationBuilder")
 _BOT_CHECKS = [
     ("request", "request instance"),
     ("get_updates_request", "get_updates_request instance"),
+    ("media_request", "media_request instance"),
+    ("interactive_request", "interactive_request instance"),
     ("connection_pool_size", "connection_pool_size"),
+    ("max_connection_pool_size", "max_connection_pool_size"),
     ("proxy", "proxy"),
     ("socket_options", "socket_options"),
     ("pool_timeout", "pool_timeout"),
@@ -70,6 +79,7 @@ _BOT_CHECKS = [
     ("media_write_timeout", "media_write_timeout"),
     ("http_version", "http_version"),
     ("get_updates_connection_pool_size", "get_updates_connection_pool_size"),
+    ("get_updates_max_connection_pool_size", "get_updates_max_connection_pool_size"),
     ("get_updates_proxy", "get_updates_proxy"),
     ("get_updates_socket_options", "get_updates_socket_options"),
     ("get_updates_pool_timeout", "get_updates_pool_timeout"),
@@ -77,6 +87,7 @@ _BOT_CHECKS = [
     ("get_updates_read_timeout", "get_updates_read_timeout"),
     ("get_updates_write_timeout", "get_updates_write_timeout"),
     ("get_updates_http_version", "get_updates_http_version"),
+    ("json_codec", "json_codec"),
     ("base_file_url", "base_file_url"),
     ("base_url", "base_url"),
     ("token", "token"),
@@ -85,6 +96,9 @@ _BOT_CHECKS = [
     ("private_key", "private_key"),
     ("rate_limiter", "rate_limiter instance"),
     ("local_mode", "local_mode setting"),
+    ("lazy_updates", "lazy_updates setting"),
+    ("intern_objects", "intern_objects setting"),
+    ("request_scheduler", "request_scheduler instance"),
 ]
 
 _TWO_ARGS_REQ = "The parameter `{}` may only be set, if no {} was set."
@@ -133,6 +147,7 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         "_get_updates_connect_timeout",
         "_get_updates_connection_pool_size",
         "_get_updates_http_version",
+        "_get_updates_max_connection_pool_size",
         "_get_updates_pool_timeout",
         "_get_updates_proxy",
         "_get_updates_read_timeout",
@@ -140,8 +155,14 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         "_get_updates_socket_options",
         "_get_updates_write_timeout",
         "_http_version",
+        "_interactive_request",
+        "_intern_objects",
+        "_json_codec",
         "_job_queue",
+        "_lazy_updates",
         "_local_mode",
+        "_max_connection_pool_size",
+        "_media_request",
         "_media_write_timeout",
         "_persistence",
         "_pool_timeout",
@@ -154,6 +175,7 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         "_rate_limiter",
         "_read_timeout",
         "_request",
+        "_request_scheduler",
         "_socket_options",
         "_token",
         "_update_processor",
@@ -167,6 +189,7 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._base_url: DVType[str] = DefaultValue("https://api.telegram.org/bot")
         self._base_file_url: DVType[str] = DefaultValue("https://api.telegram.org/file/bot")
         self._connection_pool_size: DVInput[int] = DEFAULT_NONE
+        self._max_connection_pool_size: DVInput[int] = DEFAULT_NONE
         self._proxy: DVInput[Union[str, httpx.Proxy, httpx.URL]] = DEFAULT_NONE
         self._socket_options: DVInput[Collection[SocketOpt]] = DEFAULT_NONE
         self._connect_timeout: ODVInput[float] = DEFAULT_NONE
@@ -176,6 +199,7 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._pool_timeout: ODVInput[float] = DEFAULT_NONE
         self._request: DVInput[BaseRequest] = DEFAULT_NONE
         self._get_updates_connection_pool_size: DVInput[int] = DEFAULT_NONE
+        self._get_updates_max_connection_pool_size: DVInput[int] = DEFAULT_NONE
         self._get_updates_proxy: DVInput[Union[str, httpx.Proxy, httpx.URL]] = DEFAULT_NONE
         self._get_updates_socket_options: DVInput[Collection[SocketOpt]] = DEFAULT_NONE
         self._get_updates_connect_timeout: ODVInput[float] = DEFAULT_NONE
@@ -184,11 +208,15 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._get_updates_pool_timeout: ODVInput[float] = DEFAULT_NONE
         self._get_updates_request: DVInput[BaseRequest] = DEFAULT_NONE
         self._get_updates_http_version: DVInput[str] = DefaultValue("1.1")
+        self._media_request: ODVInput[BaseRequest] = DEFAULT_NONE
+        self._interactive_request: ODVInput[BaseRequest] = DEFAULT_NONE
         self._private_key: ODVInput[bytes] = DEFAULT_NONE
         self._private_key_password: ODVInput[bytes] = DEFAULT_NONE
         self._defaults: ODVInput[Defaults] = DEFAULT_NONE
         self._arbitrary_callback_data: Union[DefaultValue[bool], int] = DEFAULT_FALSE
         self._local_mode: DVType[bool] = DEFAULT_FALSE
+        self._lazy_updates: DVType[bool] = DEFAULT_FALSE
+        self._intern_objects: Union[DefaultValue[bool], int] = DEFAULT_FALSE
         self._bot: DVInput[Bot] = DEFAULT_NONE
         self._update_queue: DVType[Queue[Union[Update, object]]] = DefaultValue(Queue())
 
@@ -211,7 +239,9 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._post_shutdown: Optional[Callable[[Application], Coroutine[Any, Any, None]]] = None
         self._post_stop: Optional[Callable[[Application], Coroutine[Any, Any, None]]] = None
         self._rate_limiter: ODVInput[BaseRateLimiter] = DEFAULT_NONE
+        self._request_scheduler: ODVInput[RequestScheduler] = DEFAULT_NONE
         self._http_version: DVInput[str] = DefaultValue("1.1")
+        self._json_codec: DVInput[JSONCodec] = DEFAULT_NONE
 
     def _build_request(self, get_updates: bool) -> BaseRequest:
         prefix = "_get_updates_" if get_updates else "_"
@@ -228,6 +258,9 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
             connection_pool_size = (
                 DefaultValue.get_value(getattr(self, f"{prefix}connection_pool_size")) or 256
             )
+        max_connection_pool_size = DefaultValue.get_value(
+            getattr(self, f"{prefix}max_connection_pool_size")
+        )
 
         timeouts = {
             "connect_timeout": getattr(self, f"{prefix}connect_timeout"),
@@ -248,9 +281,11 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
 
         return HTTPXRequest(
             connection_pool_size=connection_pool_size,
+            max_connection_pool_size=max_connection_pool_size,
             proxy=proxy,
             http_version=http_version,  # type: ignore[arg-type]
             socket_options=socket_options,
+            json_codec=DefaultValue.get_value(self._json_codec),
             **effective_timeouts,
         )
 
@@ -270,6 +305,11 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
             get_updates_request=self._build_request(get_updates=True),
             rate_limiter=DefaultValue.get_value(self._rate_limiter),
             local_mode=DefaultValue.get_value(self._local_mode),
+            lazy_updates=DefaultValue.get_value(self._lazy_updates),
+            request_scheduler=DefaultValue.get_value(self._request_scheduler),
+            media_request=DefaultValue.get_value(self._media_request),
+            interactive_request=DefaultValue.get_value(self._interactive_request),
+            intern_objects=DefaultValue.get_value(self._intern_objects),
         )
 
     def _bot_check(self, name: str) -> None:
@@ -431,6 +471,9 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         if not isinstance(getattr(self, f"_{prefix}connection_pool_size"), DefaultValue):
             raise RuntimeError(_TWO_ARGS_REQ.format(name, "connection_pool_size"))
 
+        if not isinstance(getattr(self, f"_{prefix}max_connection_pool_size"), DefaultValue):
+            raise RuntimeError(_TWO_ARGS_REQ.format(name, "max_connection_pool_size"))
+
         if not isinstance(getattr(self, f"_{prefix}proxy"), DefaultValue):
             raise RuntimeError(_TWO_ARGS_REQ.format(name, "proxy"))
 
@@ -440,6 +483,9 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         if not isinstance(getattr(self, f"_{prefix}http_version"), DefaultValue):
             raise RuntimeError(_TWO_ARGS_REQ.format(name, "http_version"))
 
+        if not isinstance(self._json_codec, DefaultValue):
+            raise RuntimeError(_TWO_ARGS_REQ.format(name, "json_codec"))
+
         self._bot_check(name)
 
         if self._updater not in (DEFAULT_NONE, None):
@@ -500,6 +546,27 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._connection_pool_size = connection_pool_size
         return self
 
+    def max_connection_pool_size(self: BuilderType, max_connection_pool_size: int) -> BuilderType:
+        """Sets the maximum size of the connection pool for the
+        :paramref:`~telegram.request.HTTPXRequest.max_connection_pool_size` parameter of
+        :attr:`telegram.Bot.request`. If set, the connection pool grows from
+        :meth:`connection_pool_size` up to this size under load. Defaults to :obj:`None`, in
+        which case the connection pool has a fixed size.
+
+        .. seealso:: :meth:`get_updates_max_connection_pool_size`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            max_connection_pool_size (:obj:`int`): The maximum size of the connection pool.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._request_param_check(name="max_connection_pool_size", get_updates=False)
+        self._max_connection_pool_size = max_connection_pool_size
+        return self
+
     def proxy_url(self: BuilderType, proxy_url: str) -> BuilderType:
         """Legacy name for :meth:`proxy`, kept for backward compatibility.
 
@@ -698,6 +765,50 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._http_version = http_version
         return self
 
+    def media_request(self: BuilderType, media_request: BaseRequest) -> BuilderType:
+        """Sets a :class:`telegram.request.BaseRequest` instance for the
+        :paramref:`telegram.Bot.media_request` parameter of :attr:`telegram.ext.Application.bot`.
+        This request object will be used for all requests that upload files, such that large
+        uploads don't occupy the connections of :meth:`request`. If not set, the request object
+        specified via :meth:`request` will be used for these requests.
+
+        .. seealso:: :meth:`request`, :meth:`interactive_request`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            media_request (:class:`telegram.request.BaseRequest`): The request instance.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._bot_check("media_request")
+        self._updater_check("media_request")
+        self._media_request = media_request
+        return self
+
+    def interactive_request(self: BuilderType, interactive_request: BaseRequest) -> BuilderType:
+        """Sets a :class:`telegram.request.BaseRequest` instance for the
+        :paramref:`telegram.Bot.interactive_request` parameter of
+        :attr:`telegram.ext.Application.bot`. This request object will be used for requests that
+        a user is actively waiting for, e.g. :meth:`telegram.Bot.answer_callback_query`. If not
+        set, the request object specified via :meth:`request` will be used for these requests.
+
+        .. seealso:: :meth:`request`, :meth:`media_request`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            interactive_request (:class:`telegram.request.BaseRequest`): The request instance.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._bot_check("interactive_request")
+        self._updater_check("interactive_request")
+        self._interactive_request = interactive_request
+        return self
+
     def get_updates_request(self: BuilderType, get_updates_request: BaseRequest) -> BuilderType:
         """Sets a :class:`telegram.request.BaseRequest` instance for the
         :paramref:`~telegram.Bot.get_updates_request` parameter of
@@ -734,6 +845,28 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._get_updates_connection_pool_size = get_updates_connection_pool_size
         return self
 
+    def get_updates_max_connection_pool_size(
+        self: BuilderType, get_updates_max_connection_pool_size: int
+    ) -> BuilderType:
+        """Sets the maximum size of the connection pool for the
+        :paramref:`telegram.request.HTTPXRequest.max_connection_pool_size` parameter which is
+        used for the :meth:`telegram.Bot.get_updates` request. Defaults to :obj:`None`.
+
+        .. seealso:: :meth:`max_connection_pool_size`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            get_updates_max_connection_pool_size (:obj:`int`): The maximum size of the
+                connection pool.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._request_param_check(name="max_connection_pool_size", get_updates=True)
+        self._get_updates_max_connection_pool_size = get_updates_max_connection_pool_size
+        return self
+
     def get_updates_proxy_url(self: BuilderType, get_updates_proxy_url: str) -> BuilderType:
         """Legacy name for :meth:`get_updates_proxy`, kept for backward compatibility.
 
@@ -923,6 +1056,31 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._get_updates_http_version = get_updates_http_version
         return self
 
+    def json_codec(self: BuilderType, json_codec: JSONCodec) -> BuilderType:
+        """Sets the codec that is used for the
+        :paramref:`~telegram.request.HTTPXRequest.json_codec` parameter of both
+        :attr:`telegram.Bot.request` and the request object used for
+        :meth:`telegram.Bot.get_updates`. It is used for encoding the parameters of all requests
+        to the Bot API, for decoding the responses and for decoding updates received via
+        :meth:`telegram.ext.Updater.start_webhook`. By default, the standard library's
+        :mod:`json` is used.
+
+        .. seealso:: :paramref:`telegram.ext.DictPersistence.json_codec`
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            json_codec (:class:`telegram.request.JSONCodec`): The codec.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._request_param_check(name="json_codec", get_updates=False)
+        if self._get_updates_request is not DEFAULT_NONE:
+            raise RuntimeError(_TWO_ARGS_REQ.format("json_codec", "get_updates_request instance"))
+        self._json_codec = json_codec
+        return self
+
     def private_key(
         self: BuilderType,
         private_key: Union[bytes, FilePathInput],
@@ -1029,6 +1187,55 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._local_mode = local_mode
         return self
 
+    def lazy_updates(self: BuilderType, lazy_updates: bool) -> BuilderType:
+        """Specifies the value for :paramref:`~telegram.ext.ExtBot.lazy_updates` for the
+        :attr:`telegram.ext.Application.bot`.
+        If not called, will default to :obj:`False`.
+
+        Tip:
+            Enabling this is useful for bots that receive many updates but only access a few
+            attributes of each, e.g. :attr:`telegram.Update.effective_message` and
+            :attr:`telegram.Update.effective_chat`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            lazy_updates (:obj:`bool`): Whether nested objects of incoming updates should be
+                decoded only on first access.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._bot_check("lazy_updates")
+        self._updater_check("lazy_updates")
+        self._lazy_updates = lazy_updates
+        return self
+
+    def intern_objects(self: BuilderType, intern_objects: Union[bool, int]) -> BuilderType:
+        """Specifies the value for :paramref:`~telegram.ext.ExtBot.intern_objects` for the
+        :attr:`telegram.ext.Application.bot`.
+        If not called, will default to :obj:`False`.
+
+        Tip:
+            Enabling this is useful for bots that receive many updates from a limited number of
+            users and chats.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            intern_objects (:obj:`bool` | :obj:`int`): Whether unchanged users and chats should
+                be shared between updates. Pass an integer to specify the maximum number of
+                objects cached in memory. If :obj:`True` is passed, the default value of
+                ``1024`` will be used.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._bot_check("intern_objects")
+        self._updater_check("intern_objects")
+        self._intern_objects = intern_objects
+        return self
+
     def bot(
         self: "ApplicationBuilder[BT, CCT, UD, CD, BD, JQ]",
         bot: InBT,
@@ -1381,6 +1588,24 @@ class ApplicationBuilder(Generic[BT, CCT, UD, CD, BD, JQ]):
         self._rate_limiter = rate_limiter
         return self  # type: ignore[return-value]
 
+    def request_scheduler(self: BuilderType, request_scheduler: "RequestScheduler") -> BuilderType:
+        """Sets a :class:`telegram.ext.RequestScheduler` instance for the
+        :paramref:`telegram.ext.ExtBot.request_scheduler` parameter of
+        :attr:`telegram.ext.Application.bot`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            request_scheduler (:class:`telegram.ext.RequestScheduler`): The request scheduler.
+
+        Returns:
+            :class:`ApplicationBuilder`: The same builder with the updated argument.
+        """
+        self._bot_check("request_scheduler")
+        self._updater_check("request_scheduler")
+        self._request_scheduler = request_scheduler
+        return self
+
 
 InitApplicationBuilder = (  # This is defined all the way down here so that its type is inferred
     ApplicationBuilder[  # by Pylance correctly.
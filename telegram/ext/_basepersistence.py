@@ -81,6 +81,9 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
     * :meth:`update_conversation`
     * :meth:`flush`
 
+    Persistence implementations that support :paramref:`lazy_loading` must additionally overwrite
+    :meth:`get_user_data_entry` and :meth:`get_chat_data_entry`.
+
     If you don't actually need one of those methods, a simple :keyword:`pass` is enough.
     For example, if you don't store ``bot_data``, you don't need :meth:`get_bot_data`,
     :meth:`update_bot_data` or :meth:`refresh_bot_data`.
@@ -131,6 +134,19 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
             seconds.
 
             .. versionadded:: 20.0
+        lazy_loading (:obj:`bool`, optional): If :obj:`True`, the
+            :class:`~telegram.ext.Application` does not load all ``user_data`` and ``chat_data``
+            on startup. Instead, the entries are loaded with :meth:`get_user_data_entry` and
+            :meth:`get_chat_data_entry` once they are needed. Defaults to :obj:`False`.
+
+            .. versionadded:: NEXT.VERSION
+        max_cached_entries (:obj:`int`, optional): If :paramref:`lazy_loading` is :obj:`True`,
+            the :class:`~telegram.ext.Application` keeps at most this many entries of
+            ``user_data`` and of ``chat_data`` in memory, respectively. The least recently used
+            entries are dropped from memory after they were written to the persistence. By
+            default, all entries are kept in memory once they were loaded.
+
+            .. versionadded:: NEXT.VERSION
     Attributes:
         store_data (:class:`~telegram.ext.PersistenceInput`): Specifies which kinds of data will
             be saved by this persistence instance.
@@ -138,6 +154,8 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
     """
 
     __slots__ = (
+        "_lazy_loading",
+        "_max_cached_entries",
         "_update_interval",
         "bot",
         "store_data",
@@ -147,9 +165,27 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
         self,
         store_data: Optional[PersistenceInput] = None,
         update_interval: float = 60,
+        *,
+        lazy_loading: bool = False,
+        max_cached_entries: Optional[int] = None,
     ):
         self.store_data: PersistenceInput = store_data or PersistenceInput()
         self._update_interval: float = update_interval
+        self._lazy_loading: bool = lazy_loading
+        self._max_cached_entries: Optional[int] = max_cached_entries
+
+        if lazy_loading and (
+            type(self).get_user_data_entry is BasePersistence.get_user_data_entry
+            or type(self).get_chat_data_entry is BasePersistence.get_chat_data_entry
+        ):
+            raise TypeError(
+                f"{type(self).__name__} does not support lazy loading of user_data and chat_data."
+            )
+        if max_cached_entries is not None:
+            if not lazy_loading:
+                raise ValueError("`max_cached_entries` can only be used with `lazy_loading`.")
+            if max_cached_entries < 1:
+                raise ValueError("`max_cached_entries` must be a positive integer.")
 
         self.bot: Bot = None  # type: ignore[assignment]
 
@@ -168,6 +204,37 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
             "You can not assign a new value to update_interval after initialization."
         )
 
+    @property
+    def lazy_loading(self) -> bool:
+        """:obj:`bool`: Whether the :class:`~telegram.ext.Application` loads the entries of
+        ``user_data`` and ``chat_data`` lazily.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._lazy_loading
+
+    @lazy_loading.setter
+    def lazy_loading(self, _: object) -> NoReturn:
+        raise AttributeError(
+            "You can not assign a new value to lazy_loading after initialization."
+        )
+
+    @property
+    def max_cached_entries(self) -> Optional[int]:
+        """:obj:`int`: Optional. The maximum number of entries of ``user_data`` and ``chat_data``,
+        respectively, that the :class:`~telegram.ext.Application` keeps in memory if
+        :attr:`lazy_loading` is :obj:`True`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._max_cached_entries
+
+    @max_cached_entries.setter
+    def max_cached_entries(self, _: object) -> NoReturn:
+        raise AttributeError(
+            "You can not assign a new value to max_cached_entries after initialization."
+        )
+
     def set_bot(self, bot: Bot) -> None:
         """Set the Bot to be used by this persistence instance.
 
@@ -221,6 +288,50 @@ class BasePersistence(Generic[UD, CD, BD], ABC):
                 The restored chat data.
         """
 
+    async def get_user_data_entry(self, user_id: int) -> Optional[UD]:
+        """Will be called by :class:`telegram.ext.Application` if :attr:`lazy_loading` is
+        :obj:`True` when the ``user_data`` of a user is needed for the first time, e.g. before
+        the first handler callback for an update from that user is run. It should return the
+        stored data of that user or :obj:`None`, if no data is stored for that user.
+
+        Note:
+            Persistence implementations that support lazy loading must override this method and
+            :meth:`get_chat_data_entry`. The default implementation raises
+            :exc:`NotImplementedError`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            user_id (:obj:`int`): The user id to load the data for.
+
+        Returns:
+            :obj:`dict` | :attr:`telegram.ext.ContextTypes.user_data` | :obj:`None`: The
+                restored data of the user.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support lazy loading.")
+
+    async def get_chat_data_entry(self, chat_id: int) -> Optional[CD]:
+        """Will be called by :class:`telegram.ext.Application` if :attr:`lazy_loading` is
+        :obj:`True` when the ``chat_data`` of a chat is needed for the first time, e.g. before
+        the first handler callback for an update from that chat is run. It should return the
+        stored data of that chat or :obj:`None`, if no data is stored for that chat.
+
+        Note:
+            Persistence implementations that support lazy loading must override this method and
+            :meth:`get_user_data_entry`. The default implementation raises
+            :exc:`NotImplementedError`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            chat_id (:obj:`int`): The chat id to load the data for.
+
+        Returns:
+            :obj:`dict` | :attr:`telegram.ext.ContextTypes.chat_data` | :obj:`None`: The
+                restored data of the chat.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support lazy loading.")
+
     @abstractmethod
     async def get_bot_data(self) -> BD:
         """Will be called by :class:`telegram.ext.Application` upon creation with a
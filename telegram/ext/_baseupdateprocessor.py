@@ -16,17 +16,25 @@
 #
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
-"""This module contains the BaseProcessor class."""
+"""This module contains the BaseProcessor class and its built-in implementations."""
+import asyncio
+import inspect
 from abc import ABC, abstractmethod
 from asyncio import BoundedSemaphore
+from collections import deque
+from collections.abc import Hashable
 from contextlib import AbstractAsyncContextManager
 from types import TracebackType
-from typing import TYPE_CHECKING, Any, Optional, TypeVar, final
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar, final
+
+from telegram._update import Update
+from telegram._utils.logging import get_logger
 
 if TYPE_CHECKING:
     from collections.abc import Awaitable
 
 _BUPT = TypeVar("_BUPT", bound="BaseUpdateProcessor")
+_LOGGER = get_logger(__name__)
 
 
 class BaseUpdateProcessor(AbstractAsyncContextManager["BaseUpdateProcessor"], ABC):
@@ -186,3 +194,190 @@ class SimpleUpdateProcessor(BaseUpdateProcessor):
 
     async def shutdown(self) -> None:
         """Does nothing."""
+
+
+def _chat_or_user_key(update: object) -> Optional[Hashable]:
+    if isinstance(update, Update):
+        if update.effective_chat:
+            return update.effective_chat.id
+        if update.effective_user:
+            return update.effective_user.id
+    return None
+
+
+class _KeyQueue:
+    """The updates of a single key that wait until the update currently processed for that key
+    is done, and the updates that wait for room in that queue, in the order of their arrival.
+    The futures of the latter are resolved with :obj:`True` once their coroutine was moved to the
+    queue and with :obj:`False` if they have to try again."""
+
+    __slots__ = ("coroutines", "waiters")
+
+    def __init__(self) -> None:
+        self.coroutines: deque["Awaitable[Any]"] = deque()
+        self.waiters: deque[tuple[asyncio.Future[bool], "Awaitable[Any]"]] = deque()
+
+    def admit_waiter(self) -> None:
+        """Moves the coroutine of the longest waiting update to the queue."""
+        while self.waiters:
+            future, coroutine = self.waiters.popleft()
+            if future.cancelled():
+                _close(coroutine)
+                continue
+            self.coroutines.append(coroutine)
+            future.set_result(True)
+            return
+
+
+def _close(coroutine: "Awaitable[Any]") -> None:
+    # Avoids warnings about coroutines that were never awaited
+    if inspect.iscoroutine(coroutine):
+        coroutine.close()
+
+
+class OrderedUpdateProcessor(BaseUpdateProcessor):
+    """Instance of :class:`telegram.ext.BaseUpdateProcessor` that processes updates concurrently
+    across chats while processing the updates of the same chat strictly one after another, in
+    the order in which they were received.
+
+    Updates are grouped by the key returned by :paramref:`key`. If an update arrives while
+    another update with the same key is still being processed, it is queued and processed by the
+    same task once the previous updates of that key are done. Queued updates don't occupy one of
+    the :attr:`~telegram.ext.BaseUpdateProcessor.max_concurrent_updates` slots, i.e. a busy chat
+    can not block the processing of updates from other chats.
+
+    Note:
+        For queued updates, :meth:`~telegram.ext.BaseUpdateProcessor.process_update` returns as
+        soon as the update is queued, i.e. before it is processed. Hence,
+        :class:`telegram.ext.Application` marks these updates as done in
+        :attr:`~telegram.ext.Application.update_queue` (see :meth:`asyncio.Queue.task_done`)
+        before they are processed. Use :attr:`queued_updates` and :attr:`active_keys` to check
+        whether updates are still pending.
+
+    Example:
+        .. code:: python
+
+            application = (
+                Application.builder()
+                .token("TOKEN")
+                .concurrent_updates(OrderedUpdateProcessor(256))
+                .build()
+            )
+
+    .. seealso:: :wiki:`Concurrency`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        max_concurrent_updates (:obj:`int`): The maximum number of updates to be processed
+            concurrently. If this number is exceeded, new updates will be queued until the number
+            of currently processed updates decreases.
+        key (Callable[[:obj:`object`], Hashable | :obj:`None`], optional): A function that
+            returns the key by which the updates are grouped. Updates for which the function
+            returns :obj:`None` are processed without any ordering guarantees. By default, updates
+            are grouped by the id of :attr:`telegram.Update.effective_chat` or, if that is not
+            available, by the id of :attr:`telegram.Update.effective_user`.
+        max_queue_size (:obj:`int`, optional): The maximum number of updates that may wait in the
+            queue of a single key. If the queue of a key is full, further updates of that key wait
+            until there is room again. While waiting, these updates count towards
+            :attr:`~telegram.ext.BaseUpdateProcessor.max_concurrent_updates`. Defaults to ``100``.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`max_concurrent_updates` or :paramref:`max_queue_size` is
+            a non-positive integer.
+    """
+
+    __slots__ = ("_key", "_max_queue_size", "_processed_updates", "_queues")
+
+    def __init__(
+        self,
+        max_concurrent_updates: int,
+        key: Optional[Callable[[object], Optional[Hashable]]] = None,
+        max_queue_size: int = 100,
+    ):
+        super().__init__(max_concurrent_updates)
+        if max_queue_size < 1:
+            raise ValueError("`max_queue_size` must be a positive integer!")
+        self._key: Callable[[object], Optional[Hashable]] = key or _chat_or_user_key
+        self._max_queue_size: int = max_queue_size
+        self._queues: dict[Hashable, _KeyQueue] = {}
+        self._processed_updates: int = 0
+
+    @property
+    def max_queue_size(self) -> int:
+        """:obj:`int`: The maximum number of updates that may wait in the queue of a single key."""
+        return self._max_queue_size
+
+    @property
+    def active_keys(self) -> int:
+        """:obj:`int`: The number of keys for which updates are currently being processed."""
+        return len(self._queues)
+
+    @property
+    def queued_updates(self) -> int:
+        """:obj:`int`: The total number of updates that currently wait in the queues of their
+        keys."""
+        return sum(len(queue.coroutines) for queue in self._queues.values())
+
+    @property
+    def processed_updates(self) -> int:
+        """:obj:`int`: The total number of updates processed by this processor."""
+        return self._processed_updates
+
+    async def do_process_update(
+        self,
+        update: object,
+        coroutine: "Awaitable[Any]",
+    ) -> None:
+        """Awaits the coroutine, if no other update with the same key is being processed.
+        Otherwise, the coroutine is queued and awaited after the previous updates of that key.
+
+        Args:
+            update (:obj:`object`): The update to be processed.
+            coroutine (:term:`Awaitable`): The coroutine that will be awaited to process the
+                update.
+        """
+        key = self._key(update)
+        if key is None:
+            await self._run(coroutine)
+            return
+
+        while (queue := self._queues.get(key)) is not None:
+            # Updates that arrive later must not overtake the ones waiting for room
+            if not queue.waiters and len(queue.coroutines) < self._max_queue_size:
+                queue.coroutines.append(coroutine)
+                return
+            future = asyncio.get_running_loop().create_future()
+            queue.waiters.append((future, coroutine))
+            if await future:
+                return
+
+        queue = self._queues[key] = _KeyQueue()
+        try:
+            await self._run(coroutine)
+            while queue.coroutines:
+                next_coroutine = queue.coroutines.popleft()
+                queue.admit_waiter()
+                await self._run(next_coroutine)
+        finally:
+            del self._queues[key]
+            # Only happens if we were cancelled. The waiting updates try again in their order.
+            for pending in queue.coroutines:
+                _close(pending)
+            for future, _ in queue.waiters:
+                if not future.done():
+                    future.set_result(False)
+
+    async def _run(self, coroutine: "Awaitable[Any]") -> None:
+        try:
+            await coroutine
+        except Exception:
+            _LOGGER.exception("An error was raised while processing an update.")
+        finally:
+            self._processed_updates += 1
+
+    async def initialize(self) -> None:
+        """Does nothing."""
+
+    async def shutdown(self) -> None:
+        """Does nothing."""
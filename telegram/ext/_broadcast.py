@@ -0,0 +1,217 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the BroadcastReport class and the logic behind
+:meth:`telegram.ext.Application.broadcast`."""
+import asyncio
+import time
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Coroutine, Iterable
+from typing import Any, Callable, Optional, Union
+
+from telegram._utils.logging import get_logger
+from telegram._utils.repr import build_repr_with_selected_attrs
+from telegram.error import ChatMigrated, Forbidden, RetryAfter
+
+_LOGGER = get_logger(__name__)
+
+
+class BroadcastReport:
+    """This object reports the progress of a broadcast started with
+    :meth:`telegram.ext.Application.broadcast`.
+
+    The report is updated while the broadcast is running. Store :attr:`offset` in a checkpoint to
+    be able to resume the broadcast after a crash by passing it as
+    :paramref:`~telegram.ext.Application.broadcast.start_offset`.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        start_offset (:obj:`int`, optional): The number of recipients that were skipped at the
+            start of the broadcast. Defaults to ``0``.
+
+    Attributes:
+        offset (:obj:`int`): The number of recipients, counted from the start of the recipients
+            passed to :meth:`~telegram.ext.Application.broadcast`, for which the broadcast is
+            completed. All recipients before this offset were processed, while some recipients
+            after it may have been processed already, too.
+        sent (:obj:`int`): The number of recipients to which the message was sent successfully.
+        failed_chat_ids (list[:obj:`int` | :obj:`str`]): The recipients for which sending failed
+            due to reasons other than those listed below.
+        blocked_chat_ids (list[:obj:`int` | :obj:`str`]): The recipients for which sending
+            failed with :exc:`telegram.error.Forbidden`, e.g. because the user blocked the bot.
+        migrated_chat_ids (dict[:obj:`int` | :obj:`str`, :obj:`int`]): Maps the recipients that
+            were migrated to a supergroup to the id of the new supergroup. The message was sent
+            to the new supergroup.
+    """
+
+    __slots__ = (
+        "_end_time",
+        "_start_time",
+        "blocked_chat_ids",
+        "failed_chat_ids",
+        "migrated_chat_ids",
+        "offset",
+        "sent",
+    )
+
+    def __init__(self, start_offset: int = 0):
+        self.offset: int = start_offset
+        self.sent: int = 0
+        self.failed_chat_ids: list[Union[int, str]] = []
+        self.blocked_chat_ids: list[Union[int, str]] = []
+        self.migrated_chat_ids: dict[Union[int, str], int] = {}
+        self._start_time: float = time.perf_counter()
+        self._end_time: Optional[float] = None
+
+    def __repr__(self) -> str:
+        """Give a string representation of the report in the form
+        ``BroadcastReport[offset=..., sent=..., done=...]``.
+
+        As this class doesn't implement :meth:`object.__str__`, the default implementation
+        will be used, which is equivalent to :meth:`__repr__`.
+
+        Returns:
+            :obj:`str`
+        """
+        return build_repr_with_selected_attrs(
+            self, offset=self.offset, sent=self.sent, done=self.done
+        )
+
+    @property
+    def done(self) -> bool:
+        """:obj:`bool`: Whether the broadcast is finished."""
+        return self._end_time is not None
+
+    @property
+    def elapsed(self) -> float:
+        """:obj:`float`: The time in seconds that the broadcast has been running for or, if it is
+        finished, took."""
+        return (self._end_time or time.perf_counter()) - self._start_time
+
+    @property
+    def throughput(self) -> float:
+        """:obj:`float`: The average number of messages sent per second."""
+        elapsed = self.elapsed
+        return self.sent / elapsed if elapsed > 0 else 0.0
+
+    def _finish(self) -> None:
+        self._end_time = time.perf_counter()
+
+
+async def _aenumerate(
+    chat_ids: Union[Iterable[Union[int, str]], AsyncIterable[Union[int, str]]]
+) -> AsyncIterator[tuple[int, Union[int, str]]]:
+    index = 0
+    if isinstance(chat_ids, AsyncIterable):
+        async for chat_id in chat_ids:
+            yield index, chat_id
+            index += 1
+    else:
+        for chat_id in chat_ids:
+            yield index, chat_id
+            index += 1
+
+
+async def run_broadcast(
+    chat_ids: Union[Iterable[Union[int, str]], AsyncIterable[Union[int, str]]],
+    callback: Callable[[Union[int, str]], Awaitable[object]],
+    *,
+    start_offset: int,
+    max_concurrent_sends: int,
+    max_retries: int,
+    checkpoint_callback: Optional[Callable[[BroadcastReport], Coroutine[Any, Any, None]]],
+    checkpoint_interval: float,
+    on_migrate: Callable[[Union[int, str], int], None],
+) -> BroadcastReport:
+    """Implementation of :meth:`telegram.ext.Application.broadcast`. See there for details."""
+    report = BroadcastReport(start_offset)
+    semaphore = asyncio.Semaphore(max_concurrent_sends)
+    tasks: set[asyncio.Task] = set()
+    # Indices beyond report.offset that are already done
+    done_indices: set[int] = set()
+    last_checkpoint = time.perf_counter()
+
+    async def send(chat_id: Union[int, str]) -> None:
+        attempt = 0
+        while True:
+            try:
+                await callback(chat_id)
+                report.sent += 1
+                return
+            except RetryAfter as exc:
+                if attempt >= max_retries:
+                    _LOGGER.warning("Flood limit hit for %s too often, giving up.", chat_id)
+                    report.failed_chat_ids.append(chat_id)
+                    return
+                await asyncio.sleep(exc.retry_after)
+            except ChatMigrated as exc:
+                if attempt >= max_retries:
+                    report.failed_chat_ids.append(chat_id)
+                    return
+                report.migrated_chat_ids[chat_id] = exc.new_chat_id
+                on_migrate(chat_id, exc.new_chat_id)
+                chat_id = exc.new_chat_id
+            except Forbidden:
+                report.blocked_chat_ids.append(chat_id)
+                return
+            except Exception:
+                _LOGGER.exception("Sending the broadcast to %s failed.", chat_id)
+                report.failed_chat_ids.append(chat_id)
+                return
+            attempt += 1
+
+    async def process(index: int, chat_id: Union[int, str]) -> None:
+        try:
+            await send(chat_id)
+        finally:
+            semaphore.release()
+        # Only reached if `send` returned normally. Recipients whose task was cancelled must not
+        # be covered by the offset, as resuming from a checkpoint would skip them otherwise.
+        done_indices.add(index)
+        while report.offset in done_indices:
+            done_indices.remove(report.offset)
+            report.offset += 1
+
+    try:
+        async for index, chat_id in _aenumerate(chat_ids):
+            if index < start_offset:
+                continue
+
+            await semaphore.acquire()
+            task = asyncio.create_task(process(index, chat_id))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+
+            now = time.perf_counter()
+            if checkpoint_callback and now - last_checkpoint >= checkpoint_interval:
+                await checkpoint_callback(report)
+                last_checkpoint = now
+
+        await asyncio.gather(*tasks)
+    except BaseException:
+        # E.g. if the broadcast was cancelled or the checkpoint callback failed
+        for task in tasks:
+            task.cancel()
+        # Wait for the cancellation to complete, such that the report is final
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    report._finish()  # pylint: disable=protected-access
+    if checkpoint_callback:
+        await checkpoint_callback(report)
+    return report
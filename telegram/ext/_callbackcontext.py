@@ -223,8 +223,16 @@ class CallbackContext(Generic[BT, UD, CD, BD]):
         :meth:`telegram.ext.Job.run`.
 
         .. versionadded:: 13.6
+
+        .. versionchanged:: NEXT.VERSION
+            If :attr:`telegram.ext.BasePersistence.lazy_loading` is :obj:`True`, the
+            :attr:`chat_data` and :attr:`user_data` are loaded from the persistence first, if
+            they were not loaded yet.
         """
         if self.application.persistence:
+            await self.application._load_lazy_data(  # pylint: disable=protected-access
+                chat_id=self._chat_id, user_id=self._user_id
+            )
             if self.application.persistence.store_data.bot_data:
                 await self.application.persistence.refresh_bot_data(self.bot_data)
             if self.application.persistence.store_data.chat_data and self._chat_id is not None:
@@ -17,12 +17,12 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the DictPersistence class."""
-import json
 from copy import deepcopy
 from typing import TYPE_CHECKING, Any, Optional, cast
 
 from telegram.ext import BasePersistence, PersistenceInput
 from telegram.ext._utils.types import CDCData, ConversationDict, ConversationKey
+from telegram.request._jsoncodec import DEFAULT_JSON_CODEC, JSONCodec
 
 if TYPE_CHECKING:
     from telegram._utils.types import JSONDict
@@ -43,7 +43,7 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
           writing them to file/database.
 
         * This implementation of :class:`BasePersistence` does not handle data that cannot be
-          serialized by :func:`json.dumps`.
+          serialized by :func:`json.dumps` (or the :paramref:`json_codec`, if passed).
 
     .. seealso:: :wiki:`Making Your Bot Persistent <Making-your-bot-persistent>`
 
@@ -72,6 +72,13 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
             wait between two consecutive runs of updating the persistence. Defaults to 60 seconds.
 
             .. versionadded:: 20.0
+        json_codec (:class:`telegram.request.JSONCodec`, optional): The codec to use for encoding
+            and decoding the data. Note that the keys of :attr:`user_data` and :attr:`chat_data`
+            are integers, so the codec must be able to encode dictionaries with non-string keys.
+            Defaults to a codec that uses the standard library's :mod:`json`.
+
+            .. versionadded:: NEXT.VERSION
+
     Attributes:
         store_data (:class:`~telegram.ext.PersistenceInput`): Specifies which kinds of data will
             be saved by this persistence instance.
@@ -86,6 +93,7 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
         "_chat_data_json",
         "_conversations",
         "_conversations_json",
+        "_json_codec",
         "_user_data",
         "_user_data_json",
     )
@@ -99,8 +107,10 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
         conversations_json: str = "",
         callback_data_json: str = "",
         update_interval: float = 60,
+        json_codec: Optional[JSONCodec] = None,
     ):
         super().__init__(store_data=store_data, update_interval=update_interval)
+        self._json_codec: JSONCodec = json_codec or DEFAULT_JSON_CODEC
         self._user_data = None
         self._chat_data = None
         self._bot_data = None
@@ -113,19 +123,23 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
         self._conversations_json: Optional[str] = None
         if user_data_json:
             try:
-                self._user_data = self._decode_user_chat_data_from_json(user_data_json)
+                self._user_data = self._decode_user_chat_data_from_json(
+                    user_data_json, self._json_codec
+                )
                 self._user_data_json = user_data_json
             except (ValueError, AttributeError) as exc:
                 raise TypeError("Unable to deserialize user_data_json. Not valid JSON") from exc
         if chat_data_json:
             try:
-                self._chat_data = self._decode_user_chat_data_from_json(chat_data_json)
+                self._chat_data = self._decode_user_chat_data_from_json(
+                    chat_data_json, self._json_codec
+                )
                 self._chat_data_json = chat_data_json
             except (ValueError, AttributeError) as exc:
                 raise TypeError("Unable to deserialize chat_data_json. Not valid JSON") from exc
         if bot_data_json:
             try:
-                self._bot_data = json.loads(bot_data_json)
+                self._bot_data = self._json_codec.loads(bot_data_json)
                 self._bot_data_json = bot_data_json
             except (ValueError, AttributeError) as exc:
                 raise TypeError("Unable to deserialize bot_data_json. Not valid JSON") from exc
@@ -133,7 +147,7 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
                 raise TypeError("bot_data_json must be serialized dict")
         if callback_data_json:
             try:
-                data = json.loads(callback_data_json)
+                data = self._json_codec.loads(callback_data_json)
             except (ValueError, AttributeError) as exc:
                 raise TypeError(
                     "Unable to deserialize callback_data_json. Not valid JSON"
@@ -162,7 +176,9 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
 
         if conversations_json:
             try:
-                self._conversations = self._decode_conversations_from_json(conversations_json)
+                self._conversations = self._decode_conversations_from_json(
+                    conversations_json, self._json_codec
+                )
                 self._conversations_json = conversations_json
             except (ValueError, AttributeError) as exc:
                 raise TypeError(
@@ -179,7 +195,7 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
         """:obj:`str`: The user_data serialized as a JSON-string."""
         if self._user_data_json:
             return self._user_data_json
-        return json.dumps(self.user_data)
+        return self._json_codec.dumps(self.user_data)
 
     @property
     def chat_data(self) -> Optional[dict[int, dict[Any, Any]]]:
@@ -191,7 +207,7 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
         """:obj:`str`: The chat_data serialized as a JSON-string."""
         if self._chat_data_json:
             return self._chat_data_json
-        return json.dumps(self.chat_data)
+        return self._json_codec.dumps(self.chat_data)
 
     @property
     def bot_data(self) -> Optional[dict[Any, Any]]:
@@ -203,7 +219,7 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
         """:obj:`str`: The bot_data serialized as a JSON-string."""
         if self._bot_data_json:
             return self._bot_data_json
-        return json.dumps(self.bot_data)
+        return self._json_codec.dumps(self.bot_data)
 
     @property
     def callback_data(self) -> Optional[CDCData]:
@@ -222,7 +238,7 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
         """
         if self._callback_data_json:
             return self._callback_data_json
-        return json.dumps(self.callback_data)
+        return self._json_codec.dumps(self.callback_data)
 
     @property
     def conversations(self) -> Optional[dict[str, ConversationDict]]:
@@ -235,8 +251,8 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
         if self._conversations_json:
             return self._conversations_json
         if self.conversations:
-            return self._encode_conversations_to_json(self.conversations)
-        return json.dumps(self.conversations)
+            return self._encode_conversations_to_json(self.conversations, self._json_codec)
+        return self._json_codec.dumps(self.conversations)
 
     async def get_user_data(self) -> dict[int, dict[object, object]]:
         """Returns the user_data created from the ``user_data_json`` or an empty :obj:`dict`.
@@ -420,12 +436,16 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
         """
 
     @staticmethod
-    def _encode_conversations_to_json(conversations: dict[str, ConversationDict]) -> str:
+    def _encode_conversations_to_json(
+        conversations: dict[str, ConversationDict],
+        json_codec: JSONCodec = DEFAULT_JSON_CODEC,
+    ) -> str:
         """Helper method to encode a conversations dict (that uses tuples as keys) to a
         JSON-serializable way. Use :meth:`self._decode_conversations_from_json` to decode.
 
         Args:
             conversations (:obj:`dict`): The conversations dict to transform to JSON.
+            json_codec (:class:`telegram.request.JSONCodec`, optional): The codec to use.
 
         Returns:
             :obj:`str`: The JSON-serialized conversations dict
@@ -434,41 +454,47 @@ class DictPersistence(BasePersistence[dict[Any, Any], dict[Any, Any], dict[Any,
         for handler, states in conversations.items():
             tmp[handler] = {}
             for key, state in states.items():
-                tmp[handler][json.dumps(key)] = state
-        return json.dumps(tmp)
+                tmp[handler][json_codec.dumps(key)] = state
+        return json_codec.dumps(tmp)
 
     @staticmethod
-    def _decode_conversations_from_json(json_string: str) -> dict[str, ConversationDict]:
+    def _decode_conversations_from_json(
+        json_string: str, json_codec: JSONCodec = DEFAULT_JSON_CODEC
+    ) -> dict[str, ConversationDict]:
         """Helper method to decode a conversations dict (that uses tuples as keys) from a
         JSON-string created with :meth:`self._encode_conversations_to_json`.
 
         Args:
             json_string (:obj:`str`): The conversations dict as JSON string.
+            json_codec (:class:`telegram.request.JSONCodec`, optional): The codec to use.
 
         Returns:
             :obj:`dict`: The conversations dict after decoding
         """
-        tmp = json.loads(json_string)
+        tmp = json_codec.loads(json_string)
         conversations: dict[str, ConversationDict] = {}
         for handler, states in tmp.items():
             conversations[handler] = {}
             for key, state in states.items():
-                conversations[handler][tuple(json.loads(key))] = state
+                conversations[handler][tuple(json_codec.loads(key))] = state
         return conversations
 
     @staticmethod
-    def _decode_user_chat_data_from_json(data: str) -> dict[int, dict[object, object]]:
+    def _decode_user_chat_data_from_json(
+        data: str, json_codec: JSONCodec = DEFAULT_JSON_CODEC
+    ) -> dict[int, dict[object, object]]:
         """Helper method to decode chat or user data (that uses ints as keys) from a
         JSON-string.
 
         Args:
             data (:obj:`str`): The user/chat_data dict as JSON string.
+            json_codec (:class:`telegram.request.JSONCodec`, optional): The codec to use.
 
         Returns:
             :obj:`dict`: The user/chat_data defaultdict after decoding
         """
         tmp: dict[int, dict[object, object]] = {}
-        decoded_data = json.loads(data)
+        decoded_data = json_codec.loads(data)
         for user, user_data in decoded_data.items():
             int_user_id = int(user)
             tmp[int_user_id] = {}
@@ -91,6 +91,7 @@ from telegram import (
 )
 from telegram._utils.datetime import to_timestamp
 from telegram._utils.defaultvalue import DEFAULT_NONE, DefaultValue
+from telegram._utils.interning import InternCache
 from telegram._utils.logging import get_logger
 from telegram._utils.repr import build_repr_with_selected_attrs
 from telegram._utils.types import CorrectOptionID, FileInput, JSONDict, ODVInput, ReplyMarkup
@@ -113,7 +114,7 @@ if TYPE_CHECKING:
         PassportElementError,
         ShippingOption,
     )
-    from telegram.ext import BaseRateLimiter, Defaults
+    from telegram.ext import BaseRateLimiter, Defaults, RequestScheduler
 
 HandledTypes = TypeVar("HandledTypes", bound=Union[Message, CallbackQuery, ChatFullInfo])
 KT = TypeVar("KT", bound=ReplyMarkup)
@@ -170,10 +171,42 @@ class ExtBot(Bot, Generic[RLARGS]):
             limiting the number of requests made by the bot per time interval.
 
             .. versionadded:: 20.0
+        lazy_updates (:obj:`bool`, optional): Whether incoming updates should be decoded lazily.
+            If :obj:`True`, nested objects like :attr:`telegram.Update.message` or
+            :attr:`telegram.Message.reply_to_message` are only converted from JSON on first
+            access. This reduces the cost of processing updates of which only a few attributes
+            are used. Equality and immutability of the updates are not affected. Defaults to
+            :obj:`False`.
+
+            .. versionadded:: NEXT.VERSION
+        request_scheduler (:class:`telegram.ext.RequestScheduler`, optional): A scheduler that
+            prioritizes the requests made by the bot, e.g. to answer callback queries before
+            sending the messages of a broadcast.
+
+            .. versionadded:: NEXT.VERSION
+        intern_objects (:obj:`bool` | :obj:`int`, optional): Whether instances of
+            :class:`telegram.User` and :class:`telegram.Chat` decoded by this bot should be shared
+            between updates. If the JSON data of a user or chat is unchanged since it was last
+            decoded, the existing instance is returned instead of building a new one. This reduces
+            the number of allocated objects when the same users and chats send many updates.
+            Pass an integer to specify the maximum number of objects cached in memory.
+            Defaults to :obj:`False`.
+
+            Caution:
+                Shared instances are identical across updates. Changes made to one of them, e.g.
+                via :meth:`~telegram.TelegramObject.set_bot`, affect all updates holding it.
+
+            .. versionadded:: NEXT.VERSION
 
     """
 
-    __slots__ = ("_callback_data_cache", "_defaults", "_rate_limiter")
+    __slots__ = (
+        "_callback_data_cache",
+        "_defaults",
+        "_lazy_updates",
+        "_rate_limiter",
+        "_request_scheduler",
+    )
 
     _LOGGER = get_logger(__name__, class_name="ExtBot")
 
@@ -193,6 +226,11 @@ class ExtBot(Bot, Generic[RLARGS]):
         defaults: Optional["Defaults"] = None,
         arbitrary_callback_data: Union[bool, int] = False,
         local_mode: bool = False,
+        lazy_updates: bool = False,
+        request_scheduler: Optional["RequestScheduler"] = None,
+        media_request: Optional[BaseRequest] = None,
+        interactive_request: Optional[BaseRequest] = None,
+        intern_objects: Union[bool, int] = False,
     ): ...
 
     @overload
@@ -209,6 +247,11 @@ class ExtBot(Bot, Generic[RLARGS]):
         arbitrary_callback_data: Union[bool, int] = False,
         local_mode: bool = False,
         rate_limiter: Optional["BaseRateLimiter[RLARGS]"] = None,
+        lazy_updates: bool = False,
+        request_scheduler: Optional["RequestScheduler"] = None,
+        media_request: Optional[BaseRequest] = None,
+        interactive_request: Optional[BaseRequest] = None,
+        intern_objects: Union[bool, int] = False,
     ): ...
 
     def __init__(
@@ -224,6 +267,11 @@ class ExtBot(Bot, Generic[RLARGS]):
         arbitrary_callback_data: Union[bool, int] = False,
         local_mode: bool = False,
         rate_limiter: Optional["BaseRateLimiter[RLARGS]"] = None,
+        lazy_updates: bool = False,
+        request_scheduler: Optional["RequestScheduler"] = None,
+        media_request: Optional[BaseRequest] = None,
+        interactive_request: Optional[BaseRequest] = None,
+        intern_objects: Union[bool, int] = False,
     ):
         super().__init__(
             token=token,
@@ -234,12 +282,21 @@ class ExtBot(Bot, Generic[RLARGS]):
             private_key=private_key,
             private_key_password=private_key_password,
             local_mode=local_mode,
+            media_request=media_request,
+            interactive_request=interactive_request,
         )
         with self._unfrozen():
             self._defaults: Optional[Defaults] = defaults
             self._rate_limiter: Optional[BaseRateLimiter] = rate_limiter
+            self._lazy_updates: bool = lazy_updates
+            self._request_scheduler: Optional[RequestScheduler] = request_scheduler
             self._callback_data_cache: Optional[CallbackDataCache] = None
 
+            if intern_objects is not False:
+                self._intern_cache = InternCache(
+                    maxsize=1024 if intern_objects is True else cast(int, intern_objects)
+                )
+
             # set up callback_data
             if arbitrary_callback_data is False:
                 return
@@ -341,7 +398,7 @@ class ExtBot(Bot, Generic[RLARGS]):
         pool_timeout: ODVInput[float] = DEFAULT_NONE,
     ) -> Union[bool, JSONDict, list[JSONDict]]:
         """Order of method calls is: Bot.some_method -> Bot._post -> Bot._do_post.
-        So we can override Bot._do_post to add rate limiting.
+        So we can override Bot._do_post to add request scheduling and rate limiting.
         """
         rate_limit_args = self._extract_rl_kwargs(data)
         if not self.rate_limiter and rate_limit_args is not None:
@@ -349,8 +406,8 @@ class ExtBot(Bot, Generic[RLARGS]):
                 "`rate_limit_args` can only be used if a `ExtBot.rate_limiter` is set."
             )
 
-        # getting updates should not be rate limited!
-        if endpoint == "getUpdates" or not self.rate_limiter:
+        # getting updates should not be rate limited or scheduled!
+        if endpoint == "getUpdates" or not (self.rate_limiter or self.request_scheduler):
             return await super()._do_post(
                 endpoint=endpoint,
                 data=data,
@@ -366,15 +423,42 @@ class ExtBot(Bot, Generic[RLARGS]):
             "connect_timeout": connect_timeout,
             "pool_timeout": pool_timeout,
         }
+        if not self.rate_limiter:
+            return await self.request_scheduler.process_request(  # type: ignore[union-attr]
+                callback=super()._do_post,
+                args=(endpoint, data),
+                kwargs=kwargs,
+                endpoint=endpoint,
+                data=data,
+            )
+
         self._LOGGER.debug(
             "Passing request through rate limiter of type %s with rate_limit_args %s",
             type(self.rate_limiter),
             rate_limit_args,
         )
+        if not self.request_scheduler:
+            return await self.rate_limiter.process_request(
+                callback=super()._do_post,
+                args=(endpoint, data),
+                kwargs=kwargs,
+                endpoint=endpoint,
+                data=data,
+                rate_limit_args=rate_limit_args,
+            )
+        # The request takes a slot of the scheduler only once the rate limiter lets it pass.
+        # Otherwise, requests waiting in the rate limiter, e.g. the ones of a broadcast, could
+        # occupy all slots and block requests of higher priority.
         return await self.rate_limiter.process_request(
-            callback=super()._do_post,
-            args=(endpoint, data),
-            kwargs=kwargs,
+            callback=self.request_scheduler.process_request,
+            args=(),
+            kwargs={
+                "callback": super()._do_post,
+                "args": (endpoint, data),
+                "kwargs": kwargs,
+                "endpoint": endpoint,
+                "data": data,
+            },
             endpoint=endpoint,
             data=data,
             rate_limit_args=rate_limit_args,
@@ -395,6 +479,32 @@ class ExtBot(Bot, Generic[RLARGS]):
         # This is a property because the rate limiter shouldn't be changed at runtime
         return self._rate_limiter
 
+    @property
+    def request_scheduler(self) -> Optional["RequestScheduler"]:
+        """The :class:`telegram.ext.RequestScheduler` used by this bot, if any.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        # This is a property because the scheduler shouldn't be changed at runtime
+        return self._request_scheduler
+
+    @property
+    def lazy_updates(self) -> bool:
+        """:obj:`bool`: Whether incoming updates are decoded lazily.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._lazy_updates
+
+    def _parse_updates(self, data: list[JSONDict]) -> tuple[Update, ...]:
+        if not self._lazy_updates:
+            return super()._parse_updates(data)
+        return tuple(
+            update
+            for update in (Update._de_json_lazy(entry, self) for entry in data)
+            if update is not None
+        )
+
     def _merge_lpo_defaults(
         self, lpo: ODVInput[LinkPreviewOptions]
     ) -> Optional[LinkPreviewOptions]:
@@ -545,6 +655,10 @@ class ExtBot(Bot, Generic[RLARGS]):
         # * Messages where the reply_to_message is sent by the bot
         # * Messages where via_bot is the bot
         # Finally there is effective_chat.pinned message, but that's only returned in get_chat
+        if self.callback_data_cache is None:
+            # Return early so that lazily decoded updates stay undecoded
+            return
+
         if update.callback_query:
             self._insert_callback_data(update.callback_query)
         # elif instead of if, as effective_message includes callback_query.message
@@ -956,6 +956,8 @@ class Job(Generic[CCT]):
     async def _run(
         self, application: "Application[Any, CCT, Any, Any, Any, JobQueue[CCT]]"
     ) -> None:
+        # pylint: disable=protected-access
+        pinned_context = None
         try:
             try:
                 context = application.context_types.context.from_job(self, application)
@@ -968,6 +970,9 @@ class Job(Generic[CCT]):
                 return
 
             await context.refresh_data()
+            # Keeps the data from being evicted while the job uses it
+            application._pin_lazy_data(context)
+            pinned_context = context
             await self.callback(context)
         except Exception as exc:
             await application.create_task(
@@ -976,7 +981,9 @@ class Job(Generic[CCT]):
             )
         finally:
             # This is internal logic of application - let's keep it private for now
-            application._mark_for_persistence_update(job=self)  # pylint: disable=protected-access
+            application._mark_for_persistence_update(job=self)
+            if pinned_context is not None:
+                application._unpin_lazy_data(pinned_context)
 
     def schedule_removal(self) -> None:
         """
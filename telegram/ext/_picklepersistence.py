@@ -17,12 +17,20 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains the PicklePersistence class."""
+import asyncio
+import glob
+import io
+import os
 import pickle
+import shutil
+import struct
+import zlib
 from copy import deepcopy
 from pathlib import Path
 from typing import Any, Callable, Optional, TypeVar, Union, cast, overload
 
 from telegram import Bot, TelegramObject
+from telegram._utils.logging import get_logger
 from telegram._utils.types import FilePathInput
 from telegram._utils.warnings import warn
 from telegram.ext import BasePersistence, PersistenceInput
@@ -31,6 +39,10 @@ from telegram.ext._utils.types import BD, CD, UD, CDCData, ConversationDict, Con
 
 _REPLACED_KNOWN_BOT = "a known bot replaced by PTB's PicklePersistence"
 _REPLACED_UNKNOWN_BOT = "an unknown bot replaced by PTB's PicklePersistence"
+# Each journal record is prefixed by the length and the CRC32 checksum of the pickled record
+_JOURNAL_HEADER = struct.Struct(">II")
+
+_LOGGER = get_logger(__name__, class_name="PicklePersistence")
 
 TelegramObj = TypeVar("TelegramObj", bound=TelegramObject)
 
@@ -167,6 +179,34 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             wait between two consecutive runs of updating the persistence. Defaults to 60 seconds.
 
             .. versionadded:: 20.0
+        journal (:obj:`bool`, optional): When :obj:`True` and :attr:`on_flush` is :obj:`False`,
+            changes are not saved by rewriting the pickle file(s). Instead, only the changed
+            entry is appended to the journal file ``filepath_journal``. When loading the data, the
+            journal is replayed on top of the pickle file(s). If the last entry of the journal was
+            not written completely, e.g. because the process was killed, it is discarded.
+            The ``update_*`` and ``drop_*`` methods return only after the entry was written to
+            the journal and flushed to disk with :func:`os.fsync`, so that completed updates
+            survive a crash of the process or the machine, as far as the operating system and the
+            storage honor :func:`os.fsync`. Entries of concurrent updates are written in a
+            background thread and synced together. Defaults to :obj:`False`.
+
+            .. versionadded:: NEXT.VERSION
+        journal_compaction_threshold (:obj:`int`, optional): When :attr:`journal` is
+            :obj:`True`, the journal is compacted once it contains this many entries. That is,
+            the pickle file(s) are rewritten in a background thread and the journal is cleared.
+            :meth:`flush` always compacts the journal. Defaults to ``10_000``.
+
+            .. versionadded:: NEXT.VERSION
+        shards (:obj:`int`, optional): If passed, :attr:`single_file` is ignored and the user
+            and chat data are split into this many files each, named ``filepath_user_data_<n>``
+            and ``filepath_chat_data_<n>``, where ``n`` is the id modulo :paramref:`shards`. The
+            other data is stored as for ``single_file=False``. Only files that contain changed
+            data are rewritten and the files are loaded in parallel on startup. When the number
+            of shards is changed, the existing files are migrated on the next write. The same
+            applies to a file that was written with ``single_file=True``, which is deleted
+            after the migration.
+
+            .. versionadded:: NEXT.VERSION
     Attributes:
         filepath (:obj:`str` | :obj:`pathlib.Path`): The filepath for storing the pickle files.
             When :attr:`single_file` is :obj:`False` this will be used as a prefix.
@@ -183,16 +223,39 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             in the ``context`` interface.
 
             .. versionadded:: 13.6
+        journal (:obj:`bool`): Whether changes are appended to a journal file instead of
+            rewriting the pickle file(s).
+
+            .. versionadded:: NEXT.VERSION
+        journal_compaction_threshold (:obj:`int`): Number of journal entries after which the
+            journal is compacted.
+
+            .. versionadded:: NEXT.VERSION
+        shards (:obj:`int`): Optional. The number of files that user and chat data are split
+            into each.
+
+            .. versionadded:: NEXT.VERSION
     """
 
     __slots__ = (
+        "_compaction_lock",
+        "_dirty",
+        "_journal_lock",
+        "_journal_pending",
+        "_journal_records",
+        "_loaded",
+        "_shard_keys",
+        "_stale_files",
         "bot_data",
         "callback_data",
         "chat_data",
         "context_types",
         "conversations",
         "filepath",
+        "journal",
+        "journal_compaction_threshold",
         "on_flush",
+        "shards",
         "single_file",
         "user_data",
     )
@@ -205,6 +268,10 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         single_file: bool = True,
         on_flush: bool = False,
         update_interval: float = 60,
+        *,
+        journal: bool = False,
+        journal_compaction_threshold: int = 10_000,
+        shards: Optional[int] = None,
     ): ...
 
     @overload
@@ -216,6 +283,10 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         on_flush: bool = False,
         update_interval: float = 60,
         context_types: Optional[ContextTypes[Any, UD, CD, BD]] = None,
+        *,
+        journal: bool = False,
+        journal_compaction_threshold: int = 10_000,
+        shards: Optional[int] = None,
     ): ...
 
     def __init__(
@@ -226,6 +297,10 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         on_flush: bool = False,
         update_interval: float = 60,
         context_types: Optional[ContextTypes[Any, UD, CD, BD]] = None,
+        *,
+        journal: bool = False,
+        journal_compaction_threshold: int = 10_000,
+        shards: Optional[int] = None,
     ):
         super().__init__(store_data=store_data, update_interval=update_interval)
         self.filepath: Path = Path(filepath)
@@ -239,6 +314,26 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         self.context_types: ContextTypes[Any, UD, CD, BD] = cast(
             ContextTypes[Any, UD, CD, BD], context_types or ContextTypes()
         )
+        self.journal: bool = journal
+        self.journal_compaction_threshold: int = journal_compaction_threshold
+        self.shards: Optional[int] = shards
+        if shards is not None and shards < 1:
+            raise ValueError("`shards` must be a positive integer.")
+        self._loaded: bool = False
+        self._journal_records: int = 0
+        # Bookkeeping for the sharded layout: The keys stored in each shard, the files that have
+        # to be written and the files that are replaced by files in the current layout
+        self._shard_keys: dict[str, list[set[int]]] = {
+            "user_data": [set() for _ in range(shards or 0)],
+            "chat_data": [set() for _ in range(shards or 0)],
+        }
+        self._dirty: set[tuple[str, Optional[int]]] = set()
+        self._stale_files: set[Path] = set()
+        # Created lazily, so that they are bound to the running event loop
+        self._compaction_lock: Optional[asyncio.Lock] = None
+        self._journal_lock: Optional[asyncio.Lock] = None
+        # Journal records that were not yet handed to a thread for writing
+        self._journal_pending: list[bytes] = []
 
     def _load_singlefile(self) -> None:
         try:
@@ -290,6 +385,325 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         with filepath.open("wb") as file:
             _BotPickler(self.bot, file, protocol=pickle.HIGHEST_PROTOCOL).dump(data)
 
+    def _dump_file_atomic(self, filepath: Path, data: object) -> None:
+        # Write to a temporary file first, so that the file is never left in a corrupted state
+        temp_path = filepath.with_name(f"{filepath.name}.tmp")
+        with temp_path.open("wb") as file:
+            _BotPickler(self.bot, file, protocol=pickle.HIGHEST_PROTOCOL).dump(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, filepath)
+
+    @property
+    def _journal_path(self) -> Path:
+        return Path(f"{self.filepath}_journal")
+
+    @property
+    def _compacting_journal_path(self) -> Path:
+        return Path(f"{self.filepath}_journal_compacting")
+
+    async def _load_all(self) -> None:
+        """Loads all data from the pickle file(s) and replays the journal on top of it. Used if
+        :attr:`journal` is :obj:`True` or :attr:`shards` is set, since in these cases the
+        datasets can't be loaded independently of each other.
+        """
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if self.shards:
+            # A file written with `single_file=True` is migrated to the sharded layout. Data in
+            # the sharded files is more recent, e.g. if a previous migration was interrupted.
+            single_file: dict[str, Any] = {}
+            if self.filepath.is_file():
+                single_file = await asyncio.to_thread(self._load_file, self.filepath) or {}
+                self._dirty.update(
+                    (kind, None) for kind in ("bot_data", "callback_data", "conversations")
+                )
+                self._stale_files.add(self.filepath)
+
+            (
+                self.user_data,
+                self.chat_data,
+                bot_data,
+                callback_data,
+                conversations,
+            ) = await asyncio.gather(
+                self._load_shards("user_data", single_file.get("user_data")),
+                self._load_shards("chat_data", single_file.get("chat_data")),
+                *(
+                    asyncio.to_thread(self._load_file, Path(f"{self.filepath}_{kind}"))
+                    for kind in ("bot_data", "callback_data", "conversations")
+                ),
+            )
+            self.bot_data = (
+                bot_data or single_file.get("bot_data") or self.context_types.bot_data()
+            )
+            self.callback_data = callback_data or single_file.get("callback_data") or None
+            self.conversations = {**single_file.get("conversations", {}), **(conversations or {})}
+        elif self.single_file:
+            self._load_singlefile()
+        else:
+            self.user_data = self._load_file(Path(f"{self.filepath}_user_data")) or {}
+            self.chat_data = self._load_file(Path(f"{self.filepath}_chat_data")) or {}
+            self.bot_data = (
+                self._load_file(Path(f"{self.filepath}_bot_data"))
+                or self.context_types.bot_data()
+            )
+            self.callback_data = self._load_file(Path(f"{self.filepath}_callback_data")) or None
+            self.conversations = self._load_file(Path(f"{self.filepath}_conversations")) or {}
+
+        # The compacting journal is only present if a compaction was interrupted. Its records are
+        # older than the ones in the journal and possibly not yet contained in the pickle file(s)
+        interrupted = self._compacting_journal_path.is_file()
+        if interrupted:
+            self._replay_journal(self._compacting_journal_path)
+        self._journal_records = self._replay_journal(self._journal_path)
+        if interrupted:
+            self._dump_snapshot()
+            self._compacting_journal_path.unlink()
+            self._journal_path.unlink(missing_ok=True)
+            self._journal_records = 0
+
+    async def _load_shards(
+        self, kind: str, migrated: Optional[dict[int, Any]] = None
+    ) -> dict[int, Any]:
+        """Loads all shards of ``user_data`` or ``chat_data`` in parallel. Files that don't match
+        the current layout, e.g. because the number of shards changed, are merged and replaced by
+        the correct shards on the next write. ``migrated`` is the data from a file written with
+        ``single_file=True``, which is overridden by the data in the shards.
+        """
+        shards = cast(int, self.shards)
+        paths: dict[Optional[int], Path] = {}
+        if (unsharded := Path(f"{self.filepath}_{kind}")).is_file():
+            paths[None] = unsharded
+        prefix = f"{self.filepath.name}_{kind}_"
+        for path in self.filepath.parent.glob(f"{glob.escape(prefix)}*"):
+            if (suffix := path.name[len(prefix) :]).isdigit():
+                paths[int(suffix)] = path
+
+        loaded = await asyncio.gather(
+            *(asyncio.to_thread(self._load_file, path) for path in paths.values())
+        )
+        data: dict[int, Any] = dict(migrated or {})
+        shard_keys: list[set[int]] = [set() for _ in range(shards)]
+        for key in data:
+            shard_keys[key % shards].add(key)
+        relayout = migrated is not None
+        for index, shard in zip(paths, loaded):
+            relayout = relayout or index is None or index >= shards
+            for key, value in (shard or {}).items():
+                data[key] = value
+                shard_keys[key % shards].add(key)
+                relayout = relayout or key % shards != index
+
+        self._shard_keys[kind] = shard_keys
+        if relayout:
+            self._dirty.update((kind, index) for index in range(shards))
+            self._stale_files.update(
+                path for index, path in paths.items() if index is None or index >= shards
+            )
+        return data
+
+    def _mark_dirty(self, kind: str, key: Optional[int] = None, dropped: bool = False) -> None:
+        """Marks the file that contains the changed data to be written on the next dump. Only
+        relevant if :attr:`shards` is set.
+        """
+        if not self.shards:
+            return
+        if key is None:
+            self._dirty.add((kind, None))
+            return
+        index = key % self.shards
+        if dropped:
+            self._shard_keys[kind][index].discard(key)
+        else:
+            self._shard_keys[kind][index].add(key)
+        self._dirty.add((kind, index))
+
+    def _replay_journal(self, filepath: Path) -> int:
+        """Applies all complete records of the journal and returns their number."""
+        try:
+            with filepath.open("rb") as file:
+                data = file.read()
+        except OSError:
+            return 0
+
+        offset = records = 0
+        while offset + _JOURNAL_HEADER.size <= len(data):
+            length, checksum = _JOURNAL_HEADER.unpack_from(data, offset)
+            start = offset + _JOURNAL_HEADER.size
+            payload = data[start : start + length]
+            if len(payload) < length or zlib.crc32(payload) != checksum:
+                break
+            try:
+                record = _BotUnpickler(self.bot, io.BytesIO(payload)).load()
+            except Exception as exc:
+                raise TypeError(f"Something went wrong unpickling {filepath.name}") from exc
+            self._apply_journal_record(*record)
+            offset = start + length
+            records += 1
+
+        if offset < len(data):
+            _LOGGER.warning(
+                "Discarding incomplete record at the end of %s. It was probably not written "
+                "completely, because the process was terminated.",
+                filepath.name,
+            )
+            with filepath.open("r+b") as file:
+                file.truncate(offset)
+        return records
+
+    def _apply_journal_record(self, kind: str, key: Any, value: Any) -> None:
+        if kind == "user_data":
+            self.user_data[key] = value  # type: ignore[index]
+            self._mark_dirty(kind, key)
+        elif kind == "drop_user_data":
+            self.user_data.pop(key, None)  # type: ignore[union-attr]
+            self._mark_dirty("user_data", key, dropped=True)
+        elif kind == "chat_data":
+            self.chat_data[key] = value  # type: ignore[index]
+            self._mark_dirty(kind, key)
+        elif kind == "drop_chat_data":
+            self.chat_data.pop(key, None)  # type: ignore[union-attr]
+            self._mark_dirty("chat_data", key, dropped=True)
+        elif kind == "bot_data":
+            self.bot_data = value
+            self._mark_dirty(kind)
+        elif kind == "callback_data":
+            self.callback_data = value
+            self._mark_dirty(kind)
+        elif kind == "conversations":
+            name, conversation_key = key
+            conversations = cast(dict[str, dict[ConversationKey, object]], self.conversations)
+            conversations.setdefault(name, {})[conversation_key] = value
+            self._mark_dirty(kind)
+        else:
+            raise TypeError(f"Unknown journal record {kind!r} in {self._journal_path.name}")
+
+    def _append_journal(self, records: bytes) -> None:
+        with self._journal_path.open("ab") as file:
+            file.write(records)
+            file.flush()
+            os.fsync(file.fileno())
+
+    async def _write_journal(self, kind: str, key: object, value: object) -> None:
+        """Appends a record to the journal and returns once it is flushed to disk.
+
+        Records of concurrent calls are written and synced together: While one thread writes,
+        new records are queued and the next caller to acquire the lock writes all of them.
+        """
+        if self._journal_lock is None:
+            self._journal_lock = asyncio.Lock()
+
+        buffer = io.BytesIO()
+        _BotPickler(self.bot, buffer, protocol=pickle.HIGHEST_PROTOCOL).dump((kind, key, value))
+        payload = buffer.getvalue()
+        self._journal_pending.append(
+            _JOURNAL_HEADER.pack(len(payload), zlib.crc32(payload)) + payload
+        )
+        async with self._journal_lock:
+            # If the queue is empty, our record was already written by a previous caller
+            if self._journal_pending:
+                records, self._journal_pending = self._journal_pending, []
+                try:
+                    await asyncio.to_thread(self._append_journal, b"".join(records))
+                except BaseException:
+                    # Leave them for the next caller, so that its call doesn't succeed silently
+                    self._journal_pending[:0] = records
+                    raise
+        self._journal_records += 1
+
+        if self._journal_records >= self.journal_compaction_threshold and not (
+            self._compaction_lock and self._compaction_lock.locked()
+        ):
+            await self._compact_journal()
+
+    def _snapshot(self) -> tuple[dict[str, Any], set[tuple[str, Optional[int]]]]:
+        """Returns the data to write to the pickle file(s) along with the dirty shards it
+        contains. If :attr:`shards` is set, only the dirty files are included.
+        """
+        # The persistence never modifies the stored objects in place but always replaces them.
+        # Hence, shallow copies of the containers are enough to pickle a consistent state in a
+        # background thread while the data is being updated.
+        if not self.shards:
+            return {
+                "conversations": {
+                    name: dict(states) for name, states in (self.conversations or {}).items()
+                },
+                "user_data": dict(self.user_data or {}),
+                "chat_data": dict(self.chat_data or {}),
+                "bot_data": self.bot_data,
+                "callback_data": self.callback_data,
+            }, set()
+
+        dirty, self._dirty = self._dirty, set()
+        snapshot: dict[str, Any] = {}
+        for kind, index in dirty:
+            if index is not None:
+                data = getattr(self, kind)
+                snapshot[f"{kind}_{index}"] = {
+                    key: data[key] for key in self._shard_keys[kind][index]
+                }
+            elif kind == "conversations":
+                snapshot[kind] = {
+                    name: dict(states) for name, states in (self.conversations or {}).items()
+                }
+            else:
+                snapshot[kind] = getattr(self, kind)
+        return snapshot, dirty
+
+    def _write_snapshot(self, snapshot: dict[str, Any]) -> None:
+        if self.single_file and not self.shards:
+            self._dump_file_atomic(self.filepath, snapshot)
+            return
+
+        for suffix, data in snapshot.items():
+            self._dump_file_atomic(Path(f"{self.filepath}_{suffix}"), data)
+        while self._stale_files:
+            self._stale_files.pop().unlink(missing_ok=True)
+
+    def _dump_snapshot(self) -> None:
+        snapshot, dirty = self._snapshot()
+        try:
+            self._write_snapshot(snapshot)
+        except Exception:
+            self._dirty.update(dirty)
+            raise
+
+    async def _compact_journal(self) -> None:
+        """Writes the current data to the pickle file(s) and clears the journal. Records written
+        while the pickle file(s) are being written go to a new journal.
+        """
+        if self._compaction_lock is None:
+            self._compaction_lock = asyncio.Lock()
+
+        if self._journal_lock is None:
+            self._journal_lock = asyncio.Lock()
+
+        async with self._compaction_lock:
+            # The journal must not be moved while records are appended to it
+            async with self._journal_lock:
+                snapshot, dirty = self._snapshot()
+                journal, compacting = self._journal_path, self._compacting_journal_path
+                if compacting.is_file():
+                    # A previous compaction failed. Its records are not part of the pickle
+                    # file(s) yet
+                    if journal.is_file():
+                        with journal.open("rb") as source, compacting.open("ab") as target:
+                            shutil.copyfileobj(source, target)
+                        journal.unlink()
+                elif journal.is_file():
+                    journal.replace(compacting)
+                self._journal_records = 0
+
+            try:
+                await asyncio.to_thread(self._write_snapshot, snapshot)
+            except Exception:
+                self._dirty.update(dirty)
+                raise
+            compacting.unlink(missing_ok=True)
+
     async def get_user_data(self) -> dict[int, UD]:
         """Returns the user_data from the pickle file if it exists or an empty :obj:`dict`.
 
@@ -298,6 +712,8 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         """
         if self.user_data:
             pass
+        elif self.journal or self.shards:
+            await self._load_all()
         elif not self.single_file:
             data = self._load_file(Path(f"{self.filepath}_user_data"))
             if not data:
@@ -315,6 +731,8 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         """
         if self.chat_data:
             pass
+        elif self.journal or self.shards:
+            await self._load_all()
         elif not self.single_file:
             data = self._load_file(Path(f"{self.filepath}_chat_data"))
             if not data:
@@ -333,6 +751,8 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         """
         if self.bot_data:
             pass
+        elif self.journal or self.shards:
+            await self._load_all()
         elif not self.single_file:
             data = self._load_file(Path(f"{self.filepath}_bot_data"))
             if not data:
@@ -354,6 +774,8 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         """
         if self.callback_data:
             pass
+        elif self.journal or self.shards:
+            await self._load_all()
         elif not self.single_file:
             data = self._load_file(Path(f"{self.filepath}_callback_data"))
             if not data:
@@ -376,6 +798,8 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         """
         if self.conversations:
             pass
+        elif self.journal or self.shards:
+            await self._load_all()
         elif not self.single_file:
             data = self._load_file(Path(f"{self.filepath}_conversations"))
             if not data:
@@ -396,13 +820,20 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             key (:obj:`tuple`): The key the state is changed for.
             new_state (:class:`object`): The new state for the given key.
         """
+        if self.journal or self.shards:
+            await self._load_all()
         if not self.conversations:
             self.conversations = {}
         if self.conversations.setdefault(name, {}).get(key) == new_state:
             return
         self.conversations[name][key] = new_state
+        self._mark_dirty("conversations")
         if not self.on_flush:
-            if not self.single_file:
+            if self.journal:
+                await self._write_journal("conversations", (name, key), new_state)
+            elif self.shards:
+                self._dump_snapshot()
+            elif not self.single_file:
                 self._dump_file(Path(f"{self.filepath}_conversations"), self.conversations)
             else:
                 self._dump_singlefile()
@@ -414,13 +845,20 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             user_id (:obj:`int`): The user the data might have been changed for.
             data (:obj:`dict`): The :attr:`telegram.ext.Application.user_data` ``[user_id]``.
         """
+        if self.journal or self.shards:
+            await self._load_all()
         if self.user_data is None:
             self.user_data = {}
         if self.user_data.get(user_id) == data:
             return
         self.user_data[user_id] = data
+        self._mark_dirty("user_data", user_id)
         if not self.on_flush:
-            if not self.single_file:
+            if self.journal:
+                await self._write_journal("user_data", user_id, data)
+            elif self.shards:
+                self._dump_snapshot()
+            elif not self.single_file:
                 self._dump_file(Path(f"{self.filepath}_user_data"), self.user_data)
             else:
                 self._dump_singlefile()
@@ -432,13 +870,20 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             chat_id (:obj:`int`): The chat the data might have been changed for.
             data (:obj:`dict`): The :attr:`telegram.ext.Application.chat_data` ``[chat_id]``.
         """
+        if self.journal or self.shards:
+            await self._load_all()
         if self.chat_data is None:
             self.chat_data = {}
         if self.chat_data.get(chat_id) == data:
             return
         self.chat_data[chat_id] = data
+        self._mark_dirty("chat_data", chat_id)
         if not self.on_flush:
-            if not self.single_file:
+            if self.journal:
+                await self._write_journal("chat_data", chat_id, data)
+            elif self.shards:
+                self._dump_snapshot()
+            elif not self.single_file:
                 self._dump_file(Path(f"{self.filepath}_chat_data"), self.chat_data)
             else:
                 self._dump_singlefile()
@@ -450,11 +895,18 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
             data (:obj:`dict` | :attr:`telegram.ext.ContextTypes.bot_data`): The
                 :attr:`telegram.ext.Application.bot_data`.
         """
+        if self.journal or self.shards:
+            await self._load_all()
         if self.bot_data == data:
             return
         self.bot_data = data
+        self._mark_dirty("bot_data")
         if not self.on_flush:
-            if not self.single_file:
+            if self.journal:
+                await self._write_journal("bot_data", None, data)
+            elif self.shards:
+                self._dump_snapshot()
+            elif not self.single_file:
                 self._dump_file(Path(f"{self.filepath}_bot_data"), self.bot_data)
             else:
                 self._dump_singlefile()
@@ -470,11 +922,18 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
                 dict[:obj:`str`, :class:`object`]]], dict[:obj:`str`, :obj:`str`]]):
                 The relevant data to restore :class:`telegram.ext.CallbackDataCache`.
         """
+        if self.journal or self.shards:
+            await self._load_all()
         if self.callback_data == data:
             return
         self.callback_data = data
+        self._mark_dirty("callback_data")
         if not self.on_flush:
-            if not self.single_file:
+            if self.journal:
+                await self._write_journal("callback_data", None, data)
+            elif self.shards:
+                self._dump_snapshot()
+            elif not self.single_file:
                 self._dump_file(Path(f"{self.filepath}_callback_data"), self.callback_data)
             else:
                 self._dump_singlefile()
@@ -488,12 +947,19 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         Args:
             chat_id (:obj:`int`): The chat id to delete from the persistence.
         """
+        if self.journal or self.shards:
+            await self._load_all()
         if self.chat_data is None:
             return
         self.chat_data.pop(chat_id, None)
+        self._mark_dirty("chat_data", chat_id, dropped=True)
 
         if not self.on_flush:
-            if not self.single_file:
+            if self.journal:
+                await self._write_journal("drop_chat_data", chat_id, None)
+            elif self.shards:
+                self._dump_snapshot()
+            elif not self.single_file:
                 self._dump_file(Path(f"{self.filepath}_chat_data"), self.chat_data)
             else:
                 self._dump_singlefile()
@@ -507,12 +973,19 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         Args:
             user_id (:obj:`int`): The user id to delete from the persistence.
         """
+        if self.journal or self.shards:
+            await self._load_all()
         if self.user_data is None:
             return
         self.user_data.pop(user_id, None)
+        self._mark_dirty("user_data", user_id, dropped=True)
 
         if not self.on_flush:
-            if not self.single_file:
+            if self.journal:
+                await self._write_journal("drop_user_data", user_id, None)
+            elif self.shards:
+                self._dump_snapshot()
+            elif not self.single_file:
                 self._dump_file(Path(f"{self.filepath}_user_data"), self.user_data)
             else:
                 self._dump_singlefile()
@@ -539,8 +1012,18 @@ class PicklePersistence(BasePersistence[UD, CD, BD]):
         """
 
     async def flush(self) -> None:
-        """Will save all data in memory to pickle file(s)."""
-        if self.single_file:
+        """Will save all data in memory to pickle file(s).
+
+        .. versionchanged:: NEXT.VERSION
+            If :attr:`journal` is :obj:`True`, the journal is compacted.
+        """
+        if self.journal:
+            if self._loaded:
+                await self._compact_journal()
+        elif self.shards:
+            if self._loaded:
+                self._dump_snapshot()
+        elif self.single_file:
             if (
                 self.user_data
                 or self.chat_data
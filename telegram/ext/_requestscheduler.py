@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a class that allows to prioritize requests to the Bot API."""
+import asyncio
+import contextlib
+from collections import deque
+from collections.abc import Coroutine, Iterator
+from contextvars import ContextVar
+from typing import Any, Callable, Optional, Union
+
+from telegram._bot import _INTERACTIVE_ENDPOINTS
+from telegram._utils.enum import IntEnum
+from telegram._utils.types import JSONDict
+
+
+class RequestPriority(IntEnum):
+    """This enum contains the priority classes of requests scheduled by
+    :class:`telegram.ext.RequestScheduler`. Lower values mean higher priority.
+
+    .. versionadded:: NEXT.VERSION
+    """
+
+    __slots__ = ()
+
+    INTERACTIVE = 0
+    """:obj:`int`: Requests that a user is actively waiting for, e.g.
+    :meth:`~telegram.Bot.answer_callback_query`."""
+    NORMAL = 1
+    """:obj:`int`: All requests that are not explicitly classified otherwise."""
+    BULK = 2
+    """:obj:`int`: Requests that are not time critical, e.g. messages sent in a broadcast."""
+
+
+_PRIORITY: ContextVar[Optional[RequestPriority]] = ContextVar("_PRIORITY", default=None)
+
+
+class RequestScheduler:
+    """Schedules the requests that :class:`telegram.ext.ExtBot` makes to the Bot API according
+    to their priority. The scheduler sits behind the :attr:`~telegram.ext.ExtBot.rate_limiter`
+    (if any), i.e. a request takes a slot only once the rate limiter lets it pass, and limits the
+    number of requests that are processed concurrently. If all slots are in use, waiting requests
+    get the next free slot in the order of their :class:`~telegram.ext.RequestPriority` and,
+    within the same priority, in the order in which they arrived. This way, requests that users
+    are waiting for don't queue up behind e.g. a mass broadcast.
+
+    To protect requests of lower priority from starving, a request that waited for longer than
+    :paramref:`starvation_timeout` is served before any request of higher priority that waited
+    for a shorter time.
+
+    By default, the priority of a request is determined by :meth:`get_priority`. It can be set
+    explicitly for all requests made in a block of code by using :meth:`use_priority`:
+
+    .. code:: python
+
+        with bot.request_scheduler.use_priority(RequestPriority.BULK):
+            for chat_id in chat_ids:
+                await bot.send_message(chat_id, "News!")
+
+    Hint:
+        Requests to :meth:`~telegram.Bot.get_updates` are never scheduled.
+
+    Note:
+        Choose :paramref:`max_concurrent_requests` small enough that requests queue up in the
+        scheduler rather than in the connection pool of the
+        :class:`~telegram.request.BaseRequest`.
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        max_concurrent_requests (:obj:`int`, optional): The maximum number of requests processed
+            concurrently. Defaults to ``16``.
+        starvation_timeout (:obj:`float`, optional): The time in seconds after which a waiting
+            request is served regardless of its priority. Defaults to ``5``.
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`max_concurrent_requests` is not a positive integer or
+            :paramref:`starvation_timeout` is negative.
+    """
+
+    __slots__ = ("_active", "_max_concurrent_requests", "_starvation_timeout", "_waiters")
+
+    def __init__(self, max_concurrent_requests: int = 16, starvation_timeout: float = 5):
+        if max_concurrent_requests < 1:
+            raise ValueError("`max_concurrent_requests` must be a positive integer!")
+        if starvation_timeout < 0:
+            raise ValueError("`starvation_timeout` must not be negative!")
+        self._max_concurrent_requests: int = max_concurrent_requests
+        self._starvation_timeout: float = starvation_timeout
+        self._active: int = 0
+        # Contains the time at which the request started waiting and the future that is resolved
+        # once the request got a slot. Ordered by priority.
+        self._waiters: dict[RequestPriority, deque[tuple[float, asyncio.Future[None]]]] = {
+            priority: deque() for priority in RequestPriority
+        }
+
+    @property
+    def max_concurrent_requests(self) -> int:
+        """:obj:`int`: The maximum number of requests processed concurrently."""
+        return self._max_concurrent_requests
+
+    @property
+    def starvation_timeout(self) -> float:
+        """:obj:`float`: The time in seconds after which a waiting request is served regardless
+        of its priority."""
+        return self._starvation_timeout
+
+    @property
+    def pending_requests(self) -> dict[RequestPriority, int]:
+        """dict[:class:`telegram.ext.RequestPriority`, :obj:`int`]: The number of requests that
+        currently wait for a slot, per priority."""
+        return {
+            priority: sum(not future.done() for _, future in queue)
+            for priority, queue in self._waiters.items()
+        }
+
+    @staticmethod
+    @contextlib.contextmanager
+    def use_priority(priority: RequestPriority) -> Iterator[None]:
+        """Context manager that sets the priority of all requests made within it, overriding
+        :meth:`get_priority`. This also applies to tasks created within the context manager.
+
+        Args:
+            priority (:class:`telegram.ext.RequestPriority`): The priority to use.
+        """
+        token = _PRIORITY.set(priority)
+        try:
+            yield
+        finally:
+            _PRIORITY.reset(token)
+
+    def get_priority(
+        self,
+        endpoint: str,
+        data: dict[str, Any],  # noqa: ARG002
+    ) -> RequestPriority:
+        """Determines the priority of a request. Returns the priority set by
+        :meth:`use_priority`, if any. Otherwise, answers to callback queries, inline queries,
+        shipping queries, pre checkout queries and web app queries as well as chat actions are
+        :attr:`~telegram.ext.RequestPriority.INTERACTIVE` and all other requests are
+        :attr:`~telegram.ext.RequestPriority.NORMAL`.
+
+        Tip:
+            Override this method in a subclass to customize the priorities.
+
+        Args:
+            endpoint (:obj:`str`): The endpoint the request is sent to.
+            data (dict[:obj:`str`, :obj:`any`]): The parameters of the request.
+
+        Returns:
+            :class:`telegram.ext.RequestPriority`
+        """
+        if (priority := _PRIORITY.get()) is not None:
+            return priority
+        if endpoint in _INTERACTIVE_ENDPOINTS:
+            return RequestPriority.INTERACTIVE
+        return RequestPriority.NORMAL
+
+    async def process_request(
+        self,
+        callback: Callable[..., Coroutine[Any, Any, Union[bool, JSONDict, list[JSONDict]]]],
+        args: Any,
+        kwargs: dict[str, Any],
+        endpoint: str,
+        data: dict[str, Any],
+    ) -> Union[bool, JSONDict, list[JSONDict]]:
+        """Waits for a free slot according to the priority of the request and then processes the
+        request by calling :paramref:`callback`.
+
+        Args:
+            callback (Callable[..., :term:`coroutine`]): The coroutine function that must be
+                called to make the request.
+            args (tuple[:obj:`object`]): The positional arguments for the :paramref:`callback`
+                function.
+            kwargs (dict[:obj:`str`, :obj:`object`]): The keyword arguments for the
+                :paramref:`callback` function.
+            endpoint (:obj:`str`): The endpoint the request is sent to.
+            data (dict[:obj:`str`, :obj:`object`]): The parameters of the request.
+
+        Returns:
+            :obj:`bool` | dict[:obj:`str`, ...] | :obj:`None`: The result of the callback function.
+        """
+        await self._acquire(self.get_priority(endpoint, data))
+        try:
+            return await callback(*args, **kwargs)
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: RequestPriority) -> None:
+        # Slots are handed over directly to waiting requests in _release, so if there is a free
+        # slot, no request is waiting
+        if self._active < self._max_concurrent_requests:
+            self._active += 1
+            return
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._waiters[priority].append((loop.time(), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # We got the slot right before we were cancelled, so we have to pass it on
+                self._release()
+            raise
+
+    def _release(self) -> None:
+        now = asyncio.get_running_loop().time()
+        next_queue = None
+        for queue in self._waiters.values():
+            # Drop requests that were cancelled while waiting
+            while queue and queue[0][1].done():
+                queue.popleft()
+            if not queue:
+                continue
+            if next_queue is None:
+                next_queue = queue
+            elif (
+                now - queue[0][0] >= self._starvation_timeout
+                and queue[0][0] < next_queue[0][0]
+            ):
+                # This request waited for too long and longer than the current candidate
+                next_queue = queue
+
+        if next_queue is None:
+            self._active -= 1
+        else:
+            next_queue.popleft()[1].set_result(None)
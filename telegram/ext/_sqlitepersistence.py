@@ -0,0 +1,506 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the SQLitePersistence class."""
+import asyncio
+import io
+import json
+import pickle
+import sqlite3
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar, cast, overload
+
+from telegram._utils.types import FilePathInput
+from telegram.ext import BasePersistence, PersistenceInput
+from telegram.ext._contexttypes import ContextTypes
+from telegram.ext._picklepersistence import _BotPickler, _BotUnpickler
+from telegram.ext._utils.types import BD, CD, UD, CDCData, ConversationDict, ConversationKey
+
+_RT = TypeVar("_RT")
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS user_data (id INTEGER PRIMARY KEY, data BLOB NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS chat_data (id INTEGER PRIMARY KEY, data BLOB NOT NULL)",
+    # Stores bot_data and callback_data, which are one entry each
+    "CREATE TABLE IF NOT EXISTS shared_data (name TEXT PRIMARY KEY, data BLOB NOT NULL)"
+    " WITHOUT ROWID",
+    "CREATE TABLE IF NOT EXISTS conversations (name TEXT NOT NULL, key TEXT NOT NULL,"
+    " state BLOB NOT NULL, PRIMARY KEY (name, key)) WITHOUT ROWID",
+)
+_UPSERT = {
+    "user_data": "INSERT OR REPLACE INTO user_data (id, data) VALUES (?, ?)",
+    "chat_data": "INSERT OR REPLACE INTO chat_data (id, data) VALUES (?, ?)",
+    "shared_data": "INSERT OR REPLACE INTO shared_data (name, data) VALUES (?, ?)",
+    "conversations": "INSERT OR REPLACE INTO conversations (name, key, state) VALUES (?, ?, ?)",
+}
+_DELETE = {
+    "user_data": "DELETE FROM user_data WHERE id = ?",
+    "chat_data": "DELETE FROM chat_data WHERE id = ?",
+    "shared_data": "DELETE FROM shared_data WHERE name = ?",
+    "conversations": "DELETE FROM conversations WHERE name = ? AND key = ?",
+}
+_SELECT_ALL = {
+    "user_data": "SELECT id, data FROM user_data",
+    "chat_data": "SELECT id, data FROM chat_data",
+}
+_SELECT_ONE = {
+    "user_data": "SELECT data FROM user_data WHERE id = ?",
+    "chat_data": "SELECT data FROM chat_data WHERE id = ?",
+}
+
+# A pending write: The table and the primary key of the row mapped to the new value of the row or
+# None, if the row is to be deleted
+_PendingWrites = dict[tuple[str, tuple[object, ...]], Optional[bytes]]
+
+
+class SQLitePersistence(BasePersistence[UD, CD, BD]):
+    """Using Python's builtin :mod:`sqlite3` for making your bot persistent.
+
+    Every entry of :attr:`~telegram.ext.Application.user_data` and
+    :attr:`~telegram.ext.Application.chat_data`, every conversation state as well as
+    :attr:`~telegram.ext.Application.bot_data` and the callback data are stored in their own
+    row of an SQLite database. Hence, updating or dropping an entry only writes that single row,
+    regardless of the total amount of stored data. The database is used in
+    `WAL mode <https://www.sqlite.org/wal.html>`_ and all changes that are made during one run of
+    :meth:`telegram.ext.Application.update_persistence` are written in a single transaction.
+
+    Attention:
+        The interface provided by this class is intended to be accessed exclusively by
+        :class:`~telegram.ext.Application`. Calling any of the methods below manually might
+        interfere with the integration of persistence into :class:`~telegram.ext.Application`.
+
+    Note:
+        The stored values are serialized with :mod:`pickle`, just like in
+        :class:`~telegram.ext.PicklePersistence`. Specifically any reference to
+        :attr:`~BasePersistence.bot` will be replaced by a placeholder before pickling and
+        :attr:`~BasePersistence.bot` will be inserted back when loading the data.
+
+    .. seealso:: :wiki:`Making Your Bot Persistent <Making-your-bot-persistent>`
+
+    .. versionadded:: NEXT.VERSION
+
+    Args:
+        filepath (:obj:`str` | :obj:`pathlib.Path`): The path of the database file. It is created,
+            if it doesn't exist yet.
+        store_data (:class:`~telegram.ext.PersistenceInput`, optional): Specifies which kinds of
+            data will be saved by this persistence instance. By default, all available kinds of
+            data will be saved.
+        update_interval (:obj:`int` | :obj:`float`, optional): The
+            :class:`~telegram.ext.Application` will update
+            the persistence in regular intervals. This parameter specifies the time (in seconds) to
+            wait between two consecutive runs of updating the persistence. Defaults to 60 seconds.
+        context_types (:class:`telegram.ext.ContextTypes`, optional): Pass an instance
+            of :class:`telegram.ext.ContextTypes` to customize the types used in the
+            ``context`` interface. If not passed, the defaults documented in
+            :class:`telegram.ext.ContextTypes` will be used.
+        lazy_loading (:obj:`bool`, optional): Whether the entries of ``user_data`` and
+            ``chat_data`` are loaded only once they are needed. See
+            :paramref:`telegram.ext.BasePersistence.lazy_loading`. Defaults to :obj:`False`.
+        max_cached_entries (:obj:`int`, optional): The maximum number of entries of
+            ``user_data`` and ``chat_data``, respectively, to keep in memory if
+            :paramref:`lazy_loading` is :obj:`True`. See
+            :paramref:`telegram.ext.BasePersistence.max_cached_entries`.
+
+    Attributes:
+        filepath (:obj:`pathlib.Path`): The path of the database file.
+        store_data (:class:`~telegram.ext.PersistenceInput`): Specifies which kinds of data will
+            be saved by this persistence instance.
+        context_types (:class:`telegram.ext.ContextTypes`): Container for the types used
+            in the ``context`` interface.
+    """
+
+    __slots__ = (
+        "_bot_data",
+        "_callback_data",
+        "_commit_task",
+        "_connection",
+        "_failed_commit_task",
+        "_lock",
+        "_pending",
+        "context_types",
+        "filepath",
+    )
+
+    @overload
+    def __init__(
+        self: "SQLitePersistence[dict[Any, Any], dict[Any, Any], dict[Any, Any]]",
+        filepath: FilePathInput,
+        store_data: Optional[PersistenceInput] = None,
+        update_interval: float = 60,
+        *,
+        lazy_loading: bool = False,
+        max_cached_entries: Optional[int] = None,
+    ): ...
+
+    @overload
+    def __init__(
+        self: "SQLitePersistence[UD, CD, BD]",
+        filepath: FilePathInput,
+        store_data: Optional[PersistenceInput] = None,
+        update_interval: float = 60,
+        context_types: Optional[ContextTypes[Any, UD, CD, BD]] = None,
+        *,
+        lazy_loading: bool = False,
+        max_cached_entries: Optional[int] = None,
+    ): ...
+
+    def __init__(
+        self,
+        filepath: FilePathInput,
+        store_data: Optional[PersistenceInput] = None,
+        update_interval: float = 60,
+        context_types: Optional[ContextTypes[Any, UD, CD, BD]] = None,
+        *,
+        lazy_loading: bool = False,
+        max_cached_entries: Optional[int] = None,
+    ):
+        super().__init__(
+            store_data=store_data,
+            update_interval=update_interval,
+            lazy_loading=lazy_loading,
+            max_cached_entries=max_cached_entries,
+        )
+        self.filepath: Path = Path(filepath)
+        self.context_types: ContextTypes[Any, UD, CD, BD] = cast(
+            ContextTypes[Any, UD, CD, BD], context_types or ContextTypes()
+        )
+        self._connection: Optional[sqlite3.Connection] = None
+        self._pending: _PendingWrites = {}
+        self._commit_task: Optional[asyncio.Task] = None
+        self._failed_commit_task: Optional[asyncio.Task] = None
+        # Created lazily, so that it's bound to the running event loop
+        self._lock: Optional[asyncio.Lock] = None
+        # The data that was last written, so that unchanged data is not written again
+        self._bot_data: Optional[BD] = None
+        self._callback_data: Optional[CDCData] = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        if self._connection is None:
+            # Transactions are handled explicitly in _write_pending. The connection is only ever
+            # used by one thread at a time, which is ensured by self._lock
+            connection = sqlite3.connect(
+                self.filepath, isolation_level=None, check_same_thread=False
+            )
+            try:
+                connection.execute("PRAGMA journal_mode=WAL")
+                # Safe in WAL mode, i.e. the database can't be corrupted by a crash
+                connection.execute("PRAGMA synchronous=NORMAL")
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+            except Exception:
+                connection.close()
+                raise
+            self._connection = connection
+        return self._connection
+
+    def _dumps(self, obj: object) -> bytes:
+        buffer = io.BytesIO()
+        _BotPickler(self.bot, buffer, protocol=pickle.HIGHEST_PROTOCOL).dump(obj)
+        return buffer.getvalue()
+
+    def _loads(self, data: bytes) -> Any:
+        return _BotUnpickler(self.bot, io.BytesIO(data)).load()
+
+    @staticmethod
+    def _encode_conversation_key(key: ConversationKey) -> str:
+        return json.dumps(key)
+
+    @staticmethod
+    def _decode_conversation_key(key: str) -> ConversationKey:
+        return tuple(json.loads(key))
+
+    def _write_pending(self, pending: _PendingWrites) -> None:
+        upserts: defaultdict[str, list[tuple[object, ...]]] = defaultdict(list)
+        deletes: defaultdict[str, list[tuple[object, ...]]] = defaultdict(list)
+        for (table, key), value in pending.items():
+            if value is None:
+                deletes[table].append(key)
+            else:
+                upserts[table].append((*key, value))
+
+        connection = self._get_connection()
+        connection.execute("BEGIN")
+        try:
+            for table, rows in upserts.items():
+                connection.executemany(_UPSERT[table], rows)
+            for table, rows in deletes.items():
+                connection.executemany(_DELETE[table], rows)
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        connection.execute("COMMIT")
+
+    def _get_lock(self) -> asyncio.Lock:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def _commit(self) -> None:
+        """Writes all pending changes in a single transaction."""
+        async with self._get_lock():
+            if self._commit_task is asyncio.current_task():
+                # Changes made from now on will be written in the next transaction
+                self._commit_task = None
+            pending, self._pending = self._pending, {}
+            if not pending:
+                return
+            try:
+                await asyncio.to_thread(self._write_pending, pending)
+            except Exception:
+                # Try again on the next commit, unless the row has been changed in the meantime
+                for key, value in pending.items():
+                    self._pending.setdefault(key, value)
+                raise
+
+    async def _write(self, table: str, key: tuple[object, ...], value: Optional[object]) -> None:
+        """Schedules a change of a single row and waits until it is committed.
+
+        All changes that are made while the event loop processes the current batch of tasks are
+        collected and written in a single transaction. In particular, this applies to all
+        changes made by one run of :meth:`telegram.ext.Application.update_persistence`.
+        """
+        # Pickle right away, as the data may be changed once we return control to the event loop
+        self._pending[(table, key)] = None if value is None else self._dumps(value)
+        if self._commit_task is None:
+            self._commit_task = asyncio.create_task(self._commit())
+        commit_task = self._commit_task
+        try:
+            await asyncio.shield(commit_task)
+        except Exception:
+            # The changes are tried again on the next commit. Report the failure only once
+            # instead of once for every changed row.
+            if self._failed_commit_task is commit_task:
+                return
+            self._failed_commit_task = commit_task
+            raise
+
+    async def _read(self, func: Callable[[sqlite3.Connection], _RT]) -> _RT:
+        """Runs ``func`` in a worker thread once all pending changes are written."""
+        await self._commit()
+        async with self._get_lock():
+            return await asyncio.to_thread(lambda: func(self._get_connection()))
+
+    async def _read_user_chat_data(self, table: str) -> dict[int, Any]:
+        rows = await self._read(
+            lambda connection: connection.execute(_SELECT_ALL[table]).fetchall()
+        )
+        return {key: self._loads(data) for key, data in rows}
+
+    async def _read_user_chat_data_entry(self, table: str, key: int) -> Optional[Any]:
+        row = await self._read(
+            lambda connection: connection.execute(_SELECT_ONE[table], (key,)).fetchone()
+        )
+        return None if row is None else self._loads(row[0])
+
+    async def _read_shared_data(self, name: str) -> Optional[Any]:
+        row = await self._read(
+            lambda connection: connection.execute(
+                "SELECT data FROM shared_data WHERE name = ?", (name,)
+            ).fetchone()
+        )
+        return None if row is None else self._loads(row[0])
+
+    async def get_user_data(self) -> dict[int, UD]:
+        """Returns the user_data from the database or an empty :obj:`dict`.
+
+        Returns:
+            dict[:obj:`int`, :obj:`dict`]: The restored user data.
+        """
+        return await self._read_user_chat_data("user_data")
+
+    async def get_chat_data(self) -> dict[int, CD]:
+        """Returns the chat_data from the database or an empty :obj:`dict`.
+
+        Returns:
+            dict[:obj:`int`, :obj:`dict`]: The restored chat data.
+        """
+        return await self._read_user_chat_data("chat_data")
+
+    async def get_user_data_entry(self, user_id: int) -> Optional[UD]:
+        """Returns the user_data of the given user from the database or :obj:`None`.
+
+        Args:
+            user_id (:obj:`int`): The user id to load the data for.
+
+        Returns:
+            :obj:`dict` | :attr:`telegram.ext.ContextTypes.user_data` | :obj:`None`: The
+                restored data of the user.
+        """
+        return await self._read_user_chat_data_entry("user_data", user_id)
+
+    async def get_chat_data_entry(self, chat_id: int) -> Optional[CD]:
+        """Returns the chat_data of the given chat from the database or :obj:`None`.
+
+        Args:
+            chat_id (:obj:`int`): The chat id to load the data for.
+
+        Returns:
+            :obj:`dict` | :attr:`telegram.ext.ContextTypes.chat_data` | :obj:`None`: The
+                restored data of the chat.
+        """
+        return await self._read_user_chat_data_entry("chat_data", chat_id)
+
+    async def get_bot_data(self) -> BD:
+        """Returns the bot_data from the database if it exists or an empty object of type
+        :obj:`dict` | :attr:`telegram.ext.ContextTypes.bot_data`.
+
+        Returns:
+            :obj:`dict` | :attr:`telegram.ext.ContextTypes.bot_data`: The restored bot data.
+        """
+        data = await self._read_shared_data("bot_data")
+        if data is None:
+            return self.context_types.bot_data()
+        return cast(BD, data)
+
+    async def get_callback_data(self) -> Optional[CDCData]:
+        """Returns the callback data from the database if it exists or :obj:`None`.
+
+        Returns:
+            tuple[list[tuple[:obj:`str`, :obj:`float`, dict[:obj:`str`, :class:`object`]]],
+            dict[:obj:`str`, :obj:`str`]] | :obj:`None`: The restored metadata or :obj:`None`,
+            if no data was stored.
+        """
+        return cast(Optional[CDCData], await self._read_shared_data("callback_data"))
+
+    async def get_conversations(self, name: str) -> ConversationDict:
+        """Returns the conversations of the given handler from the database or an empty
+        :obj:`dict`.
+
+        Args:
+            name (:obj:`str`): The handlers name.
+
+        Returns:
+            :obj:`dict`: The restored conversations for the handler.
+        """
+        rows = await self._read(
+            lambda connection: connection.execute(
+                "SELECT key, state FROM conversations WHERE name = ?", (name,)
+            ).fetchall()
+        )
+        return {self._decode_conversation_key(key): self._loads(state) for key, state in rows}
+
+    async def update_conversation(
+        self, name: str, key: ConversationKey, new_state: Optional[object]
+    ) -> None:
+        """Will update the state of the conversation with the given key for the given handler.
+
+        Args:
+            name (:obj:`str`): The handler's name.
+            key (:obj:`tuple`): The key the state is changed for.
+            new_state (:class:`object`): The new state for the given key.
+        """
+        await self._write("conversations", (name, self._encode_conversation_key(key)), new_state)
+
+    async def update_user_data(self, user_id: int, data: UD) -> None:
+        """Will update the user_data of the given user.
+
+        Args:
+            user_id (:obj:`int`): The user the data might have been changed for.
+            data (:obj:`dict`): The :attr:`telegram.ext.Application.user_data` ``[user_id]``.
+        """
+        await self._write("user_data", (user_id,), data)
+
+    async def update_chat_data(self, chat_id: int, data: CD) -> None:
+        """Will update the chat_data of the given chat.
+
+        Args:
+            chat_id (:obj:`int`): The chat the data might have been changed for.
+            data (:obj:`dict`): The :attr:`telegram.ext.Application.chat_data` ``[chat_id]``.
+        """
+        await self._write("chat_data", (chat_id,), data)
+
+    async def update_bot_data(self, data: BD) -> None:
+        """Will update the bot_data (if changed).
+
+        Args:
+            data (:obj:`dict` | :attr:`telegram.ext.ContextTypes.bot_data`): The
+                :attr:`telegram.ext.Application.bot_data`.
+        """
+        if self._bot_data is not None and self._bot_data == data:
+            return
+        self._bot_data = data
+        await self._write("shared_data", ("bot_data",), data)
+
+    async def update_callback_data(self, data: CDCData) -> None:
+        """Will update the callback_data (if changed).
+
+        Args:
+            data (tuple[list[tuple[:obj:`str`, :obj:`float`, dict[:obj:`str`, :class:`object`]]], \
+                dict[:obj:`str`, :obj:`str`]]): The relevant data to restore
+                :class:`telegram.ext.CallbackDataCache`.
+        """
+        if self._callback_data is not None and self._callback_data == data:
+            return
+        self._callback_data = data
+        await self._write("shared_data", ("callback_data",), data)
+
+    async def drop_chat_data(self, chat_id: int) -> None:
+        """Will delete the row of the specified chat from the database.
+
+        Args:
+            chat_id (:obj:`int`): The chat id to delete from the persistence.
+        """
+        await self._write("chat_data", (chat_id,), None)
+
+    async def drop_user_data(self, user_id: int) -> None:
+        """Will delete the row of the specified user from the database.
+
+        Args:
+            user_id (:obj:`int`): The user id to delete from the persistence.
+        """
+        await self._write("user_data", (user_id,), None)
+
+    async def refresh_user_data(self, user_id: int, user_data: UD) -> None:
+        """Does nothing.
+
+        .. seealso:: :meth:`telegram.ext.BasePersistence.refresh_user_data`
+        """
+
+    async def refresh_chat_data(self, chat_id: int, chat_data: CD) -> None:
+        """Does nothing.
+
+        .. seealso:: :meth:`telegram.ext.BasePersistence.refresh_chat_data`
+        """
+
+    async def refresh_bot_data(self, bot_data: BD) -> None:
+        """Does nothing.
+
+        .. seealso:: :meth:`telegram.ext.BasePersistence.refresh_bot_data`
+        """
+
+    async def flush(self) -> None:
+        """Writes all pending changes, transfers the contents of the write-ahead log into the
+        database file and closes the connection to the database. The connection is reopened
+        when the persistence is used again.
+
+        .. seealso:: :meth:`telegram.ext.BasePersistence.flush`
+        """
+        await self._commit()
+        async with self._get_lock():
+            if self._connection is None:
+                return
+            connection, self._connection = self._connection, None
+
+            def close() -> None:
+                try:
+                    connection.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                finally:
+                    connection.close()
+
+            await asyncio.to_thread(close)
@@ -393,7 +393,12 @@ class Updater(contextlib.AbstractAsyncContextManager["Updater"]):
                     )
                 else:
                     for update in updates:
-                        await self.update_queue.put(update)
+                        # Enqueue the whole batch without a coroutine per update, unless the
+                        # queue is bounded and full
+                        try:
+                            self.update_queue.put_nowait(update)
+                        except asyncio.QueueFull:
+                            await self.update_queue.put(update)
                     self._last_update_id = updates[-1].update_id + 1  # Add one to 'confirm' it
 
             return True  # Keep fetching updates & don't quit. Polls with poll_interval.
@@ -0,0 +1,305 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains helper classes that allow :class:`telegram.ext.Application` to only check
+those handlers of a group that can possibly handle an update.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+import re
+from collections.abc import Sequence
+from typing import Any, Optional
+
+from telegram import MessageEntity, Update
+from telegram.ext import filters as filters_module
+from telegram.ext._handlers.basehandler import BaseHandler
+from telegram.ext._handlers.callbackqueryhandler import CallbackQueryHandler
+from telegram.ext._handlers.commandhandler import CommandHandler
+from telegram.ext._handlers.messagehandler import MessageHandler
+from telegram.ext._handlers.prefixhandler import PrefixHandler
+
+# Implementations of `BaseFilter.check_update` that only return a truthy value for updates with
+# one of the message-like attributes set
+_MESSAGE_ONLY_CHECKS = frozenset(
+    (
+        filters_module.BaseFilter.check_update,
+        filters_module.MessageFilter.check_update,
+        filters_module.UpdateFilter.check_update,
+    )
+)
+_REGEX_SPECIAL_CHARS = frozenset(".^$*+?{}[]\\|()")
+_REGEX_QUANTIFIERS = frozenset("*+?{")
+
+
+def literal_prefix(pattern: object) -> str:
+    """Returns a string that all strings matched by ``re.match(pattern, string)`` start with.
+    Returns an empty string if no such prefix can be determined.
+    """
+    if isinstance(pattern, re.Pattern):
+        if pattern.flags & (re.IGNORECASE | re.VERBOSE):
+            return ""
+        pattern = pattern.pattern
+    if not isinstance(pattern, str) or "|" in pattern:
+        # Alternations may make any prefix optional. We don't parse the pattern, so we play it
+        # safe here
+        return ""
+
+    prefix: list[str] = []
+    idx = 1 if pattern.startswith("^") else 0
+    while idx < len(pattern):
+        char = pattern[idx]
+        if char == "\\":
+            if idx + 1 >= len(pattern) or pattern[idx + 1].isalnum():
+                # special sequences like \d or back references
+                break
+            char = pattern[idx + 1]
+            step = 2
+        elif char in _REGEX_SPECIAL_CHARS:
+            break
+        else:
+            step = 1
+        if pattern[idx + step : idx + step + 1] in _REGEX_QUANTIFIERS:
+            # The character may be repeated zero times
+            break
+        prefix.append(char)
+        idx += step
+    return "".join(prefix)
+
+
+class UpdateKeys:
+    """The properties of an update that the :class:`GroupIndex` looks at. Computed once per
+    update and shared between all handler groups.
+    """
+
+    __slots__ = (
+        "blank_text",
+        "callback_data",
+        "command",
+        "has_callback_query",
+        "has_message",
+        "prefix_command",
+    )
+
+    def __init__(self, update: object):
+        self.has_message: bool = False
+        self.has_callback_query: bool = False
+        # None means that any command/data might be present, i.e. no filtering is possible
+        self.command: Optional[str] = None
+        self.prefix_command: Optional[str] = None
+        self.callback_data: Optional[str] = None
+        # PrefixHandler.check_update fails for texts that consist only of whitespace
+        self.blank_text: bool = False
+
+        if not isinstance(update, Update):
+            return
+
+        self.has_message = bool(
+            update.channel_post
+            or update.message
+            or update.edited_channel_post
+            or update.edited_message
+            or update.business_message
+            or update.edited_business_message
+        )
+
+        if callback_query := update.callback_query:
+            self.has_callback_query = True
+            if isinstance(callback_query.data, str) and callback_query.data:
+                self.callback_data = callback_query.data
+
+        message = update.effective_message
+        if not message or not message.text:
+            return
+
+        # Same logic as in CommandHandler.check_update
+        if (
+            message.entities
+            and message.entities[0].type == MessageEntity.BOT_COMMAND
+            and message.entities[0].offset == 0
+        ):
+            self.command = message.text[1 : message.entities[0].length].split("@")[0].lower()
+
+        # Same logic as in PrefixHandler.check_update
+        if text_list := message.text.split():
+            self.prefix_command = text_list[0].lower()
+        else:
+            self.blank_text = True
+
+
+class HandlerList(list[BaseHandler[Any, Any, Any]]):
+    """List of the handlers of a single handler group as stored in
+    :attr:`telegram.ext.Application.handlers`. Every in-place change bumps :attr:`version`, so
+    that :meth:`GroupIndex.is_stale` doesn't have to compare the whole list for every update.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, *args: Any) -> None:
+        super().__init__(*args)
+        self.version: int = 0
+
+
+def _bump_version(name: str) -> None:
+    method = getattr(list, name)
+
+    def wrapper(self: HandlerList, *args: Any, **kwargs: Any) -> Any:
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = wrapper.__qualname__ = name
+    wrapper.__doc__ = method.__doc__
+    setattr(HandlerList, name, wrapper)
+
+
+for _name in (
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "__setitem__",
+    "append",
+    "clear",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "reverse",
+    "sort",
+):
+    _bump_version(_name)
+del _name
+
+
+class GroupIndex:
+    """Index over the handlers of a single handler group.
+
+    Handlers are bucketed by what they can possibly handle. Handlers that can't be classified
+    (including all subclasses that override ``check_update``) are candidates for every update.
+    :meth:`candidates` returns the handlers in the same order as they appear in the group, so the
+    "first match per group" semantics are not affected.
+    """
+
+    __slots__ = (
+        "_callback_any",
+        "_callback_lengths",
+        "_callback_prefix",
+        "_callbacks",
+        "_commands",
+        "_messages",
+        "_prefix_commands",
+        "_prefixes",
+        "_wildcards",
+        "handlers",
+        "snapshot",
+        "version",
+    )
+
+    def __init__(self, handlers: list[BaseHandler[Any, Any, Any]]):
+        self.handlers = handlers
+        self.snapshot = list(handlers)
+        self.version: Optional[int] = getattr(handlers, "version", None)
+
+        self._wildcards: list[int] = []
+        self._messages: list[int] = []
+        self._commands: dict[str, list[int]] = {}
+        self._prefix_commands: dict[str, list[int]] = {}
+        self._prefixes: list[int] = []
+        self._callbacks: list[int] = []
+        self._callback_any: list[int] = []
+        self._callback_prefix: dict[str, list[int]] = {}
+
+        for position, handler in enumerate(handlers):
+            check_update = type(handler).check_update
+            if check_update is CommandHandler.check_update:
+                for command in handler.commands:  # type: ignore[attr-defined]
+                    self._commands.setdefault(command, []).append(position)
+            elif check_update is PrefixHandler.check_update:
+                self._prefixes.append(position)
+                for command in handler.commands:  # type: ignore[attr-defined]
+                    self._prefix_commands.setdefault(command, []).append(position)
+            elif check_update is CallbackQueryHandler.check_update:
+                self._callbacks.append(position)
+                prefix = literal_prefix(handler.pattern)  # type: ignore[attr-defined]
+                if prefix:
+                    self._callback_prefix.setdefault(prefix, []).append(position)
+                else:
+                    self._callback_any.append(position)
+            elif (
+                check_update is MessageHandler.check_update
+                and type(handler.filters).check_update  # type: ignore[attr-defined]
+                in _MESSAGE_ONLY_CHECKS
+            ):
+                self._messages.append(position)
+            else:
+                self._wildcards.append(position)
+
+        self._callback_lengths: tuple[int, ...] = tuple(
+            sorted({len(prefix) for prefix in self._callback_prefix})
+        )
+
+    @property
+    def is_trivial(self) -> bool:
+        """Whether indexing this group has no benefit, i.e. all handlers are wildcards."""
+        return len(self._wildcards) == len(self.handlers)
+
+    def is_stale(self, handlers: list[BaseHandler[Any, Any, Any]]) -> bool:
+        """Whether the list of handlers was changed since this index was built.
+
+        For a :class:`HandlerList` this only compares the version. Plain lists, i.e. lists that
+        were assigned directly to :attr:`telegram.ext.Application.handlers`, are compared item
+        by item.
+        """
+        if handlers is not self.handlers:
+            return True
+        if self.version is not None:
+            return handlers.version != self.version  # type: ignore[attr-defined]
+        return handlers != self.snapshot
+
+    def candidates(self, keys: UpdateKeys) -> Sequence[BaseHandler[Any, Any, Any]]:
+        """Returns the handlers that can possibly handle the update described by ``keys``."""
+        positions = list(self._wildcards)
+
+        if keys.has_message:
+            positions.extend(self._messages)
+
+        if keys.command is not None:
+            positions.extend(self._commands.get(keys.command, ()))
+
+        if keys.prefix_command is not None:
+            positions.extend(self._prefix_commands.get(keys.prefix_command, ()))
+        elif keys.blank_text:
+            positions.extend(self._prefixes)
+
+        if keys.has_callback_query:
+            if keys.callback_data is None:
+                positions.extend(self._callbacks)
+            else:
+                positions.extend(self._callback_any)
+                data = keys.callback_data
+                for length in self._callback_lengths:
+                    if length > len(data):
+                        break
+                    positions.extend(self._callback_prefix.get(data[:length], ()))
+
+        positions.sort()
+        handlers = self.snapshot
+        return [handlers[position] for position in positions]
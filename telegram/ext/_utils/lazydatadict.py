@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains the mapping that holds ``user_data`` and ``chat_data`` if they are
+loaded lazily from the persistence.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+from collections import defaultdict
+from collections.abc import Collection
+from typing import Callable, Generic, TypeVar
+
+_VT = TypeVar("_VT")
+
+
+class LazyDataDict(defaultdict, Generic[_VT]):
+    """A :class:`collections.defaultdict` that keeps track of which entries were loaded from the
+    persistence and that keeps the entries ordered by their last use, such that the least
+    recently used entries can be evicted.
+
+    Entries that are created by accessing a missing key are considered as *not loaded*, while
+    entries that are set explicitly are considered as loaded. Entries that are in use by a running
+    handler or job can be *pinned*, which excludes them from eviction.
+    """
+
+    __slots__ = ("_not_loaded", "_pinned")
+
+    def __init__(self, default_factory: Callable[[], _VT]):
+        super().__init__(default_factory)
+        self._not_loaded: set[int] = set()
+        # Maps the pinned keys to the number of times they were pinned
+        self._pinned: dict[int, int] = {}
+
+    def __missing__(self, key: int) -> _VT:
+        value = super().__missing__(key)
+        self._not_loaded.add(key)
+        return value
+
+    def __setitem__(self, key: int, value: _VT) -> None:
+        self._not_loaded.discard(key)
+        super().__setitem__(key, value)
+
+    def is_loaded(self, key: int) -> bool:
+        """Whether there is an entry for ``key`` that was not just created by accessing it."""
+        return key in self and key not in self._not_loaded
+
+    def touch(self, key: int) -> None:
+        """Marks the entry for ``key`` as the most recently used entry, if present."""
+        if key in self:
+            # dicts keep the insertion order, so reinserting moves the entry to the end
+            super().__setitem__(key, self.pop(key))
+
+    def pin(self, key: int) -> None:
+        """Excludes the entry for ``key`` from eviction until :meth:`unpin` was called as often as
+        this method."""
+        self._pinned[key] = self._pinned.get(key, 0) + 1
+
+    def unpin(self, key: int) -> None:
+        """Releases one pin of the entry for ``key``, see :meth:`pin`."""
+        count = self._pinned.get(key, 0) - 1
+        if count > 0:
+            self._pinned[key] = count
+        else:
+            self._pinned.pop(key, None)
+
+    def is_pinned(self, key: int) -> bool:
+        """Whether the entry for ``key`` is currently pinned."""
+        return key in self._pinned
+
+    def evict(self, max_entries: int, keep: Collection[int]) -> list[int]:
+        """Removes the least recently used entries until at most ``max_entries`` are left.
+        Pinned entries are never removed.
+
+        Args:
+            max_entries (:obj:`int`): The maximum number of entries to keep.
+            keep (Collection[:obj:`int`]): Further keys that must not be evicted.
+
+        Returns:
+            list[:obj:`int`]: The evicted keys.
+        """
+        excess = len(self) - max_entries
+        if excess <= 0:
+            return []
+
+        evicted = []
+        for key in self:
+            if len(evicted) >= excess:
+                break
+            if key not in keep and key not in self._pinned:
+                evicted.append(key)
+        for key in evicted:
+            del self[key]
+            self._not_loaded.discard(key)
+        return evicted
@@ -0,0 +1,105 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains helper functions to create the copies of the data that
+:class:`telegram.ext.Application` hands to the persistence.
+
+.. versionadded:: NEXT.VERSION
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+import datetime as dtm
+from copy import deepcopy
+from typing import Any, Final, TypeVar
+
+_T = TypeVar("_T")
+
+# Objects of these types can't be changed, so the snapshot can share them with the original
+_IMMUTABLE_TYPES: Final = frozenset(
+    (
+        type(None),
+        bool,
+        int,
+        float,
+        complex,
+        str,
+        bytes,
+        range,
+        dtm.date,
+        dtm.datetime,
+        dtm.time,
+        dtm.timedelta,
+        dtm.timezone,
+    )
+)
+
+
+def _copy(obj: Any, memo: dict[int, Any]) -> Any:
+    cls = type(obj)
+    if cls in _IMMUTABLE_TYPES:
+        return obj
+
+    obj_id = id(obj)
+    if (copied := memo.get(obj_id)) is not None:
+        return copied
+
+    if cls is dict:
+        copied = memo[obj_id] = {}
+        for key, value in obj.items():
+            copied[key if type(key) in _IMMUTABLE_TYPES else _copy(key, memo)] = (
+                value if type(value) in _IMMUTABLE_TYPES else _copy(value, memo)
+            )
+        return copied
+
+    if cls is list:
+        copied = memo[obj_id] = []
+        copied.extend(
+            item if type(item) in _IMMUTABLE_TYPES else _copy(item, memo) for item in obj
+        )
+        return copied
+
+    if cls is tuple:
+        items = [_copy(item, memo) for item in obj]
+        # The tuple may have been copied while copying its items, if it contains itself
+        if (copied := memo.get(obj_id)) is not None:
+            return copied
+        # Same as deepcopy: Tuples of immutable objects are not copied
+        copied = obj if all(a is b for a, b in zip(items, obj)) else tuple(items)
+        memo[obj_id] = copied
+        return copied
+
+    if cls is set:
+        copied = memo[obj_id] = {_copy(item, memo) for item in obj}
+        return copied
+
+    # Sharing the memo keeps references between the builtin containers and other objects intact
+    return deepcopy(obj, memo)
+
+
+def snapshot(obj: _T) -> _T:
+    """Returns a deep copy of ``obj``, just like :func:`copy.deepcopy`. Builtin containers and
+    immutable objects are handled directly, which is considerably faster than
+    :func:`copy.deepcopy`. Immutable objects are shared between ``obj`` and the copy.
+
+    Args:
+        obj: The object to copy.
+    """
+    return _copy(obj, {})  # type: ignore[no-any-return]
@@ -18,7 +18,7 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 # pylint: disable=missing-module-docstring
 import asyncio
-import json
+import logging
 from http import HTTPStatus
 from pathlib import Path
 from socket import socket
@@ -158,13 +158,18 @@ class TelegramHandler(tornado.web.RequestHandler):
         _LOGGER.debug("Webhook triggered")
         self._validate_post()
 
-        json_string = self.request.body.decode()
-        data = json.loads(json_string)
+        # The body is handed to the codec as bytes, so that codecs which can parse bytes
+        # directly don't have to decode it first
+        data = self.bot.request.json_codec.loads(self.request.body)
         self.set_status(HTTPStatus.OK)
-        _LOGGER.debug("Webhook received data: %s", json_string)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("Webhook received data: %s", self.request.body.decode())
 
         try:
-            update = Update.de_json(data, self.bot)
+            if isinstance(self.bot, ExtBot) and self.bot.lazy_updates:
+                update = Update._de_json_lazy(data, self.bot)
+            else:
+                update = Update.de_json(data, self.bot)
         except Exception as exc:
             _LOGGER.critical(
                 "Something went wrong processing the data received from Telegram. "
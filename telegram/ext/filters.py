@@ -106,7 +106,7 @@ import re
 from abc import ABC, abstractmethod
 from collections.abc import Collection, Iterable, Sequence
 from re import Match, Pattern
-from typing import NoReturn, Optional, Union, cast
+from typing import Callable, NoReturn, Optional, Union, cast
 
 from telegram import Chat as TGChat
 from telegram import (
@@ -173,6 +173,14 @@ class BaseFilter:
     .. versionadded:: 20.0
         Added the arguments :attr:`name` and :attr:`data_filter`.
 
+    .. versionchanged:: NEXT.VERSION
+        Combined filters are compiled into a single callable when they are first used. Nested
+        combinations are flattened, :attr:`telegram.Update.effective_message` is computed only
+        once per update and built-in filters that occur more than once are evaluated only once.
+        Within a chain of ``&`` combinations, built-in filters that are cheap to evaluate are
+        checked before e.g. :class:`filters.Regex <telegram.ext.filters.Regex>`. Custom filters
+        are always evaluated in the order in which they were combined.
+
     Args:
         name (:obj:`str`): Name for this filter. Defaults to the type of filter.
         data_filter (:obj:`bool`): Whether this filter is a data filter. A data filter should
@@ -376,14 +384,17 @@ class _InvertedFilter(UpdateFilter):
 
     """
 
-    __slots__ = ("inv_filter",)
+    __slots__ = ("_evaluator", "inv_filter")
 
     def __init__(self, f: BaseFilter):
         super().__init__()
         self.inv_filter = f
+        self._evaluator: Optional[_FilterEvaluator] = None
 
     def filter(self, update: Update) -> bool:
-        return not bool(self.inv_filter.check_update(update))
+        if self._evaluator is None:
+            self._evaluator = _compile_filter(self)[0]
+        return self._evaluator(update, update.effective_message)  # type: ignore[return-value]
 
     @property
     def name(self) -> str:
@@ -404,7 +415,7 @@ class _MergedFilter(UpdateFilter):
 
     """
 
-    __slots__ = ("and_filter", "base_filter", "or_filter")
+    __slots__ = ("_evaluator", "and_filter", "base_filter", "or_filter")
 
     def __init__(
         self,
@@ -426,6 +437,7 @@ class _MergedFilter(UpdateFilter):
         self.or_filter = or_filter
         if self.or_filter and not isinstance(self.and_filter, bool) and self.or_filter.data_filter:
             self.data_filter = True
+        self._evaluator: Optional[_FilterEvaluator] = None
 
     @staticmethod
     def _merge(base_output: Union[bool, dict], comp_output: Union[bool, dict]) -> FilterDataDict:
@@ -444,34 +456,10 @@ class _MergedFilter(UpdateFilter):
                 base[k] = comp_value
         return base
 
-    # pylint: disable=too-many-return-statements
     def filter(self, update: Update) -> Union[bool, FilterDataDict]:
-        base_output = self.base_filter.check_update(update)
-        # We need to check if the filters are data filters and if so return the merged data.
-        # If it's not a data filter or an or_filter but no matches return bool
-        if self.and_filter:
-            # And filter needs to short circuit if base is falsy
-            if base_output:
-                comp_output = self.and_filter.check_update(update)
-                if comp_output:
-                    if self.data_filter:
-                        merged = self._merge(base_output, comp_output)
-                        if merged:
-                            return merged
-                    return True
-        elif self.or_filter:
-            # Or filter needs to short circuit if base is truthy
-            if base_output:
-                if self.data_filter:
-                    return base_output
-                return True
-
-            comp_output = self.or_filter.check_update(update)
-            if comp_output:
-                if self.data_filter:
-                    return comp_output
-                return True
-        return False
+        if self._evaluator is None:
+            self._evaluator = _compile_filter(self)[0]
+        return self._evaluator(update, update.effective_message)  # type: ignore[return-value]
 
     @property
     def name(self) -> str:
@@ -495,16 +483,19 @@ class _XORFilter(UpdateFilter):
 
     """
 
-    __slots__ = ("base_filter", "merged_filter", "xor_filter")
+    __slots__ = ("_evaluator", "base_filter", "merged_filter", "xor_filter")
 
     def __init__(self, base_filter: BaseFilter, xor_filter: BaseFilter):
         super().__init__()
         self.base_filter = base_filter
         self.xor_filter = xor_filter
         self.merged_filter = (base_filter & ~xor_filter) | (~base_filter & xor_filter)
+        self._evaluator: Optional[_FilterEvaluator] = None
 
     def filter(self, update: Update) -> Optional[Union[bool, FilterDataDict]]:
-        return self.merged_filter.check_update(update)
+        if self._evaluator is None:
+            self._evaluator = _compile_filter(self)[0]
+        return self._evaluator(update, update.effective_message)  # type: ignore[arg-type]
 
     @property
     def name(self) -> str:
@@ -515,6 +506,191 @@ class _XORFilter(UpdateFilter):
         raise RuntimeError("Cannot set name for combined filters.")
 
 
+_FilterOutput = Optional[Union[bool, FilterDataDict]]
+_FilterEvaluator = Callable[[Update, Message], _FilterOutput]
+# Costs used to order the operands of "and" chains: Built-in filters that only look at attributes
+# of the message are cheap. Data filters like Regex usually are not.
+_CHEAP = 0
+_EXPENSIVE = 1
+
+
+# A filter compiled into a single callable, whether the filter is pure and its cost. The callable
+# expects the update and its effective message, i.e. it must only be called for updates that passed
+# BaseFilter.check_update. Pure filters are the built-in filters and combinations of those. They
+# don't have side effects and may hence be reordered and deduplicated.
+_CompiledFilter = tuple[_FilterEvaluator, bool, int]
+
+
+def _compile_filter(filter_: BaseFilter) -> _CompiledFilter:
+    """Compiles ``filter_`` such that the tree of combined filters doesn't have to be walked on
+    every call to :meth:`BaseFilter.check_update`.
+    """
+    if isinstance(filter_, _MergedFilter):
+        if filter_.and_filter is not None:
+            return _compile_chain(filter_, is_and=True)
+        if filter_.or_filter is not None:
+            return _compile_chain(filter_, is_and=False)
+        return _compile_degenerate(filter_)
+    if isinstance(filter_, _InvertedFilter):
+        return _compile_inverted(filter_)
+    if isinstance(filter_, _XORFilter):
+        return _compile_xor(filter_)
+
+    # All combined filters are UpdateFilters, so the evaluator is only called for updates that
+    # contain a message and we can skip that check for the operands
+    filter_type = type(filter_)
+    pure = filter_type.__module__ == __name__
+    cost = _CHEAP if pure and not filter_.data_filter else _EXPENSIVE
+    evaluator: _FilterEvaluator
+    if filter_type.check_update is MessageFilter.check_update:
+        message_filter = cast(MessageFilter, filter_).filter
+
+        def evaluator(_: Update, message: Message) -> _FilterOutput:
+            return message_filter(message)
+
+    elif filter_type.check_update is UpdateFilter.check_update:
+        update_filter = cast(UpdateFilter, filter_).filter
+
+        def evaluator(update: Update, _: Message) -> _FilterOutput:
+            return update_filter(update)
+
+    else:
+        check_update = filter_.check_update
+
+        def evaluator(update: Update, _: Message) -> _FilterOutput:
+            return check_update(update)
+
+    return evaluator, pure, cost
+
+
+def _chain_operands(filter_: BaseFilter, is_and: bool) -> list[BaseFilter]:
+    """Flattens nested "and" or "or" combinations into a list of operands in evaluation order."""
+    if not isinstance(filter_, _MergedFilter):
+        return [filter_]
+    other = filter_.and_filter if is_and else filter_.or_filter
+    if other is None:
+        return [filter_]
+    return [*_chain_operands(filter_.base_filter, is_and), *_chain_operands(other, is_and)]
+
+
+def _order_by_cost(operands: list[_CompiledFilter]) -> list[_CompiledFilter]:
+    """Moves cheap operands of an "and" chain to the front. Filters that are not pure may have
+    side effects that rely on the evaluation order, so they are never moved past.
+    """
+    ordered: list[_CompiledFilter] = []
+    segment: list[_CompiledFilter] = []
+    for operand in operands:
+        if operand[1]:
+            segment.append(operand)
+            continue
+        ordered.extend(sorted(segment, key=lambda op: op[2]))
+        ordered.append(operand)
+        segment = []
+    ordered.extend(sorted(segment, key=lambda op: op[2]))
+    return ordered
+
+
+def _compile_chain(filter_: "_MergedFilter", is_and: bool) -> _CompiledFilter:
+    operands: list[_CompiledFilter] = []
+    compiled: dict[int, _CompiledFilter] = {}
+    for operand in _chain_operands(filter_, is_and):
+        if (compiled_operand := compiled.get(id(operand))) is None:
+            compiled_operand = compiled[id(operand)] = _compile_filter(operand)
+        # Evaluating a pure filter a second time gives the same result. Only the outputs of
+        # data filters in "and" chains are merged, so those must be kept.
+        elif compiled_operand[1] and not (is_and and operand.data_filter):
+            continue
+        operands.append(compiled_operand)
+
+    if is_and:
+        operands = _order_by_cost(operands)
+    evaluators = tuple(operand[0] for operand in operands)
+    pure = all(operand[1] for operand in operands)
+    cost = max(operand[2] for operand in operands)
+    data_filter = filter_.data_filter
+    evaluator: _FilterEvaluator
+
+    if is_and and not data_filter:
+
+        def evaluator(update: Update, message: Message) -> _FilterOutput:
+            for operand_evaluator in evaluators:
+                if not operand_evaluator(update, message):
+                    return False
+            return True
+
+    elif is_and:
+        first, rest = evaluators[0], evaluators[1:]
+        merge = _MergedFilter._merge  # pylint: disable=protected-access
+
+        def evaluator(update: Update, message: Message) -> _FilterOutput:
+            merged = first(update, message)
+            if not merged:
+                return False
+            for operand_evaluator in rest:
+                output = operand_evaluator(update, message)
+                if not output:
+                    return False
+                merged = merge(merged, output)
+            return merged if isinstance(merged, dict) and merged else True
+
+    elif not data_filter:
+
+        def evaluator(update: Update, message: Message) -> _FilterOutput:
+            for operand_evaluator in evaluators:
+                if operand_evaluator(update, message):
+                    return True
+            return False
+
+    else:
+
+        def evaluator(update: Update, message: Message) -> _FilterOutput:
+            for operand_evaluator in evaluators:
+                if output := operand_evaluator(update, message):
+                    return output
+            return False
+
+    return evaluator, pure, cost
+
+
+def _compile_degenerate(filter_: "_MergedFilter") -> _CompiledFilter:
+    # A merged filter without a second operand. Never created by the bitwise operators.
+    base_evaluator, pure, cost = _compile_filter(filter_.base_filter)
+
+    def evaluator(update: Update, message: Message) -> _FilterOutput:
+        base_evaluator(update, message)
+        return False
+
+    return evaluator, pure, cost
+
+
+def _compile_inverted(filter_: "_InvertedFilter") -> _CompiledFilter:
+    inverted_evaluator, pure, cost = _compile_filter(filter_.inv_filter)
+
+    def evaluator(update: Update, message: Message) -> _FilterOutput:
+        return not inverted_evaluator(update, message)
+
+    return evaluator, pure, cost
+
+
+def _compile_xor(filter_: "_XORFilter") -> _CompiledFilter:
+    # Equivalent to evaluating `merged_filter`, but each operand is evaluated only once
+    base_evaluator, base_pure, base_cost = _compile_filter(filter_.base_filter)
+    xor_evaluator, xor_pure, xor_cost = _compile_filter(filter_.xor_filter)
+    base_data, xor_data = filter_.base_filter.data_filter, filter_.xor_filter.data_filter
+    merge = _MergedFilter._merge  # pylint: disable=protected-access
+
+    def evaluator(update: Update, message: Message) -> _FilterOutput:
+        base_output = base_evaluator(update, message)
+        xor_output = xor_evaluator(update, message)
+        if bool(base_output) is bool(xor_output):
+            return False
+        if base_output:
+            return (merge(base_output, True) or True) if base_data else True
+        return (merge(True, xor_output) or True) if xor_data else True
+
+    return evaluator, base_pure and xor_pure, max(base_cost, xor_cost)
+
+
 class _All(MessageFilter):
     __slots__ = ()
 
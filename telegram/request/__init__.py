@@ -19,6 +19,7 @@
 
 from ._baserequest import BaseRequest
 from ._httpxrequest import HTTPXRequest
+from ._jsoncodec import JSONCodec
 from ._requestdata import RequestData
 
-__all__ = ("BaseRequest", "HTTPXRequest", "RequestData")
+__all__ = ("BaseRequest", "HTTPXRequest", "JSONCodec", "RequestData")
@@ -18,14 +18,15 @@
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains an abstract class to make POST and GET requests."""
 import abc
-import json
-from contextlib import AbstractAsyncContextManager
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 from http import HTTPStatus
 from types import TracebackType
-from typing import Final, Optional, TypeVar, Union, final
+from typing import Final, NoReturn, Optional, TypeVar, Union, final
 
 from telegram._utils.defaultvalue import DEFAULT_NONE as _DEFAULT_NONE
 from telegram._utils.defaultvalue import DefaultValue
+from telegram._utils.files import LazyFile
 from telegram._utils.logging import get_logger
 from telegram._utils.strings import TextEncoding
 from telegram._utils.types import JSONDict, ODVInput
@@ -41,6 +42,7 @@ from telegram.error import (
     RetryAfter,
     TelegramError,
 )
+from telegram.request._jsoncodec import DEFAULT_JSON_CODEC, JSONCodec
 from telegram.request._requestdata import RequestData
 from telegram.warnings import PTBDeprecationWarning
 
@@ -49,6 +51,11 @@ RT = TypeVar("RT", bound="BaseRequest")
 _LOGGER = get_logger(__name__, class_name="BaseRequest")
 
 
+async def _iter_payload(payload: bytes) -> AsyncIterator[bytes]:
+    if payload:
+        yield payload
+
+
 class BaseRequest(
     AbstractAsyncContextManager["BaseRequest"],
     abc.ABC,
@@ -78,8 +85,16 @@ class BaseRequest(
 
     Tip:
         JSON encoding and decoding is done with the standard library's :mod:`json` by default.
-        To use a custom library for this, you can override :meth:`parse_json_payload` and implement
-        custom logic to encode the keys of :attr:`telegram.request.RequestData.parameters`.
+        To use a custom library for this, you can override :attr:`json_codec` to return a custom
+        :class:`telegram.request.JSONCodec`.
+
+    Tip:
+        Files are downloaded via :meth:`retrieve_stream`, which by default falls back to
+        :meth:`do_request` and hence loads the complete file into memory. Override
+        :meth:`do_stream_request` to support streaming downloads and HTTP range requests.
+
+    .. versionchanged:: NEXT.VERSION
+        Added :attr:`json_codec`, :meth:`retrieve_stream` and :meth:`do_stream_request`.
 
     .. seealso:: :wiki:`Architecture Overview <Architecture>`,
         :wiki:`Builder Pattern <Builder-Pattern>`
@@ -150,6 +165,21 @@ class BaseRequest(
         """
         raise NotImplementedError
 
+    @property
+    def json_codec(self) -> JSONCodec:
+        """The codec used for encoding the parameters of requests and for decoding the responses
+        of the Bot API. :class:`telegram.Bot` also passes it to the
+        :class:`~telegram.request.RequestData` objects it creates for requests made with this
+        instance. Subclasses may override this property to use a different codec. The default
+        implementation uses the standard library's :mod:`json`.
+
+        .. versionadded:: NEXT.VERSION
+
+        Returns:
+            :class:`telegram.request.JSONCodec`: The JSON codec.
+        """
+        return DEFAULT_JSON_CODEC
+
     @abc.abstractmethod
     async def initialize(self) -> None:
         """Initialize resources used by this class. Must be implemented by a subclass."""
@@ -208,7 +238,7 @@ class BaseRequest(
             connect_timeout=connect_timeout,
             pool_timeout=pool_timeout,
         )
-        json_data = self.parse_json_payload(result)
+        json_data = self._parse_json_payload(result)
         # For successful requests, the results are in the 'result' entry
         # see https://core.telegram.org/bots/api#making-requests
         return json_data["result"]
@@ -260,6 +290,77 @@ class BaseRequest(
             pool_timeout=pool_timeout,
         )
 
+    @final
+    async def retrieve_stream(
+        self,
+        url: str,
+        offset: int = 0,
+        length: Optional[int] = None,
+        read_timeout: ODVInput[float] = DEFAULT_NONE,
+        write_timeout: ODVInput[float] = DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = DEFAULT_NONE,
+    ) -> AsyncGenerator[bytes, None]:
+        """Retrieve the contents of a file by its URL in chunks. Only the chunk that is currently
+        processed is held in memory.
+
+        Warning:
+            This method will be called by the methods of :class:`telegram.File` and should *not*
+            be called manually.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            url (:obj:`str`): The web location we want to retrieve.
+            offset (:obj:`int`, optional): The number of bytes at the start of the file to skip.
+                Defaults to ``0``.
+            length (:obj:`int`, optional): The maximum number of bytes to retrieve. By default,
+                the file is retrieved until its end.
+            read_timeout (:obj:`float` | :obj:`None`, optional): See
+                :paramref:`retrieve.read_timeout`.
+            write_timeout (:obj:`float` | :obj:`None`, optional): See
+                :paramref:`retrieve.write_timeout`.
+            connect_timeout (:obj:`float` | :obj:`None`, optional): See
+                :paramref:`retrieve.connect_timeout`.
+            pool_timeout (:obj:`float` | :obj:`None`, optional): See
+                :paramref:`retrieve.pool_timeout`.
+
+        Yields:
+            :obj:`bytes`: The chunks of the files contents.
+        """
+        try:
+            async with self.do_stream_request(
+                url=url,
+                offset=offset,
+                length=length,
+                read_timeout=read_timeout,
+                write_timeout=write_timeout,
+                connect_timeout=connect_timeout,
+                pool_timeout=pool_timeout,
+            ) as (code, chunks):
+                if not HTTPStatus.OK <= code <= 299:
+                    self._raise_for_response(code, b"".join([chunk async for chunk in chunks]))
+
+                # If the server ignored the requested range, we have to cut it out ourselves
+                skip = 0 if code == HTTPStatus.PARTIAL_CONTENT else offset
+                remaining = length
+                async for chunk in chunks:
+                    if skip:
+                        skipped = min(skip, len(chunk))
+                        chunk = chunk[skipped:]  # noqa: PLW2901
+                        skip -= skipped
+                    if remaining is not None:
+                        chunk = chunk[:remaining]  # noqa: PLW2901
+                        remaining -= len(chunk)
+                    if chunk:
+                        yield chunk
+                    if remaining == 0:
+                        break
+        except TelegramError:
+            raise
+        except Exception as exc:
+            raise NetworkError(f"Unknown error in HTTP implementation: {exc!r}") from exc
+
     async def _request_wrapper(
         self,
         url: str,
@@ -344,12 +445,23 @@ class BaseRequest(
             raise
         except Exception as exc:
             raise NetworkError(f"Unknown error in HTTP implementation: {exc!r}") from exc
+        finally:
+            if request_data:
+                # Local files passed by path are opened on demand. Close them right away instead
+                # of keeping the file descriptors until the InputFile is garbage collected
+                for _, content, _ in request_data.multipart_data.values():
+                    if isinstance(content, LazyFile):
+                        content.close()
 
         if HTTPStatus.OK <= code <= 299:
             # 200-299 range are HTTP success statuses
             return payload
 
-        response_data = self.parse_json_payload(payload)
+        self._raise_for_response(code, payload)
+
+    def _raise_for_response(self, code: int, payload: bytes) -> NoReturn:
+        """Raises the exception matching an unsuccessful response of the Bot API."""
+        response_data = self._parse_json_payload(payload)
 
         description = response_data.get("description")
         message = description if description else "Unknown HTTPError"
@@ -394,7 +506,9 @@ class BaseRequest(
         Tip:
             By default, this method uses the standard library's :func:`json.loads` and
             ``errors="replace"`` in :meth:`bytes.decode`.
-            You can override it to customize either of these behaviors.
+            You can override it to customize either of these behaviors. Alternatively, override
+            :attr:`json_codec`, which is used for decoding the responses unless this method is
+            overridden.
 
         Args:
             payload (:obj:`bytes`): The UTF-8 encoded JSON payload as returned by Telegram.
@@ -405,11 +519,23 @@ class BaseRequest(
         Raises:
             TelegramError: If loading the JSON data failed
         """
-        decoded_s = payload.decode(TextEncoding.UTF_8, "replace")
+        return BaseRequest._load_json_payload(DEFAULT_JSON_CODEC, payload)
+
+    def _parse_json_payload(self, payload: bytes) -> JSONDict:
+        # Overrides of parse_json_payload take precedence for backwards compatibility
+        if type(self).parse_json_payload is not BaseRequest.parse_json_payload:
+            return self.parse_json_payload(payload)
+        return self._load_json_payload(self.json_codec, payload)
+
+    @staticmethod
+    def _load_json_payload(json_codec: JSONCodec, payload: bytes) -> JSONDict:
         try:
-            return json.loads(decoded_s)
+            return json_codec.loads(payload)
         except ValueError as exc:
-            _LOGGER.exception('Can not load invalid JSON data: "%s"', decoded_s)
+            _LOGGER.exception(
+                'Can not load invalid JSON data: "%s"',
+                payload.decode(TextEncoding.UTF_8, "replace"),
+            )
             raise TelegramError("Invalid server response") from exc
 
     @abc.abstractmethod
@@ -455,3 +581,63 @@ class BaseRequest(
             tuple[:obj:`int`, :obj:`bytes`]: The HTTP return code & the payload part of the server
             response.
         """
+
+    @asynccontextmanager
+    async def do_stream_request(  # pylint: disable=unused-argument
+        self,
+        url: str,
+        offset: int = 0,  # noqa: ARG002
+        length: Optional[int] = None,  # noqa: ARG002
+        read_timeout: ODVInput[float] = DEFAULT_NONE,
+        write_timeout: ODVInput[float] = DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = DEFAULT_NONE,
+    ) -> AsyncIterator[tuple[int, AsyncIterator[bytes]]]:
+        """Makes a ``GET`` request whose response is streamed. Must be used as asynchronous
+        context manager, which yields the HTTP return code and an asynchronous iterator over the
+        chunks of the response. The response must be released when the context manager exits.
+
+        By default, this calls :meth:`do_request` and yields its payload as one chunk. Subclasses
+        can override this method to support streaming downloads.
+
+        Tip:
+            :paramref:`offset` and :paramref:`length` are meant to be passed to the server via the
+            ``Range`` header. In that case, the server should return a return code of
+            :attr:`http.HTTPStatus.PARTIAL_CONTENT`. For any other successful return code,
+            :meth:`retrieve_stream` assumes that the complete file was returned.
+
+        Warning:
+            This method will be called by :meth:`retrieve_stream`. It should *not* be called
+            manually.
+
+        .. versionadded:: NEXT.VERSION
+
+        Args:
+            url (:obj:`str`): The URL to request.
+            offset (:obj:`int`, optional): The number of bytes at the start of the response that
+                are not needed. Defaults to ``0``.
+            length (:obj:`int`, optional): The maximum number of bytes of the response that are
+                needed, starting at :paramref:`offset`.
+            read_timeout (:obj:`float` | :obj:`None`, optional): See
+                :paramref:`do_request.read_timeout`.
+            write_timeout (:obj:`float` | :obj:`None`, optional): See
+                :paramref:`do_request.write_timeout`.
+            connect_timeout (:obj:`float` | :obj:`None`, optional): See
+                :paramref:`do_request.connect_timeout`.
+            pool_timeout (:obj:`float` | :obj:`None`, optional): See
+                :paramref:`do_request.pool_timeout`.
+
+        Yields:
+            tuple[:obj:`int`, AsyncIterator[:obj:`bytes`]]: The HTTP return code & an
+            asynchronous iterator over the payload part of the server response.
+        """
+        # offset and length are handled by retrieve_stream, since the whole file is returned
+        code, payload = await self.do_request(
+            url=url,
+            method="GET",
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+        )
+        yield code, _iter_payload(payload)
@@ -0,0 +1,177 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a helper class that keeps track of the connections used by
+:class:`telegram.request.HTTPXRequest` and adapts their number to the load.
+
+Warning:
+    Contents of this module are intended to be used internally by the library and *not* by the
+    user. Changes to this module are not considered breaking changes and may not be documented in
+    the changelog.
+"""
+import asyncio
+import bisect
+import contextlib
+from collections import deque
+from typing import Final, Optional
+
+# Upper bounds in seconds of the buckets of the wait time histogram. The last bucket is unbounded.
+WAIT_TIME_BUCKETS: Final = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, float("inf"))
+
+
+class ConnectionPool:
+    """Limits the number of concurrent requests and records how long requests wait for a
+    connection.
+
+    If ``min_size`` equals ``max_size``, requests are only counted. Limiting is then left to the
+    connection pool of ``httpx`` and wait times are not recorded. Otherwise, the number of
+    concurrent requests is limited by :attr:`size`, which starts at ``min_size``. If a request
+    waits for longer than ``grow_after`` seconds, :attr:`size` is increased by one, up to
+    ``max_size``. Every ``shrink_interval`` seconds, :attr:`size` is reduced to the maximum number
+    of concurrent requests observed since the last adjustment, but not below ``min_size``.
+    """
+
+    __slots__ = (
+        "_last_adjustment",
+        "_peak",
+        "_waiters",
+        "active",
+        "grow_after",
+        "max_size",
+        "min_size",
+        "requests",
+        "shrink_interval",
+        "size",
+        "wait_time_counts",
+        "waiting",
+    )
+
+    def __init__(
+        self,
+        min_size: int,
+        max_size: int,
+        grow_after: float = 0.05,
+        shrink_interval: float = 30,
+    ):
+        self.min_size: int = min_size
+        self.max_size: int = max_size
+        self.grow_after: float = grow_after
+        self.shrink_interval: float = shrink_interval
+        self.size: int = min_size
+        self.active: int = 0
+        self.requests: int = 0
+        self.wait_time_counts: list[int] = [0] * len(WAIT_TIME_BUCKETS)
+        # The number of requests in `_waiters` that were not handed a connection yet. Kept as
+        # counter, as `acquire` checks it for every request.
+        self.waiting: int = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self._peak: int = 0
+        self._last_adjustment: Optional[float] = None
+
+    @property
+    def adaptive(self) -> bool:
+        return self.min_size != self.max_size
+
+    def _record(self, wait_time: float) -> None:
+        self.requests += 1
+        self._peak = max(self._peak, self.active)
+        self.wait_time_counts[bisect.bisect_left(WAIT_TIME_BUCKETS, wait_time)] += 1
+
+    async def acquire(self, timeout: Optional[float]) -> float:
+        """Waits for a free connection.
+
+        Returns:
+            :obj:`float`: The time in seconds that the request waited for the connection.
+
+        Raises:
+            :exc:`asyncio.TimeoutError`: If no connection was available within ``timeout``
+                seconds.
+        """
+        if not self.adaptive:
+            self.active += 1
+            self.requests += 1
+            return 0
+        if self.active < self.size and not self.waiting:
+            self.active += 1
+            self._record(0)
+            return 0
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        waiter = loop.create_future()
+        self._waiters.append(waiter)
+        self.waiting += 1
+        try:
+            while not waiter.done():
+                now = loop.time()
+                if self.size < self.max_size and now - start >= self.grow_after:
+                    # Requests wait too long, so the pool is too small for the current load
+                    self.size += 1
+                    self._last_adjustment = now
+                    if self.active < self.size:
+                        self.active += 1
+                        waiter.cancel()
+                        self.waiting -= 1
+                        break
+                if timeout is not None and now - start >= timeout:
+                    raise asyncio.TimeoutError
+
+                wait_for = None if timeout is None else start + timeout - now
+                if self.size < self.max_size:
+                    grow_in = start + self.grow_after - now
+                    wait_for = grow_in if wait_for is None else min(wait_for, grow_in)
+                # If the wait times out, the waiter stays in the queue
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(asyncio.shield(waiter), wait_for)
+        except BaseException:
+            if waiter.done():
+                # The connection was handed over to us, but we can't use it
+                self.release()
+            else:
+                waiter.cancel()
+                self.waiting -= 1
+            raise
+
+        wait_time = loop.time() - start
+        self._record(wait_time)
+        return wait_time
+
+    def release(self) -> None:
+        """Marks a connection as free again."""
+        if not self.adaptive:
+            self.active -= 1
+            return
+
+        now = asyncio.get_running_loop().time()
+        if self._last_adjustment is None:
+            self._last_adjustment = now
+        elif now - self._last_adjustment >= self.shrink_interval:
+            # The pool was larger than needed since the last adjustment
+            self.size = max(self.min_size, min(self.size, self._peak))
+            self._peak = self.active
+            self._last_adjustment = now
+
+        if self.active <= self.size:
+            while self._waiters:
+                waiter = self._waiters.popleft()
+                if not waiter.done():
+                    # Hand the connection over to the waiting request, so ``active`` stays
+                    waiter.set_result(None)
+                    self.waiting -= 1
+                    return
+        self.active -= 1
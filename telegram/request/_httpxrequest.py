@@ -17,7 +17,9 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains methods to make POST and GET requests using the httpx library."""
-from collections.abc import Collection
+import asyncio
+import contextlib
+from collections.abc import AsyncIterator, Collection, Iterator
 from typing import Any, Optional, Union
 
 import httpx
@@ -28,6 +30,8 @@ from telegram._utils.types import HTTPVersion, ODVInput, SocketOpt
 from telegram._utils.warnings import warn
 from telegram.error import NetworkError, TimedOut
 from telegram.request._baserequest import BaseRequest
+from telegram.request._connectionpool import WAIT_TIME_BUCKETS, ConnectionPool
+from telegram.request._jsoncodec import DEFAULT_JSON_CODEC, JSONCodec
 from telegram.request._requestdata import RequestData
 from telegram.warnings import PTBDeprecationWarning
 
@@ -37,6 +41,27 @@ from telegram.warnings import PTBDeprecationWarning
 # That also works with socks5. Just pass `--mode socks5` to mitmproxy
 
 _LOGGER = get_logger(__name__, "HTTPXRequest")
+_POOL_TIMEOUT_MESSAGE = (
+    "Pool timeout: All connections in the connection pool are occupied. Request was *not* sent "
+    "to Telegram. Consider adjusting the connection pool size or the pool timeout."
+)
+
+
+@contextlib.contextmanager
+def _translate_httpx_errors() -> Iterator[None]:
+    try:
+        yield
+    except httpx.TimeoutException as err:
+        if isinstance(err, httpx.PoolTimeout):
+            raise TimedOut(message=_POOL_TIMEOUT_MESSAGE) from err
+        raise TimedOut from err
+    except httpx.HTTPError as err:
+        # HTTPError must come last as its the base httpx exception class
+        # TODO p4: do something smart here; for now just raise NetworkError
+
+        # We include the class name for easier debugging. Especially useful if the error
+        # message of `err` is empty.
+        raise NetworkError(f"httpx.{err.__class__.__name__}: {err}") from err
 
 
 class HTTPXRequest(BaseRequest):
@@ -52,6 +77,10 @@ class HTTPXRequest(BaseRequest):
             Note:
                 Independent of the value, one additional connection will be reserved for
                 :meth:`telegram.Bot.get_updates`.
+
+            .. versionchanged:: NEXT.VERSION
+                If :paramref:`max_connection_pool_size` is passed, this is the minimum number of
+                connections.
         proxy_url (:obj:`str`, optional): Legacy name for :paramref:`proxy`, kept for backward
             compatibility. Defaults to :obj:`None`.
 
@@ -137,10 +166,34 @@ class HTTPXRequest(BaseRequest):
                 way.
 
             .. versionadded:: 21.6
-
+        json_codec (:class:`telegram.request.JSONCodec`, optional): The codec to use for encoding
+            request parameters and decoding responses. Defaults to a codec that uses the standard
+            library's :mod:`json`.
+
+            .. versionadded:: NEXT.VERSION
+        max_connection_pool_size (:obj:`int`, optional): If passed, enables adaptive sizing of
+            the connection pool. The number of requests that are processed concurrently starts
+            at :paramref:`connection_pool_size` and grows up to this value whenever requests
+            have to wait for a connection for longer than 50 milliseconds. If fewer connections
+            were used for 30 seconds, the number shrinks again, but not below
+            :paramref:`connection_pool_size`. Idle connections are closed by ``httpx`` after a
+            few seconds. See also :attr:`pool_statistics`.
+
+            .. versionadded:: NEXT.VERSION
+
+    Raises:
+        :exc:`ValueError`: If :paramref:`max_connection_pool_size` is smaller than
+            :paramref:`connection_pool_size`.
     """
 
-    __slots__ = ("_client", "_client_kwargs", "_http_version", "_media_write_timeout")
+    __slots__ = (
+        "_client",
+        "_client_kwargs",
+        "_connection_pool",
+        "_http_version",
+        "_json_codec",
+        "_media_write_timeout",
+    )
 
     def __init__(
         self,
@@ -155,6 +208,8 @@ class HTTPXRequest(BaseRequest):
         proxy: Optional[Union[str, httpx.Proxy, httpx.URL]] = None,
         media_write_timeout: Optional[float] = 20.0,
         httpx_kwargs: Optional[dict[str, Any]] = None,
+        json_codec: Optional[JSONCodec] = None,
+        max_connection_pool_size: Optional[int] = None,
     ):
         if proxy_url is not None and proxy is not None:
             raise ValueError("The parameters `proxy_url` and `proxy` are mutually exclusive.")
@@ -170,15 +225,25 @@ class HTTPXRequest(BaseRequest):
 
         self._http_version = http_version
         self._media_write_timeout = media_write_timeout
+        self._json_codec: JSONCodec = json_codec or DEFAULT_JSON_CODEC
         timeout = httpx.Timeout(
             connect=connect_timeout,
             read=read_timeout,
             write=write_timeout,
             pool=pool_timeout,
         )
+        if max_connection_pool_size is None:
+            max_connection_pool_size = connection_pool_size
+        elif max_connection_pool_size < connection_pool_size:
+            raise ValueError(
+                "`max_connection_pool_size` must not be smaller than `connection_pool_size`."
+            )
+        self._connection_pool = ConnectionPool(
+            min_size=connection_pool_size, max_size=max_connection_pool_size
+        )
         limits = httpx.Limits(
-            max_connections=connection_pool_size,
-            max_keepalive_connections=connection_pool_size,
+            max_connections=max_connection_pool_size,
+            max_keepalive_connections=max_connection_pool_size,
         )
 
         if http_version not in ("1.1", "2", "2.0"):
@@ -237,6 +302,60 @@ class HTTPXRequest(BaseRequest):
         """
         return self._client.timeout.read
 
+    @property
+    def json_codec(self) -> JSONCodec:
+        """See :attr:`BaseRequest.json_codec`.
+
+        Returns:
+            :class:`telegram.request.JSONCodec`: The codec as passed to
+                :paramref:`HTTPXRequest.json_codec`.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._json_codec
+
+    @property
+    def pool_statistics(self) -> dict[str, Any]:
+        """Statistics about the usage of the connection pool.
+
+        .. versionadded:: NEXT.VERSION
+
+        Returns:
+            dict[:obj:`str`, Any]: A dictionary with the following keys:
+
+            * ``"size"`` (:obj:`int`): The current maximum number of concurrent requests.
+            * ``"min_size"`` (:obj:`int`): See :paramref:`connection_pool_size`.
+            * ``"max_size"`` (:obj:`int`): See :paramref:`max_connection_pool_size`.
+            * ``"active"`` (:obj:`int`): The number of requests that are currently being
+              processed.
+            * ``"waiting"`` (:obj:`int`): The number of requests that currently wait for a
+              connection.
+            * ``"idle"`` (:obj:`int` | :obj:`None`): The number of open connections that are
+              currently not used, if available.
+            * ``"requests"`` (:obj:`int`): The total number of requests made.
+            * ``"wait_times"`` (dict[:obj:`float`, :obj:`int`]): A histogram of the times that
+              requests waited for a connection. Maps the upper bound of each bucket in seconds to
+              the number of requests in the bucket. Only recorded if
+              :paramref:`max_connection_pool_size` is set.
+        """
+        pool = self._connection_pool
+        transport = self._client._transport  # pylint: disable=protected-access
+        connections = getattr(getattr(transport, "_pool", None), "connections", None)
+        return {
+            "size": pool.size,
+            "min_size": pool.min_size,
+            "max_size": pool.max_size,
+            "active": pool.active,
+            "waiting": pool.waiting,
+            "idle": (
+                None
+                if connections is None
+                else sum(1 for connection in connections if connection.is_idle())
+            ),
+            "requests": pool.requests,
+            "wait_times": dict(zip(WAIT_TIME_BUCKETS, pool.wait_time_counts)),
+        }
+
     def _build_client(self) -> httpx.AsyncClient:
         return httpx.AsyncClient(**self._client_kwargs)
 
@@ -270,6 +389,79 @@ class HTTPXRequest(BaseRequest):
         files = request_data.multipart_data if request_data else None
         data = request_data.json_parameters if request_data else None
 
+        timeout = self._build_timeout(
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+            has_files=bool(files),
+        )
+        timeout = await self._acquire_connection(timeout)
+
+        try:
+            with _translate_httpx_errors():
+                res = await self._client.request(
+                    method=method,
+                    url=url,
+                    headers={"User-Agent": self.USER_AGENT},
+                    timeout=timeout,
+                    files=files,
+                    data=data,
+                )
+        finally:
+            self._connection_pool.release()
+
+        return res.status_code, res.content
+
+    @contextlib.asynccontextmanager
+    async def do_stream_request(
+        self,
+        url: str,
+        offset: int = 0,
+        length: Optional[int] = None,
+        read_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+        write_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+        connect_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+        pool_timeout: ODVInput[float] = BaseRequest.DEFAULT_NONE,
+    ) -> AsyncIterator[tuple[int, AsyncIterator[bytes]]]:
+        """See :meth:`BaseRequest.do_stream_request`. The requested range is passed to the server
+        via the ``Range`` header.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        if self._client.is_closed:
+            raise RuntimeError("This HTTPXRequest is not initialized!")
+
+        timeout = self._build_timeout(
+            read_timeout=read_timeout,
+            write_timeout=write_timeout,
+            connect_timeout=connect_timeout,
+            pool_timeout=pool_timeout,
+            has_files=False,
+        )
+        headers = {"User-Agent": self.USER_AGENT}
+        if offset or length is not None:
+            end = "" if length is None else offset + length - 1
+            headers["Range"] = f"bytes={offset}-{end}"
+        timeout = await self._acquire_connection(timeout)
+
+        try:
+            with _translate_httpx_errors():
+                async with self._client.stream(
+                    method="GET", url=url, headers=headers, timeout=timeout
+                ) as response:
+                    yield response.status_code, response.aiter_bytes()
+        finally:
+            self._connection_pool.release()
+
+    def _build_timeout(
+        self,
+        read_timeout: ODVInput[float],
+        write_timeout: ODVInput[float],
+        connect_timeout: ODVInput[float],
+        pool_timeout: ODVInput[float],
+        has_files: bool,
+    ) -> httpx.Timeout:
         # If user did not specify timeouts (for e.g. in a bot method), use the default ones when we
         # created this instance.
         if isinstance(read_timeout, DefaultValue):
@@ -280,40 +472,32 @@ class HTTPXRequest(BaseRequest):
             pool_timeout = self._client.timeout.pool
 
         if isinstance(write_timeout, DefaultValue):
-            write_timeout = self._client.timeout.write if not files else self._media_write_timeout
+            write_timeout = (
+                self._client.timeout.write if not has_files else self._media_write_timeout
+            )
 
-        timeout = httpx.Timeout(
+        return httpx.Timeout(
             connect=connect_timeout,
             read=read_timeout,
             write=write_timeout,
             pool=pool_timeout,
         )
 
+    async def _acquire_connection(self, timeout: httpx.Timeout) -> httpx.Timeout:
+        """Waits for a connection of :attr:`_connection_pool`. Returns ``timeout`` with the pool
+        timeout reduced by the time waited, such that the pool timeout applies to the total time
+        spent waiting for a connection rather than to our pool and the one of ``httpx`` each.
+        """
         try:
-            res = await self._client.request(
-                method=method,
-                url=url,
-                headers={"User-Agent": self.USER_AGENT},
-                timeout=timeout,
-                files=files,
-                data=data,
-            )
-        except httpx.TimeoutException as err:
-            if isinstance(err, httpx.PoolTimeout):
-                raise TimedOut(
-                    message=(
-                        "Pool timeout: All connections in the connection pool are occupied. "
-                        "Request was *not* sent to Telegram. Consider adjusting the connection "
-                        "pool size or the pool timeout."
-                    )
-                ) from err
-            raise TimedOut from err
-        except httpx.HTTPError as err:
-            # HTTPError must come last as its the base httpx exception class
-            # TODO p4: do something smart here; for now just raise NetworkError
-
-            # We include the class name for easier debugging. Especially useful if the error
-            # message of `err` is empty.
-            raise NetworkError(f"httpx.{err.__class__.__name__}: {err}") from err
-
-        return res.status_code, res.content
+            wait_time = await self._connection_pool.acquire(timeout.pool)
+        except asyncio.TimeoutError as err:
+            raise TimedOut(message=_POOL_TIMEOUT_MESSAGE) from err
+
+        if not wait_time or timeout.pool is None:
+            return timeout
+        return httpx.Timeout(
+            connect=timeout.connect,
+            read=timeout.read,
+            write=timeout.write,
+            pool=max(timeout.pool - wait_time, 0),
+        )
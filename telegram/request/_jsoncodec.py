@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+#
+#  A library that provides a Python interface to the Telegram Bot API
+#  Copyright (C) 2015-2024
+#  Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser Public License
+#  along with this program.  If not, see [http://www.gnu.org/licenses/].
+"""This module contains a class that encodes and decodes JSON data."""
+import json
+from typing import Any, Union
+
+from telegram._utils.strings import TextEncoding
+
+
+class JSONCodec:
+    """Encodes Python objects to JSON and decodes JSON to Python objects.
+
+    This class bundles all JSON encoding and decoding that ``python-telegram-bot`` does when
+    communicating with the Bot API, when receiving updates via a webhook and in
+    :class:`telegram.ext.DictPersistence`. The default implementation uses the standard library's
+    :mod:`json` module. To use a different JSON library, subclass this class and override
+    :meth:`dumps`, :meth:`dumpb` and :meth:`loads`.
+
+    Example:
+        .. code:: python
+
+            import orjson
+
+            class ORJSONCodec(JSONCodec):
+                def dumps(self, obj):
+                    return orjson.dumps(obj).decode()
+
+                def dumpb(self, obj):
+                    return orjson.dumps(obj)
+
+                def loads(self, data):
+                    return orjson.loads(data)
+
+            application = ApplicationBuilder().token("TOKEN").json_codec(ORJSONCodec()).build()
+
+    .. seealso:: :meth:`telegram.ext.ApplicationBuilder.json_codec`,
+        :attr:`telegram.request.BaseRequest.json_codec`
+
+    .. versionadded:: NEXT.VERSION
+    """
+
+    __slots__ = ()
+
+    def dumps(self, obj: Any) -> str:
+        """Encodes an object as JSON string.
+
+        Args:
+            obj (:obj:`object`): The object to encode. For requests to the Bot API, this is a
+                (possibly nested) composition of :obj:`dict`, :obj:`list`, :obj:`str`,
+                :obj:`int`, :obj:`float`, :obj:`bool` and :obj:`None`.
+                :class:`telegram.ext.DictPersistence` may additionally pass dictionaries with
+                :obj:`int` keys and arbitrary JSON-serializable user data.
+
+        Returns:
+            :obj:`str`: The JSON string.
+        """
+        return json.dumps(obj)
+
+    def dumpb(self, obj: Any) -> bytes:
+        """Encodes an object as UTF-8 encoded JSON. Used for payloads that are sent over the
+        network as-is.
+
+        Tip:
+            The default implementation encodes the result of :meth:`dumps`. Libraries that
+            produce :obj:`bytes` natively should override this method to avoid the round trip.
+
+        Args:
+            obj (:obj:`object`): The object to encode. See :meth:`dumps`.
+
+        Returns:
+            :obj:`bytes`: The UTF-8 encoded JSON.
+        """
+        return self.dumps(obj).encode(TextEncoding.UTF_8)
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """Decodes JSON data.
+
+        Tip:
+            :obj:`bytes` are passed as-is, e.g. for the payload of responses from the Bot API and
+            for the body of webhook requests. The default implementation decodes them with
+            ``errors="replace"`` before handing them to :func:`json.loads`.
+
+        Args:
+            data (:obj:`str` | :obj:`bytes`): The JSON data. If :obj:`bytes`, they are UTF-8
+                encoded.
+
+        Returns:
+            :obj:`object`: The decoded data.
+
+        Raises:
+            :exc:`ValueError`: If the data is not valid JSON.
+        """
+        if isinstance(data, bytes):
+            data = data.decode(TextEncoding.UTF_8, "replace")
+        return json.loads(data)
+
+
+# Shared instance used wherever no codec was passed explicitly
+DEFAULT_JSON_CODEC = JSONCodec()
@@ -17,12 +17,11 @@
 #  You should have received a copy of the GNU Lesser Public License
 #  along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains a class that holds the parameters of a request to the Bot API."""
-import json
 from typing import Any, Optional, Union, final
 from urllib.parse import urlencode
 
-from telegram._utils.strings import TextEncoding
 from telegram._utils.types import UploadFileDict
+from telegram.request._jsoncodec import DEFAULT_JSON_CODEC, JSONCodec
 from telegram.request._requestparameter import RequestParameter
 
 
@@ -43,10 +42,15 @@ class RequestData:
             ``multipart/form-data``.
     """
 
-    __slots__ = ("_parameters", "contains_files")
+    __slots__ = ("_json_codec", "_parameters", "contains_files")
 
-    def __init__(self, parameters: Optional[list[RequestParameter]] = None):
+    def __init__(
+        self,
+        parameters: Optional[list[RequestParameter]] = None,
+        json_codec: Optional[JSONCodec] = None,
+    ):
         self._parameters: list[RequestParameter] = parameters or []
+        self._json_codec: JSONCodec = json_codec or DEFAULT_JSON_CODEC
         self.contains_files: bool = any(param.input_files for param in self._parameters)
 
     @property
@@ -71,18 +75,29 @@ class RequestData:
         value.
 
         Tip:
-            By default, this property uses the standard library's :func:`json.dumps`.
-            To use a custom library for JSON encoding, you can directly encode the keys of
-            :attr:`parameters` - note that string valued keys should not be JSON encoded.
+            Encoding is done by :attr:`json_codec`, which uses the standard library's
+            :func:`json.dumps` by default.
+
+        .. versionchanged:: NEXT.VERSION
+            Uses :attr:`json_codec` for encoding.
 
         Returns:
             dict[:obj:`str`, :obj:`str`]
         """
-        return {
-            param.name: param.json_value
-            for param in self._parameters
-            if param.json_value is not None
-        }
+        json_parameters = {}
+        for param in self._parameters:
+            json_value = param.encode_json_value(self._json_codec)
+            if json_value is not None:
+                json_parameters[param.name] = json_value
+        return json_parameters
+
+    @property
+    def json_codec(self) -> JSONCodec:
+        """:class:`telegram.request.JSONCodec`: The codec used to encode the parameters.
+
+        .. versionadded:: NEXT.VERSION
+        """
+        return self._json_codec
 
     def url_encoded_parameters(self, encode_kwargs: Optional[dict[str, Any]] = None) -> str:
         """Encodes the parameters with :func:`urllib.parse.urlencode`.
@@ -118,14 +133,16 @@ class RequestData:
         """The :attr:`parameters` as UTF-8 encoded JSON payload.
 
         Tip:
-            By default, this property uses the standard library's :func:`json.dumps`.
-            To use a custom library for JSON encoding, you can directly encode the keys of
-            :attr:`parameters` - note that string valued keys should not be JSON encoded.
+            Encoding is done by :meth:`telegram.request.JSONCodec.dumpb` of :attr:`json_codec`,
+            which uses the standard library's :func:`json.dumps` by default.
+
+        .. versionchanged:: NEXT.VERSION
+            Uses :attr:`json_codec` for encoding.
 
         Returns:
             :obj:`bytes`
         """
-        return json.dumps(self.json_parameters).encode(TextEncoding.UTF_8)
+        return self._json_codec.dumpb(self.json_parameters)
 
     @property
     def multipart_data(self) -> UploadFileDict:
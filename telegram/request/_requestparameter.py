@@ -17,7 +17,6 @@
 #  You should have received a copy of the GNU Lesser Public License
 #  along with this program.  If not, see [http://www.gnu.org/licenses/].
 """This module contains a class that describes a single parameter of a request to the Bot API."""
-import json
 from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import datetime
@@ -30,6 +29,7 @@ from telegram._telegramobject import TelegramObject
 from telegram._utils.datetime import to_timestamp
 from telegram._utils.enum import StringEnum
 from telegram._utils.types import UploadFileDict
+from telegram.request._jsoncodec import DEFAULT_JSON_CODEC, JSONCodec
 
 
 @final
@@ -70,11 +70,18 @@ class RequestParameter:
         The latter can currently only happen if :attr:`input_files` has exactly one element that
         must not be uploaded via an attach:// URI.
         """
+        return self.encode_json_value(DEFAULT_JSON_CODEC)
+
+    def encode_json_value(self, json_codec: JSONCodec) -> Optional[str]:
+        """Like :attr:`json_value`, but uses the passed codec for encoding.
+
+        .. versionadded:: NEXT.VERSION
+        """
         if isinstance(self.value, str):
             return self.value
         if self.value is None:
             return None
-        return json.dumps(self.value)
+        return json_codec.dumps(self.value)
 
     @property
     def multipart_data(self) -> Optional[UploadFileDict]:
@@ -24,7 +24,7 @@ from tempfile import TemporaryFile, mkstemp
 import pytest
 
 from telegram import File, FileCredentials, Voice
-from telegram.error import TelegramError
+from telegram.error import NetworkError, TelegramError
 from tests.auxil.files import data_file
 from tests.auxil.slots import mro_slots
 
@@ -152,11 +152,26 @@ class TestFileWithoutRequest(FileTestBase):
         assert a != e
         assert hash(a) != hash(e)
 
-    async def test_download(self, monkeypatch, file):
-        async def test(*args, **kwargs):
-            return self.file_content
+    def mock_retrieve_stream(self, monkeypatch, file, content=None, fail_after=None):
+        """Mocks retrieve_stream to return the requested range of ``content`` in chunks of 3
+        bytes. Returns the list of the requested ranges.
+        """
+        content = self.file_content if content is None else content
+        requested_ranges = []
 
-        monkeypatch.setattr(file.get_bot().request, "retrieve", test)
+        async def retrieve_stream(url, offset=0, length=None, **kwargs):
+            requested_ranges.append((offset, length))
+            end = len(content) if length is None else offset + length
+            for index, start in enumerate(range(offset, end, 3)):
+                if index == fail_after:
+                    raise NetworkError("Connection lost")
+                yield content[start : min(start + 3, end)]
+
+        monkeypatch.setattr(file.get_bot().request, "retrieve_stream", retrieve_stream)
+        return requested_ranges
+
+    async def test_download(self, monkeypatch, file):
+        self.mock_retrieve_stream(monkeypatch, file)
         out_file = await file.download_to_drive()
 
         try:
@@ -168,10 +183,7 @@ class TestFileWithoutRequest(FileTestBase):
         "custom_path_type", [str, Path], ids=["str custom_path", "pathlib.Path custom_path"]
     )
     async def test_download_custom_path(self, monkeypatch, file, custom_path_type):
-        async def test(*args, **kwargs):
-            return self.file_content
-
-        monkeypatch.setattr(file.get_bot().request, "retrieve", test)
+        self.mock_retrieve_stream(monkeypatch, file)
         file_handle, custom_path = mkstemp()
         custom_path = Path(custom_path)
         try:
@@ -182,6 +194,87 @@ class TestFileWithoutRequest(FileTestBase):
             os.close(file_handle)
             custom_path.unlink(missing_ok=True)
 
+    async def test_download_resume(self, monkeypatch, offline_bot, tmp_path):
+        file = File(
+            self.file_id,
+            self.file_unique_id,
+            file_path=self.file_path,
+            file_size=len(self.file_content),
+        )
+        file.set_bot(offline_bot)
+        requested_ranges = self.mock_retrieve_stream(monkeypatch, file, fail_after=2)
+        custom_path = tmp_path / "file"
+        part_path = tmp_path / f"file.{self.file_unique_id}.part"
+
+        with pytest.raises(NetworkError, match="Connection lost"):
+            await file.download_to_drive(custom_path)
+        assert not custom_path.exists()
+        assert part_path.read_bytes() == self.file_content[:6]
+
+        requested_ranges = self.mock_retrieve_stream(monkeypatch, file)
+        assert await file.download_to_drive(custom_path) == custom_path
+        assert requested_ranges == [(6, None)]
+        assert custom_path.read_bytes() == self.file_content
+        assert not part_path.exists()
+
+        # A complete part file is just moved into place
+        part_path.write_bytes(self.file_content)
+        requested_ranges = self.mock_retrieve_stream(monkeypatch, file)
+        await file.download_to_drive(custom_path)
+        assert requested_ranges == []
+        assert custom_path.read_bytes() == self.file_content
+
+    async def test_download_no_resume_without_file_size(self, monkeypatch, offline_bot, tmp_path):
+        file = File(self.file_id, self.file_unique_id, file_path=self.file_path)
+        file.set_bot(offline_bot)
+        requested_ranges = self.mock_retrieve_stream(monkeypatch, file)
+        custom_path = tmp_path / "file"
+        (tmp_path / f"file.{self.file_unique_id}.part").write_bytes(b"garbage")
+
+        await file.download_to_drive(custom_path)
+        assert requested_ranges == [(0, None)]
+        assert custom_path.read_bytes() == self.file_content
+
+    @pytest.mark.parametrize("parallel_ranges", [2, 3, 5, 100])
+    async def test_download_parallel_ranges(
+        self, monkeypatch, offline_bot, tmp_path, parallel_ranges
+    ):
+        content = bytes(range(256)) * 3
+        file = File(self.file_id, self.file_unique_id, file_path=self.file_path, file_size=768)
+        file.set_bot(offline_bot)
+        requested_ranges = self.mock_retrieve_stream(monkeypatch, file, content=content)
+        custom_path = tmp_path / "file"
+
+        assert (
+            await file.download_to_drive(custom_path, parallel_ranges=parallel_ranges)
+            == custom_path
+        )
+        assert custom_path.read_bytes() == content
+        assert not (tmp_path / f"file.{self.file_unique_id}.part").exists()
+
+        # The ranges cover the file without gaps or overlaps
+        assert 1 < len(requested_ranges) <= parallel_ranges
+        expected_offset = 0
+        for offset, length in sorted(requested_ranges):
+            assert offset == expected_offset
+            expected_offset += length
+        assert expected_offset == len(content)
+
+    async def test_download_parallel_ranges_error(self, monkeypatch, offline_bot, tmp_path):
+        file = File(self.file_id, self.file_unique_id, file_path=self.file_path, file_size=12)
+        file.set_bot(offline_bot)
+        self.mock_retrieve_stream(monkeypatch, file, fail_after=1)
+        custom_path = tmp_path / "file"
+
+        with pytest.raises(NetworkError, match="Connection lost"):
+            await file.download_to_drive(custom_path, parallel_ranges=2)
+        # Partial files of parallel downloads can't be resumed
+        assert list(tmp_path.iterdir()) == []
+
+    async def test_download_parallel_ranges_invalid(self, file):
+        with pytest.raises(ValueError, match="must be at least 1"):
+            await file.download_to_drive(parallel_ranges=0)
+
     async def test_download_file_obj(self, monkeypatch, file):
         async def test(*args, **kwargs):
             return self.file_content
@@ -297,6 +390,28 @@ class TestFileWithRequest(FileTestBase):
             custom_fobj.seek(0)
             assert custom_fobj.read() == self.file_content
 
+    async def test_download_bytesio_local_file(self, local_file):
+        custom_fobj = BytesIO(b"prefix")
+        custom_fobj.seek(0, os.SEEK_END)
+        await local_file.download_to_memory(out=custom_fobj)
+        assert custom_fobj.getvalue() == b"prefix" + self.file_content
+
+    async def test_download_custom_path_local_file_hardlink(self, local_file, tmp_path):
+        custom_path = tmp_path / "linked"
+        out_file = await local_file.download_to_drive(custom_path, hardlink=True)
+        assert out_file == custom_path
+        assert out_file.samefile(local_file.file_path)
+        assert out_file.read_bytes() == self.file_content
+
+    async def test_download_custom_path_local_file_hardlink_fallback(self, local_file, tmp_path):
+        # Hard links can't be created if the target already exists, so the file is copied
+        custom_path = tmp_path / "existing"
+        custom_path.write_bytes(b"old content")
+        out_file = await local_file.download_to_drive(custom_path, hardlink=True)
+        assert out_file == custom_path
+        assert not out_file.samefile(local_file.file_path)
+        assert out_file.read_bytes() == self.file_content
+
     @pytest.mark.parametrize(
         "custom_path_type", [str, Path], ids=["str custom_path", "pathlib.Path custom_path"]
     )
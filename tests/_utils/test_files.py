@@ -17,9 +17,12 @@
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
 import contextlib
+import os
 import subprocess
 import sys
+from io import BytesIO
 from pathlib import Path
+from tempfile import TemporaryFile
 
 import pytest
 
@@ -83,6 +86,40 @@ class TestFiles:
                 == expected_non_local
             )
 
+    @pytest.mark.parametrize("path_type", [str, Path])
+    def test_parse_file_input_path_streamed(self, path_type):
+        source_file = data_file("game.gif")
+        parsed = telegram._utils.files.parse_file_input(path_type(source_file), filename="name")
+
+        assert isinstance(parsed, InputFile)
+        assert parsed.filename == "name"
+        # The file is neither read nor opened on parsing but passed on as file handle
+        content = parsed.field_tuple[1]
+        assert isinstance(content, telegram._utils.files.LazyFile)
+        assert content.closed
+        assert content.tell() == 0
+        assert not content.closed
+        assert content.read() == source_file.read_bytes()
+        content.close()
+        assert content.closed
+
+        parsed = telegram._utils.files.parse_file_input(path_type(source_file))
+        assert parsed.filename == "game.gif"
+        assert parsed.input_file_content.closed
+
+    def test_lazy_file_reopen(self):
+        source_file = data_file("game.gif")
+        lazy_file = telegram._utils.files.LazyFile(source_file)
+        assert lazy_file.read(10) == source_file.read_bytes()[:10]
+        assert lazy_file.fileno() == lazy_file.file.fileno()
+        lazy_file.close()
+        lazy_file.close()
+        # The file is opened again, from the start
+        assert lazy_file.read() == source_file.read_bytes()
+        lazy_file.seek(5)
+        assert lazy_file.tell() == 5
+        lazy_file.close()
+
     def test_parse_file_input_file_like(self):
         source_file = data_file("game.gif")
         with source_file.open("rb") as file:
@@ -128,6 +165,45 @@ class TestFiles:
         assert isinstance(parsed, InputFile)
         assert bool(parsed.attach_name) is attach
 
+    @pytest.mark.parametrize("sendfile", [True, False], ids=["sendfile", "no sendfile"])
+    def test_copy_local_file(self, monkeypatch, sendfile):
+        if not sendfile:
+            monkeypatch.delattr(os, "sendfile", raising=False)
+        source_file = data_file("telegram.png")
+        with TemporaryFile() as out:
+            out.write(b"prefix")
+            telegram._utils.files.copy_local_file(source_file, out)
+            # The position of the file object must be correct after the copy
+            assert out.tell() == len(b"prefix") + source_file.stat().st_size
+            out.write(b"suffix")
+            out.seek(0)
+            assert out.read() == b"prefix" + source_file.read_bytes() + b"suffix"
+
+    def test_copy_local_file_sendfile_error(self, monkeypatch):
+        def sendfile(*args):
+            raise OSError("sendfile only supports sockets")
+
+        monkeypatch.setattr(os, "sendfile", sendfile, raising=False)
+        source_file = data_file("telegram.png")
+        with TemporaryFile() as out:
+            telegram._utils.files.copy_local_file(source_file, out)
+            out.seek(0)
+            assert out.read() == source_file.read_bytes()
+
+    def test_copy_local_file_no_file_descriptor(self):
+        source_file = data_file("telegram.png")
+        out = BytesIO()
+        telegram._utils.files.copy_local_file(source_file, out)
+        assert out.getvalue() == source_file.read_bytes()
+
+    @pytest.mark.parametrize("content", [b"", b"content"], ids=["empty", "non-empty"])
+    def test_read_local_file_into(self, tmp_path, content):
+        source_file = tmp_path / "file"
+        source_file.write_bytes(content)
+        buf = bytearray(b"prefix")
+        telegram._utils.files.read_local_file_into(source_file, buf)
+        assert buf == b"prefix" + content
+
     def test_load_file_none(self):
         assert telegram._utils.files.load_file(None) == (None, None)
 
@@ -0,0 +1,73 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+from telegram import Chat, User
+from telegram._utils.interning import InternCache
+from tests.auxil.slots import mro_slots
+
+
+def user_data(user_id: int, **kwargs):
+    return {"id": user_id, "is_bot": False, "first_name": "name", **kwargs}
+
+
+class TestInternCache:
+    def test_slot_behaviour(self):
+        inst = InternCache(maxsize=1)
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_de_json(self, offline_bot):
+        cache = InternCache(maxsize=10)
+        data = user_data(1)
+        user = cache.de_json(User, data, offline_bot)
+        assert user.get_bot() is offline_bot
+        # modifying the data after decoding must not affect the cached payload
+        data["first_name"] = "other"
+        assert cache.de_json(User, user_data(1), offline_bot) is user
+        assert cache.de_json(User, data, offline_bot).first_name == "other"
+        assert len(cache) == 1
+
+    def test_key_includes_class(self, offline_bot):
+        cache = InternCache(maxsize=10)
+        user = cache.de_json(User, user_data(1), offline_bot)
+        chat = cache.de_json(Chat, {"id": 1, "type": Chat.PRIVATE}, offline_bot)
+        assert isinstance(chat, Chat)
+        assert cache.de_json(User, user_data(1), offline_bot) is user
+        assert len(cache) == 2
+
+    def test_no_id(self, offline_bot):
+        cache = InternCache(maxsize=10)
+        data = {"type": Chat.PRIVATE, "id": None}
+        assert cache.de_json(Chat, data, offline_bot) is not cache.de_json(Chat, data, None)
+        assert len(cache) == 0
+
+    def test_eviction(self, offline_bot):
+        cache = InternCache(maxsize=2)
+        first = cache.de_json(User, user_data(1), offline_bot)
+        second = cache.de_json(User, user_data(2), offline_bot)
+        # accessing the first user makes the second one the least recently used
+        assert cache.de_json(User, user_data(1), offline_bot) is first
+        cache.de_json(User, user_data(3), offline_bot)
+
+        assert len(cache) == 2
+        assert cache.de_json(User, user_data(1), offline_bot) is first
+        assert cache.de_json(User, user_data(2), offline_bot) is not second
+
+        cache.clear()
+        assert len(cache) == 0
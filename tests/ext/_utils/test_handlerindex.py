@@ -0,0 +1,275 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import re
+
+import pytest
+
+from telegram import CallbackQuery, Update, User
+from telegram.ext import (
+    CallbackQueryHandler,
+    CommandHandler,
+    InlineQueryHandler,
+    MessageHandler,
+    PrefixHandler,
+    TypeHandler,
+    filters,
+)
+from telegram.ext._utils.handlerindex import (
+    GroupIndex,
+    HandlerList,
+    UpdateKeys,
+    literal_prefix,
+)
+from tests.auxil.build_messages import make_command_update, make_message_update
+from tests.auxil.slots import mro_slots
+
+
+async def callback(update, context):
+    pass
+
+
+class SubCommandHandler(CommandHandler):
+    __slots__ = ()
+
+    def check_update(self, update):
+        return True
+
+
+def make_callback_query_update(data):
+    return Update(
+        1,
+        callback_query=CallbackQuery("1", User(1, "", False), "chat_instance", data=data),
+    )
+
+
+@pytest.fixture(scope="module")
+def handlers():
+    return [
+        CommandHandler("start", callback),
+        MessageHandler(filters.Regex("^foo"), callback),
+        PrefixHandler("!", "help", callback),
+        CallbackQueryHandler(callback, pattern="^menu_(\\d+)$"),
+        CallbackQueryHandler(callback, pattern=re.compile("settings")),
+        CallbackQueryHandler(callback, pattern="a|b"),
+        CommandHandler(["start", "stop"], callback, filters=filters.ChatType.GROUPS),
+        InlineQueryHandler(callback),
+        MessageHandler(filters.ALL, callback),
+        CallbackQueryHandler(callback),
+        SubCommandHandler("never", callback),
+        TypeHandler(object, callback),
+    ]
+
+
+@pytest.fixture(
+    params=[
+        "/start",
+        "/start@bot arg",
+        "/stop",
+        "/unknown",
+        "foo bar",
+        "!help me",
+        "!HELP",
+        "   ",
+        "text",
+        "menu_12",
+        "menu_",
+        "settings_1",
+        "a",
+        "b",
+        "c",
+        None,
+        "no update",
+    ]
+)
+def update(request, offline_bot):
+    if request.param is None or request.param in ("menu_12", "menu_", "settings_1", "a", "c"):
+        return make_callback_query_update(request.param)
+    if request.param == "b":
+        return make_callback_query_update(object())
+    if request.param == "no update":
+        return object()
+    return make_command_update(request.param, bot=offline_bot)
+
+
+class TestLiteralPrefix:
+    @pytest.mark.parametrize(
+        ("pattern", "expected"),
+        [
+            ("^menu_(\\d+)$", "menu_"),
+            ("menu", "menu"),
+            ("menu\\.sub\\d", "menu.sub"),
+            ("men?u", "me"),
+            ("menu*", "men"),
+            ("men{1,2}", "me"),
+            ("menu\\.?", "menu"),
+            ("a|b", ""),
+            ("[ab]c", ""),
+            ("(?i)abc", ""),
+            ("^", ""),
+            ("\\", ""),
+            (re.compile("abc"), "abc"),
+            (re.compile("abc", re.IGNORECASE), ""),
+            (re.compile("a b", re.VERBOSE), ""),
+            (b"abc", ""),
+            (None, ""),
+            (str, ""),
+            (lambda data: True, ""),
+        ],
+    )
+    def test_literal_prefix(self, pattern, expected):
+        assert literal_prefix(pattern) == expected
+
+    @pytest.mark.parametrize("pattern", ["^menu_(\\d+)$", "men?u", "menu*", "ab\\.c+"])
+    @pytest.mark.parametrize("data", ["menu_1", "mu", "men", "menuuu", "ab.ccc", "ab.", "x"])
+    def test_literal_prefix_is_prefix_of_matches(self, pattern, data):
+        if re.match(pattern, data):
+            assert data.startswith(literal_prefix(pattern))
+
+
+class TestGroupIndex:
+    def test_slot_behaviour(self, handlers):
+        for inst in (
+            GroupIndex(handlers),
+            HandlerList(handlers),
+            UpdateKeys(make_command_update("/start")),
+        ):
+            for attr in inst.__slots__:
+                assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+            assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_candidates_equivalent(self, handlers, update):
+        group_index = GroupIndex(handlers)
+        candidates = group_index.candidates(UpdateKeys(update))
+
+        # Candidates must keep the original order
+        positions = [handlers.index(handler) for handler in candidates]
+        assert positions == sorted(positions)
+
+        def first_match(handler_list):
+            for handler in handler_list:
+                try:
+                    check = handler.check_update(update)
+                except IndexError:
+                    # PrefixHandler fails on blank texts. The index must preserve that
+                    return handler
+                if check is not None and check is not False:
+                    return handler
+            return None
+
+        assert first_match(candidates) is first_match(handlers)
+        # Handlers that are not candidates must not be able to handle the update
+        for handler in handlers:
+            if handler not in candidates:
+                assert first_match([handler]) is None
+
+    def test_candidates_are_filtered(self, handlers):
+        group_index = GroupIndex(handlers)
+
+        candidates = group_index.candidates(UpdateKeys(make_command_update("/start")))
+        assert handlers[0] in candidates
+        assert handlers[6] in candidates
+        assert handlers[2] not in candidates
+        assert not any(isinstance(handler, CallbackQueryHandler) for handler in candidates)
+
+        candidates = group_index.candidates(UpdateKeys(make_callback_query_update("menu_1")))
+        assert handlers[3] in candidates
+        assert handlers[4] not in candidates
+        assert handlers[5] in candidates
+        assert not any(type(handler) is CommandHandler for handler in candidates)
+        assert not any(isinstance(handler, MessageHandler) for handler in candidates)
+
+        assert group_index.candidates(UpdateKeys(object())) == [
+            handlers[7],
+            handlers[-2],
+            handlers[-1],
+        ]
+
+    def test_is_trivial(self):
+        wildcards = [TypeHandler(object, callback), SubCommandHandler("a", callback)]
+        assert GroupIndex(wildcards).is_trivial
+        assert GroupIndex([]).is_trivial
+        assert GroupIndex([TypeHandler(object, callback)]).is_trivial
+        assert not GroupIndex([CommandHandler("a", callback)]).is_trivial
+
+    def test_is_stale(self, handlers):
+        handler_list = list(handlers)
+        group_index = GroupIndex(handler_list)
+        assert not group_index.is_stale(handler_list)
+        assert group_index.is_stale(list(handler_list))
+
+        handler_list.append(CommandHandler("new", callback))
+        assert group_index.is_stale(handler_list)
+
+        handler_list.pop()
+        handler_list[0] = CommandHandler("new", callback)
+        assert group_index.is_stale(handler_list)
+
+    def test_is_stale_handler_list(self, handlers):
+        handler_list = HandlerList(handlers)
+        group_index = GroupIndex(handler_list)
+        assert not group_index.is_stale(handler_list)
+        assert group_index.is_stale(HandlerList(handler_list))
+
+        handler_list[0] = handler_list[0]
+        assert group_index.is_stale(handler_list)
+
+        group_index = GroupIndex(handler_list)
+        handler_list.append(CommandHandler("new", callback))
+        handler_list.pop()
+        assert group_index.is_stale(handler_list)
+
+    @pytest.mark.parametrize(
+        ("method", "args"),
+        [
+            ("__delitem__", (0,)),
+            ("__iadd__", ([None],)),
+            ("__imul__", (2,)),
+            ("__setitem__", (0, None)),
+            ("append", (None,)),
+            ("clear", ()),
+            ("extend", ([None],)),
+            ("insert", (0, None)),
+            ("pop", ()),
+            ("remove", (1,)),
+            ("reverse", ()),
+            ("sort", ()),
+        ],
+    )
+    def test_handler_list_version(self, method, args):
+        handler_list = HandlerList([1, 2])
+        assert handler_list.version == 0
+        getattr(handler_list, method)(*args)
+        assert handler_list.version == 1
+
+    def test_update_keys(self):
+        keys = UpdateKeys(make_command_update("/start@bot arg"))
+        assert keys.has_message
+        assert keys.command == "start"
+        assert keys.prefix_command == "/start@bot"
+        assert not keys.has_callback_query
+
+        keys = UpdateKeys(make_message_update("   "))
+        assert keys.blank_text
+        assert keys.command is None
+        assert keys.prefix_command is None
+
+        keys = UpdateKeys(make_callback_query_update("data"))
+        assert not keys.has_message
+        assert keys.has_callback_query
+        assert keys.callback_data == "data"
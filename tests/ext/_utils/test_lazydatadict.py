@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+from collections import defaultdict
+
+from telegram.ext._utils.lazydatadict import LazyDataDict
+from tests.auxil.slots import mro_slots
+
+
+class TestLazyDataDict:
+    def test_slot_behaviour(self):
+        inst = LazyDataDict(dict)
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_is_loaded(self):
+        data = LazyDataDict(dict)
+        assert isinstance(data, defaultdict)
+        assert not data.is_loaded(1)
+
+        assert data[1] == {}
+        assert 1 in data
+        assert not data.is_loaded(1)
+
+        data[1] = {"loaded": True}
+        data[2] = {"loaded": True}
+        assert data.is_loaded(1)
+        assert data.is_loaded(2)
+
+        del data[2]
+        assert not data.is_loaded(2)
+
+    def test_touch(self):
+        data = LazyDataDict(dict)
+        for key in (1, 2, 3):
+            data[key] = {key: key}
+        _ = data[4]
+
+        data.touch(1)
+        data.touch(4)
+        data.touch(5)
+        assert list(data) == [2, 3, 1, 4]
+        assert data[1] == {1: 1}
+        assert not data.is_loaded(4)
+
+    def test_evict(self):
+        data = LazyDataDict(dict)
+        for key in range(5):
+            data[key] = {}
+        _ = data[5]
+
+        assert data.evict(10, keep=()) == []
+        assert data.evict(6, keep=()) == []
+        assert data.evict(3, keep={0, 2}) == [1, 3, 4]
+        assert list(data) == [0, 2, 5]
+        assert not data.is_loaded(5)
+
+        # Can't evict more than the kept entries
+        assert data.evict(1, keep={0, 2, 5}) == []
+        assert data.evict(1, keep={5}) == [0, 2]
+        assert list(data) == [5]
+        assert data.evict(0, keep=()) == [5]
+        assert not data
+
+    def test_pin(self):
+        data = LazyDataDict(dict)
+        for key in range(4):
+            data[key] = {}
+
+        data.pin(0)
+        data.pin(0)
+        data.pin(1)
+        assert data.is_pinned(0)
+        assert not data.is_pinned(2)
+        assert data.evict(1, keep={3}) == [2]
+        assert list(data) == [0, 1, 3]
+
+        data.unpin(0)
+        data.unpin(1)
+        # unpinning keys that are not pinned is a no-op
+        data.unpin(2)
+        assert data.is_pinned(0)
+        assert not data.is_pinned(1)
+        assert data.evict(1, keep=()) == [1, 3]
+
+        data.unpin(0)
+        assert not data.is_pinned(0)
+        assert data.evict(0, keep=()) == [0]
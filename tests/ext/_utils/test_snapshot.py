@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import datetime as dtm
+from collections import OrderedDict, defaultdict
+
+import pytest
+
+from telegram import User
+from telegram.ext._utils.snapshot import snapshot
+
+
+class Custom:
+    def __init__(self, value):
+        self.value = value
+
+    def __eq__(self, other):
+        return isinstance(other, Custom) and self.value == other.value
+
+
+@pytest.fixture
+def data():
+    shared = [1, 2]
+    return {
+        "int": 1,
+        "str": "text",
+        "none": None,
+        "date": dtm.datetime(2024, 1, 1, tzinfo=dtm.timezone.utc),
+        "list": [1, [2, 3], {"nested": {4}}],
+        "tuple": (1, "a"),
+        "mutable_tuple": (1, [2]),
+        "set": {1, 2, (3, 4)},
+        (1, 2): "tuple key",
+        "shared": [shared, shared],
+        "ordered": OrderedDict(a=[1]),
+        "default": defaultdict(list, a=[1]),
+        "custom": Custom([1]),
+        "user": User(1, "first", False),
+    }
+
+
+class TestSnapshot:
+    def test_equal_and_independent(self, data):
+        copied = snapshot(data)
+        assert copied == data
+        assert copied is not data
+
+        for key in ("list", "mutable_tuple", "set", "shared", "ordered", "default", "custom"):
+            assert copied[key] is not data[key], key
+        assert copied["list"][1] is not data["list"][1]
+        assert copied["list"][2]["nested"] is not data["list"][2]["nested"]
+        assert copied["mutable_tuple"][1] is not data["mutable_tuple"][1]
+        assert copied["custom"].value is not data["custom"].value
+        assert type(copied["ordered"]) is OrderedDict
+        assert type(copied["default"]) is defaultdict
+
+        data["list"][1].append(4)
+        data["custom"].value.append(2)
+        assert copied["list"][1] == [2, 3]
+        assert copied["custom"].value == [1]
+
+    def test_immutable_objects_are_shared(self, data):
+        copied = snapshot(data)
+        for key in ("str", "date", "tuple"):
+            assert copied[key] is data[key], key
+
+    def test_references_are_kept(self, data):
+        copied = snapshot(data)
+        assert copied["shared"][0] is copied["shared"][1]
+
+        recursive = [1]
+        recursive.append(recursive)
+        recursive_tuple = ([],)
+        recursive_tuple[0].append(recursive_tuple)
+        copied = snapshot({"list": recursive, "tuple": recursive_tuple})
+        assert copied["list"][1] is copied["list"]
+        assert copied["tuple"][0][0] is copied["tuple"]
+        assert copied["tuple"] is not recursive_tuple
+
+    def test_telegram_objects(self, data, offline_bot):
+        data["user"].set_bot(offline_bot)
+        copied = snapshot(data)
+        assert copied["user"] == data["user"]
+        assert copied["user"] is not data["user"]
+        assert copied["user"].get_bot() is offline_bot
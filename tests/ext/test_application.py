@@ -58,7 +58,7 @@ from telegram.ext import (
 )
 from telegram.warnings import PTBDeprecationWarning, PTBUserWarning
 from tests.auxil.asyncio_helpers import call_after
-from tests.auxil.build_messages import make_message_update
+from tests.auxil.build_messages import make_command_update, make_message_update
 from tests.auxil.files import PROJECT_ROOT_PATH
 from tests.auxil.monkeypatch import empty_get_updates, return_true
 from tests.auxil.networking import send_webhook_message
@@ -589,6 +589,32 @@ class TestApplication:
             assert self.count == 3
             await app.stop()
 
+    async def test_indexed_dispatch(self, app, offline_bot):
+        for i in range(10):
+            app.add_handler(CommandHandler(f"command{i}", self.callback_set_count(i)))
+        app.add_handler(MessageHandler(filters.ALL, self.callback_set_count(42)))
+        update = make_command_update("/command7", bot=offline_bot)
+
+        async with app:
+            await app.process_update(update)
+            assert self.count == 7
+
+            await app.process_update(make_message_update("text", bot=offline_bot))
+            assert self.count == 42
+
+            # Changes made directly to `app.handlers` must be picked up as well
+            app.handlers[0].insert(0, CommandHandler("command7", self.callback_set_count(-7)))
+            await app.process_update(update)
+            assert self.count == -7
+
+            app.remove_handler(app.handlers[0][0])
+            await app.process_update(update)
+            assert self.count == 7
+
+            app.handlers[0] = [MessageHandler(filters.ALL, self.callback_set_count(0))]
+            await app.process_update(update)
+            assert self.count == 0
+
     async def test_add_handlers(self, app):
         """Tests both add_handler & add_handlers together & confirms the correct insertion
         order"""
@@ -36,11 +36,12 @@ from telegram.ext import (
     ExtBot,
     JobQueue,
     PicklePersistence,
+    RequestScheduler,
     Updater,
 )
 from telegram.ext._applicationbuilder import _BOT_CHECKS
 from telegram.ext._baseupdateprocessor import SimpleUpdateProcessor
-from telegram.request import HTTPXRequest
+from telegram.request import HTTPXRequest, JSONCodec
 from telegram.warnings import PTBDeprecationWarning
 from tests.auxil.constants import PRIVATE_KEY
 from tests.auxil.envvars import TEST_WITH_OPT_DEPS
@@ -79,6 +80,9 @@ class TestApplicationBuilder:
             if argument == "media_write_timeout" and get_updates:
                 # get_updates never makes media requests
                 continue
+            if argument == "json_codec" and get_updates:
+                # json_codec is set for both request objects at once
+                continue
             assert hasattr(builder, prefix + argument), f"missing method {prefix}{argument}"
 
     @pytest.mark.parametrize("bot_class", [Bot, ExtBot])
@@ -148,6 +152,11 @@ class TestApplicationBuilder:
         assert app.bot.defaults is None
         assert app.bot.rate_limiter is None
         assert app.bot.local_mode is False
+        assert app.bot.lazy_updates is False
+        assert app.bot.request_scheduler is None
+        assert app.bot._media_request is None
+        assert app.bot._interactive_request is None
+        assert app.bot._intern_cache is None
 
         get_updates_client = app.bot._request[0]._client
         assert get_updates_client.limits == httpx.Limits(
@@ -167,6 +176,9 @@ class TestApplicationBuilder:
         assert client.http1 is True
         assert not client.http2
 
+        assert isinstance(app.bot.request.json_codec, JSONCodec)
+        assert app.bot._request[0].json_codec is app.bot.request.json_codec
+
         assert isinstance(app.update_queue, asyncio.Queue)
         assert isinstance(app.updater, Updater)
         assert app.updater.bot is app.bot
@@ -201,6 +213,7 @@ class TestApplicationBuilder:
         "method",
         [
             "connection_pool_size",
+            "max_connection_pool_size",
             "connect_timeout",
             "pool_timeout",
             "read_timeout",
@@ -212,6 +225,7 @@ class TestApplicationBuilder:
             "bot",
             "updater",
             "http_version",
+            "json_codec",
         ],
     )
     def test_mutually_exclusive_for_request(self, builder, method):
@@ -232,6 +246,7 @@ class TestApplicationBuilder:
         "method",
         [
             "get_updates_connection_pool_size",
+            "get_updates_max_connection_pool_size",
             "get_updates_connect_timeout",
             "get_updates_pool_timeout",
             "get_updates_read_timeout",
@@ -240,6 +255,7 @@ class TestApplicationBuilder:
             "get_updates_proxy_url",
             "get_updates_socket_options",
             "get_updates_http_version",
+            "json_codec",
             "bot",
             "updater",
         ],
@@ -263,6 +279,7 @@ class TestApplicationBuilder:
         "method",
         [
             "get_updates_connection_pool_size",
+            "get_updates_max_connection_pool_size",
             "get_updates_connect_timeout",
             "get_updates_pool_timeout",
             "get_updates_read_timeout",
@@ -272,6 +289,7 @@ class TestApplicationBuilder:
             "get_updates_socket_options",
             "get_updates_http_version",
             "connection_pool_size",
+            "max_connection_pool_size",
             "connect_timeout",
             "pool_timeout",
             "read_timeout",
@@ -308,6 +326,7 @@ class TestApplicationBuilder:
         "method",
         [
             "get_updates_connection_pool_size",
+            "get_updates_max_connection_pool_size",
             "get_updates_connect_timeout",
             "get_updates_pool_timeout",
             "get_updates_read_timeout",
@@ -317,6 +336,7 @@ class TestApplicationBuilder:
             "get_updates_socket_options",
             "get_updates_http_version",
             "connection_pool_size",
+            "max_connection_pool_size",
             "connect_timeout",
             "pool_timeout",
             "read_timeout",
@@ -355,6 +375,9 @@ class TestApplicationBuilder:
         request = HTTPXRequest()
         get_updates_request = HTTPXRequest()
         rate_limiter = AIORateLimiter()
+        request_scheduler = RequestScheduler()
+        media_request = HTTPXRequest()
+        interactive_request = HTTPXRequest()
         builder.token(bot.token).base_url("base_url").base_file_url("base_file_url").private_key(
             PRIVATE_KEY
         ).defaults(defaults).arbitrary_callback_data(42).request(request).get_updates_request(
@@ -363,6 +386,16 @@ class TestApplicationBuilder:
             rate_limiter
         ).local_mode(
             True
+        ).lazy_updates(
+            True
+        ).request_scheduler(
+            request_scheduler
+        ).media_request(
+            media_request
+        ).interactive_request(
+            interactive_request
+        ).intern_objects(
+            64
         )
         built_bot = builder.build().bot
 
@@ -380,6 +413,11 @@ class TestApplicationBuilder:
         assert built_bot.private_key
         assert built_bot.rate_limiter is rate_limiter
         assert built_bot.local_mode is True
+        assert built_bot.lazy_updates is True
+        assert built_bot.request_scheduler is request_scheduler
+        assert built_bot._media_request is media_request
+        assert built_bot._interactive_request is interactive_request
+        assert built_bot._intern_cache.maxsize == 64
 
         @dataclass
         class Client:
@@ -435,6 +473,28 @@ class TestApplicationBuilder:
         assert client.http2 is False
         assert media_write_timeout == [None, None]
 
+        json_codec = JSONCodec()
+        app = ApplicationBuilder().token(bot.token).json_codec(json_codec).build()
+        assert app.bot.request.json_codec is json_codec
+        assert app.bot._request[0].json_codec is json_codec
+
+    def test_custom_max_connection_pool_size(self, builder, bot):
+        app = builder.token(bot.token).connection_pool_size(2).max_connection_pool_size(4).build()
+        assert app.bot.request.pool_statistics["min_size"] == 2
+        assert app.bot.request.pool_statistics["max_size"] == 4
+        assert app.bot._request[0].pool_statistics["max_size"] == 1
+
+        app = (
+            ApplicationBuilder()
+            .token(bot.token)
+            .get_updates_connection_pool_size(2)
+            .get_updates_max_connection_pool_size(3)
+            .build()
+        )
+        assert app.bot._request[0].pool_statistics["min_size"] == 2
+        assert app.bot._request[0].pool_statistics["max_size"] == 3
+        assert app.bot.request.pool_statistics["max_size"] == 256
+
     def test_custom_socket_options(self, builder, monkeypatch, bot):
         httpx_request_kwargs = []
         httpx_request_init = HTTPXRequest.__init__
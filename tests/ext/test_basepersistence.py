@@ -76,8 +76,9 @@ class TrackingPersistence(BasePersistence):
         store_data: Optional[PersistenceInput] = None,
         update_interval: float = 60,
         fill_data: bool = False,
+        **kwargs,
     ):
-        super().__init__(store_data=store_data, update_interval=update_interval)
+        super().__init__(store_data=store_data, update_interval=update_interval, **kwargs)
         self.updated_chat_ids = collections.Counter()
         self.updated_user_ids = collections.Counter()
         self.refreshed_chat_ids = collections.Counter()
@@ -194,6 +195,31 @@ class TrackingPersistence(BasePersistence):
         self.flushed = True
 
 
+class LazyTrackingPersistence(TrackingPersistence):
+    """Supports lazy loading and keeps track of the loaded entries."""
+
+    def __init__(self, max_cached_entries: Optional[int] = None):
+        super().__init__(
+            fill_data=True, lazy_loading=True, max_cached_entries=max_cached_entries
+        )
+        self.loaded_chat_ids = collections.Counter()
+        self.loaded_user_ids = collections.Counter()
+
+    async def get_chat_data(self):
+        pytest.fail("chat_data should be loaded lazily")
+
+    async def get_user_data(self):
+        pytest.fail("user_data should be loaded lazily")
+
+    async def get_chat_data_entry(self, chat_id):
+        self.loaded_chat_ids[chat_id] += 1
+        return copy.deepcopy(self.chat_data.get(chat_id))
+
+    async def get_user_data_entry(self, user_id):
+        self.loaded_user_ids[user_id] += 1
+        return copy.deepcopy(self.user_data.get(user_id))
+
+
 class TrackingConversationHandler(ConversationHandler):
     def __init__(self, *args, **kwargs):
         fallbacks = []
@@ -413,6 +439,34 @@ class TestBasePersistence:
         assert bot.callback_data_cache is None
         assert papp.persistence.set_bot(bot) is None
 
+    def test_lazy_loading_init(self):
+        persistence = LazyTrackingPersistence(max_cached_entries=5)
+        assert persistence.lazy_loading
+        assert persistence.max_cached_entries == 5
+        with pytest.raises(AttributeError, match="can not assign a new value to lazy_loading"):
+            persistence.lazy_loading = False
+        with pytest.raises(
+            AttributeError, match="can not assign a new value to max_cached_entries"
+        ):
+            persistence.max_cached_entries = 7
+
+        persistence = TrackingPersistence()
+        assert not persistence.lazy_loading
+        assert persistence.max_cached_entries is None
+
+        with pytest.raises(TypeError, match="TrackingPersistence does not support lazy loading"):
+            TrackingPersistence(lazy_loading=True)
+        with pytest.raises(ValueError, match="only be used with `lazy_loading`"):
+            TrackingPersistence(max_cached_entries=5)
+        with pytest.raises(ValueError, match="must be a positive integer"):
+            LazyTrackingPersistence(max_cached_entries=0)
+
+    async def test_get_data_entry_not_implemented(self):
+        with pytest.raises(NotImplementedError, match="does not support lazy loading"):
+            await TrackingPersistence().get_user_data_entry(1)
+        with pytest.raises(NotImplementedError, match="does not support lazy loading"):
+            await TrackingPersistence().get_chat_data_entry(1)
+
     def test_construction_with_bad_persistence(self, bot):
         class MyPersistence:
             def __init__(self):
@@ -1046,6 +1100,24 @@ class TestBasePersistence:
             else:
                 assert not papp.persistence.user_data
 
+    @default_papp
+    async def test_update_persistence_copies_bot_data(self, papp: Application):
+        async with papp:
+            papp.bot_data["key"] = {"nested": ["value"]}
+            await papp.update_persistence()
+            persisted = papp.persistence.bot_data
+            assert persisted == papp.bot_data
+            assert persisted is not papp.bot_data
+            assert persisted["key"] is not papp.bot_data["key"]
+
+            # Data that compares equal is copied again, as equality doesn't mean that the data
+            # is unchanged
+            papp.persistence.reset_tracking()
+            await papp.update_persistence()
+            assert papp.persistence.updated_bot_data
+            assert papp.persistence.bot_data == persisted
+            assert papp.persistence.bot_data is not persisted
+
     @filled_papp
     async def test_drop_chat_data(self, papp: Application):
         async with papp:
@@ -1663,3 +1735,174 @@ class TestBasePersistence:
         }
 
         await papp.shutdown()
+
+    @staticmethod
+    def build_lazy_app(bot, persistence) -> Application:
+        app = (
+            ApplicationBuilder()
+            .bot(bot)
+            .persistence(persistence)
+            .application_class(PytestApplication)
+            .build()
+        )
+
+        async def callback(update, context):
+            context.user_data["count"] = context.user_data.get("count", 0) + 1
+            context.chat_data["count"] = context.chat_data.get("count", 0) + 1
+
+        app.add_handler(MessageHandler(filters.ALL, callback))
+        return app
+
+    @staticmethod
+    def build_lazy_update(chat_id: int):
+        user = User(id=chat_id, first_name="", is_bot=False)
+        return make_message_update(message="text", user=user, chat=Chat(id=chat_id, type=""))
+
+    async def test_lazy_loading(self, offline_bot):
+        persistence = LazyTrackingPersistence()
+        app = self.build_lazy_app(offline_bot, persistence)
+        async with app:
+            assert not app.user_data
+            assert not app.chat_data
+
+            for _ in range(2):
+                await app.process_update(self.build_lazy_update(1))
+            await app.process_update(self.build_lazy_update(3))
+            # Each entry is loaded only once
+            assert persistence.loaded_user_ids == {1: 1, 3: 1}
+            assert persistence.loaded_chat_ids == {1: 1, 3: 1}
+            assert app.user_data == {
+                1: {"key": "value", "count": 2, "refreshed": True},
+                3: {"count": 1, "refreshed": True},
+            }
+            assert app.chat_data == {
+                1: {"key": "value", "count": 2, "refreshed": True},
+                3: {"count": 1, "refreshed": True},
+            }
+
+            await app.update_persistence()
+            assert persistence.user_data[1] == {"key": "value", "count": 2, "refreshed": True}
+            assert persistence.user_data[2] == {"foo": "bar"}
+            assert persistence.user_data[3] == {"count": 1, "refreshed": True}
+            assert persistence.chat_data[1] == {"key": "value", "count": 2, "refreshed": True}
+
+            # Dropped entries are not loaded again, even if they are not yet deleted from the
+            # persistence
+            app.drop_user_data(1)
+            await app.process_update(self.build_lazy_update(1))
+            assert persistence.loaded_user_ids == {1: 1, 3: 1}
+            assert app.user_data[1] == {"count": 1, "refreshed": True}
+
+    async def test_lazy_loading_eviction(self, offline_bot):
+        persistence = LazyTrackingPersistence(max_cached_entries=2)
+        app = self.build_lazy_app(offline_bot, persistence)
+        async with app:
+            for chat_id in (1, 2, 3):
+                await app.process_update(self.build_lazy_update(chat_id))
+            # Using an entry again makes it the most recently used one
+            await app.process_update(self.build_lazy_update(1))
+            assert len(app.user_data) == 3
+
+            await app.update_persistence()
+            assert set(app.user_data) == {1, 3}
+            assert set(app.chat_data) == {1, 3}
+            assert persistence.user_data[2] == {"foo": "bar", "count": 1, "refreshed": True}
+
+            # Evicted entries are loaded again with the changes
+            await app.process_update(self.build_lazy_update(2))
+            assert persistence.loaded_user_ids[2] == 2
+            assert app.user_data[2] == {"foo": "bar", "count": 2, "refreshed": True}
+
+            # Entries that are marked for update while the persistence is updated are kept
+            async def update_user_data(user_id, data):
+                app.mark_data_for_update_persistence(user_ids=3)
+
+            persistence.update_user_data = update_user_data
+            await app.update_persistence()
+            assert set(app.user_data) == {3, 2}
+            assert set(app.chat_data) == {1, 2}
+
+    async def test_lazy_loading_no_eviction_while_in_use(self, offline_bot):
+        persistence = LazyTrackingPersistence(max_cached_entries=1)
+        app = self.build_lazy_app(offline_bot, persistence)
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def callback(update, context):
+            started.set()
+            await release.wait()
+            context.user_data["late"] = True
+
+        app.add_handler(
+            MessageHandler(filters.User(user_id=1), callback, block=False), group=1
+        )
+        async with app:
+            await app.process_update(self.build_lazy_update(1))
+            await started.wait()
+            await app.process_update(self.build_lazy_update(2))
+
+            # The entry of the running handler is kept, the others are evicted
+            await app.update_persistence()
+            assert set(app.user_data) == {1}
+            assert set(app.chat_data) == {1}
+
+            release.set()
+            await asyncio.sleep(0.05)
+            await app.update_persistence()
+            assert persistence.user_data[1]["late"] is True
+            assert persistence.loaded_user_ids[1] == 1
+            assert set(app.user_data) == {1}
+
+    async def test_lazy_loading_pin_refresh_error(self, offline_bot):
+        persistence = LazyTrackingPersistence()
+        app = self.build_lazy_app(offline_bot, persistence)
+        pinned = []
+
+        async def refresh_user_data(user_id, user_data):
+            raise RuntimeError("Failed")
+
+        async def callback(update, context):
+            pinned.append(app._user_data.is_pinned(1))
+
+        persistence.refresh_user_data = refresh_user_data
+        app.add_handler(MessageHandler(filters.ALL, callback), group=1)
+        async with app:
+            # Another user of the entry, e.g. a running job
+            app._user_data.pin(1)
+            await app.process_update(self.build_lazy_update(1))
+            # The later group still uses a pinned entry, and the pin of the other user is kept
+            assert pinned == [True]
+            assert app._user_data.is_pinned(1)
+            app._user_data.unpin(1)
+            assert not app._user_data.is_pinned(1)
+
+    async def test_lazy_loading_no_eviction_on_error(self, offline_bot):
+        persistence = LazyTrackingPersistence(max_cached_entries=1)
+        app = self.build_lazy_app(offline_bot, persistence)
+
+        async def update_user_data(user_id, data):
+            raise RuntimeError("Failed")
+
+        persistence.update_user_data = update_user_data
+        async with app:
+            for chat_id in (1, 2):
+                await app.process_update(self.build_lazy_update(chat_id))
+            await app.update_persistence()
+            assert set(app.user_data) == {1, 2}
+
+    async def test_lazy_loading_not_loaded(self, offline_bot, caplog):
+        persistence = LazyTrackingPersistence()
+        app = self.build_lazy_app(offline_bot, persistence)
+        async with app:
+            app.user_data[1]["new"] = "value"
+            app.mark_data_for_update_persistence(chat_ids=(2,), user_ids=(1,))
+            with caplog.at_level(logging.WARNING):
+                await app.update_persistence()
+
+            assert not persistence.updated_user_ids
+            assert not persistence.updated_chat_ids
+            assert persistence.user_data[1] == {"key": "value"}
+            assert len(caplog.records) == 1
+            assert caplog.records[0].getMessage().startswith(
+                "The user_data of id 1 was accessed without being loaded"
+            )
@@ -19,11 +19,12 @@
 """Here we run tests directly with SimpleUpdateProcessor because that's easier than providing dummy
 implementations for SimpleUpdateProcessor and we want to test SimpleUpdateProcessor anyway."""
 import asyncio
+import datetime as dtm
 
 import pytest
 
-from telegram import Update
-from telegram.ext import SimpleUpdateProcessor
+from telegram import Chat, Message, Update
+from telegram.ext import OrderedUpdateProcessor, SimpleUpdateProcessor
 from tests.auxil.asyncio_helpers import call_after
 from tests.auxil.slots import mro_slots
 
@@ -164,3 +165,249 @@ class TestSimpleUpdateProcessor:
                 pass
 
         assert self.test_flag == "shutdown"
+
+
+def make_update(update_id, chat_id):
+    message = Message(1, dtm.datetime.now(), Chat(chat_id, Chat.PRIVATE))
+    return Update(update_id, message=message)
+
+
+class TestOrderedUpdateProcessor:
+    def test_slot_behaviour(self):
+        inst = OrderedUpdateProcessor(1)
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_init(self):
+        processor = OrderedUpdateProcessor(3, max_queue_size=7)
+        assert processor.max_concurrent_updates == 3
+        assert processor.max_queue_size == 7
+        assert OrderedUpdateProcessor(3).max_queue_size == 100
+        assert processor.active_keys == 0
+        assert processor.queued_updates == 0
+        assert processor.processed_updates == 0
+        with pytest.raises(ValueError, match="must be a positive integer"):
+            OrderedUpdateProcessor(0)
+        with pytest.raises(ValueError, match="`max_queue_size` must be a positive integer"):
+            OrderedUpdateProcessor(1, max_queue_size=0)
+
+    async def test_order_within_chat(self):
+        processor = OrderedUpdateProcessor(10)
+        processed = []
+
+        async def callback(update_id, delay):
+            await asyncio.sleep(delay)
+            processed.append(update_id)
+
+        # Later updates of the same chat finish faster, but must still be processed in order
+        tasks = [
+            asyncio.create_task(
+                processor.process_update(make_update(i, 1), callback(i, 0.1 - i / 100))
+            )
+            for i in range(5)
+        ]
+        await asyncio.sleep(0.05)
+        assert processor.active_keys == 1
+        assert processor.queued_updates == 4
+
+        await asyncio.gather(*tasks)
+        await asyncio.sleep(0.5)
+        assert processed == [0, 1, 2, 3, 4]
+        assert processor.active_keys == 0
+        assert processor.queued_updates == 0
+        assert processor.processed_updates == 5
+
+    async def test_concurrency_across_chats(self):
+        processor = OrderedUpdateProcessor(2)
+        busy = asyncio.Event()
+        processed = []
+
+        async def blocking():
+            await busy.wait()
+            processed.append("chat 1")
+
+        async def callback(name):
+            processed.append(name)
+
+        # Many updates of a busy chat must not occupy all the slots of the processor
+        tasks = [
+            asyncio.create_task(processor.process_update(make_update(i, 1), blocking()))
+            for i in range(5)
+        ]
+        await asyncio.sleep(0.05)
+        await asyncio.wait_for(
+            processor.process_update(make_update(10, 2), callback("chat 2")), 1
+        )
+        # Updates without a key are processed right away, too
+        await asyncio.wait_for(processor.process_update(object(), callback("no key")), 1)
+        assert processed == ["chat 2", "no key"]
+
+        busy.set()
+        await asyncio.gather(*tasks)
+        await asyncio.sleep(0.1)
+        assert processed == ["chat 2", "no key"] + ["chat 1"] * 5
+
+    async def test_custom_key(self):
+        keys = []
+
+        def key(update):
+            keys.append(update)
+            return "key"
+
+        processor = OrderedUpdateProcessor(2, key=key)
+        event = asyncio.Event()
+        processed = []
+
+        async def callback(name):
+            await event.wait()
+            processed.append(name)
+
+        tasks = [
+            asyncio.create_task(processor.process_update(name, callback(name)))
+            for name in ("a", "b")
+        ]
+        await asyncio.sleep(0.05)
+        assert keys == ["a", "b"]
+        assert processor.queued_updates == 1
+        event.set()
+        await asyncio.gather(*tasks)
+        await asyncio.sleep(0.05)
+        assert processed == ["a", "b"]
+
+    async def test_max_queue_size(self):
+        processor = OrderedUpdateProcessor(5, max_queue_size=2)
+        event = asyncio.Event()
+        processed = []
+
+        async def callback(update_id):
+            await event.wait()
+            processed.append(update_id)
+
+        tasks = [
+            asyncio.create_task(processor.process_update(make_update(i, 1), callback(i)))
+            for i in range(5)
+        ]
+        await asyncio.sleep(0.05)
+        assert processor.queued_updates == 2
+        # The first update is being processed, the next two are queued and the last two wait
+        # for room in the queue
+        assert sum(task.done() for task in tasks) == 2
+
+        event.set()
+        await asyncio.gather(*tasks)
+        await asyncio.sleep(0.05)
+        assert processed == [0, 1, 2, 3, 4]
+        assert processor.queued_updates == 0
+
+    async def test_max_queue_size_order(self):
+        processor = OrderedUpdateProcessor(10, max_queue_size=1)
+        event = asyncio.Event()
+        processed = []
+
+        async def callback(update_id):
+            if update_id == 0:
+                await event.wait()
+            processed.append(update_id)
+
+        tasks = [
+            asyncio.create_task(processor.process_update(make_update(i, 1), callback(i)))
+            for i in range(4)
+        ]
+        await asyncio.sleep(0.05)
+        event.set()
+        # Updates arriving while others wait for room in the queue must not overtake them
+        tasks.extend(
+            asyncio.create_task(processor.process_update(make_update(i, 1), callback(i)))
+            for i in range(4, 8)
+        )
+        await asyncio.gather(*tasks)
+        await asyncio.sleep(0.05)
+        assert processed == list(range(8))
+        assert processor.active_keys == 0
+
+    async def test_cancelled_waiter(self):
+        processor = OrderedUpdateProcessor(10, max_queue_size=1)
+        event = asyncio.Event()
+        processed = []
+
+        async def callback(update_id):
+            await event.wait()
+            processed.append(update_id)
+
+        first = asyncio.create_task(processor.process_update(make_update(0, 1), callback(0)))
+        await asyncio.sleep(0.01)
+        await processor.process_update(make_update(1, 1), callback(1))
+        cancelled_coroutine = callback(2)
+        cancelled = asyncio.create_task(
+            processor.process_update(make_update(2, 1), cancelled_coroutine)
+        )
+        waiting = asyncio.create_task(processor.process_update(make_update(3, 1), callback(3)))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        event.set()
+        await asyncio.gather(first, waiting)
+        await asyncio.sleep(0.05)
+        assert processed == [0, 1, 3]
+        assert cancelled_coroutine.cr_frame is None
+
+    async def test_exception_does_not_stop_queue(self, caplog):
+        processor = OrderedUpdateProcessor(2)
+        processed = []
+
+        async def failing():
+            await asyncio.sleep(0.05)
+            raise RuntimeError("failing")
+
+        async def callback():
+            processed.append(True)
+
+        tasks = [
+            asyncio.create_task(processor.process_update(make_update(1, 1), failing())),
+            asyncio.create_task(processor.process_update(make_update(2, 1), callback())),
+        ]
+        await asyncio.gather(*tasks)
+        assert processed == [True]
+        assert processor.processed_updates == 2
+        assert any("failing" in record.exc_text for record in caplog.records if record.exc_text)
+
+    async def test_cancellation(self):
+        processor = OrderedUpdateProcessor(2)
+
+        async def callback():
+            await asyncio.sleep(10)
+
+        first = asyncio.create_task(processor.process_update(make_update(1, 1), callback()))
+        await asyncio.sleep(0.01)
+        queued = callback()
+        await processor.process_update(make_update(2, 1), queued)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert processor.active_keys == 0
+        # The queued coroutine was closed, so that it doesn't trigger a warning
+        assert queued.cr_frame is None
+
+    async def test_cancellation_wakes_waiters(self):
+        processor = OrderedUpdateProcessor(10, max_queue_size=1)
+        processed = []
+
+        async def callback(update_id):
+            if update_id == 0:
+                await asyncio.sleep(10)
+            processed.append(update_id)
+
+        first = asyncio.create_task(processor.process_update(make_update(0, 1), callback(0)))
+        await asyncio.sleep(0.01)
+        await processor.process_update(make_update(1, 1), callback(1))
+        waiting = [
+            asyncio.create_task(processor.process_update(make_update(i, 1), callback(i)))
+            for i in (2, 3)
+        ]
+        await asyncio.sleep(0.01)
+        first.cancel()
+        # The waiting updates are processed in their order instead of waiting forever
+        await asyncio.wait_for(asyncio.gather(*waiting), 1)
+        await asyncio.sleep(0.05)
+        assert processed == [2, 3]
+        assert processor.active_keys == 0
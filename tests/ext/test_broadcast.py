@@ -0,0 +1,215 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import logging
+
+import pytest
+
+from telegram.error import BadRequest, ChatMigrated, Forbidden, RetryAfter
+from telegram.ext import BroadcastReport, RequestPriority, RequestScheduler
+from tests.auxil.slots import mro_slots
+
+
+async def async_range(stop):
+    for i in range(stop):
+        await asyncio.sleep(0)
+        yield i
+
+
+class TestBroadcastReport:
+    def test_slot_behaviour(self):
+        inst = BroadcastReport()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_init(self):
+        report = BroadcastReport(5)
+        assert report.offset == 5
+        assert report.sent == 0
+        assert report.failed_chat_ids == []
+        assert report.blocked_chat_ids == []
+        assert report.migrated_chat_ids == {}
+        assert not report.done
+        assert report.throughput == 0
+        assert str(report) == "BroadcastReport[offset=5, sent=0, done=False]"
+
+    async def test_elapsed_and_throughput(self):
+        report = BroadcastReport()
+        report.sent = 10
+        await asyncio.sleep(0.1)
+        report._finish()
+        assert report.done
+        elapsed = report.elapsed
+        assert elapsed == pytest.approx(0.1, abs=0.05)
+        await asyncio.sleep(0.05)
+        # Doesn't change after the broadcast is done
+        assert report.elapsed == elapsed
+        assert report.throughput == pytest.approx(10 / elapsed)
+
+
+class TestBroadcast:
+    @pytest.mark.parametrize("async_iterable", [True, False])
+    async def test_broadcast(self, app, async_iterable):
+        sent = []
+
+        async def callback(chat_id):
+            await asyncio.sleep(0.01)
+            sent.append(chat_id)
+
+        chat_ids = async_range(100) if async_iterable else range(100)
+        report = await app.broadcast(chat_ids, callback, max_concurrent_sends=10)
+        assert sorted(sent) == list(range(100))
+        assert report.sent == 100
+        assert report.offset == 100
+        assert report.done
+        assert report.throughput > 0
+
+    async def test_concurrency(self, app):
+        active = 0
+        max_active = 0
+
+        async def callback(_):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+        await app.broadcast(range(50), callback, max_concurrent_sends=7)
+        assert max_active == 7
+
+        with pytest.raises(ValueError, match="`max_concurrent_sends` must be a positive"):
+            await app.broadcast(range(50), callback, max_concurrent_sends=0)
+
+    async def test_errors(self, app, caplog):
+        attempts = {}
+
+        async def callback(chat_id):
+            attempts[chat_id] = attempts.get(chat_id, 0) + 1
+            if chat_id == 1:
+                raise Forbidden("blocked")
+            if chat_id == 2:
+                raise ChatMigrated(-2)
+            if chat_id == 3 and attempts[chat_id] == 1:
+                raise RetryAfter(0)
+            if chat_id == 4:
+                raise RetryAfter(0)
+            if chat_id == 5:
+                raise BadRequest("Chat not found")
+
+        app.chat_data[2]["key"] = "value"
+        with caplog.at_level(logging.ERROR):
+            report = await app.broadcast(range(7), callback, max_retries=2)
+
+        assert report.sent == 4
+        assert report.blocked_chat_ids == [1]
+        assert report.migrated_chat_ids == {2: -2}
+        assert sorted(report.failed_chat_ids) == [4, 5]
+        assert report.offset == 7
+        assert attempts == {0: 1, 1: 1, 2: 1, -2: 1, 3: 2, 4: 3, 5: 1, 6: 1}
+        assert app.chat_data[-2] == {"key": "value"}
+        assert 2 not in app.chat_data
+        assert any("Chat not found" in record.exc_text for record in caplog.records)
+
+    async def test_checkpoints_and_resume(self, app):
+        checkpoints = []
+        sent = []
+
+        async def callback(chat_id):
+            # Later recipients finish first, but the offset only covers completed prefixes
+            await asyncio.sleep(0.05 if chat_id % 2 == 0 else 0)
+            sent.append(chat_id)
+
+        async def checkpoint_callback(report):
+            checkpoints.append((report.offset, report.done))
+
+        report = await app.broadcast(
+            range(20),
+            callback,
+            start_offset=5,
+            max_concurrent_sends=4,
+            checkpoint_callback=checkpoint_callback,
+            checkpoint_interval=0,
+        )
+        assert sorted(sent) == list(range(5, 20))
+        assert report.offset == 20
+        assert checkpoints[-1] == (20, True)
+        offsets = [offset for offset, _ in checkpoints]
+        assert offsets == sorted(offsets)
+        assert all(offset >= 5 for offset in offsets)
+        assert not any(done for _, done in checkpoints[:-1])
+
+    async def test_cancellation(self, app):
+        started = []
+
+        async def callback(chat_id):
+            started.append(chat_id)
+            await asyncio.sleep(10)
+
+        task = asyncio.create_task(app.broadcast(range(10), callback, max_concurrent_sends=3))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert started == [0, 1, 2]
+
+    async def test_cancellation_offset(self, app):
+        reports = []
+        sent = []
+
+        async def callback(chat_id):
+            if chat_id > 0:
+                await asyncio.sleep(10)
+            sent.append(chat_id)
+
+        async def checkpoint_callback(report):
+            reports.append(report)
+
+        task = asyncio.create_task(
+            app.broadcast(
+                range(5),
+                callback,
+                max_concurrent_sends=5,
+                checkpoint_callback=checkpoint_callback,
+                checkpoint_interval=0,
+            )
+        )
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert sent == [0]
+        report = reports[-1]
+        # Resuming from the checkpoint must not skip the recipients that were cancelled
+        assert report.sent == 1
+        assert report.offset == 1
+        assert not report.done
+
+    async def test_bulk_priority(self, app):
+        priorities = []
+        app.bot._request_scheduler = RequestScheduler()
+
+        async def callback(_):
+            priorities.append(app.bot.request_scheduler.get_priority("sendMessage", {}))
+
+        await app.broadcast(range(3), callback)
+        assert priorities == [RequestPriority.BULK] * 3
+        assert app.bot.request_scheduler.get_priority("sendMessage", {}) is RequestPriority.NORMAL
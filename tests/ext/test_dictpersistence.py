@@ -21,6 +21,7 @@ import json
 import pytest
 
 from telegram.ext import DictPersistence
+from telegram.request import JSONCodec
 from tests.auxil.slots import mro_slots
 
 
@@ -240,6 +241,45 @@ class TestDictPersistence:
         assert dict_persistence.callback_data_json == callback_data_json
         assert dict_persistence.conversations_json == conversations_json
 
+    async def test_json_codec(
+        self,
+        user_data,
+        user_data_json,
+        bot_data,
+        bot_data_json,
+        conversations,
+        conversations_json,
+    ):
+        class Codec(JSONCodec):
+            def __init__(self):
+                self.calls = []
+
+            def dumps(self, obj):
+                self.calls.append("dumps")
+                return super().dumps(obj)
+
+            def loads(self, data):
+                self.calls.append("loads")
+                return super().loads(data)
+
+        codec = Codec()
+        dict_persistence = DictPersistence(
+            user_data_json=user_data_json,
+            bot_data_json=bot_data_json,
+            conversations_json=conversations_json,
+            json_codec=codec,
+        )
+        assert dict_persistence.user_data == user_data
+        assert dict_persistence.bot_data == bot_data
+        assert dict_persistence.conversations == conversations
+        assert codec.calls
+        assert set(codec.calls) == {"loads"}
+
+        codec.calls.clear()
+        await dict_persistence.update_bot_data({"new": "data"})
+        assert dict_persistence.bot_data_json == json.dumps({"new": "data"})
+        assert codec.calls == ["dumps"]
+
     async def test_updating(
         self,
         user_data_json,
@@ -2529,6 +2529,102 @@ class TestFilters:
         result = (filters.COMMAND | DataFilter("blah")).check_update(update)
         assert result["test"] == ["blah"]
 
+    def test_merged_cheap_filters_first(self, update, monkeypatch):
+        calls = []
+
+        def record(cls):
+            original = cls.filter
+
+            def filter(self, message):
+                calls.append(cls)
+                return original(self, message)
+
+            monkeypatch.setattr(cls, "filter", filter)
+
+        record(filters.Regex)
+        record(filters.Text)
+
+        update.message.text = "test"
+        result = (filters.Regex("^te") & filters.TEXT).check_update(update)
+        assert result["matches"][0].group() == "te"
+        assert calls == [filters.Text, filters.Regex]
+
+        calls.clear()
+        update.message.text = None
+        assert not (filters.Regex("^te") & ~filters.COMMAND & filters.TEXT).check_update(update)
+        assert calls == [filters.Text]
+
+        # "or" chains are not reordered, since the first truthy output is returned
+        calls.clear()
+        update.message.text = "test"
+        result = (filters.Regex("^te") | filters.TEXT).check_update(update)
+        assert isinstance(result, dict)
+        assert calls == [filters.Regex]
+
+    def test_merged_custom_filters_order(self, update, base_class):
+        calls = []
+
+        class RecordingFilter(base_class):
+            def filter(self, _):
+                calls.append(self.name)
+                return True
+
+        first, second = RecordingFilter(name="first"), RecordingFilter(name="second")
+        update.message.text = "test"
+        assert (filters.Regex("^te") & first & filters.TEXT & second).check_update(update)
+        assert calls == ["first", "second"]
+
+        # Custom filters may have side effects, so they are neither deduplicated nor is any other
+        # filter moved before them
+        calls.clear()
+        update.message.text = None
+        assert not (first & first & filters.TEXT & second).check_update(update)
+        assert calls == ["first", "first"]
+
+    def test_merged_deduplication(self, update, monkeypatch):
+        calls = []
+        original = filters.Text.filter
+
+        def filter(self, message):
+            calls.append(message)
+            return original(self, message)
+
+        monkeypatch.setattr(filters.Text, "filter", filter)
+
+        update.message.text = "test"
+        assert (filters.TEXT & ~filters.COMMAND & filters.TEXT).check_update(update)
+        assert len(calls) == 1
+
+        calls.clear()
+        update.message.text = None
+        combined = filters.TEXT | filters.PHOTO
+        assert not (combined | filters.TEXT | combined).check_update(update)
+        assert len(calls) == 1
+
+        # Data filters in "and" chains are kept, since their outputs are merged
+        update.message.text = "test"
+        regex = filters.Regex("te")
+        assert len((regex & regex).check_update(update)["matches"]) == 2
+
+    def test_xor_filters_evaluated_once(self, update, base_class):
+        calls = []
+
+        class RecordingFilter(base_class):
+            def __init__(self, output):
+                super().__init__(name=str(output))
+                self.output = output
+
+            def filter(self, _):
+                calls.append(self.output)
+                return self.output
+
+        assert (RecordingFilter(False) ^ RecordingFilter(True)).check_update(update) is True
+        assert calls == [False, True]
+
+        calls.clear()
+        assert not (RecordingFilter(True) ^ RecordingFilter(True)).check_update(update)
+        assert calls == [True, True]
+
     def test_filters_via_bot_init(self):
         with pytest.raises(RuntimeError, match="in conjunction with"):
             filters.ViaBot(bot_id=1, username="bot")
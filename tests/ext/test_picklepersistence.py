@@ -16,6 +16,7 @@
 #
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
 import datetime
 import gzip
 import os
@@ -1006,3 +1007,251 @@ class TestPicklePersistence:
         await pickle_persistence.update_callback_data(callback_data)
 
         assert not pickle_persistence.filepath.is_file()
+
+    @pytest.mark.parametrize("single_file", [True, False])
+    async def test_journal(
+        self, single_file, bot_data, user_data, chat_data, conversations, callback_data
+    ):
+        persistence = PicklePersistence("pickletest", single_file=single_file, journal=True)
+        assert await persistence.get_user_data() == {}
+
+        await persistence.update_user_data(12345, user_data[12345])
+        await persistence.update_user_data(67890, user_data[67890])
+        await persistence.update_chat_data(-12345, chat_data[-12345])
+        await persistence.update_bot_data(bot_data)
+        await persistence.update_callback_data(callback_data)
+        await persistence.update_conversation("name1", (123, 123), 3)
+        await persistence.update_conversation("name1", (123, 123), 4)
+        await persistence.drop_user_data(67890)
+
+        # Only the journal is written
+        assert not Path("pickletest").exists()
+        assert not Path("pickletest_user_data").exists()
+        journal_size = Path("pickletest_journal").stat().st_size
+        await persistence.update_user_data(12345, {"new": "data"})
+        assert Path("pickletest_journal").stat().st_size > journal_size
+
+        persistence = PicklePersistence("pickletest", single_file=single_file, journal=True)
+        assert await persistence.get_user_data() == {12345: {"new": "data"}}
+        assert await persistence.get_chat_data() == {-12345: chat_data[-12345]}
+        assert await persistence.get_bot_data() == bot_data
+        assert await persistence.get_callback_data() == callback_data
+        assert await persistence.get_conversations("name1") == {(123, 123): 4}
+
+    async def test_journal_incomplete_record(self, user_data, caplog):
+        persistence = PicklePersistence("pickletest", journal=True)
+        await persistence.update_user_data(12345, user_data[12345])
+        await persistence.update_user_data(67890, user_data[67890])
+
+        # Simulate a process that was killed while writing the last record
+        journal = Path("pickletest_journal")
+        complete_size = journal.stat().st_size
+        journal.write_bytes(journal.read_bytes()[:-3])
+
+        persistence = PicklePersistence("pickletest", journal=True)
+        assert await persistence.get_user_data() == {12345: user_data[12345]}
+        assert "Discarding incomplete record" in caplog.text
+        assert journal.stat().st_size < complete_size - 3
+
+        # New records are appended after the last complete one
+        await persistence.update_user_data(1, {})
+        persistence = PicklePersistence("pickletest", journal=True)
+        assert await persistence.get_user_data() == {12345: user_data[12345], 1: {}}
+
+    async def test_journal_fsync(self, monkeypatch):
+        synced = []
+        fsync = os.fsync
+
+        def tracking_fsync(fd):
+            synced.append(os.fstat(fd).st_size)
+            fsync(fd)
+
+        monkeypatch.setattr(os, "fsync", tracking_fsync)
+        persistence = PicklePersistence("pickletest", journal=True)
+        await persistence.update_user_data(1, {1: 1})
+        assert synced == [Path("pickletest_journal").stat().st_size]
+
+        # Records of concurrent calls are synced together and all of them are written
+        await asyncio.gather(
+            *(persistence.update_user_data(user_id, {user_id: user_id}) for user_id in range(10))
+        )
+        assert 1 < len(synced) < 11
+        assert synced[-1] == Path("pickletest_journal").stat().st_size
+
+        persistence = PicklePersistence("pickletest", journal=True)
+        assert await persistence.get_user_data() == {i: {i: i} for i in range(10)}
+
+    @pytest.mark.parametrize("single_file", [True, False])
+    async def test_journal_compaction(self, single_file, user_data):
+        persistence = PicklePersistence(
+            "pickletest", single_file=single_file, journal=True, journal_compaction_threshold=3
+        )
+        await persistence.get_user_data()
+        await persistence.update_user_data(1, {1: 1})
+        await persistence.update_user_data(2, {2: 2})
+        assert Path("pickletest_journal").is_file()
+
+        await persistence.update_user_data(3, {3: 3})
+        assert not Path("pickletest_journal").exists()
+        assert not Path("pickletest_journal_compacting").exists()
+        filepath = Path("pickletest" if single_file else "pickletest_user_data")
+        assert filepath.is_file()
+
+        await persistence.drop_user_data(1)
+        await persistence.flush()
+        assert not Path("pickletest_journal").exists()
+
+        persistence = PicklePersistence("pickletest", single_file=single_file, journal=True)
+        assert await persistence.get_user_data() == {2: {2: 2}, 3: {3: 3}}
+
+    async def test_journal_interrupted_compaction(self, user_data):
+        persistence = PicklePersistence("pickletest", journal=True)
+        await persistence.update_user_data(12345, user_data[12345])
+        await persistence.flush()
+        await persistence.update_user_data(1, {1: 1})
+        # Simulate a compaction that was interrupted before the pickle file was written
+        Path("pickletest_journal").replace("pickletest_journal_compacting")
+        await persistence.update_user_data(2, {2: 2})
+
+        persistence = PicklePersistence("pickletest", journal=True)
+        assert await persistence.get_user_data() == {
+            12345: user_data[12345],
+            1: {1: 1},
+            2: {2: 2},
+        }
+        assert not Path("pickletest_journal").exists()
+        assert not Path("pickletest_journal_compacting").exists()
+
+        persistence = PicklePersistence("pickletest")
+        assert await persistence.get_user_data() == {
+            12345: user_data[12345],
+            1: {1: 1},
+            2: {2: 2},
+        }
+
+    async def test_shards(self, user_data, chat_data, bot_data, conversations):
+        persistence = PicklePersistence("pickletest", shards=4)
+        assert await persistence.get_user_data() == {}
+
+        for user_id, data in user_data.items():
+            await persistence.update_user_data(user_id, data)
+        await persistence.update_chat_data(-12345, chat_data[-12345])
+        await persistence.update_bot_data(bot_data)
+        await persistence.update_conversation("name1", (123, 123), 3)
+
+        assert not Path("pickletest").exists()
+        assert not Path("pickletest_user_data").exists()
+        assert {path.name for path in Path().glob("pickletest_*")} == {
+            f"pickletest_user_data_{12345 % 4}",
+            f"pickletest_user_data_{67890 % 4}",
+            f"pickletest_chat_data_{-12345 % 4}",
+            "pickletest_bot_data",
+            "pickletest_conversations",
+        }
+        with Path(f"pickletest_user_data_{12345 % 4}").open("rb") as file:
+            assert pickle.load(file) == {12345: user_data[12345]}
+
+        # Only the shard containing the changed data is written
+        shard = Path(f"pickletest_user_data_{67890 % 4}")
+        shard.unlink()
+        await persistence.update_user_data(12345, {"new": "data"})
+        assert not shard.exists()
+        await persistence.drop_user_data(12345)
+
+        persistence = PicklePersistence("pickletest", shards=4)
+        assert await persistence.get_user_data() == {}
+        assert await persistence.get_chat_data() == {-12345: chat_data[-12345]}
+        assert await persistence.get_bot_data() == bot_data
+        assert await persistence.get_conversations("name1") == {(123, 123): 3}
+
+    async def test_shards_on_flush(self, user_data):
+        persistence = PicklePersistence("pickletest", shards=2, on_flush=True)
+        await persistence.update_user_data(1, {1: 1})
+        await persistence.update_user_data(2, {2: 2})
+        assert not list(Path().glob("pickletest*"))
+
+        await persistence.flush()
+        assert {path.name for path in Path().glob("pickletest*")} == {
+            "pickletest_user_data_0",
+            "pickletest_user_data_1",
+        }
+        Path("pickletest_user_data_0").unlink()
+        await persistence.update_user_data(1, {1: 2})
+        await persistence.flush()
+        assert not Path("pickletest_user_data_0").exists()
+
+    async def test_shards_change_layout(self, user_data):
+        persistence = PicklePersistence("pickletest", single_file=False)
+        await persistence.update_user_data(1, {1: 1})
+        await persistence.update_user_data(2, {2: 2})
+        await persistence.update_user_data(3, {3: 3})
+
+        persistence = PicklePersistence("pickletest", shards=3)
+        assert await persistence.get_user_data() == {1: {1: 1}, 2: {2: 2}, 3: {3: 3}}
+        await persistence.update_user_data(3, {3: 4})
+        assert not Path("pickletest_user_data").exists()
+
+        persistence = PicklePersistence("pickletest", shards=2, on_flush=True)
+        assert await persistence.get_user_data() == {1: {1: 1}, 2: {2: 2}, 3: {3: 4}}
+        await persistence.flush()
+        assert {path.name for path in Path().glob("pickletest_user_data*")} == {
+            "pickletest_user_data_0",
+            "pickletest_user_data_1",
+        }
+
+        persistence = PicklePersistence("pickletest", shards=2)
+        assert await persistence.get_user_data() == {1: {1: 1}, 2: {2: 2}, 3: {3: 4}}
+
+    async def test_shards_migrate_single_file(self, bot_data, callback_data):
+        persistence = PicklePersistence("pickletest")
+        await persistence.update_user_data(1, {1: 1})
+        await persistence.update_user_data(2, {2: 2})
+        await persistence.update_chat_data(-1, {-1: -1})
+        await persistence.update_bot_data(bot_data)
+        await persistence.update_callback_data(callback_data)
+        await persistence.update_conversation("name1", (123, 123), 3)
+
+        persistence = PicklePersistence("pickletest", shards=2)
+        assert await persistence.get_user_data() == {1: {1: 1}, 2: {2: 2}}
+        assert await persistence.get_chat_data() == {-1: {-1: -1}}
+        assert await persistence.get_bot_data() == bot_data
+        assert await persistence.get_callback_data() == callback_data
+        assert await persistence.get_conversations("name1") == {(123, 123): 3}
+
+        # All data is written to the sharded layout on the next write
+        await persistence.update_user_data(1, {1: 2})
+        assert not Path("pickletest").exists()
+        assert {path.name for path in Path().glob("pickletest*")} == {
+            "pickletest_user_data_0",
+            "pickletest_user_data_1",
+            "pickletest_chat_data_0",
+            "pickletest_chat_data_1",
+            "pickletest_bot_data",
+            "pickletest_callback_data",
+            "pickletest_conversations",
+        }
+
+        persistence = PicklePersistence("pickletest", shards=2)
+        assert await persistence.get_user_data() == {1: {1: 2}, 2: {2: 2}}
+        assert await persistence.get_chat_data() == {-1: {-1: -1}}
+        assert await persistence.get_bot_data() == bot_data
+        assert await persistence.get_callback_data() == callback_data
+        assert await persistence.get_conversations("name1") == {(123, 123): 3}
+
+    async def test_shards_with_journal(self, user_data):
+        persistence = PicklePersistence(
+            "pickletest", shards=2, journal=True, journal_compaction_threshold=2
+        )
+        await persistence.update_user_data(1, {1: 1})
+        assert not Path("pickletest_user_data_1").exists()
+        await persistence.update_user_data(3, {3: 3})
+        assert Path("pickletest_user_data_1").exists()
+        assert not Path("pickletest_user_data_0").exists()
+
+        await persistence.update_user_data(2, {2: 2})
+        persistence = PicklePersistence("pickletest", shards=2, journal=True)
+        assert await persistence.get_user_data() == {1: {1: 1}, 2: {2: 2}, 3: {3: 3}}
+
+    async def test_shards_invalid(self):
+        with pytest.raises(ValueError, match="positive integer"):
+            PicklePersistence("pickletest", shards=0)
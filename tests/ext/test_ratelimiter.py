@@ -238,6 +238,80 @@ class TestAIORateLimiter:
         await asyncio.sleep(1.1)
         assert isinstance(task_2.exception(), RetryAfter)
 
+    @pytest.mark.parametrize("flooded_chat_id", [-1, 1])
+    async def test_retry_after_scoped_to_chat(self, bot, flooded_chat_id):
+        # Makes sure that a RetryAfter only blocks the pending requests for the same chat
+        class ChatRetryRequest(self.CountRequest):
+            async def do_request(self, *args, **kwargs):
+                if kwargs["request_data"].parameters.get("chat_id") == flooded_chat_id:
+                    TestAIORateLimiter.count += 1
+                    raise RetryAfter(retry_after=1)
+                return await super().do_request(*args, **kwargs)
+
+        rate_limiter = AIORateLimiter(max_retries=1, overall_max_rate=0, group_max_rate=0)
+        rl_bot = ExtBot(token=bot.token, request=ChatRetryRequest(), rate_limiter=rate_limiter)
+        async with rl_bot:
+            flooded_1 = asyncio.create_task(rl_bot.send_message(flooded_chat_id, "test"))
+            await asyncio.sleep(0.1)
+            flooded_2 = asyncio.create_task(rl_bot.send_message(flooded_chat_id, "test"))
+            other = asyncio.create_task(rl_bot.send_message(2, "test"))
+            await asyncio.sleep(0.1)
+
+            assert not flooded_1.done()
+            assert not flooded_2.done()
+            assert other.done()
+            assert other.exception() is None
+
+            await asyncio.sleep(1.3)
+            assert isinstance(flooded_1.exception(), RetryAfter)
+            assert not flooded_2.done()
+
+            await asyncio.sleep(1)
+            assert isinstance(flooded_2.exception(), RetryAfter)
+
+        stalled_time = rate_limiter.stalled_time
+        kind = "group" if flooded_chat_id < 0 else "chat"
+        # flooded_1 waited 1.1 seconds before retrying, flooded_2 waited until 1.1 and then
+        # another 1.1 seconds before retrying
+        assert stalled_time[kind] == pytest.approx(1.1 + 1.0 + 1.1, rel=0.1)
+        assert stalled_time["overall"] == 0
+        assert stalled_time.keys() == {"overall", "group", "chat"}
+
+    async def test_retry_after_deadline_extended_while_waiting(self, bot):
+        # Makes sure that pending requests keep waiting if the deadline is extended while they
+        # are already waiting
+        class ExtendingRetryRequest(self.CountRequest):
+            floods = 0
+
+            async def do_request(self, *args, **kwargs):
+                if self.floods:
+                    self.floods -= 1
+                    raise RetryAfter(retry_after=1)
+                return await super().do_request(*args, **kwargs)
+
+        request = ExtendingRetryRequest()
+        rl_bot = ExtBot(
+            token=bot.token,
+            request=request,
+            rate_limiter=AIORateLimiter(max_retries=1, overall_max_rate=0, group_max_rate=0),
+        )
+        async with rl_bot:
+            TestAIORateLimiter.call_times = []
+            start = time.time()
+            # Sets the deadline for chat 1 to 1.1 seconds from now
+            request.floods = 1
+            flooded = asyncio.create_task(rl_bot.send_message(1, "test"))
+            await asyncio.sleep(0.1)
+            waiting = asyncio.create_task(rl_bot.send_message(1, "test"))
+            await asyncio.sleep(0.4)
+            # Extends the deadline for all requests to 1.6 seconds from the start
+            request.floods = 1
+            await asyncio.wait_for(asyncio.gather(rl_bot.get_me(), flooded, waiting), 3)
+
+        # The requests are only processed after the extended deadline
+        assert len(TestAIORateLimiter.call_times) == 3
+        assert min(TestAIORateLimiter.call_times) - start == pytest.approx(1.6, abs=0.1)
+
     @pytest.mark.parametrize("group_id", [-1, "-1", "@username"])
     @pytest.mark.parametrize("chat_id", [1, "1"])
     async def test_basic_rate_limiting(self, bot, group_id, chat_id):
@@ -358,3 +432,81 @@ class TestAIORateLimiter:
         finally:
             TestAIORateLimiter.count = 0
             TestAIORateLimiter.call_times = []
+
+    async def test_private_chat_rate_limiting(self, bot):
+        try:
+            rl_bot = ExtBot(
+                token=bot.token,
+                request=self.CountRequest(retry_after=None),
+                rate_limiter=AIORateLimiter(
+                    overall_max_rate=0,
+                    group_max_rate=0,
+                    private_chat_max_rate=1,
+                    private_chat_time_period=1 / 2,
+                ),
+            )
+
+            async with rl_bot:
+                chat_1_tasks = [
+                    asyncio.create_task(rl_bot.send_message(chat_id=1, text="test"))
+                    for _ in range(4)
+                ]
+                chat_2_tasks = [
+                    asyncio.create_task(rl_bot.send_message(chat_id="2", text="test"))
+                    for _ in range(4)
+                ]
+                group_tasks = [
+                    asyncio.create_task(rl_bot.send_message(chat_id=-1, text="test"))
+                    for _ in range(4)
+                ]
+
+                await asyncio.sleep(0.6)
+                # Private chats are limited individually, groups are not limited at all
+                assert sum(task.done() for task in chat_1_tasks) == 2
+                assert sum(task.done() for task in chat_2_tasks) == 2
+                assert all(task.done() for task in group_tasks)
+                assert len(rl_bot.rate_limiter._private_chat_limiters) == 2
+                assert len(rl_bot.rate_limiter._group_limiters) == 0
+
+                await asyncio.sleep(1.1)
+                assert all(task.done() for task in chat_1_tasks + chat_2_tasks)
+        finally:
+            await asyncio.gather(*chat_1_tasks, *chat_2_tasks, *group_tasks)
+            TestAIORateLimiter.count = 0
+            TestAIORateLimiter.call_times = []
+
+    def test_max_cached_limiters_validation(self):
+        with pytest.raises(ValueError, match="`max_cached_limiters` must be a positive integer"):
+            AIORateLimiter(max_cached_limiters=0)
+
+    async def test_max_cached_limiters(self, bot):
+        try:
+            rl_bot = ExtBot(
+                token=bot.token,
+                request=self.CountRequest(retry_after=None),
+                rate_limiter=AIORateLimiter(
+                    overall_max_rate=0,
+                    group_max_rate=1,
+                    group_time_period=60,
+                    private_chat_max_rate=1,
+                    private_chat_time_period=60,
+                    max_cached_limiters=3,
+                ),
+            )
+            rate_limiter = rl_bot.rate_limiter
+
+            # None of the limiters has capacity left, so only the cache size limits the number
+            await asyncio.gather(
+                *(rl_bot.send_message(chat_id=-(i + 1), text="test") for i in range(5)),
+                *(rl_bot.send_message(chat_id=i + 1, text="test") for i in range(5)),
+            )
+            assert list(rate_limiter._group_limiters) == [-3, -4, -5]
+            assert list(rate_limiter._private_chat_limiters) == [3, 4, 5]
+
+            # Using a limiter makes it the most recently used one
+            rate_limiter._get_limiter(rate_limiter._group_limiters, -3, 1, 60)
+            await rl_bot.send_message(chat_id=-6, text="test")
+            assert list(rate_limiter._group_limiters) == [-5, -3, -6]
+        finally:
+            TestAIORateLimiter.count = 0
+            TestAIORateLimiter.call_times = []
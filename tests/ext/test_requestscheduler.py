@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import json
+from http import HTTPStatus
+
+import pytest
+
+from telegram import User
+from telegram.ext import BaseRateLimiter, ExtBot, RequestPriority, RequestScheduler
+from telegram.request import BaseRequest
+from tests.auxil.slots import mro_slots
+
+
+class RecordingRequest(BaseRequest):
+    def __init__(self):
+        self.endpoints = []
+
+    async def initialize(self) -> None:
+        pass
+
+    async def shutdown(self) -> None:
+        pass
+
+    async def do_request(self, url, *args, **kwargs):
+        endpoint = url.rsplit("/", 1)[-1]
+        self.endpoints.append(endpoint)
+        if endpoint == "getUpdates":
+            result = []
+        else:
+            result = User(id=1, first_name="bot", is_bot=True).to_dict()
+        return HTTPStatus.OK, json.dumps({"ok": True, "result": result}).encode()
+
+
+async def make_request(scheduler, endpoint, processed, event=None):
+    async def callback():
+        if event:
+            await event.wait()
+        processed.append(endpoint)
+        return True
+
+    return await scheduler.process_request(
+        callback=callback, args=(), kwargs={}, endpoint=endpoint, data={}
+    )
+
+
+class TestRequestScheduler:
+    def test_slot_behaviour(self):
+        inst = RequestScheduler()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    def test_init(self):
+        scheduler = RequestScheduler()
+        assert scheduler.max_concurrent_requests == 16
+        assert scheduler.starvation_timeout == 5
+        scheduler = RequestScheduler(max_concurrent_requests=3, starvation_timeout=1)
+        assert scheduler.max_concurrent_requests == 3
+        assert scheduler.starvation_timeout == 1
+        assert scheduler.pending_requests == dict.fromkeys(RequestPriority, 0)
+
+        with pytest.raises(ValueError, match="`max_concurrent_requests` must be a positive"):
+            RequestScheduler(max_concurrent_requests=0)
+        with pytest.raises(ValueError, match="`starvation_timeout` must not be negative"):
+            RequestScheduler(starvation_timeout=-1)
+
+    async def test_get_priority(self):
+        scheduler = RequestScheduler()
+        assert scheduler.get_priority("sendMessage", {}) is RequestPriority.NORMAL
+        assert scheduler.get_priority("answerCallbackQuery", {}) is RequestPriority.INTERACTIVE
+
+        async def get_priority():
+            return scheduler.get_priority("sendMessage", {})
+
+        with scheduler.use_priority(RequestPriority.BULK):
+            assert scheduler.get_priority("sendMessage", {}) is RequestPriority.BULK
+            assert scheduler.get_priority("answerCallbackQuery", {}) is RequestPriority.BULK
+            with RequestScheduler.use_priority(RequestPriority.INTERACTIVE):
+                assert scheduler.get_priority("sendMessage", {}) is RequestPriority.INTERACTIVE
+            # Tasks inherit the priority
+            assert await asyncio.create_task(get_priority()) is RequestPriority.BULK
+        assert scheduler.get_priority("sendMessage", {}) is RequestPriority.NORMAL
+
+    async def test_priority_order(self):
+        scheduler = RequestScheduler(max_concurrent_requests=1)
+        event = asyncio.Event()
+        processed = []
+
+        blocking = asyncio.create_task(make_request(scheduler, "blocking", processed, event))
+        await asyncio.sleep(0.01)
+        tasks = []
+        for endpoint, priority in (
+            ("bulk_1", RequestPriority.BULK),
+            ("normal", RequestPriority.NORMAL),
+            ("bulk_2", RequestPriority.BULK),
+            ("answerCallbackQuery", None),
+        ):
+            if priority is None:
+                tasks.append(asyncio.create_task(make_request(scheduler, endpoint, processed)))
+            else:
+                with scheduler.use_priority(priority):
+                    tasks.append(
+                        asyncio.create_task(make_request(scheduler, endpoint, processed))
+                    )
+            await asyncio.sleep(0.01)
+
+        assert scheduler.pending_requests == {
+            RequestPriority.INTERACTIVE: 1,
+            RequestPriority.NORMAL: 1,
+            RequestPriority.BULK: 2,
+        }
+        event.set()
+        await asyncio.gather(blocking, *tasks)
+        assert processed == ["blocking", "answerCallbackQuery", "normal", "bulk_1", "bulk_2"]
+
+    async def test_starvation_protection(self):
+        scheduler = RequestScheduler(max_concurrent_requests=1, starvation_timeout=0.2)
+        event = asyncio.Event()
+        processed = []
+
+        blocking = asyncio.create_task(make_request(scheduler, "blocking", processed, event))
+        await asyncio.sleep(0.01)
+        with scheduler.use_priority(RequestPriority.BULK):
+            bulk = asyncio.create_task(make_request(scheduler, "bulk", processed))
+        await asyncio.sleep(0.3)
+        interactive = asyncio.create_task(make_request(scheduler, "answerInlineQuery", processed))
+        await asyncio.sleep(0.01)
+
+        event.set()
+        await asyncio.gather(blocking, bulk, interactive)
+        assert processed == ["blocking", "bulk", "answerInlineQuery"]
+
+    async def test_cancelled_waiter(self):
+        scheduler = RequestScheduler(max_concurrent_requests=1)
+        event = asyncio.Event()
+        processed = []
+
+        blocking = asyncio.create_task(make_request(scheduler, "blocking", processed, event))
+        await asyncio.sleep(0.01)
+        cancelled = asyncio.create_task(make_request(scheduler, "cancelled", processed))
+        waiting = asyncio.create_task(make_request(scheduler, "waiting", processed))
+        await asyncio.sleep(0.01)
+        cancelled.cancel()
+        await asyncio.sleep(0.01)
+        assert scheduler.pending_requests[RequestPriority.NORMAL] == 1
+
+        event.set()
+        await asyncio.gather(blocking, waiting)
+        assert processed == ["blocking", "waiting"]
+        # All slots are free again
+        assert scheduler._active == 0
+
+    async def test_ext_bot_integration(self, bot):
+        priorities = []
+        rate_limited = []
+
+        class TestScheduler(RequestScheduler):
+            def get_priority(self, endpoint, data):
+                priority = super().get_priority(endpoint, data)
+                priorities.append((endpoint, priority))
+                return priority
+
+        class TestRateLimiter(BaseRateLimiter):
+            async def initialize(self):
+                pass
+
+            async def shutdown(self):
+                pass
+
+            async def process_request(self, callback, args, kwargs, endpoint, **_kwargs):
+                rate_limited.append(endpoint)
+                return await callback(*args, **kwargs)
+
+        for rate_limiter in (None, TestRateLimiter()):
+            priorities.clear()
+            rate_limited.clear()
+            request = RecordingRequest()
+            ext_bot = ExtBot(
+                token=bot.token,
+                request=request,
+                get_updates_request=request,
+                rate_limiter=rate_limiter,
+                request_scheduler=TestScheduler(),
+            )
+            assert isinstance(ext_bot.request_scheduler, TestScheduler)
+
+            await ext_bot.get_me()
+            with ext_bot.request_scheduler.use_priority(RequestPriority.BULK):
+                await ext_bot.get_me()
+            await ext_bot.get_updates()
+
+            assert request.endpoints == ["getMe", "getMe", "getUpdates"]
+            # getUpdates is never scheduled
+            assert priorities == [
+                ("getMe", RequestPriority.NORMAL),
+                ("getMe", RequestPriority.BULK),
+            ]
+            if rate_limiter:
+                assert rate_limited == ["getMe", "getMe"]
+
+    async def test_ext_bot_rate_limiter_holds_no_slot(self, bot):
+        release = asyncio.Event()
+
+        class BlockingRateLimiter(BaseRateLimiter):
+            async def initialize(self):
+                pass
+
+            async def shutdown(self):
+                pass
+
+            async def process_request(self, callback, args, kwargs, rate_limit_args, **_kwargs):
+                if rate_limit_args == "block":
+                    await release.wait()
+                return await callback(*args, **kwargs)
+
+        request = RecordingRequest()
+        ext_bot = ExtBot(
+            token=bot.token,
+            request=request,
+            rate_limiter=BlockingRateLimiter(),
+            request_scheduler=RequestScheduler(max_concurrent_requests=1),
+        )
+        with ext_bot.request_scheduler.use_priority(RequestPriority.BULK):
+            blocked = asyncio.create_task(ext_bot.get_me(rate_limit_args="block"))
+        await asyncio.sleep(0.01)
+
+        # The request waiting in the rate limiter does not occupy the only slot
+        await asyncio.wait_for(ext_bot.get_me(), 1)
+        assert request.endpoints == ["getMe"]
+
+        release.set()
+        await blocked
+        assert request.endpoints == ["getMe", "getMe"]
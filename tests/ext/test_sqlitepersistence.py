@@ -0,0 +1,264 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import asyncio
+import datetime as dtm
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from telegram import Chat, Message, User
+from telegram.ext import ContextTypes, PersistenceInput, SQLitePersistence
+from tests.auxil.slots import mro_slots
+
+
+@pytest.fixture
+def filepath(tmp_path):
+    return tmp_path / "persistence.sqlite"
+
+
+@pytest.fixture
+def persistence(filepath):
+    return SQLitePersistence(filepath)
+
+
+@pytest.fixture
+def callback_data():
+    return [("test1", 1000.0, {"button1": "test0", "button2": "test1"})], {"test1": "test2"}
+
+
+async def fill(persistence, callback_data):
+    await asyncio.gather(
+        persistence.update_user_data(12345, {"test1": "test2", "test3": {"test4": "test5"}}),
+        persistence.update_user_data(67890, {3: "test4"}),
+        persistence.update_chat_data(-12345, {"test1": "test2"}),
+        persistence.update_chat_data(-67890, {3: "test4"}),
+        persistence.update_bot_data({"test1": "test2", "test3": {"test4": "test5"}}),
+        persistence.update_callback_data(callback_data),
+        persistence.update_conversation("name1", (123, 123), 3),
+        persistence.update_conversation("name1", (456, "654"), 4),
+        persistence.update_conversation("name2", (123, 321), 1),
+    )
+
+
+class TestSQLitePersistence:
+    """Just tests the SQLitePersistence interface. Integration of persistence into Application
+    is tested in TestBasePersistence!"""
+
+    async def test_slot_behaviour(self, persistence):
+        inst = persistence
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    async def test_no_database_present(self, persistence, filepath):
+        assert await persistence.get_user_data() == {}
+        assert await persistence.get_chat_data() == {}
+        assert await persistence.get_bot_data() == {}
+        assert await persistence.get_callback_data() is None
+        assert await persistence.get_conversations("noname") == {}
+        assert filepath.is_file()
+
+    @pytest.mark.parametrize("filepath_type", [str, Path])
+    async def test_round_trip(self, filepath, filepath_type, callback_data):
+        persistence = SQLitePersistence(filepath_type(filepath))
+        await fill(persistence, callback_data)
+        await persistence.flush()
+
+        persistence = SQLitePersistence(filepath)
+        assert await persistence.get_user_data() == {
+            12345: {"test1": "test2", "test3": {"test4": "test5"}},
+            67890: {3: "test4"},
+        }
+        assert await persistence.get_chat_data() == {
+            -12345: {"test1": "test2"},
+            -67890: {3: "test4"},
+        }
+        assert await persistence.get_bot_data() == {"test1": "test2", "test3": {"test4": "test5"}}
+        assert await persistence.get_callback_data() == callback_data
+        assert await persistence.get_conversations("name1") == {(123, 123): 3, (456, "654"): 4}
+        assert await persistence.get_conversations("name2") == {(123, 321): 1}
+
+    async def test_updating_and_dropping(self, persistence, callback_data):
+        await fill(persistence, callback_data)
+
+        await persistence.update_user_data(12345, {"new": "data"})
+        await persistence.drop_user_data(67890)
+        await persistence.drop_chat_data(-12345)
+        await persistence.update_conversation("name1", (123, 123), None)
+        await persistence.update_conversation("name2", (123, 321), 5)
+        await persistence.update_bot_data({"new": "bot_data"})
+
+        # Dropping data that does not exist is fine
+        await persistence.drop_user_data(1)
+        await persistence.drop_chat_data(1)
+        await persistence.update_conversation("name3", (1, 1), None)
+
+        persistence = SQLitePersistence(persistence.filepath)
+        assert await persistence.get_user_data() == {12345: {"new": "data"}}
+        assert await persistence.get_chat_data() == {-67890: {3: "test4"}}
+        assert await persistence.get_bot_data() == {"new": "bot_data"}
+        assert await persistence.get_conversations("name1") == {(456, "654"): 4}
+        assert await persistence.get_conversations("name2") == {(123, 321): 5}
+        assert await persistence.get_conversations("name3") == {}
+
+    async def test_get_data_entry(self, filepath, callback_data):
+        persistence = SQLitePersistence(filepath, lazy_loading=True, max_cached_entries=10)
+        assert persistence.lazy_loading
+        assert persistence.max_cached_entries == 10
+        await fill(persistence, callback_data)
+
+        assert await persistence.get_user_data_entry(67890) == {3: "test4"}
+        assert await persistence.get_user_data_entry(1) is None
+        assert await persistence.get_chat_data_entry(-12345) == {"test1": "test2"}
+        assert await persistence.get_chat_data_entry(1) is None
+
+        await persistence.drop_user_data(67890)
+        assert await persistence.get_user_data_entry(67890) is None
+
+    async def test_wal_mode_and_indexed_tables(self, persistence, filepath, callback_data):
+        await fill(persistence, callback_data)
+
+        with sqlite3.connect(filepath) as connection:
+            assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+            plan = connection.execute(
+                "EXPLAIN QUERY PLAN DELETE FROM user_data WHERE id = 1"
+            ).fetchall()
+            assert "USING INTEGER PRIMARY KEY" in plan[0][-1]
+            plan = connection.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM conversations WHERE name = 'a' AND key = 'b'"
+            ).fetchall()
+            assert "USING PRIMARY KEY" in plan[0][-1]
+        await persistence.flush()
+
+    async def test_batched_writes(self, persistence, monkeypatch, callback_data):
+        transactions = []
+        write_pending = SQLitePersistence._write_pending
+
+        def _write_pending(self, pending):
+            transactions.append(dict(pending))
+            write_pending(self, pending)
+
+        monkeypatch.setattr(SQLitePersistence, "_write_pending", _write_pending)
+
+        await fill(persistence, callback_data)
+        assert len(transactions) == 1
+        assert len(transactions[0]) == 9
+
+        # Data is pickled when the update is requested, not when it's written
+        data = {"key": "value"}
+        task = asyncio.create_task(persistence.update_user_data(1, data))
+        await asyncio.sleep(0)
+        data["key"] = "changed"
+        await task
+        assert len(transactions) == 2
+        assert (await persistence.get_user_data())[1] == {"key": "value"}
+
+    async def test_failed_write_is_retried(self, persistence, monkeypatch):
+        write_pending = SQLitePersistence._write_pending
+
+        def _write_pending(self, pending):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(SQLitePersistence, "_write_pending", _write_pending)
+        results = await asyncio.gather(
+            persistence.update_user_data(1, {"a": 1}),
+            persistence.update_user_data(2, {"b": 2}),
+            return_exceptions=True,
+        )
+        # The failure is reported only once
+        assert isinstance(results[0], sqlite3.OperationalError)
+        assert results[1] is None
+
+        monkeypatch.setattr(SQLitePersistence, "_write_pending", write_pending)
+        await persistence.update_user_data(2, {"b": 3})
+        assert await persistence.get_user_data() == {1: {"a": 1}, 2: {"b": 3}}
+
+    async def test_transaction_is_rolled_back(self, persistence):
+        await persistence.update_user_data(1, {"a": 1})
+        with pytest.raises(sqlite3.IntegrityError, match="datatype mismatch"):
+            persistence._write_pending(
+                {("user_data", (2,)): b"data", ("user_data", ("not an id",)): b"data"}
+            )
+        assert await persistence.get_user_data() == {1: {"a": 1}}
+
+    async def test_no_write_if_data_did_not_change(self, persistence, monkeypatch, callback_data):
+        await persistence.update_bot_data({"test": "data"})
+        await persistence.update_callback_data(callback_data)
+
+        def _write_pending(self, pending):
+            pytest.fail("Unchanged data should not be written")
+
+        monkeypatch.setattr(SQLitePersistence, "_write_pending", _write_pending)
+        await persistence.update_bot_data({"test": "data"})
+        await persistence.update_callback_data(callback_data)
+
+    async def test_flush(self, persistence, filepath):
+        await persistence.update_user_data(1, {"a": 1})
+        assert Path(f"{filepath}-wal").is_file()
+        await persistence.flush()
+        assert persistence._connection is None
+        assert not Path(f"{filepath}-wal").is_file()
+        # flushing twice is fine
+        await persistence.flush()
+
+        # The connection is reopened
+        await persistence.update_user_data(2, {"b": 2})
+        assert await persistence.get_user_data() == {1: {"a": 1}, 2: {"b": 2}}
+        await persistence.flush()
+
+    async def test_bot_is_replaced(self, persistence, cdc_bot):
+        persistence.set_bot(cdc_bot)
+        user = User(1, "first", False)
+        user.set_bot(cdc_bot)
+        message = Message(1, dtm.datetime.now(), Chat(1, "private"), from_user=user)
+        message.set_bot(cdc_bot)
+        await persistence.update_chat_data(1, {"message": message})
+
+        persistence = SQLitePersistence(persistence.filepath)
+        persistence.set_bot(cdc_bot)
+        restored = (await persistence.get_chat_data())[1]["message"]
+        assert restored == message
+        assert restored.get_bot() is cdc_bot
+        assert restored.from_user.get_bot() is cdc_bot
+
+    @pytest.mark.parametrize("ud", [int, float, complex])
+    @pytest.mark.parametrize("bd", [int, float, complex])
+    async def test_with_context_types(self, filepath, ud, bd):
+        cc = ContextTypes(user_data=ud, bot_data=bd)
+        persistence = SQLitePersistence(filepath, context_types=cc)
+
+        assert isinstance(await persistence.get_bot_data(), bd)
+        assert await persistence.get_bot_data() == 0
+
+        await persistence.update_user_data(1, ud(1))
+        await persistence.update_bot_data(bd(1))
+        await persistence.flush()
+
+        persistence = SQLitePersistence(filepath, context_types=cc)
+        assert isinstance((await persistence.get_user_data())[1], ud)
+        assert (await persistence.get_user_data())[1] == 1
+        assert isinstance(await persistence.get_bot_data(), bd)
+        assert await persistence.get_bot_data() == 1
+
+    async def test_store_data(self, filepath):
+        store_data = PersistenceInput(bot_data=False, callback_data=False)
+        persistence = SQLitePersistence(filepath, store_data=store_data, update_interval=10)
+        assert persistence.store_data is store_data
+        assert persistence.update_interval == 10
@@ -287,6 +287,30 @@ class TestUpdater:
         assert self.message_count == 4
         assert self.received == [1, 2, 3, 4]
 
+    async def test_polling_bounded_update_queue(self, monkeypatch, updater):
+        # The batch is larger than the update queue, so enqueuing has to wait for the consumer
+        batches = [[Update(update_id=i) for i in range(1, 6)]]
+
+        async def get_updates(*args, **kwargs):
+            if batches:
+                return batches.pop()
+            await asyncio.sleep(0.1)
+            return []
+
+        monkeypatch.setattr(updater.bot, "get_updates", get_updates)
+        monkeypatch.setattr(updater.bot, "delete_webhook", return_true)
+        bounded_updater = Updater(bot=updater.bot, update_queue=asyncio.Queue(maxsize=2))
+
+        async with bounded_updater:
+            await bounded_updater.start_polling()
+            received = [
+                (await asyncio.wait_for(bounded_updater.update_queue.get(), 1)).update_id
+                for _ in range(5)
+            ]
+            await bounded_updater.stop()
+
+        assert received == [1, 2, 3, 4, 5]
+
     async def test_polling_mark_updates_as_read(self, monkeypatch, updater, caplog):
         updates = asyncio.Queue()
         max_update_id = 3
@@ -1013,6 +1037,27 @@ class TestUpdater:
             updater.bot.callback_data_cache.clear_callback_data()
             updater.bot.callback_data_cache.clear_callback_queries()
 
+    async def test_webhook_lazy_updates(self, monkeypatch, bot_info):
+        async with make_bot(bot_info, lazy_updates=True) as lazy_bot:
+            updater = Updater(bot=lazy_bot, update_queue=asyncio.Queue())
+            monkeypatch.setattr(updater.bot, "set_webhook", return_true)
+
+            ip = "127.0.0.1"
+            port = randrange(1024, 49152)  # Select random port
+
+            async with updater:
+                await updater.start_webhook(ip, port, url_path="TOKEN")
+                update = make_message_update(message="test_webhook_lazy_updates")
+                await send_webhook_message(ip, port, update.to_json(), "TOKEN")
+                received_update = await updater.update_queue.get()
+
+                assert received_update._lazy_data == {"message": update.message.to_dict()}
+                assert received_update.message == update.message
+                assert received_update.message.text == "test_webhook_lazy_updates"
+                assert not received_update._lazy_data
+
+                await updater.stop()
+
     async def test_webhook_invalid_ssl(self, monkeypatch, updater):
 
         ip = "127.0.0.1"
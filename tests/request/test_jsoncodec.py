@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+#
+# A library that provides a Python interface to the Telegram Bot API
+# Copyright (C) 2015-2024
+# Leandro Toledo de Souza <devs@python-telegram-bot.org>
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser Public License for more details.
+#
+# You should have received a copy of the GNU Lesser Public License
+# along with this program.  If not, see [http://www.gnu.org/licenses/].
+import json
+
+import pytest
+
+from telegram.request import JSONCodec
+from tests.auxil.slots import mro_slots
+
+
+class TestJSONCodecWithoutRequest:
+    def test_slot_behaviour(self):
+        inst = JSONCodec()
+        for attr in inst.__slots__:
+            assert getattr(inst, attr, "err") != "err", f"got extra slot '{attr}'"
+        assert len(mro_slots(inst)) == len(set(mro_slots(inst))), "duplicate slot"
+
+    @pytest.mark.parametrize(
+        "obj", [1, "string", None, [1, "1"], {"a": [True, 1.5]}, {1: {"key": "value"}}]
+    )
+    def test_dumps(self, obj):
+        assert JSONCodec().dumps(obj) == json.dumps(obj)
+        assert JSONCodec().dumpb(obj) == json.dumps(obj).encode()
+
+    @pytest.mark.parametrize("data", ['{"a": [1, "b"]}', b'{"a": [1, "b"]}'])
+    def test_loads(self, data):
+        assert JSONCodec().loads(data) == {"a": [1, "b"]}
+
+    def test_loads_invalid_utf8(self):
+        assert JSONCodec().loads(b'{"a": "b\xff"}') == {"a": "b�"}
+
+    def test_loads_invalid_json(self):
+        with pytest.raises(ValueError, match="Expecting"):
+            JSONCodec().loads(b"{invalid")
+
+    def test_dumpb_uses_dumps(self):
+        class Codec(JSONCodec):
+            def dumps(self, obj):
+                return "custom"
+
+        assert Codec().dumpb({"a": 1}) == b"custom"
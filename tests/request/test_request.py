@@ -33,6 +33,7 @@ from httpx import AsyncHTTPTransport
 
 from telegram import InputFile
 from telegram._utils.defaultvalue import DEFAULT_NONE
+from telegram._utils.files import parse_file_input
 from telegram._utils.strings import TextEncoding
 from telegram.error import (
     BadRequest,
@@ -45,7 +46,7 @@ from telegram.error import (
     TelegramError,
     TimedOut,
 )
-from telegram.request import BaseRequest, RequestData
+from telegram.request import BaseRequest, JSONCodec, RequestData
 from telegram.request._httpxrequest import HTTPXRequest
 from telegram.request._requestparameter import RequestParameter
 from telegram.warnings import PTBDeprecationWarning
@@ -213,6 +214,37 @@ class TestRequestWithoutRequest:
         # Explicitly call `parse_json_payload` here is well so that this public method is covered
         # not only implicitly.
         assert httpx_request.parse_json_payload(server_response) == {"result": "test_string�"}
+        assert BaseRequest.parse_json_payload(server_response) == {"result": "test_string�"}
+
+    async def test_json_codec(self, monkeypatch):
+        class Codec(JSONCodec):
+            def loads(self, data):
+                assert isinstance(data, bytes)
+                return {"result": "custom"}
+
+        codec = Codec()
+        async with NonchalantHttpxRequest(json_codec=codec) as httpx_request:
+            assert httpx_request.json_codec is codec
+            monkeypatch.setattr(httpx_request, "do_request", mocker_factory(response=b"{}"))
+            assert await httpx_request.post(None, None, None) == "custom"
+
+        assert isinstance(NonchalantHttpxRequest().json_codec, JSONCodec)
+
+    async def test_parse_json_payload_override(self, monkeypatch):
+        # Overriding parse_json_payload takes precedence over json_codec, as it did before
+        # json_codec was added
+        class Codec(JSONCodec):
+            def loads(self, data):
+                raise AssertionError("Must not be called")
+
+        class Request(NonchalantHttpxRequest):
+            @staticmethod
+            def parse_json_payload(payload):
+                return {"result": "override"}
+
+        async with Request(json_codec=Codec()) as httpx_request:
+            monkeypatch.setattr(httpx_request, "do_request", mocker_factory(response=b"{}"))
+            assert await httpx_request.post(None, None, None) == "override"
 
     async def test_illegal_json_response(self, monkeypatch, httpx_request: HTTPXRequest, caplog):
         # for proper JSON it should be `"result":` instead of `result:`
@@ -404,6 +436,47 @@ class TestRequestWithoutRequest:
         with pytest.raises(NotImplementedError):
             SimpleRequest().read_timeout
 
+    @pytest.mark.parametrize(
+        ("offset", "length", "expected"),
+        [(0, None, b"0123456789"), (3, None, b"3456789"), (3, 4, b"3456"), (8, 5, b"89")],
+    )
+    async def test_retrieve_stream_default(self, offset, length, expected):
+        class SimpleRequest(BaseRequest):
+            async def do_request(self_, *args, **kwargs):
+                self.test_flag = kwargs
+                return HTTPStatus.OK, b"0123456789"
+
+            async def initialize(self) -> None:
+                pass
+
+            async def shutdown(self) -> None:
+                pass
+
+        chunks = [
+            chunk
+            async for chunk in SimpleRequest().retrieve_stream(
+                "url", offset=offset, length=length, read_timeout=1
+            )
+        ]
+        assert b"".join(chunks) == expected
+        assert self.test_flag["method"] == "GET"
+        assert self.test_flag["read_timeout"] == 1
+
+    async def test_retrieve_stream_error(self):
+        class CustomRequest(BaseRequest):
+            async def do_request(self, *args, **kwargs):
+                return HTTPStatus.FORBIDDEN, b'{"description": "Test Message", "ok": false}'
+
+            async def initialize(self) -> None:
+                pass
+
+            async def shutdown(self) -> None:
+                pass
+
+        with pytest.raises(Forbidden, match="Test Message"):
+            async for _ in CustomRequest().retrieve_stream("url"):
+                pass
+
     @pytest.mark.parametrize("media", [True, False])
     async def test_timeout_propagation_write_timeout(
         self, monkeypatch, media, input_media_photo, recwarn  # noqa: F811
@@ -726,6 +799,274 @@ class TestHTTPXRequestWithoutRequest:
 
             assert exc_info.value.__cause__ is pool_timeout
 
+    async def test_do_request_streams_file_handles(self):
+        read_sizes = []
+        received_bodies = []
+        source_file = data_file("telegram.mp4")
+
+        class RecordingReader:
+            def __init__(self):
+                self.file = source_file.open("rb")
+
+            def read(self, size=-1):
+                read_sizes.append(size)
+                return self.file.read(size)
+
+            def seek(self, *args):
+                return self.file.seek(*args)
+
+            def tell(self):
+                return self.file.tell()
+
+            def fileno(self):
+                return self.file.fileno()
+
+        async def handler(request):
+            received_bodies.append(await request.aread())
+            return httpx.Response(HTTPStatus.OK)
+
+        file_handle = RecordingReader()
+        request_data = RequestData(
+            [
+                RequestParameter.from_input(
+                    "video", InputFile(file_handle, filename="video.mp4", read_file_handle=False)
+                )
+            ]
+        )
+        async with HTTPXRequest(
+            httpx_kwargs={"transport": httpx.MockTransport(handler)}
+        ) as httpx_request:
+            # Sending twice makes sure that retrying a request uploads the whole file again
+            for _ in range(2):
+                await httpx_request.do_request(
+                    method="POST", url="https://example.com", request_data=request_data
+                )
+        file_handle.file.close()
+
+        content = source_file.read_bytes()
+        assert len(received_bodies) == 2
+        assert all(content in body for body in received_bodies)
+        # The file is never read at once but in chunks
+        assert -1 not in read_sizes
+        assert max(read_sizes) < len(content)
+
+    @pytest.mark.parametrize("supports_range", [True, False])
+    async def test_do_stream_request(self, supports_range):
+        content = bytes(range(256)) * 1024
+        range_headers = []
+
+        async def handler(request):
+            range_headers.append(request.headers.get("Range"))
+            if supports_range and request.headers.get("Range"):
+                start, end = request.headers["Range"].removeprefix("bytes=").split("-")
+                end = int(end) + 1 if end else len(content)
+                return httpx.Response(
+                    HTTPStatus.PARTIAL_CONTENT, content=content[int(start) : end]
+                )
+            return httpx.Response(HTTPStatus.OK, content=content)
+
+        async with HTTPXRequest(
+            httpx_kwargs={"transport": httpx.MockTransport(handler)}
+        ) as httpx_request:
+            for offset, length in [(0, None), (1000, None), (1000, 5000)]:
+                data = b""
+                async for chunk in httpx_request.retrieve_stream(
+                    "https://example.com", offset=offset, length=length
+                ):
+                    data += chunk
+                end = None if length is None else offset + length
+                assert data == content[offset:end]
+                assert httpx_request._connection_pool.active == 0
+
+        assert range_headers == [None, "bytes=1000-", "bytes=1000-5999"]
+
+    async def test_do_stream_request_timeout(self):
+        async def handler(request):
+            raise httpx.ReadTimeout("read timeout")
+
+        async with HTTPXRequest(
+            httpx_kwargs={"transport": httpx.MockTransport(handler)}
+        ) as httpx_request:
+            with pytest.raises(TimedOut):
+                async for _ in httpx_request.retrieve_stream("https://example.com"):
+                    pass
+            assert httpx_request._connection_pool.active == 0
+
+    async def test_request_closes_local_files(self, monkeypatch):
+        source_file = data_file("telegram.mp4")
+        received_bodies = []
+
+        async def handler(request):
+            received_bodies.append(await request.aread())
+            return httpx.Response(HTTPStatus.OK, json={"ok": True, "result": True})
+
+        input_file = parse_file_input(source_file)
+        request_data = RequestData([RequestParameter.from_input("video", input_file)])
+        async with HTTPXRequest(
+            httpx_kwargs={"transport": httpx.MockTransport(handler)}
+        ) as httpx_request:
+            # The file is reopened for each request and closed after it
+            for _ in range(2):
+                await httpx_request.post(url="https://example.com", request_data=request_data)
+                assert input_file.input_file_content.closed
+
+            async def do_request(*args, **kwargs):
+                input_file.input_file_content.read(10)
+                raise httpx.ReadError("read error")
+
+            monkeypatch.setattr(httpx_request, "do_request", do_request)
+            with pytest.raises(NetworkError):
+                await httpx_request.post(url="https://example.com", request_data=request_data)
+            assert input_file.input_file_content.closed
+
+        content = source_file.read_bytes()
+        assert len(received_bodies) == 2
+        assert all(content in body for body in received_bodies)
+
+    def test_max_connection_pool_size(self):
+        request = HTTPXRequest(connection_pool_size=2, max_connection_pool_size=5)
+        assert request._client_kwargs["limits"] == httpx.Limits(
+            max_connections=5, max_keepalive_connections=5
+        )
+        statistics = request.pool_statistics
+        assert statistics["size"] == 2
+        assert statistics["min_size"] == 2
+        assert statistics["max_size"] == 5
+
+        with pytest.raises(ValueError, match="must not be smaller than `connection_pool_size`"):
+            HTTPXRequest(connection_pool_size=2, max_connection_pool_size=1)
+
+    async def test_pool_statistics(self, monkeypatch):
+        async def request(_, **kwargs):
+            assert httpx_request.pool_statistics["active"] == 1
+            return httpx.Response(HTTPStatus.OK)
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", request)
+
+        async with HTTPXRequest() as httpx_request:
+            await httpx_request.do_request(method="GET", url="URL")
+            await httpx_request.do_request(method="GET", url="URL")
+            statistics = httpx_request.pool_statistics
+
+        assert statistics["size"] == statistics["min_size"] == statistics["max_size"] == 1
+        assert statistics["active"] == 0
+        assert statistics["waiting"] == 0
+        assert statistics["idle"] == 0
+        assert statistics["requests"] == 2
+        # Wait times are only recorded for adaptive pools
+        assert set(statistics["wait_times"].values()) == {0}
+
+    async def test_adaptive_pool_grows_and_shrinks(self, monkeypatch):
+        active = 0
+        max_active = 0
+
+        async def request(_, **kwargs):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.2)
+            active -= 1
+            return httpx.Response(HTTPStatus.OK)
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", request)
+
+        async with HTTPXRequest(
+            connection_pool_size=1, max_connection_pool_size=3, pool_timeout=None
+        ) as httpx_request:
+            httpx_request._connection_pool.shrink_interval = 0.3
+            tasks = [
+                asyncio.create_task(httpx_request.do_request(method="GET", url="URL"))
+                for _ in range(5)
+            ]
+            await asyncio.sleep(0.01)
+            assert httpx_request.pool_statistics["waiting"] == 4
+            await asyncio.gather(*tasks)
+
+            statistics = httpx_request.pool_statistics
+            assert max_active == 3
+            assert statistics["size"] == 3
+            assert statistics["requests"] == 5
+            assert statistics["waiting"] == 0
+            assert sum(statistics["wait_times"].values()) == 5
+            assert statistics["wait_times"][0.001] == 1
+
+            # With less load, the pool shrinks again
+            for _ in range(3):
+                await asyncio.sleep(0.2)
+                await httpx_request.do_request(method="GET", url="URL")
+            assert httpx_request.pool_statistics["size"] == 1
+
+    async def test_adaptive_pool_timeout(self, monkeypatch):
+        async def request(_, **kwargs):
+            await asyncio.sleep(0.2)
+            return httpx.Response(HTTPStatus.OK)
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", request)
+
+        # The pool timeout is shorter than the time after which the pool grows
+        async with HTTPXRequest(
+            connection_pool_size=1, max_connection_pool_size=2, pool_timeout=0.02
+        ) as httpx_request:
+            results = await asyncio.gather(
+                httpx_request.do_request(method="GET", url="URL"),
+                httpx_request.do_request(method="GET", url="URL"),
+                return_exceptions=True,
+            )
+            assert results[0] == (HTTPStatus.OK, b"")
+            assert isinstance(results[1], TimedOut)
+            assert "Pool timeout" in str(results[1])
+            assert httpx_request.pool_statistics["active"] == 0
+
+    async def test_adaptive_pool_remaining_pool_timeout(self, monkeypatch):
+        pool_timeouts = []
+
+        async def request(_, **kwargs):
+            pool_timeouts.append(kwargs["timeout"].pool)
+            await asyncio.sleep(0.2)
+            return httpx.Response(HTTPStatus.OK)
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", request)
+
+        async with HTTPXRequest(
+            connection_pool_size=1, max_connection_pool_size=2, pool_timeout=1
+        ) as httpx_request:
+            httpx_request._connection_pool.grow_after = 10
+            await asyncio.gather(
+                httpx_request.do_request(method="GET", url="URL"),
+                httpx_request.do_request(method="GET", url="URL"),
+            )
+
+        # The time spent waiting for our pool is deducted from the pool timeout of httpx
+        assert pool_timeouts[0] == 1
+        assert 0 < pool_timeouts[1] <= 0.85
+
+    async def test_adaptive_pool_waiting_cancelled(self, monkeypatch):
+        async def request(_, **kwargs):
+            await asyncio.sleep(0.2)
+            return httpx.Response(HTTPStatus.OK)
+
+        monkeypatch.setattr(httpx.AsyncClient, "request", request)
+
+        async with HTTPXRequest(
+            connection_pool_size=1, max_connection_pool_size=2, pool_timeout=None
+        ) as httpx_request:
+            pool = httpx_request._connection_pool
+            pool.grow_after = 10
+            tasks = [
+                asyncio.create_task(httpx_request.do_request(method="GET", url="URL"))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0.01)
+            assert pool.waiting == 2
+            tasks[1].cancel()
+            await asyncio.sleep(0.01)
+            assert pool.waiting == 1
+
+            await asyncio.gather(tasks[0], tasks[2])
+            assert pool.waiting == 0
+            assert pool.active == 0
+            assert not any(not waiter.done() for waiter in pool._waiters)
+
     @pytest.mark.parametrize("media", [True, False])
     async def test_do_request_write_timeout(
         self, monkeypatch, media, httpx_request, input_media_photo, recwarn  # noqa: F811
@@ -23,7 +23,7 @@ from urllib.parse import quote
 import pytest
 
 from telegram import InputFile, InputMediaPhoto, InputMediaVideo, MessageEntity
-from telegram.request import RequestData
+from telegram.request import JSONCodec, RequestData
 from telegram.request._requestparameter import RequestParameter
 from tests.auxil.files import data_file
 from tests.auxil.slots import mro_slots
@@ -182,6 +182,25 @@ class TestRequestDataWithoutRequest:
         assert file_rqs.json_payload == json.dumps(file_jsons).encode()
         assert mixed_rqs.json_payload == json.dumps(mixed_jsons).encode()
 
+    def test_json_codec(self, simple_params):
+        class Codec(JSONCodec):
+            def dumps(self, obj):
+                return f"dumps {obj!r}"
+
+            def dumpb(self, obj):
+                return b"dumpb"
+
+        codec = Codec()
+        rqs = RequestData(
+            [RequestParameter.from_input(key, value) for key, value in simple_params.items()],
+            json_codec=codec,
+        )
+        assert rqs.json_codec is codec
+        assert rqs.json_parameters["string"] == "string"
+        assert rqs.json_parameters["integer"] == "dumps 1"
+        assert rqs.json_payload == b"dumpb"
+        assert isinstance(RequestData().json_codec, JSONCodec)
+
     def test_multipart_data(
         self,
         simple_rqs,
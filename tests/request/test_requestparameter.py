@@ -23,6 +23,7 @@ import pytest
 
 from telegram import InputFile, InputMediaPhoto, InputMediaVideo, InputSticker, MessageEntity
 from telegram.constants import ChatType
+from telegram.request import JSONCodec
 from telegram.request._requestparameter import RequestParameter
 from tests.auxil.files import data_file
 from tests.auxil.slots import mro_slots
@@ -62,6 +63,15 @@ class TestRequestParameterWithoutRequest:
         request_parameter = RequestParameter("name", value, None)
         assert request_parameter.json_value == expected
 
+    @pytest.mark.parametrize(("value", "expected"), [(1, "custom"), ("one", "one"), (None, None)])
+    def test_encode_json_value(self, value, expected):
+        class Codec(JSONCodec):
+            def dumps(self, obj):
+                return "custom"
+
+        request_parameter = RequestParameter("name", value, None)
+        assert request_parameter.encode_json_value(Codec()) == expected
+
     def test_multiple_multipart_data(self):
         assert RequestParameter("name", "value", []).multipart_data is None
 
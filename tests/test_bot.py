@@ -93,7 +93,7 @@ from telegram.constants import (
 from telegram.error import BadRequest, EndPointNotFound, InvalidToken
 from telegram.ext import ExtBot, InvalidCallbackData
 from telegram.helpers import escape_markdown
-from telegram.request import BaseRequest, HTTPXRequest, RequestData
+from telegram.request import BaseRequest, HTTPXRequest, JSONCodec, RequestData
 from telegram.warnings import PTBDeprecationWarning, PTBUserWarning
 from tests.auxil.bot_method_checks import check_defaults_handling
 from tests.auxil.ci_bots import FALLBACKS
@@ -510,7 +510,17 @@ class TestBotWithoutRequest:
         # Some methods of ext.ExtBot
         global_extra_args = {"rate_limit_args"}
         extra_args_per_method = defaultdict(
-            set, {"__init__": {"arbitrary_callback_data", "defaults", "rate_limiter"}}
+            set,
+            {
+                "__init__": {
+                    "arbitrary_callback_data",
+                    "defaults",
+                    "intern_objects",
+                    "lazy_updates",
+                    "rate_limiter",
+                    "request_scheduler",
+                }
+            },
         )
         different_hints_per_method = defaultdict(set, {"__setattr__": {"ext_bot"}})
 
@@ -572,6 +582,117 @@ class TestBotWithoutRequest:
         )
         assert caplog.records[0].exc_info[0] is AttributeError
 
+    async def test_get_updates_lazy(self, offline_bot, monkeypatch):
+        message = Message(
+            1,
+            dtm.datetime.utcnow(),
+            Chat(1, ""),
+            from_user=User(1, "", False),
+            text="text",
+        )
+
+        async def post(*args, **kwargs):
+            return [Update(17, message=message).to_dict()]
+
+        monkeypatch.setattr(BaseRequest, "post", post)
+
+        lazy_bot = PytestExtBot(token=offline_bot.token, lazy_updates=True)
+        assert lazy_bot.lazy_updates is True
+        updates = await lazy_bot.get_updates()
+
+        assert len(updates) == 1
+        assert updates[0].update_id == 17
+        assert "message" in updates[0]._lazy_data
+        assert updates[0].message == message
+        assert updates[0].message.from_user == message.from_user
+        assert updates[0].message.get_bot() is lazy_bot
+        assert "message" not in updates[0]._lazy_data
+
+    async def test_json_codec_passed_to_request_data(self, offline_bot, monkeypatch):
+        json_codec = JSONCodec()
+        request = HTTPXRequest(json_codec=json_codec)
+
+        async def post(*args, **kwargs):
+            assert kwargs["request_data"].json_codec is json_codec
+            return True
+
+        monkeypatch.setattr(BaseRequest, "post", post)
+        test_bot = Bot(offline_bot.token, request=request)
+        assert await test_bot.delete_webhook()
+
+    @pytest.mark.filterwarnings("ignore::telegram.warnings.PTBUserWarning")
+    async def test_endpoint_specific_requests(self, offline_bot, monkeypatch):
+        used_requests = []
+
+        async def post(self_, url, *args, **kwargs):
+            used_requests.append(self_)
+            return [] if url.endswith("getUpdates") else True
+
+        monkeypatch.setattr(BaseRequest, "post", post)
+        request = HTTPXRequest()
+        get_updates_request = HTTPXRequest()
+        media_request = HTTPXRequest()
+        interactive_request = HTTPXRequest()
+        test_bot = Bot(
+            offline_bot.token,
+            request=request,
+            get_updates_request=get_updates_request,
+            media_request=media_request,
+            interactive_request=interactive_request,
+        )
+
+        await test_bot.get_updates()
+        await test_bot.do_api_request("deleteWebhook")
+        await test_bot.do_api_request("answerCallbackQuery", {"callback_query_id": "1"})
+        # Only requests that actually upload files use the media request
+        await test_bot.do_api_request("sendDocument", {"chat_id": 1, "document": "file_id"})
+        await test_bot.do_api_request(
+            "sendDocument",
+            {"chat_id": 1, "document": InputFile(data_file("telegram.png").read_bytes())},
+        )
+        assert used_requests == [
+            get_updates_request,
+            request,
+            interactive_request,
+            request,
+            media_request,
+        ]
+
+    @pytest.mark.filterwarnings("ignore::telegram.warnings.PTBUserWarning")
+    async def test_endpoint_specific_requests_init_and_default(self, offline_bot, monkeypatch):
+        received = defaultdict(int)
+
+        async def initialize(self_):
+            received[self_] += 1
+
+        async def get_me(*args, **kwargs):
+            return offline_bot.bot
+
+        monkeypatch.setattr(HTTPXRequest, "initialize", initialize)
+        test_bot = PytestBot(
+            offline_bot.token, media_request=HTTPXRequest(), interactive_request=HTTPXRequest()
+        )
+        monkeypatch.setattr(test_bot, "get_me", get_me)
+        await test_bot.initialize()
+        assert len(received) == 4
+        assert set(received.values()) == {1}
+
+        # Without endpoint specific requests, the default request object is used
+        used_requests = []
+
+        async def post(self_, *args, **kwargs):
+            used_requests.append(self_)
+            return True
+
+        monkeypatch.setattr(BaseRequest, "post", post)
+        test_bot = PytestBot(offline_bot.token)
+        await test_bot.do_api_request("answerCallbackQuery", {"callback_query_id": "1"})
+        await test_bot.do_api_request(
+            "sendDocument",
+            {"chat_id": 1, "document": InputFile(data_file("telegram.png").read_bytes())},
+        )
+        assert used_requests == [test_bot.request, test_bot.request]
+
     async def test_answer_web_app_query(self, offline_bot, raw_bot, monkeypatch):
         params = False
 
@@ -1841,6 +1962,29 @@ class TestBotWithoutRequest:
             assert warning.filename == __file__, "wrong stacklevel!"
             assert warning.category is PTBUserWarning
 
+    @pytest.mark.parametrize("bot_class", [Bot, ExtBot])
+    async def test_http2_runtime_error_endpoint_specific_requests(self, recwarn, bot_class):
+        request = HTTPXRequest(http_version="2")
+        bot_class("12345:ABCDE", base_url="http://", interactive_request=request)
+        bot_class(
+            "12345:ABCDE",
+            base_url="http://",
+            request=request,
+            get_updates_request=HTTPXRequest(http_version="2"),
+            media_request=HTTPXRequest(http_version="2"),
+        )
+        assert len(recwarn) == 2
+        assert "You set the HTTP version for the interactive_request HTTPXRequest instance" in str(
+            recwarn[0].message
+        )
+        assert (
+            "You set the HTTP version for the get_updates_request, request and media_request "
+            "HTTPXRequest instance" in str(recwarn[1].message)
+        )
+        for warning in recwarn:
+            assert warning.filename == __file__, "wrong stacklevel!"
+            assert warning.category is PTBUserWarning
+
     async def test_set_get_my_name(self, offline_bot, monkeypatch):
         """We only test that we pass the correct values to TG since this endpoint is heavily
         rate limited which makes automated tests rather infeasible."""
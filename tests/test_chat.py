@@ -28,6 +28,7 @@ from tests.auxil.bot_method_checks import (
     check_shortcut_call,
     check_shortcut_signature,
 )
+from tests.auxil.pytest_classes import PytestExtBot
 from tests.auxil.slots import mro_slots
 
 
@@ -83,6 +84,13 @@ class TestChatWithoutRequest(ChatTestBase):
         assert chat.first_name == self.first_name
         assert chat.last_name == self.last_name
 
+    def test_de_json_interned(self, offline_bot):
+        bot = PytestExtBot(token=offline_bot.token, intern_objects=True)
+        json_dict = {"id": self.id_, "type": self.type_, "title": self.title}
+        chat = Chat.de_json(json_dict, bot)
+        assert Chat.de_json(dict(json_dict), bot) is chat
+        assert Chat.de_json({**json_dict, "title": "new_title"}, bot).title == "new_title"
+
     def test_to_dict(self, chat):
         chat_dict = chat.to_dict()
 
@@ -576,6 +576,14 @@ class TestMessageWithoutRequest(MessageTestBase):
             assert getattr(message, attr, "err") != "err", f"got extra slot '{attr}'"
         assert len(mro_slots(message)) == len(set(mro_slots(message))), "duplicate slot"
 
+    def test_decoders(self):
+        decoders = Message._get_decoders()
+        assert decoders is Message._get_decoders()
+        assert Message._DECODERS.items() <= decoders.items()
+        assert {"giveaway", "external_reply", "quote", "forward_origin"} <= decoders.keys()
+        # The lazily decoded attributes are derived from the same table
+        assert dict(Message._LAZY_DECODERS) == {**Message._DECODERS, "from_user": User.de_json}
+
     def test_all_possibilities_de_json_and_to_dict(self, offline_bot, message_params):
         new = Message.de_json(message_params.to_dict(), offline_bot)
         assert new.api_kwargs == {}
@@ -27,6 +27,7 @@ from types import MappingProxyType
 import pytest
 
 from telegram import Bot, BotCommand, Chat, Message, PhotoSize, TelegramObject, User
+from telegram._telegramobject import IdAttrs
 from telegram._utils.defaultvalue import DEFAULT_FALSE, DEFAULT_NONE, DefaultValue
 from telegram.ext import PicklePersistence
 from telegram.warnings import PTBUserWarning
@@ -117,6 +118,18 @@ class TestTelegramObject:
         with pytest.raises(AttributeError, match="can't be set"):
             tg_object.api_kwargs = {"foo": "baz"}
 
+    def test_empty_api_kwargs_shared(self, bot):
+        user = User(1, "first_name", False)
+        assert user.api_kwargs is TelegramObject().api_kwargs
+        assert user.api_kwargs is pickle.loads(pickle.dumps(user)).api_kwargs
+        assert user.api_kwargs is deepcopy(user).api_kwargs
+        assert User(1, "first_name", False, api_kwargs={}).api_kwargs is user.api_kwargs
+        assert User.de_json({"id": 1, "first_name": "", "is_bot": False}, bot).api_kwargs == {}
+
+        with_kwargs = User(1, "first_name", False, api_kwargs={"foo": "bar"})
+        assert with_kwargs.api_kwargs == {"foo": "bar"}
+        assert user.api_kwargs == {}
+
     @pytest.mark.parametrize("cls", TO_SUBCLASSES, ids=[cls.__name__ for cls in TO_SUBCLASSES])
     def test_subclasses_have_api_kwargs(self, cls):
         """Checks that all subclasses of TelegramObject have an api_kwargs argument that is
@@ -159,6 +172,77 @@ class TestTelegramObject:
         with pytest.raises(TypeError, match="This is a test"):
             SubClass.de_json({}, bot)
 
+    def test_de_json_unknown_keys(self, bot):
+        class SubClass(TelegramObject):
+            def __init__(self, arg: int, *, api_kwargs=None):
+                super().__init__(api_kwargs=api_kwargs)
+                self.arg = arg
+
+        class KwargsSubClass(TelegramObject):
+            def __init__(self, arg: int, **kwargs):
+                super().__init__(api_kwargs=kwargs.pop("api_kwargs", None))
+                self.arg = arg
+                self.kwargs = kwargs
+
+        to = SubClass.de_json({"arg": 1, "unknown": 2}, bot)
+        assert to.arg == 1
+        assert to.api_kwargs == {"unknown": 2}
+
+        # Classes accepting arbitrary keyword arguments get all keys passed to __init__
+        to = KwargsSubClass.de_json({"arg": 1, "unknown": 2}, bot)
+        assert to.arg == 1
+        assert to.kwargs == {"unknown": 2}
+        assert to.api_kwargs == {}
+
+    @pytest.mark.parametrize("data", [{"arg": 1}, {"arg": 1, "unknown": 2}])
+    def test_de_json_frozen(self, bot, data):
+        class SubClass(TelegramObject):
+            __slots__ = ("arg",)
+
+            def __init__(self, arg: int, *, api_kwargs=None):
+                super().__init__(api_kwargs=api_kwargs)
+                self.arg = arg
+                self._freeze()
+
+        to = SubClass.de_json(data, bot)
+        assert type(to) is SubClass
+        assert to.get_bot() is bot
+        with pytest.raises(AttributeError, match="can't be set"):
+            to.arg = 2
+        with pytest.raises(AttributeError, match="can't be deleted"):
+            del to.arg
+        to._bot = None
+        del to._bot
+        assert SubClass.__subclasses__() == []
+
+    def test_de_json_custom_setattr(self, bot):
+        class SubClass(TelegramObject):
+            def __init__(self, arg: int, *, api_kwargs=None):
+                super().__init__(api_kwargs=api_kwargs)
+                self.arg = arg
+                self._freeze()
+
+            def __setattr__(self, key, value):
+                super().__setattr__(key, value * 2 if key == "arg" else value)
+
+        to = SubClass.de_json({"arg": 1}, bot)
+        assert to.arg == 2
+        with pytest.raises(AttributeError, match="can't be set"):
+            to.arg = 2
+
+    def test_decode_fields(self, bot):
+        data = {"nested": {"arg": 1}, "plain": 2}
+        calls = []
+
+        def decoder(value, bot):
+            calls.append((value, bot))
+            return "decoded"
+
+        TelegramObject._decode_fields(data, {"nested": decoder, "missing": decoder}, bot)
+        assert data == {"nested": "decoded", "plain": 2}
+        # Decoders of keys that are not present are not called
+        assert calls == [({"arg": 1}, bot)]
+
     def test_to_dict_private_attribute(self):
         class TelegramObjectSubclass(TelegramObject):
             __slots__ = ("_b", "a")  # Added slots so that the attrs are converted to dict
@@ -224,6 +308,66 @@ class TestTelegramObject:
         assert "default_none" not in to_dict
         assert to_dict["default_false"] is False
 
+    @pytest.mark.parametrize("recursive", [True, False])
+    def test_to_dict_value_conversion(self, recursive):
+        class SubClass(TelegramObject):
+            __slots__ = ("date", "duration", "empty", "flag", "nested", "number", "rows", "text")
+
+            def __init__(self):
+                super().__init__()
+                self.date = datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc)
+                self.duration = datetime.timedelta(seconds=90)
+                self.empty = ()
+                self.flag = False
+                self.nested = User(1, "name", False)
+                self.number = 1.5
+                self.rows = ((User(2, "row", False), 3), [4])
+                self.text = "text"
+
+        to_dict = SubClass().to_dict(recursive=recursive)
+        assert to_dict["date"] == 1704067200
+        assert to_dict["duration"] == 90
+        assert "empty" not in to_dict
+        assert to_dict["flag"] is False
+        assert to_dict["number"] == 1.5
+        assert to_dict["text"] == "text"
+        # Items of sequences are converted regardless of `recursive`
+        assert to_dict["rows"] == [[User(2, "row", False).to_dict(recursive), 3], [4]]
+        if recursive:
+            assert to_dict["nested"] == User(1, "name", False).to_dict()
+        else:
+            assert to_dict["nested"] == User(1, "name", False)
+
+    def test_get_attrs_names_per_class(self):
+        class Parent(TelegramObject):
+            __slots__ = ("_private", "parent")
+
+            def __init__(self):
+                super().__init__()
+                self.parent = 1
+                self._private = 2
+
+        class Child(Parent):
+            __slots__ = ("child",)
+
+            def __init__(self):
+                super().__init__()
+                self.child = 3
+
+        # The attribute names are cached per class, so the order of the calls must not matter
+        assert Parent().to_dict() == {"parent": 1}
+        assert Child().to_dict() == {"parent": 1, "child": 3}
+        assert Parent().to_dict() == {"parent": 1}
+        assert set(Child()._get_attrs_names(include_private=True)) == {
+            "child",
+            "parent",
+            "_private",
+            "_bot",
+            "_frozen",
+            "_id_attrs",
+            "api_kwargs",
+        }
+
     def test_slot_behaviour(self):
         inst = TelegramObject()
         for attr in inst.__slots__:
@@ -256,6 +400,44 @@ class TestTelegramObject:
         assert b == a
         assert len(recwarn) == 0
 
+    def test_id_attrs_descriptor(self, recwarn):
+        class TGO(TelegramObject):
+            __slots__ = ("first", "second")
+            _id_attrs = IdAttrs("first", "second")
+
+            def __init__(self, first, second):
+                super().__init__()
+                self.first = first
+                self.second = second
+                self._freeze()
+
+        assert isinstance(TGO._id_attrs, IdAttrs)
+        a = TGO(1, 2)
+        assert a._id_attrs == (1, 2)
+        assert a == TGO(1, 2)
+        assert hash(a) == hash(TGO(1, 2))
+        assert a != TGO(1, 3)
+        assert len(recwarn) == 0
+
+        # The built tuple is not stored, e.g. when copying or unpickling objects
+        copied = deepcopy(a)
+        assert copied._id_attrs == (1, 2)
+        assert TelegramObject.__dict__["_id_attrs"].__get__(copied) == ()
+
+        # Other assigned values are used instead, e.g. by subclasses of the user
+        class Sub(TGO):
+            __slots__ = ()
+
+            def __init__(self, first, second):
+                super().__init__(first, second)
+                self._id_attrs = (first,)
+
+        assert Sub(1, 2)._id_attrs == (1,)
+        assert Sub(1, 2) == Sub(1, 3)
+        assert hash(Sub(1, 2)) == hash(Sub(1, 3))
+        assert deepcopy(Sub(1, 2))._id_attrs == (1,)
+        assert len(recwarn) == 0
+
     def test_bot_instance_none(self):
         tg_object = TelegramObject()
         with pytest.raises(RuntimeError):
@@ -16,6 +16,7 @@
 #
 # You should have received a copy of the GNU Lesser Public License
 # along with this program.  If not, see [http://www.gnu.org/licenses/].
+import pickle
 import time
 from copy import deepcopy
 from datetime import datetime
@@ -252,6 +253,63 @@ class TestUpdateWithoutRequest(UpdateTestBase):
                 assert getattr(update, _type) == paramdict[_type]
         assert i == 1
 
+    @pytest.mark.parametrize("paramdict", argvalues=params, ids=ids)
+    def test_de_json_lazy(self, offline_bot, paramdict):
+        json_dict = {"update_id": self.update_id}
+        json_dict.update({k: v.to_dict() for k, v in paramdict.items()})
+        update = Update._de_json_lazy(json_dict, offline_bot)
+        eager_update = Update.de_json(json_dict, offline_bot)
+
+        assert update.api_kwargs == {}
+        assert update.update_id == self.update_id
+        assert update == eager_update
+
+        (_type,) = paramdict
+        assert set(update._lazy_data) == {_type}
+        assert getattr(update, _type) == paramdict[_type]
+        assert getattr(update, _type).get_bot() is offline_bot
+        assert update._lazy_data == {}
+        assert update.to_dict() == eager_update.to_dict()
+        for other_type in all_types:
+            if other_type != _type:
+                assert getattr(update, other_type) is None
+
+    def test_de_json_lazy_message(self, offline_bot):
+        json_dict = {"update_id": self.update_id, "message": message.to_dict()}
+        update = Update._de_json_lazy(json_dict, offline_bot)
+
+        lazy_message = update.effective_message
+        assert set(lazy_message._lazy_data) == {"from_user", "sender_chat"}
+        assert lazy_message.text == message.text
+        assert lazy_message.chat == message.chat
+        assert update.effective_user == message.from_user
+        assert lazy_message._lazy_data == {"sender_chat": json_dict["message"]["sender_chat"]}
+
+        with pytest.raises(AttributeError, match="can't be set"):
+            update.message = None
+        with pytest.raises(AttributeError, match="can't be set"):
+            lazy_message.sender_chat = None
+        with pytest.raises(AttributeError, match="has no attribute 'no_such_attribute'"):
+            lazy_message.no_such_attribute  # noqa: B018
+
+    @pytest.mark.parametrize("method", ["pickle", "deepcopy", "to_dict"])
+    def test_de_json_lazy_decodes_all(self, offline_bot, method):
+        json_dict = {"update_id": self.update_id, "message": message.to_dict()}
+        update = Update._de_json_lazy(json_dict, offline_bot)
+
+        if method == "pickle":
+            update.set_bot(None)
+            result = pickle.loads(pickle.dumps(update))
+        elif method == "deepcopy":
+            result = deepcopy(update)
+        else:
+            result = Update.de_json(update.to_dict(), offline_bot)
+
+        assert result == update
+        assert result.message.from_user == message.from_user
+        assert result.message.sender_chat == message.sender_chat
+        assert not result._lazy_data
+
     def test_update_de_json_empty(self, offline_bot):
         update = Update.de_json(None, offline_bot)
 
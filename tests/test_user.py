@@ -25,6 +25,7 @@ from tests.auxil.bot_method_checks import (
     check_shortcut_call,
     check_shortcut_signature,
 )
+from tests.auxil.pytest_classes import PytestExtBot
 from tests.auxil.slots import mro_slots
 
 
@@ -109,6 +110,17 @@ class TestUserWithoutRequest(UserTestBase):
         assert user.can_connect_to_business == self.can_connect_to_business
         assert user.has_main_web_app == self.has_main_web_app
 
+    def test_de_json_interned(self, json_dict, offline_bot):
+        bot = PytestExtBot(token=offline_bot.token, intern_objects=True)
+        user = User.de_json(dict(json_dict), bot)
+        assert User.de_json(dict(json_dict), bot) is user
+        assert User.de_json(dict(json_dict), offline_bot) is not user
+
+        changed = User.de_json({**json_dict, "username": "new_username"}, bot)
+        assert changed is not user
+        assert changed.username == "new_username"
+        assert User.de_json(dict(json_dict), bot) is not changed
+
     def test_to_dict(self, user):
         user_dict = user.to_dict()
 